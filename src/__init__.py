@@ -21,8 +21,15 @@ from ._arraykit import resolve_dtype_iter as resolve_dtype_iter
 from ._arraykit import isna_element as isna_element
 from ._arraykit import dtype_from_element as dtype_from_element
 from ._arraykit import delimited_to_arrays as delimited_to_arrays
+from ._arraykit import delimited_to_record_index as delimited_to_record_index
+from ._arraykit import delimited_to_dtypes as delimited_to_dtypes
+from ._arraykit import fixed_width_to_arrays as fixed_width_to_arrays
+from ._arraykit import iter_delimited_to_arrays as iter_delimited_to_arrays
+from ._arraykit import tail_delimited_to_arrays as tail_delimited_to_arrays
 from ._arraykit import iterable_str_to_array_1d as iterable_str_to_array_1d
 from ._arraykit import split_after_count as split_after_count
+from ._arraykit import split_after_count_array as split_after_count_array
+from ._arraykit import arrays_to_delimited as arrays_to_delimited
 from ._arraykit import get_new_indexers_and_screen as get_new_indexers_and_screen
 from ._arraykit import count_iteration as count_iteration
 from ._arraykit import first_true_1d as first_true_1d
@@ -1,5 +1,7 @@
 import typing as tp
 import datetime
+import mmap
+import os
 
 import numpy as np  # type: ignore
 
@@ -113,11 +115,15 @@ def iterable_str_to_array_1d(
         ) -> np.ndarray: ...
 
 def delimited_to_arrays(
-        file_like: tp.Iterable[str],
+        file_like: tp.Union[tp.Iterable[str], bytes, bytearray, memoryview, mmap.mmap, os.PathLike],
         *,
         axis: int = 0,
-        dtypes: tp.Optional[tp.Callable[[int], tp.Any]] = None,
-        line_select: tp.Optional[tp.Callable[[int], bool]] = None,
+        dtypes: tp.Optional[tp.Union[tp.Callable[[int], tp.Any], tp.Sequence[tp.Any], tp.Mapping[int, tp.Any]]] = None,
+        line_select: tp.Optional[tp.Union[tp.Callable[[int], bool], np.ndarray, tp.Iterable[int], slice]] = None,
+        usecols: tp.Optional[tp.Union[np.ndarray, tp.Iterable[int]]] = None,
+        skip_header: int = 0,
+        skip_footer: int = 0,
+        comment_char: tp.Optional[str] = None,
         delimiter: str = ',',
         doublequote: bool = True,
         escapechar: tp.Optional[str] = '',
@@ -127,7 +133,116 @@ def delimited_to_arrays(
         strict: bool = False,
         thousandschar: str = ',',
         decimalchar: str = '.',
-        ) -> tp.List[np.array]: ...
+        infer_datetime: bool = False,
+        infer_rows: int = 0,
+        downcast: bool = False,
+        categorical: bool = False,
+        na_values: tp.Optional[tp.Iterable[str]] = None,
+        return_mask: bool = False,
+        return_stats: bool = False,
+        on_error: str = 'raise',
+        out: tp.Optional[tp.Sequence[np.ndarray]] = None,
+        out_offset: int = 0,
+        record_index: tp.Optional[np.ndarray] = None,
+        rows: tp.Optional[tp.Union[slice, tp.Iterable[int]]] = None,
+        threads: int = 1,
+        ) -> tp.Union[tp.List[tp.Any], int, tp.Tuple[tp.Any, ...]]: ...
+
+def delimited_to_record_index(
+        file_like: tp.Union[bytes, bytearray, memoryview, mmap.mmap, os.PathLike],
+        *,
+        delimiter: str = ',',
+        doublequote: bool = True,
+        escapechar: tp.Optional[str] = '',
+        quotechar: tp.Optional[str] = '"',
+        quoting: int = 0,
+        skipinitialspace: bool = False,
+        ) -> np.ndarray: ...
+
+def delimited_to_dtypes(
+        file_like: tp.Union[tp.Iterable[str], bytes, bytearray, memoryview, mmap.mmap, os.PathLike],
+        *,
+        axis: int = 0,
+        dtypes: tp.Optional[tp.Union[tp.Callable[[int], tp.Any], tp.Sequence[tp.Any], tp.Mapping[int, tp.Any]]] = None,
+        line_select: tp.Optional[tp.Union[tp.Callable[[int], bool], np.ndarray, tp.Iterable[int], slice]] = None,
+        usecols: tp.Optional[tp.Union[np.ndarray, tp.Iterable[int]]] = None,
+        delimiter: str = ',',
+        doublequote: bool = True,
+        escapechar: tp.Optional[str] = '',
+        quotechar: tp.Optional[str] = '"',
+        quoting: int = 0,
+        skipinitialspace: bool = False,
+        strict: bool = False,
+        thousandschar: str = ',',
+        decimalchar: str = '.',
+        infer_datetime: bool = False,
+        downcast: bool = False,
+        na_values: tp.Optional[tp.Iterable[str]] = None,
+        max_rows: tp.Optional[int] = None,
+        return_widths: bool = False,
+        ) -> tp.Union[tp.List[np.dtype], tp.Tuple[tp.List[np.dtype], tp.List[int]]]: ...
+
+def fixed_width_to_arrays(
+        file_like: tp.Union[tp.Iterable[str], bytes, bytearray, memoryview, mmap.mmap, os.PathLike],
+        *,
+        axis: int = 0,
+        widths: tp.Optional[tp.Iterable[int]] = None,
+        colspecs: tp.Optional[tp.Iterable[tp.Tuple[int, tp.Optional[int]]]] = None,
+        dtypes: tp.Optional[tp.Union[tp.Callable[[int], tp.Any], tp.Sequence[tp.Any], tp.Mapping[int, tp.Any]]] = None,
+        line_select: tp.Optional[tp.Union[tp.Callable[[int], bool], np.ndarray, tp.Iterable[int], slice]] = None,
+        thousandschar: str = ',',
+        decimalchar: str = '.',
+        infer_datetime: bool = False,
+        na_values: tp.Optional[tp.Iterable[str]] = None,
+        threads: int = 1,
+        ) -> tp.List[np.ndarray]: ...
+
+def iter_delimited_to_arrays(
+        file_like: tp.Union[tp.Iterable[str], bytes, bytearray, memoryview, mmap.mmap, os.PathLike],
+        *,
+        chunk_rows: int = 65536,
+        axis: int = 0,
+        dtypes: tp.Optional[tp.Union[tp.Callable[[int], tp.Any], tp.Sequence[tp.Any], tp.Mapping[int, tp.Any]]] = None,
+        line_select: tp.Optional[tp.Union[tp.Callable[[int], bool], np.ndarray, tp.Iterable[int], slice]] = None,
+        usecols: tp.Optional[tp.Union[np.ndarray, tp.Iterable[int]]] = None,
+        delimiter: str = ',',
+        doublequote: bool = True,
+        escapechar: tp.Optional[str] = '',
+        quotechar: tp.Optional[str] = '"',
+        quoting: int = 0,
+        skipinitialspace: bool = False,
+        strict: bool = False,
+        thousandschar: str = ',',
+        decimalchar: str = '.',
+        infer_datetime: bool = False,
+        infer_rows: int = 0,
+        na_values: tp.Optional[tp.Iterable[str]] = None,
+        threads: int = 1,
+        ) -> tp.Iterator[tp.List[np.array]]: ...
+
+def tail_delimited_to_arrays(
+        path: tp.Union[str, bytes, os.PathLike],
+        *,
+        axis: int = 0,
+        dtypes: tp.Optional[tp.Union[tp.Callable[[int], tp.Any], tp.Sequence[tp.Any], tp.Mapping[int, tp.Any]]] = None,
+        line_select: tp.Optional[tp.Union[tp.Callable[[int], bool], np.ndarray, tp.Iterable[int], slice]] = None,
+        usecols: tp.Optional[tp.Union[np.ndarray, tp.Iterable[int]]] = None,
+        skip_header: int = 0,
+        delimiter: str = ',',
+        doublequote: bool = True,
+        escapechar: tp.Optional[str] = '',
+        quotechar: tp.Optional[str] = '"',
+        quoting: int = 0,
+        skipinitialspace: bool = False,
+        strict: bool = False,
+        thousandschar: str = ',',
+        decimalchar: str = '.',
+        infer_datetime: bool = False,
+        na_values: tp.Optional[tp.Iterable[str]] = None,
+        return_mask: bool = False,
+        on_error: str = 'raise',
+        threads: int = 1,
+        ) -> tp.Callable[[], tp.Union[tp.List[np.array], tp.Tuple[tp.Any, ...]]]: ...
 
 def split_after_count(
         string: str,
@@ -141,6 +256,31 @@ def split_after_count(
         strict: bool = False,
         ) -> tp.Tuple[str, str]: ...
 
+def split_after_count_array(
+        strings: tp.Union[np.ndarray, tp.Iterable[str]],
+        *,
+        delimiter: str = ',',
+        count: int = 0,
+        doublequote: bool = True,
+        escapechar: tp.Optional[str] = '',
+        quotechar: tp.Optional[str] = '"',
+        quoting: int = 0,
+        strict: bool = False,
+        ) -> tp.Tuple[np.ndarray, np.ndarray]: ...
+
+def arrays_to_delimited(
+        arrays: tp.Sequence[np.ndarray],
+        file_like: tp.Union[bytearray, tp.IO[tp.Any], os.PathLike],
+        *,
+        delimiter: str = ',',
+        doublequote: bool = True,
+        escapechar: tp.Optional[str] = '',
+        quotechar: tp.Optional[str] = '"',
+        quoting: int = 0,
+        lineterminator: str = '\n',
+        float_format: tp.Optional[str] = None,
+        ) -> None: ...
+
 def count_iteration(__iterable: tp.Iterable) -> int: ...
 
 def immutable_filter(__array: np.ndarray) -> np.ndarray: ...
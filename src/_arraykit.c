@@ -41,6 +41,34 @@ static PyMethodDef arraykit_methods[] =  {
             (PyCFunction)delimited_to_arrays,
             METH_VARARGS | METH_KEYWORDS,
             NULL},
+    {"delimited_to_record_index",
+            (PyCFunction)delimited_to_record_index,
+            METH_VARARGS | METH_KEYWORDS,
+            NULL},
+    {"delimited_to_dtypes",
+            (PyCFunction)delimited_to_dtypes,
+            METH_VARARGS | METH_KEYWORDS,
+            NULL},
+    {"fixed_width_to_arrays",
+            (PyCFunction)fixed_width_to_arrays,
+            METH_VARARGS | METH_KEYWORDS,
+            NULL},
+    {"iter_delimited_to_arrays",
+            (PyCFunction)iter_delimited_to_arrays,
+            METH_VARARGS | METH_KEYWORDS,
+            NULL},
+    {"tail_delimited_to_arrays",
+            (PyCFunction)tail_delimited_to_arrays,
+            METH_VARARGS | METH_KEYWORDS,
+            NULL},
+    {"split_after_count_array",
+            (PyCFunction)split_after_count_array,
+            METH_VARARGS | METH_KEYWORDS,
+            NULL},
+    {"arrays_to_delimited",
+            (PyCFunction)arrays_to_delimited,
+            METH_VARARGS | METH_KEYWORDS,
+            NULL},
     {"iterable_str_to_array_1d",
             (PyCFunction)iterable_str_to_array_1d,
             METH_VARARGS | METH_KEYWORDS,
@@ -107,6 +135,8 @@ PyInit__arraykit(void)
         PyType_Ready(&BIIterBlockType) ||
         PyType_Ready(&TriMapType) ||
         PyType_Ready(&ArrayGOType) ||
+        PyType_Ready(&DTAIterType) ||
+        PyType_Ready(&DTATailType) ||
         PyModule_AddObject(m, "BlockIndex", (PyObject *) &BlockIndexType) ||
         PyModule_AddObject(m, "TriMap", (PyObject *) &TriMapType) ||
         PyModule_AddObject(m, "ArrayGO", (PyObject *) &ArrayGOType) ||
@@ -30,6 +30,14 @@
 #define AK_is_t(c) (((c) == 't') || ((c) == 'T'))
 #define AK_is_u(c) (((c) == 'u') || ((c) == 'U'))
 
+// Evaluate `stmt`, setting an exception, with the GIL held; used where code might run on a worker thread with the GIL released (see AK_TaskPool_Run). This is a no-op on a thread that already holds the GIL.
+#define AK_WITH_GIL(stmt)                                \
+    do {                                                 \
+        PyGILState_STATE _ak_gil = PyGILState_Ensure();  \
+        stmt;                                            \
+        PyGILState_Release(_ak_gil);                     \
+    } while (0)
+
 //------------------------------------------------------------------------------
 // Utility setters of C types from possibly NULL PyObject*; all return -1 on error.
 
@@ -75,6 +83,74 @@ AK_set_int(const char *name,
     return 0;
 }
 
+// Handling of fields that fail conversion and of strict-mode quoting errors: raise an exception, write a null value (NaN or zero) marked in the mask, or also collect a report of each error.
+typedef enum AK_OnError {
+    AK_ON_ERROR_RAISE,
+    AK_ON_ERROR_NULL,
+    AK_ON_ERROR_COLLECT
+} AK_OnError;
+
+// Set an AK_OnError from `src`, one of "raise", "null", or "collect"; if src is NULL or None, use AK_ON_ERROR_RAISE. Returns -1 on error, else 0.
+static inline int
+AK_set_on_error(AK_OnError *target, PyObject *src)
+{
+    *target = AK_ON_ERROR_RAISE;
+    if (src == NULL || src == Py_None) return 0;
+    if (PyUnicode_Check(src)) {
+        if (PyUnicode_CompareWithASCIIString(src, "raise") == 0) {
+            return 0;
+        }
+        if (PyUnicode_CompareWithASCIIString(src, "null") == 0) {
+            *target = AK_ON_ERROR_NULL;
+            return 0;
+        }
+        if (PyUnicode_CompareWithASCIIString(src, "collect") == 0) {
+            *target = AK_ON_ERROR_COLLECT;
+            return 0;
+        }
+    }
+    PyErr_SetString(PyExc_ValueError, "on_error must be one of 'raise', 'null', or 'collect'");
+    return -1;
+}
+
+// Append a (record, field, text) tuple to `report`, a list. Returns -1 on error, else 0.
+static inline int
+AK_report_append(PyObject *report, Py_ssize_t record, Py_ssize_t field, PyObject *text)
+{
+    if (text == NULL) return -1;
+    PyObject *item = Py_BuildValue("(nnO)", record, field, text);
+    Py_DECREF(text);
+    if (item == NULL) return -1;
+    int err = PyList_Append(report, item);
+    Py_DECREF(item);
+    return err;
+}
+
+// Given a list of (record, field, text) tuples, return a new immutable structured array of the tuples, sorted by record and field, with fields "record", "field", and "text". Returns NULL on error.
+static inline PyObject *
+AK_report_to_array(PyObject *report)
+{
+    if (PyList_Sort(report)) return NULL;
+    Py_ssize_t width = 1;
+    for (Py_ssize_t i = 0; i < PyList_GET_SIZE(report); ++i) {
+        Py_ssize_t len = PyUnicode_GET_LENGTH(PyTuple_GET_ITEM(PyList_GET_ITEM(report, i), 2));
+        if (len > width) width = len;
+    }
+    PyObject *spec = Py_BuildValue("[(ss)(ss)(sN)]",
+            "record", "i8",
+            "field", "i8",
+            "text", PyUnicode_FromFormat("U%zd", width));
+    if (spec == NULL) return NULL;
+    PyArray_Descr *dtype = NULL;
+    int ok = PyArray_DescrConverter(spec, &dtype);
+    Py_DECREF(spec);
+    if (!ok) return NULL;
+    PyObject *array = PyArray_FromAny(report, dtype, 1, 1, NPY_ARRAY_DEFAULT, NULL); // steals dtype
+    if (array == NULL) return NULL;
+    PyArray_CLEARFLAGS((PyArrayObject *)array, NPY_ARRAY_WRITEABLE);
+    return array;
+}
+
 // Set a character from `src` on `target`; if src is NULL use default. Returns -1 on error, else 0. If a None is given, a null char will be assigned.
 static inline int
 AK_set_char(const char *name,
@@ -109,6 +185,302 @@ AK_set_char(const char *name,
     return 0;
 }
 
+// Read `size` positions of `type` from `data`, elements of `stride` bytes, into `positions`, or go to `negative` or `overflow`.
+#define AK_POSITIONS_FROM_ARRAY(type)                                            \
+    do {                                                                         \
+        for (npy_intp i = 0; i < size; ++i) {                                    \
+            type v = *(type*)(data + i * stride);                                \
+            if (v < 0) goto negative;                                            \
+            if ((npy_uint64)v > (npy_uint64)PY_SSIZE_T_MAX) goto overflow;       \
+            positions[i] = (Py_ssize_t)v;                                        \
+        }                                                                        \
+    } while (0)
+
+// Read positions from `a`, a one-dimensional, aligned, native-byte-order integer array, into `positions`, of space for each element, reading its data directly. Returns -1 on error, else 0.
+static inline int
+AK_positions_from_array(const char *name, Py_ssize_t *positions, PyArrayObject *a)
+{
+    char *data = PyArray_BYTES(a);
+    npy_intp size = PyArray_SIZE(a);
+    npy_intp stride = PyArray_STRIDE(a, 0);
+    PyArray_Descr *descr = PyArray_DESCR(a);
+    if (descr->kind == 'i' && descr->elsize == 8) {
+        AK_POSITIONS_FROM_ARRAY(npy_int64);
+    }
+    else if (descr->kind == 'i' && descr->elsize == 4) {
+        AK_POSITIONS_FROM_ARRAY(npy_int32);
+    }
+    else if (descr->kind == 'i' && descr->elsize == 2) {
+        AK_POSITIONS_FROM_ARRAY(npy_int16);
+    }
+    else if (descr->kind == 'i' && descr->elsize == 1) {
+        AK_POSITIONS_FROM_ARRAY(npy_int8);
+    }
+    else if (descr->kind == 'u' && descr->elsize == 8) {
+        AK_POSITIONS_FROM_ARRAY(npy_uint64);
+    }
+    else if (descr->kind == 'u' && descr->elsize == 4) {
+        AK_POSITIONS_FROM_ARRAY(npy_uint32);
+    }
+    else if (descr->kind == 'u' && descr->elsize == 2) {
+        AK_POSITIONS_FROM_ARRAY(npy_uint16);
+    }
+    else if (descr->kind == 'u' && descr->elsize == 1) {
+        AK_POSITIONS_FROM_ARRAY(npy_uint8);
+    }
+    else {
+        PyErr_Format(PyExc_TypeError, "\"%s\" has an unsupported integer dtype", name);
+        return -1;
+    }
+    return 0;
+negative:
+    PyErr_Format(PyExc_ValueError, "\"%s\" positions must be non-negative", name);
+    return -1;
+overflow:
+    PyErr_Format(PyExc_OverflowError, "\"%s\" positions must fit in a Py_ssize_t", name);
+    return -1;
+}
+
+// Read positions from `seq`, a sequence from PySequence_Fast, into `positions`, of space for each item. Returns -1 on error, else 0.
+static inline int
+AK_positions_from_sequence(const char *name, Py_ssize_t *positions, PyObject *seq)
+{
+    Py_ssize_t size = PySequence_Fast_GET_SIZE(seq);
+    PyObject **items = PySequence_Fast_ITEMS(seq);
+    for (Py_ssize_t i = 0; i < size; ++i) {
+        if (PyBool_Check(items[i])) {
+            PyErr_Format(PyExc_TypeError,
+                    "\"%s\" positions must be integers; provide a mask as a Boolean array",
+                    name);
+            return -1;
+        }
+        PyObject *index = PyNumber_Index(items[i]);
+        if (index == NULL) return -1;
+        positions[i] = PyLong_AsSsize_t(index);
+        Py_DECREF(index);
+        if (positions[i] == -1 && PyErr_Occurred()) return -1;
+        if (positions[i] < 0) {
+            PyErr_Format(PyExc_ValueError,
+                    "\"%s\" positions must be non-negative",
+                    name);
+            return -1;
+        }
+    }
+    return 0;
+}
+
+static int
+AK_positions_compare(const void *a, const void *b)
+{
+    Py_ssize_t x = *(const Py_ssize_t*)a;
+    Py_ssize_t y = *(const Py_ssize_t*)b;
+    return (x > y) - (x < y);
+}
+
+// Sort `positions` and remove duplicates, returning the count of unique positions. Cannot error.
+static inline Py_ssize_t
+AK_positions_unique(Py_ssize_t *positions, Py_ssize_t count)
+{
+    bool sorted = true;
+    for (Py_ssize_t i = 1; i < count; ++i) {
+        if (positions[i] < positions[i - 1]) {
+            sorted = false;
+            break;
+        }
+    }
+    if (!sorted) {
+        qsort(positions, count, sizeof(Py_ssize_t), AK_positions_compare);
+    }
+    Py_ssize_t unique = count > 0 ? 1 : 0;
+    for (Py_ssize_t i = 1; i < count; ++i) {
+        if (positions[i] != positions[unique - 1]) {
+            positions[unique++] = positions[i];
+        }
+    }
+    return unique;
+}
+
+// Return true if `number` is in `positions`, `count` sorted, unique positions, by binary search. Cannot error.
+static inline bool
+AK_positions_contain(const Py_ssize_t *positions, Py_ssize_t count, Py_ssize_t number)
+{
+    if (count == 0 || number > positions[count - 1]) return false;
+    Py_ssize_t lo = 0;
+    Py_ssize_t hi = count;
+    while (lo < hi) {
+        Py_ssize_t mid = lo + (hi - lo) / 2;
+        if (positions[mid] < number) {
+            lo = mid + 1;
+        }
+        else {
+            hi = mid;
+        }
+    }
+    return positions[lo] == number;
+}
+
+// Set a selection of non-negative positions from `src`, given either as a Boolean array (a mask of positions) or as an iterable of integers (such as an integer array, list, or set), as `count` sorted, unique positions on `target`, such that memory scales with the number of positions rather than their values; test membership with AK_positions_contain. If `src` is NULL or None, `target` is set to NULL. The caller must PyMem_Free `target`. Returns -1 on error, else 0.
+static inline int
+AK_set_positions(const char *name,
+        Py_ssize_t **target,
+        Py_ssize_t *count,
+        PyObject *src)
+{
+    *target = NULL;
+    *count = 0;
+    if (src == NULL || src == Py_None) return 0;
+
+    Py_ssize_t *positions = NULL;
+    Py_ssize_t size;
+    if (PyArray_Check(src) && PyArray_TYPE((PyArrayObject*)src) == NPY_BOOL) {
+        PyArrayObject *a = (PyArrayObject*)src;
+        if (PyArray_NDIM(a) != 1) {
+            PyErr_Format(PyExc_ValueError, "\"%s\" must be one-dimensional", name);
+            return -1;
+        }
+        npy_intp mask_size = PyArray_SIZE(a);
+        size = 0;
+        for (npy_intp i = 0; i < mask_size; ++i) {
+            size += *(npy_bool*)PyArray_GETPTR1(a, i) != 0;
+        }
+        positions = (Py_ssize_t*)PyMem_Malloc(sizeof(Py_ssize_t) * (size > 0 ? size : 1));
+        if (positions == NULL) {
+            PyErr_NoMemory();
+            return -1;
+        }
+        size = 0;
+        for (npy_intp i = 0; i < mask_size; ++i) {
+            if (*(npy_bool*)PyArray_GETPTR1(a, i)) positions[size++] = i;
+        }
+    }
+    else if (PyArray_Check(src)
+            && PyArray_ISINTEGER((PyArrayObject*)src)
+            && PyArray_ISBEHAVED_RO((PyArrayObject*)src)) {
+        PyArrayObject *a = (PyArrayObject*)src;
+        if (PyArray_NDIM(a) != 1) {
+            PyErr_Format(PyExc_ValueError, "\"%s\" must be one-dimensional", name);
+            return -1;
+        }
+        size = PyArray_SIZE(a);
+        positions = (Py_ssize_t*)PyMem_Malloc(sizeof(Py_ssize_t) * (size > 0 ? size : 1));
+        if (positions == NULL) {
+            PyErr_NoMemory();
+            return -1;
+        }
+        if (AK_positions_from_array(name, positions, a)) goto error;
+    }
+    else { // lists, sets, other iterables, and integer arrays not in native byte order
+        PyObject *seq = PySequence_Fast(src, "");
+        if (seq == NULL) {
+            PyErr_Format(PyExc_TypeError,
+                    "\"%s\" must be a Boolean array or an iterable of integers, not %.200s",
+                    name,
+                    Py_TYPE(src)->tp_name);
+            return -1;
+        }
+        size = PySequence_Fast_GET_SIZE(seq);
+        positions = (Py_ssize_t*)PyMem_Malloc(sizeof(Py_ssize_t) * (size > 0 ? size : 1));
+        if (positions == NULL) {
+            Py_DECREF(seq);
+            PyErr_NoMemory();
+            return -1;
+        }
+        int err = AK_positions_from_sequence(name, positions, seq);
+        Py_DECREF(seq);
+        if (err) goto error;
+    }
+    *target = positions;
+    *count = AK_positions_unique(positions, size);
+    return 0;
+error:
+    PyMem_Free(positions);
+    return -1;
+}
+
+// Set `specs` to a new array of start and stop pairs, in code points, for `count` fixed-width fields. Exactly one of `widths`, an iterable of positive integers of contiguous fields, or `colspecs`, an iterable of (start, stop) pairs where stop might be None to read to the end of the record, must be provided. Returns 0 on success, -1 on error.
+static inline int
+AK_set_fixed_specs(Py_ssize_t **specs,
+        Py_ssize_t *count,
+        PyObject *widths,
+        PyObject *colspecs)
+{
+    *specs = NULL;
+    *count = 0;
+    bool has_widths = widths != NULL && widths != Py_None;
+    bool has_colspecs = colspecs != NULL && colspecs != Py_None;
+    if (has_widths == has_colspecs) {
+        PyErr_SetString(PyExc_ValueError, "one of widths or colspecs must be provided");
+        return -1;
+    }
+    const char *name = has_widths ? "widths" : "colspecs";
+    PyObject *seq = PySequence_Fast(has_widths ? widths : colspecs, "");
+    if (seq == NULL) {
+        PyErr_Format(PyExc_TypeError, "\"%s\" must be an iterable", name);
+        return -1;
+    }
+    Py_ssize_t size = PySequence_Fast_GET_SIZE(seq);
+    PyObject **items = PySequence_Fast_ITEMS(seq);
+    if (size == 0) {
+        PyErr_Format(PyExc_ValueError, "\"%s\" must not be empty", name);
+        Py_DECREF(seq);
+        return -1;
+    }
+    Py_ssize_t *pairs = (Py_ssize_t*)PyMem_Malloc(sizeof(Py_ssize_t) * 2 * size);
+    if (pairs == NULL) {
+        Py_DECREF(seq);
+        PyErr_NoMemory();
+        return -1;
+    }
+    Py_ssize_t start = 0;
+    Py_ssize_t stop;
+    for (Py_ssize_t i = 0; i < size; ++i) {
+        if (has_widths) {
+            Py_ssize_t width = PyNumber_AsSsize_t(items[i], PyExc_OverflowError);
+            if (width == -1 && PyErr_Occurred()) goto error;
+            if (width <= 0) {
+                PyErr_SetString(PyExc_ValueError, "\"widths\" must be positive");
+                goto error;
+            }
+            stop = start + width;
+        }
+        else {
+            PyObject *pair = PySequence_Fast(items[i], "");
+            if (pair == NULL || PySequence_Fast_GET_SIZE(pair) != 2) {
+                Py_XDECREF(pair);
+                PyErr_SetString(PyExc_TypeError,
+                        "\"colspecs\" must be an iterable of (start, stop) pairs");
+                goto error;
+            }
+            PyObject *stop_obj = PySequence_Fast_GET_ITEM(pair, 1);
+            start = PyNumber_AsSsize_t(PySequence_Fast_GET_ITEM(pair, 0), PyExc_OverflowError);
+            if (start == -1 && PyErr_Occurred()) {
+                Py_DECREF(pair);
+                goto error;
+            }
+            stop = stop_obj == Py_None ? PY_SSIZE_T_MAX
+                    : PyNumber_AsSsize_t(stop_obj, PyExc_OverflowError);
+            Py_DECREF(pair);
+            if (stop == -1 && PyErr_Occurred()) goto error;
+            if (start < 0 || stop < start) {
+                PyErr_SetString(PyExc_ValueError,
+                        "\"colspecs\" must have non-negative starts not greater than stops");
+                goto error;
+            }
+        }
+        pairs[2 * i] = start;
+        pairs[2 * i + 1] = stop;
+        start = stop;
+    }
+    Py_DECREF(seq);
+    *specs = pairs;
+    *count = size;
+    return 0;
+error:
+    Py_DECREF(seq);
+    PyMem_Free(pairs);
+    return -1;
+}
+
 // Given a dtype_specifier, which might be a dtype, NULL, or None, assign a fresh dtype object (or NULL) to dtype_returned. Returns 0 on success, -1 on failure. This will not interpret a None dtype_specified as a float dtype. This will never set dtype_returned to None (only NULL). Returns a new reference.
 static inline int
 AK_DTypeFromSpecifier(PyObject *dtype_specifier, PyArray_Descr **dtype_returned)
@@ -132,6 +504,154 @@ AK_DTypeFromSpecifier(PyObject *dtype_specifier, PyArray_Descr **dtype_returned)
     return 0;
 }
 
+//------------------------------------------------------------------------------
+// Datetime utilities
+
+// Return the number of days in a month of the proleptic Gregorian calendar.
+static inline int
+AK_days_in_month(int year, int month)
+{
+    static const int days[] = {31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31};
+    if (month == 2 && (year % 4 == 0) && ((year % 100 != 0) || (year % 400 == 0))) {
+        return 29;
+    }
+    return days[month - 1];
+}
+
+// Return the number of days from 1970-01-01 to a date of the proleptic Gregorian calendar. Based on days_from_civil by Howard Hinnant.
+static inline npy_int64
+AK_days_from_civil(npy_int64 year, int month, int day)
+{
+    year -= month <= 2;
+    npy_int64 era = (year >= 0 ? year : year - 399) / 400;
+    npy_int64 yoe = year - era * 400;
+    npy_int64 doy = (153 * (month > 2 ? month - 3 : month + 9) + 2) / 5 + day - 1;
+    npy_int64 doe = yoe * 365 + yoe / 4 - yoe / 100 + doy;
+    return era * 146097 + doe - 719468;
+}
+
+// Set the year, month, and day of the proleptic Gregorian calendar that is `days` from 1970-01-01. Based on civil_from_days by Howard Hinnant.
+static inline void
+AK_civil_from_days(npy_int64 days, npy_int64 *year, int *month, int *day)
+{
+    days += 719468;
+    npy_int64 era = (days >= 0 ? days : days - 146096) / 146097;
+    npy_int64 doe = days - era * 146097;
+    npy_int64 yoe = (doe - doe / 1460 + doe / 36524 - doe / 146096) / 365;
+    npy_int64 doy = doe - (365 * yoe + yoe / 4 - yoe / 100);
+    npy_int64 mp = (5 * doy + 2) / 153;
+    *day = (int)(doy - (153 * mp + 2) / 5 + 1);
+    *month = (int)(mp < 10 ? mp + 3 : mp - 9);
+    *year = yoe + era * 400 + (*month <= 2);
+}
+
+// Return the metadata, including the unit, of a datetime64 dtype.
+static inline PyArray_DatetimeMetaData *
+AK_datetime_meta(PyArray_Descr* dtype)
+{
+    return &(((PyArray_DatetimeDTypeMetaData *)dtype->c_metadata)->meta);
+}
+
+// Given the length of an ISO 8601 string (less leading space), return the unit that represents it without loss, or NPY_FR_ERROR if the length is not one inferred as a datetime.
+static inline NPY_DATETIMEUNIT
+AK_datetime64_unit_from_length(Py_ssize_t length)
+{
+    switch (length) {
+        case 10:
+            return NPY_FR_D;
+        case 13:
+            return NPY_FR_h;
+        case 16:
+            return NPY_FR_m;
+        case 19:
+            return NPY_FR_s;
+    }
+    if (length <= 20) return NPY_FR_ERROR; // no fractional digits
+    if (length <= 23) return NPY_FR_ms;
+    if (length <= 26) return NPY_FR_us;
+    return NPY_FR_ns;
+}
+
+// Return true if AK_datetime64_from_fields supports the unit.
+static inline bool
+AK_datetime64_unit_native(NPY_DATETIMEUNIT unit)
+{
+    switch (unit) {
+        case NPY_FR_Y:
+        case NPY_FR_M:
+        case NPY_FR_W:
+        case NPY_FR_D:
+        case NPY_FR_h:
+        case NPY_FR_m:
+        case NPY_FR_s:
+        case NPY_FR_ms:
+        case NPY_FR_us:
+        case NPY_FR_ns:
+            return true;
+        default:
+            return false;
+    }
+}
+
+// Given validated date and time fields, set `value` to a datetime64 value of `unit`, truncating fields more precise than `unit`, as done by NumPy. Returns 0 on success, -1 if the value cannot be represented.
+static inline int
+AK_datetime64_from_fields(int year,
+        int month,
+        int day,
+        int hour,
+        int minute,
+        int second,
+        npy_int64 nanosecond,
+        NPY_DATETIMEUNIT unit,
+        npy_int64 *value)
+{
+    npy_int64 days = AK_days_from_civil(year, month, day);
+    switch (unit) {
+        case NPY_FR_Y:
+            *value = year - 1970;
+            return 0;
+        case NPY_FR_M:
+            *value = (npy_int64)(year - 1970) * 12 + month - 1;
+            return 0;
+        case NPY_FR_W: // weeks start on the epoch; floor divide
+            *value = days >= 0 ? days / 7 : (days - 6) / 7;
+            return 0;
+        case NPY_FR_D:
+            *value = days;
+            return 0;
+        case NPY_FR_h:
+            *value = days * 24 + hour;
+            return 0;
+        case NPY_FR_m:
+            *value = (days * 24 + hour) * 60 + minute;
+            return 0;
+        default:
+            break;
+    }
+    npy_int64 seconds = ((days * 24 + hour) * 60 + minute) * 60 + second;
+    switch (unit) {
+        case NPY_FR_s:
+            *value = seconds;
+            return 0;
+        case NPY_FR_ms:
+            *value = seconds * 1000 + nanosecond / 1000000;
+            return 0;
+        case NPY_FR_us:
+            *value = seconds * 1000000 + nanosecond / 1000;
+            return 0;
+        case NPY_FR_ns:
+            // nanoseconds can only represent years from about 1678 to 2262
+            if (seconds >= NPY_MAX_INT64 / 1000000000 || seconds <= NPY_MIN_INT64 / 1000000000) {
+                break;
+            }
+            *value = seconds * 1000000000 + nanosecond;
+            return 0;
+        default:
+            break;
+    }
+    return -1;
+}
+
 //------------------------------------------------------------------------------
 // TypeParser: Type, New, Destructor
 
@@ -143,7 +663,8 @@ typedef enum AK_TypeParserState {
     TPS_FLOAT,
     TPS_COMPLEX, // 4
     TPS_STRING,
-    TPS_EMPTY // empty fields
+    TPS_EMPTY, // empty fields
+    TPS_DATETIME // only if datetime inference is enabled
 } AK_TypeParserState;
 
 // Given previous and new parser states, return a next parser state. Does not error.
@@ -158,6 +679,13 @@ AK_TPS_Resolve(AK_TypeParserState previous, AK_TypeParserState new) {
     // if either are string, go to string
     if (previous == TPS_STRING || new == TPS_STRING) return TPS_STRING;
 
+    // datetime found with anything except empty or datetime is string
+    if (previous == TPS_DATETIME) {
+        if (new == TPS_EMPTY || new == TPS_DATETIME) return TPS_DATETIME;
+        return TPS_STRING;
+    }
+    if (new == TPS_DATETIME) return TPS_STRING; // previous is not empty
+
     // handle both new, previous bool directly
     if (previous == TPS_BOOL) {
         if (new == TPS_EMPTY || new == TPS_BOOL) return TPS_BOOL;
@@ -208,6 +736,9 @@ AK_TPS_ToDtype(AK_TypeParserState state) {
         case TPS_COMPLEX:
             dtype = PyArray_DescrNewFromType(NPY_COMPLEX128);
             break;
+        case TPS_DATETIME: // the unit is set by AK_TP_ToDtype
+            dtype = PyArray_DescrNewFromType(NPY_DATETIME);
+            break;
     }
     if (dtype == NULL) return NULL; // assume error is set by PyArray_DescrFromType
     return dtype;
@@ -240,6 +771,27 @@ typedef struct AK_TypeParser {
     Py_UCS4 tsep;
     Py_UCS4 decc;
 
+    // datetime inference, evaluated alongside the above
+    bool infer_datetime;
+    bool dt_active; // the field might still be a datetime
+    Py_ssize_t dt_len; // characters less leading space
+    int dt_value; // value of the current date or time component
+    int dt_year;
+    int dt_month;
+    NPY_DATETIMEUNIT dt_unit_field;
+    NPY_DATETIMEUNIT dt_unit_line; // the most precise unit observed
+
+    // downcast inference, evaluated alongside the above
+    bool downcast;
+    npy_uint64 dc_magnitude; // of the current field, accumulated for at most 18 digits
+    bool dc_negative;
+    Py_ssize_t dc_significant; // digits from the first to the last non-zero digit
+    Py_ssize_t dc_zeros; // zeros following the last non-zero digit
+    npy_int64 dc_min; // of integer fields
+    npy_int64 dc_max;
+    bool dc_int64; // an integer field might require 64 bits
+    bool dc_float32; // all numeric fields are represented by float32 without loss
+
 } AK_TypeParser;
 
 // Initialize all state. This returns no error. This is called once per field for each field in a code point line: this is why parsed_field is reset, but parsed_line is not.
@@ -267,15 +819,44 @@ AK_TP_reset_field(AK_TypeParser* tp)
 
     tp->parsed_field = TPS_UNKNOWN;
     // NOTE: do not reset parsed_line
+
+    tp->dt_active = tp->infer_datetime;
+    tp->dt_len = 0;
+    tp->dt_value = 0;
+    tp->dt_year = 0;
+    tp->dt_month = 0;
+    tp->dt_unit_field = NPY_FR_D; // the least precise unit inferred
+
+    tp->dc_magnitude = 0;
+    tp->dc_negative = false;
+    tp->dc_significant = 0;
+    tp->dc_zeros = 0;
+}
+
+// Initialize the resolved state of the line. This returns no error.
+static inline void
+AK_TP_reset_line(AK_TypeParser* tp)
+{
+    tp->parsed_line = TPS_UNKNOWN;
+    tp->dt_unit_line = NPY_FR_D;
+    tp->dc_min = NPY_MAX_INT64;
+    tp->dc_max = NPY_MIN_INT64;
+    tp->dc_int64 = false;
+    tp->dc_float32 = true;
 }
 
 static inline AK_TypeParser *
-AK_TP_New(Py_UCS4 tsep, Py_UCS4 decc)
+AK_TP_New(Py_UCS4 tsep, Py_UCS4 decc, bool infer_datetime)
 {
-    AK_TypeParser *tp = (AK_TypeParser*)PyMem_Malloc(sizeof(AK_TypeParser));
-    if (tp == NULL) return (AK_TypeParser*)PyErr_NoMemory();
+    AK_TypeParser *tp = (AK_TypeParser*)PyMem_RawMalloc(sizeof(AK_TypeParser));
+    if (tp == NULL) {
+        AK_WITH_GIL(PyErr_NoMemory());
+        return NULL;
+    }
+    tp->infer_datetime = infer_datetime;
+    tp->downcast = false;
     AK_TP_reset_field(tp);
-    tp->parsed_line = TPS_UNKNOWN;
+    AK_TP_reset_line(tp);
     tp->tsep = tsep; // take tsep into context for auto eval?
     tp->decc = decc;
     return tp;
@@ -284,14 +865,14 @@ AK_TP_New(Py_UCS4 tsep, Py_UCS4 decc)
 static inline void
 AK_TP_Free(AK_TypeParser* tp)
 {
-    PyMem_Free(tp);
+    PyMem_RawFree(tp);
 }
 
 //------------------------------------------------------------------------------
 
-// Given a type parse, process a single character and update the type parser state in `parsed_field`. Return true when processing should continue, false when no further processing is necessary. `pos` is the raw position within the current field.
+// Process a single character for the bool and numeric types, setting `parsed_field` to TPS_STRING when none of these types are possible. Returns true when processing should continue, false when no further processing is necessary. `pos` is the raw position within the current field.
 static inline bool
-AK_TP_ProcessChar(AK_TypeParser* tp,
+AK_TP_process_numeric(AK_TypeParser* tp,
         Py_UCS4 c,
         Py_ssize_t pos)
 {
@@ -478,6 +1059,107 @@ AK_TP_ProcessChar(AK_TypeParser* tp,
     return true; // continue processing
 }
 
+// Validate the datetime component that ends at `pos`, the position (less leading space) of the following separator or the end of the field. Returns false if the component is out of range.
+static inline bool
+AK_TP_datetime_close(AK_TypeParser* tp, Py_ssize_t pos)
+{
+    int value = tp->dt_value;
+    tp->dt_value = 0;
+    switch (pos) {
+        case 4:
+            tp->dt_year = value;
+            return true;
+        case 7:
+            tp->dt_month = value;
+            return value >= 1 && value <= 12;
+        case 10:
+            return value >= 1 && value <= AK_days_in_month(tp->dt_year, tp->dt_month);
+        case 13:
+            return value <= 23;
+        case 16:
+        case 19:
+            return value <= 59;
+    }
+    return true; // fractional seconds
+}
+
+// Process a single character against the ISO 8601 forms inferred as datetime64: YYYY-MM-DD, optionally followed by T or a space and HH, HH:MM, HH:MM:SS, or HH:MM:SS.f. Returns true while the field might still be a datetime.
+static inline bool
+AK_TP_process_datetime(AK_TypeParser* tp, Py_UCS4 c)
+{
+    Py_ssize_t pos = tp->dt_len;
+    if (pos == 0 && AK_is_space(c)) return true; // leading space
+    ++tp->dt_len;
+
+    switch (pos) {
+        case 4:
+        case 7:
+            return c == '-' && AK_TP_datetime_close(tp, pos);
+        case 10:
+            return (c == 'T' || c == ' ') && AK_TP_datetime_close(tp, pos);
+        case 13:
+        case 16:
+            return c == ':' && AK_TP_datetime_close(tp, pos);
+        case 19:
+            return c == '.' && AK_TP_datetime_close(tp, pos);
+    }
+    if (!AK_is_digit(c)) return false;
+    if (pos < 19) { // fractional seconds are not accumulated
+        tp->dt_value = tp->dt_value * 10 + (int)(c - '0');
+    }
+    return true;
+}
+
+// Process a single character for the integer range and decimal precision of numeric fields; called only while the field might be numeric. Cannot error.
+static inline void
+AK_TP_process_downcast(AK_TypeParser* tp, Py_UCS4 c)
+{
+    if (c == '-') {
+        tp->dc_negative = true;
+        return;
+    }
+    if (!AK_is_digit(c)) return;
+    int digit = (int)(c - '0');
+    if (tp->count_digit <= 18) {
+        tp->dc_magnitude = tp->dc_magnitude * 10 + digit;
+    }
+    if (digit != 0) {
+        tp->dc_significant += tp->dc_zeros + 1;
+        tp->dc_zeros = 0;
+    }
+    else if (tp->dc_significant) {
+        ++tp->dc_zeros;
+    }
+}
+
+// Given a type parse, process a single character and update the type parser state. Return true when processing should continue, false when no further processing is necessary. `pos` is the raw position within the current field.
+static inline bool
+AK_TP_ProcessChar(AK_TypeParser* tp,
+        Py_UCS4 c,
+        Py_ssize_t pos)
+{
+    if (tp->dt_active) {
+        tp->dt_active = AK_TP_process_datetime(tp, c);
+    }
+    if (tp->parsed_field == TPS_UNKNOWN) {
+        AK_TP_process_numeric(tp, c, pos);
+        if (tp->downcast) {
+            AK_TP_process_downcast(tp, c);
+        }
+    }
+    return tp->dt_active || tp->parsed_field == TPS_UNKNOWN;
+}
+
+// After all characters of a field are processed, return true if the field is a datetime, setting `dt_unit_field` to the unit that represents it without loss.
+static inline bool
+AK_TP_resolve_datetime(AK_TypeParser* tp)
+{
+    NPY_DATETIMEUNIT unit = AK_datetime64_unit_from_length(tp->dt_len);
+    if (unit == NPY_FR_ERROR) return false;
+    tp->dt_unit_field = unit;
+    return AK_TP_datetime_close(tp, tp->dt_len);
+}
+
 // This private function is used by AK_TP_ResolveLineResetField to evaluate the state of the AK_TypeParser and determine the resolved AK_TypeParserState.
 static inline AK_TypeParserState
 AK_TP_resolve_field(AK_TypeParser* tp,
@@ -485,6 +1167,8 @@ AK_TP_resolve_field(AK_TypeParser* tp,
 {
     if (count == 0) return TPS_EMPTY;
 
+    if (tp->dt_active && AK_TP_resolve_datetime(tp)) return TPS_DATETIME;
+
     // if parsed_field is known, return it
     if (tp->parsed_field != TPS_UNKNOWN) return tp->parsed_field;
 
@@ -586,6 +1270,35 @@ AK_TP_resolve_field(AK_TypeParser* tp,
     return TPS_STRING; // default
 }
 
+// Given the resolved state of the current field, update the integer range and float precision of the line. As decimal strings of at most six significant digits are recovered from float32 (FLT_DIG), float32 is used only when all fields have no more than six significant digits, no exponent, and no more than 30 digits, keeping values within the range of normal float32. Cannot error.
+static inline void
+AK_TP_downcast_field(AK_TypeParser* tp, AK_TypeParserState state)
+{
+    if (state == TPS_INT) {
+        if (tp->count_digit > 18) {
+            tp->dc_int64 = true;
+        }
+        else {
+            npy_int64 value = (npy_int64)tp->dc_magnitude;
+            if (tp->dc_negative) {
+                value = -value;
+            }
+            if (value < tp->dc_min) {
+                tp->dc_min = value;
+            }
+            if (value > tp->dc_max) {
+                tp->dc_max = value;
+            }
+        }
+    }
+    if (state == TPS_INT || state == TPS_FLOAT) {
+        if (tp->count_nan || tp->count_inf) return;
+        if (tp->count_e || tp->dc_significant > 6 || tp->count_digit > 30) {
+            tp->dc_float32 = false;
+        }
+    }
+}
+
 // After field is complete, call AK_TP_ResolveLineResetField to evaluate and set the current parsed_line. All TypeParse field attributes are reset after this is called. Returns true if the line still needs to be evaluated.
 static inline bool
 AK_TP_ResolveLineResetField(AK_TypeParser* tp,
@@ -593,414 +1306,167 @@ AK_TP_ResolveLineResetField(AK_TypeParser* tp,
 {
     if (tp->parsed_line != TPS_STRING) {
         // resolve with previous parsed_line (or unkown if just initialized)
-        tp->parsed_line = AK_TPS_Resolve(tp->parsed_line, AK_TP_resolve_field(tp, count));
+        AK_TypeParserState parsed_field = AK_TP_resolve_field(tp, count);
+        tp->parsed_line = AK_TPS_Resolve(tp->parsed_line, parsed_field);
+        if (tp->downcast) {
+            AK_TP_downcast_field(tp, parsed_field);
+        }
+        if (tp->dt_unit_field > tp->dt_unit_line) {
+            tp->dt_unit_line = tp->dt_unit_field;
+        }
     }
     AK_TP_reset_field(tp);
     // if string, return false to stop further line processing
     return tp->parsed_line != TPS_STRING;
 }
 
+// If downcasting, return the smallest type that represents all fields of the resolved line, or NPY_NOTYPE to use the default type. Cannot error.
+static inline int
+AK_TP_downcast_type(AK_TypeParser* tp)
+{
+    if (tp->parsed_line == TPS_INT && !tp->dc_int64) {
+        if (tp->dc_min >= NPY_MIN_INT8 && tp->dc_max <= NPY_MAX_INT8) return NPY_INT8;
+        if (tp->dc_min >= NPY_MIN_INT16 && tp->dc_max <= NPY_MAX_INT16) return NPY_INT16;
+        if (tp->dc_min >= NPY_MIN_INT32 && tp->dc_max <= NPY_MAX_INT32) return NPY_INT32;
+    }
+    else if (tp->parsed_line == TPS_FLOAT && tp->dc_float32) {
+        return NPY_FLOAT32;
+    }
+    return NPY_NOTYPE;
+}
+
+// Return a new dtype for the resolved line. Returns NULL on error.
+static inline PyArray_Descr *
+AK_TP_ToDtype(AK_TypeParser* tp)
+{
+    if (tp->downcast) {
+        int type = AK_TP_downcast_type(tp);
+        if (type != NPY_NOTYPE) return PyArray_DescrNewFromType(type);
+    }
+    PyArray_Descr *dtype = AK_TPS_ToDtype(tp->parsed_line);
+    if (dtype != NULL && tp->parsed_line == TPS_DATETIME) {
+        PyArray_DatetimeMetaData* dma = AK_datetime_meta(dtype);
+        dma->base = tp->dt_unit_line;
+        dma->num = 1;
+    }
+    return dtype;
+}
+
 //------------------------------------------------------------------------------
-// UCS4 array processors
+// Code point array processors
 
 static char * TRUE_LOWER = "true";
 static char * TRUE_UPPER = "TRUE";
+static char * FALSE_LOWER = "false";
+static char * FALSE_UPPER = "FALSE";
 
 #define AK_ERROR_NO_DIGITS 1
 #define AK_ERROR_OVERFLOW 2
 #define AK_ERROR_INVALID_CHARS 3
+#define AK_ERROR_DATETIME 5
 
-// Convert a Py_UCS4 array to a signed integer. Extended from pandas/_libs/src/parser/tokenizer.c. Sets `error` to values greater than 0 on error; never sets error on success.
-static inline npy_int64
-AK_UCS4_to_int64(Py_UCS4 *p_item, Py_UCS4 *end, int *error, char tsep)
-{
-    npy_int64 int_min = NPY_MIN_INT64;
-    npy_int64 int_max = NPY_MAX_INT64;
-    int isneg = 0;
-    npy_int64 number = 0;
-    int d;
+// Converters for each width of code point buffer, defined in a template
+#define AK_UCS_CHAR Py_UCS1
+#define AK_UCS_FUNC(name) AK_UCS1_##name
+# include "delimited_to_arrays_ucs.h"
 
-    Py_UCS4 *p = p_item;
+#define AK_UCS_CHAR Py_UCS2
+#define AK_UCS_FUNC(name) AK_UCS2_##name
+# include "delimited_to_arrays_ucs.h"
 
-    while (AK_is_space(*p)) {
-        ++p;
-        if (p >= end) return number; // NOTE: this means that all space will return zero without error
-    }
-    if (*p == '-') {
-        isneg = 1;
-        ++p;
-    } else if (*p == '+') {
-        ++p;
-    }
-    if (p >= end) return number;
+#define AK_UCS_CHAR Py_UCS4
+#define AK_UCS_FUNC(name) AK_UCS4_##name
+# include "delimited_to_arrays_ucs.h"
 
-    // Check that there is a first digit.
-    if (!AK_is_digit(*p)) {
-        *error = AK_ERROR_NO_DIGITS;
-        return 0;
-    }
-    if (isneg) {
-        // If number is greater than pre_min, at least one more digit can be processed without overflowing.
-        int dig_pre_min = -(int_min % 10);
-        npy_int64 pre_min = int_min / 10;
-        d = *p;
-        if (tsep != '\0') {
-            while (1) {
-                if (d == tsep) {
-                    ++p;
-                    if (p >= end) return number;
-                    d = *p;
-                    continue;
-                } else if (!AK_is_digit(d)) {
-                    break;
-                }
-                if ((number > pre_min) ||
-                    ((number == pre_min) && (d - '0' <= dig_pre_min))) {
-                    number = number * 10 - (d - '0');
-                    ++p;
-                    if (p >= end) return number;
-                    d = *p;
-                } else {
-                    *error = AK_ERROR_OVERFLOW;
-                    return 0;
-                }
-            }
-        } else {
-            while (AK_is_digit(d)) {
-                if ((number > pre_min) ||
-                    ((number == pre_min) && (d - '0' <= dig_pre_min))) {
-                    number = number * 10 - (d - '0');
-                    ++p;
-                    if (p >= end) return number;
-                    d = *p;
-                } else {
-                    *error = AK_ERROR_OVERFLOW;
-                    return 0;
-                }
-            }
-        }
-    } else {
-        // If number is less than pre_max, at least one more digit can be processed without overflowing.
-        npy_int64 pre_max = int_max / 10;
-        int dig_pre_max = int_max % 10;
-        d = *p;
-        if (tsep != '\0') {
-            while (1) {
-                if (d == tsep) {
-                    ++p;
-                    if (p >= end) return number;
-                    d = *p;
-                    continue;
-                } else if (!AK_is_digit(d)) {
-                    break;
-                }
-                if ((number < pre_max) ||
-                    ((number == pre_max) && (d - '0' <= dig_pre_max))) {
-                    number = number * 10 + (d - '0');
-                    ++p;
-                    if (p >= end) return number;
-                    d = *p;
-                } else {
-                    *error = AK_ERROR_OVERFLOW;
-                    return 0;
-                }
-            }
-        } else {
-            while (AK_is_digit(d)) {
-                if ((number < pre_max) ||
-                    ((number == pre_max) && (d - '0' <= dig_pre_max))) {
-                    number = number * 10 + (d - '0');
-                    ++p;
-                    if (p >= end) return number;
-                    d = *p;
-                } else {
-                    *error = AK_ERROR_OVERFLOW;
-                    return 0;
-                }
-            }
-        }
-    }
-    while (p < end) {
-        if (!AK_is_space(*p)) {
-            *error = AK_ERROR_INVALID_CHARS;
-            return 0;
-        }
-        p++;
-    }
-    return number;
-}
-
-// Convert a Py_UCS4 array to an unsigned integer. Extended from pandas/_libs/src/parser/tokenizer.c. Sets error to > 0 on error; never sets error on success.
-static inline npy_uint64
-AK_UCS4_to_uint64(Py_UCS4 *p_item, Py_UCS4 *end, int *error, char tsep)
-{
-    npy_uint64 pre_max = NPY_MAX_UINT64 / 10;
-    npy_uint64 number = 0;
-    int dig_pre_max = NPY_MAX_UINT64 % 10;
-    int d;
+//------------------------------------------------------------------------------
+// AK_NAValues, used by CPL
 
-    Py_UCS4 *p = p_item;
-    while (AK_is_space(*p)) {
-        ++p;
-        if (p >= end) return number;
-    }
-    if (*p == '-') {
-        *error = AK_ERROR_INVALID_CHARS;
-        return 0;
-    } else if (*p == '+') {
-        p++;
-        if (p >= end) return number;
-    }
+// Tokens that denote a missing value when matching all characters of a field. As candidate tokens are tracked in a bit mask while a field is loaded, at most 64 tokens are permitted.
+typedef struct AK_NAValues {
+    Py_ssize_t count;
+    Py_UCS4 **tokens;
+    Py_ssize_t *lengths;
+    npy_uint64 candidates; // a bit set for each token
+} AK_NAValues;
 
-    // Check that there is a first digit.
-    if (!AK_is_digit(*p)) {
-        *error = AK_ERROR_NO_DIGITS;
-        return 0;
-    }
-    // If number is less than pre_max, at least one more digit can be processed without overflowing.
-    d = *p;
-    if (tsep != '\0') {
-        while (1) {
-            if (d == tsep) {
-                ++p;
-                if (p >= end) return number;
-                d = *p;
-                continue;
-            } else if (!AK_is_digit(d)) {
-                break;
-            }
-            if ((number < pre_max) ||
-                ((number == pre_max) && (d - '0' <= dig_pre_max))) {
-                number = number * 10 + (d - '0');
-                ++p;
-                if (p >= end) return number;
-                d = *p;
-            } else {
-                *error = AK_ERROR_OVERFLOW;
-                return 0;
-            }
-        }
-    } else {
-        while (AK_is_digit(d)) {
-            if ((number < pre_max) ||
-                ((number == pre_max) && (d - '0' <= dig_pre_max))) {
-                number = number * 10 + (d - '0');
-                ++p;
-                if (p >= end) return number;
-                d = *p;
-            } else {
-                *error = AK_ERROR_OVERFLOW;
-                return 0;
-            }
-        }
-    }
-    while (p < end) {
-        if (!AK_is_space(*p)) {
-            *error = AK_ERROR_INVALID_CHARS;
-            return 0;
-        }
-        p++;
+static inline void
+AK_NAValues_Free(AK_NAValues *na)
+{
+    if (na == NULL) return;
+    for (Py_ssize_t i = 0; i < na->count; ++i) {
+        PyMem_Free(na->tokens[i]);
     }
-    return number;
+    PyMem_Free(na->tokens);
+    PyMem_Free(na->lengths);
+    PyMem_Free(na);
 }
 
-// Based on precise_xstrtod from pandas/_libs/src/parser/tokenizer.c.
-static inline npy_float64
-AK_UCS4_to_float64(Py_UCS4 *p_item, Py_UCS4 *end, int *error, char tsep, char decc)
-{
-    // Cache powers of 10 in memory.
-    npy_float64 e[] = {
-        1.,    1e1,   1e2,   1e3,   1e4,   1e5,   1e6,   1e7,   1e8,   1e9,
-        1e10,  1e11,  1e12,  1e13,  1e14,  1e15,  1e16,  1e17,  1e18,  1e19,
-        1e20,  1e21,  1e22,  1e23,  1e24,  1e25,  1e26,  1e27,  1e28,  1e29,
-        1e30,  1e31,  1e32,  1e33,  1e34,  1e35,  1e36,  1e37,  1e38,  1e39,
-        1e40,  1e41,  1e42,  1e43,  1e44,  1e45,  1e46,  1e47,  1e48,  1e49,
-        1e50,  1e51,  1e52,  1e53,  1e54,  1e55,  1e56,  1e57,  1e58,  1e59,
-        1e60,  1e61,  1e62,  1e63,  1e64,  1e65,  1e66,  1e67,  1e68,  1e69,
-        1e70,  1e71,  1e72,  1e73,  1e74,  1e75,  1e76,  1e77,  1e78,  1e79,
-        1e80,  1e81,  1e82,  1e83,  1e84,  1e85,  1e86,  1e87,  1e88,  1e89,
-        1e90,  1e91,  1e92,  1e93,  1e94,  1e95,  1e96,  1e97,  1e98,  1e99,
-        1e100, 1e101, 1e102, 1e103, 1e104, 1e105, 1e106, 1e107, 1e108, 1e109,
-        1e110, 1e111, 1e112, 1e113, 1e114, 1e115, 1e116, 1e117, 1e118, 1e119,
-        1e120, 1e121, 1e122, 1e123, 1e124, 1e125, 1e126, 1e127, 1e128, 1e129,
-        1e130, 1e131, 1e132, 1e133, 1e134, 1e135, 1e136, 1e137, 1e138, 1e139,
-        1e140, 1e141, 1e142, 1e143, 1e144, 1e145, 1e146, 1e147, 1e148, 1e149,
-        1e150, 1e151, 1e152, 1e153, 1e154, 1e155, 1e156, 1e157, 1e158, 1e159,
-        1e160, 1e161, 1e162, 1e163, 1e164, 1e165, 1e166, 1e167, 1e168, 1e169,
-        1e170, 1e171, 1e172, 1e173, 1e174, 1e175, 1e176, 1e177, 1e178, 1e179,
-        1e180, 1e181, 1e182, 1e183, 1e184, 1e185, 1e186, 1e187, 1e188, 1e189,
-        1e190, 1e191, 1e192, 1e193, 1e194, 1e195, 1e196, 1e197, 1e198, 1e199,
-        1e200, 1e201, 1e202, 1e203, 1e204, 1e205, 1e206, 1e207, 1e208, 1e209,
-        1e210, 1e211, 1e212, 1e213, 1e214, 1e215, 1e216, 1e217, 1e218, 1e219,
-        1e220, 1e221, 1e222, 1e223, 1e224, 1e225, 1e226, 1e227, 1e228, 1e229,
-        1e230, 1e231, 1e232, 1e233, 1e234, 1e235, 1e236, 1e237, 1e238, 1e239,
-        1e240, 1e241, 1e242, 1e243, 1e244, 1e245, 1e246, 1e247, 1e248, 1e249,
-        1e250, 1e251, 1e252, 1e253, 1e254, 1e255, 1e256, 1e257, 1e258, 1e259,
-        1e260, 1e261, 1e262, 1e263, 1e264, 1e265, 1e266, 1e267, 1e268, 1e269,
-        1e270, 1e271, 1e272, 1e273, 1e274, 1e275, 1e276, 1e277, 1e278, 1e279,
-        1e280, 1e281, 1e282, 1e283, 1e284, 1e285, 1e286, 1e287, 1e288, 1e289,
-        1e290, 1e291, 1e292, 1e293, 1e294, 1e295, 1e296, 1e297, 1e298, 1e299,
-        1e300, 1e301, 1e302, 1e303, 1e304, 1e305, 1e306, 1e307, 1e308};
-
-    npy_float64 number = 0.0;
-    int exponent = 0;
-    bool negative_base = false;
-    bool negative_e = false;
-
-    int num_digits = 0;
-    int max_digits = 17;
-    int n = 0;
-
-    Py_UCS4 *p = p_item;
-    while (AK_is_space(*p)) {
-        ++p;
-        if (p >= end) return number;
-    }
-    switch (*p) {
-        case '-':
-            negative_base = true;
-            // fall through
-        case '+':
-            p++;
-            if (p >= end) return number; // nothing to do with sign
-    }
-    // check for inf, nan
-    if (AK_is_i(*p)) {
-        p++;
-        if (p >= end) goto error;
-        if (AK_is_n(*p)) {
-            p++;
-            if (p >= end) goto error;
-            if (AK_is_f(*p)) {
-                p++;
-                while (p < end) {
-                    if (!AK_is_space(*p++)) goto error;
-                }
-                if (negative_base) return -NPY_INFINITY;
-                return NPY_INFINITY;
-            }
-        }
-        goto error; // matched i but nothing else
-    }
-    else if (AK_is_n(*p)) {
-        p++;
-        if (p >= end) goto error;
-        if (AK_is_a(*p)) {
-            p++;
-            if (p >= end) goto error;
-            if (AK_is_n(*p)) {
-                p++;
-                while (p < end) {
-                    if (!AK_is_space(*p++)) goto error;
-                }
-                return NPY_NAN;
-            }
-        }
-        goto error; // matched n but nothing else
+// Set `target` to a new AK_NAValues from `src`, an iterable of strings; empty strings are ignored, as empty fields are always missing. If `src` is NULL or None, `target` is set to NULL. Returns -1 on error.
+static inline int
+AK_set_na_values(AK_NAValues **target, PyObject *src)
+{
+    *target = NULL;
+    if (src == NULL || src == Py_None) return 0;
+    if (PyUnicode_Check(src)) {
+        PyErr_SetString(PyExc_TypeError, "na_values must be an iterable of strings");
+        return -1;
     }
-    while (AK_is_digit(*p)) {
-        if (num_digits < max_digits) {
-            number = number * 10. + (*p - '0');
-            num_digits++;
-        } else {
-            ++exponent;
-        }
-        p++;
-        if (p >= end) goto exit;
-        if (tsep != '\0' && *p == (Py_UCS4)tsep) {
-            ++p;
-            if (p >= end) goto exit;
-        }
+    PyObject *seq = PySequence_Fast(src, "na_values must be an iterable of strings");
+    if (seq == NULL) return -1;
+    Py_ssize_t size = PySequence_Fast_GET_SIZE(seq);
+    if (size > 64) {
+        PyErr_SetString(PyExc_ValueError, "na_values must have at most 64 values");
+        Py_DECREF(seq);
+        return -1;
     }
-
-    if (*p == (Py_UCS4)decc) {
-        p++;
-        if (p >= end) goto exit;
-
-        while (num_digits < max_digits && AK_is_digit(*p)) {
-            number = number * 10. + (*p - '0');
-            num_digits++;
-            exponent--;
-            p++;
-            if (p >= end) goto exit;
-        }
-        if (num_digits >= max_digits)  // Consume extra decimal digits.
-            while (AK_is_digit(*p)) {
-                ++p;
-                if (p >= end) goto exit;
-            }
+    AK_NAValues *na = (AK_NAValues*)PyMem_Malloc(sizeof(AK_NAValues));
+    if (na == NULL) {
+        Py_DECREF(seq);
+        PyErr_NoMemory();
+        return -1;
     }
-    if (num_digits == 0) {
-        *error = ERANGE;
-        return 0.0;
+    na->count = 0;
+    na->candidates = 0;
+    na->tokens = (Py_UCS4**)PyMem_Malloc(sizeof(Py_UCS4*) * (size > 0 ? size : 1));
+    na->lengths = (Py_ssize_t*)PyMem_Malloc(sizeof(Py_ssize_t) * (size > 0 ? size : 1));
+    if (na->tokens == NULL || na->lengths == NULL) {
+        PyErr_NoMemory();
+        goto error;
     }
-    if (AK_is_e(*p)) {
-        ++p;
-        if (p >= end) goto exit;
-
-        switch (*p) {
-            case '-':
-                negative_e = true;
-                // fall through
-            case '+':
-                p++;
-                if (p >= end) goto exit; // sign is not used
+    PyObject **items = PySequence_Fast_ITEMS(seq);
+    for (Py_ssize_t i = 0; i < size; ++i) {
+        if (!PyUnicode_Check(items[i])) {
+            PyErr_SetString(PyExc_TypeError, "na_values must be an iterable of strings");
+            goto error;
         }
-        num_digits = 0; // reset
-        while (num_digits < max_digits && AK_is_digit(*p)) {
-            n = n * 10 + (*p - '0');
-            num_digits++;
-            p++;
-            if (p >= end) goto exit;
-        }
-    }
-    // if we have anything but space trailing, error
-    while (p < end) {
-        if (!AK_is_space(*p++)) goto error;
-    }
-exit:
-    if (negative_base) number = -number;
-    // n will be zero if no E found
-    if (negative_e) {
-        exponent -= n;
-    }
-    else {
-        exponent += n;
-    }
-    // AK_DEBUG_MSG_OBJ("at exit", PyLong_FromLong(exponent));
-    // done with p at this point
-    if (exponent > 308) {
-        *error = ERANGE;
-        return HUGE_VAL;
-    } else if (exponent > 0) {
-        number *= e[exponent];
-    } else if (exponent < -308) {  // Subnormal
-        if (exponent < -616) {  // Prevent invalid array access.
-            number = 0.;
-        } else {
-            number /= e[-308 - exponent];
-            number /= e[308];
-        }
-    } else {
-        number /= e[-exponent];
-    }
-
-    if (number == HUGE_VAL || number == -HUGE_VAL) *error = ERANGE;
-    return number;
+        Py_ssize_t length = PyUnicode_GET_LENGTH(items[i]);
+        if (length == 0) continue;
+        Py_UCS4 *token = PyUnicode_AsUCS4Copy(items[i]);
+        if (token == NULL) goto error;
+        na->candidates |= (npy_uint64)1 << na->count;
+        na->tokens[na->count] = token;
+        na->lengths[na->count++] = length;
+    }
+    Py_DECREF(seq);
+    *target = na;
+    return 0;
 error:
-    *error = 1;
-    return number;
+    Py_DECREF(seq);
+    AK_NAValues_Free(na);
+    return -1;
 }
 
 //------------------------------------------------------------------------------
 // CodePointLine
 
-// An AK_CodePointLine stores a contiguous buffer of Py_UCS4 without null terminators between fields. Separately, we store an array of integers, where each integer is the size of each field. The total number of fields is given by offset_count.
+// An AK_CodePointLine stores a contiguous buffer of code points without null terminators between fields. Separately, we store an array of integers, where each integer is the size of each field. The total number of fields is given by offset_count. As with PyUnicode objects, the buffer stores code points in the narrowest width (1, 2, or 4 bytes, given by `kind`) that fits all points; the buffer starts with 1-byte points and is widened when a wider point is appended.
 typedef struct AK_CodePointLine{
     // NOTE: should these be unsigned int types, like Py_uintptr_t?
     Py_ssize_t buffer_count; // accumulated number of code points
     Py_ssize_t buffer_capacity; // max number of code points
-    Py_UCS4 *buffer;
+    char *buffer;
+    int kind; // bytes per code point: PyUnicode_1BYTE_KIND, PyUnicode_2BYTE_KIND, or PyUnicode_4BYTE_KIND
+    Py_UCS4 kind_max; // max code point storable with kind
 
     Py_ssize_t offsets_count; // accumulated number of elements, never reset
     Py_ssize_t offsets_capacity; // max number of elements
@@ -1008,36 +1474,51 @@ typedef struct AK_CodePointLine{
     Py_ssize_t offset_max; // observe max offset found across all
 
     // these can be reset
-    Py_UCS4 *buffer_current_ptr;
+    char *buffer_current_ptr;
     Py_ssize_t offsets_current_index;
 
     AK_TypeParser *type_parser;
     bool type_parser_field_active;
     bool type_parser_line_active;
+    Py_ssize_t infer_rows; // if greater than 0, stop type parsing once this many fields settle the type
+    bool type_parser_sampled; // type parsing stopped before all fields were evaluated
+    bool type_only; // code points and offsets are not stored; only the type, count, and max offset are evaluated
+
+    AK_NAValues *na_values; // if not NULL, fields matching a token are stored as empty; borrowed
+    npy_uint64 na_candidates; // a bit set for each token the current field might match
 
+    Py_ssize_t *errors; // if not NULL, positions of fields that failed conversion and were written as null
+    Py_ssize_t errors_count;
 } AK_CodePointLine;
 
 // Returns NULL on error.
 static inline AK_CodePointLine *
-AK_CPL_New(bool type_parse, Py_UCS4 tsep, Py_UCS4 decc)
+AK_CPL_New(bool type_parse, Py_UCS4 tsep, Py_UCS4 decc, bool infer_datetime)
 {
-    AK_CodePointLine *cpl = (AK_CodePointLine*)PyMem_Malloc(sizeof(AK_CodePointLine));
-    if (cpl == NULL) return (AK_CodePointLine*)PyErr_NoMemory();
+    AK_CodePointLine *cpl = (AK_CodePointLine*)PyMem_RawMalloc(sizeof(AK_CodePointLine));
+    if (cpl == NULL) {
+        AK_WITH_GIL(PyErr_NoMemory());
+        return NULL;
+    }
 
     cpl->buffer_count = 0;
     cpl->buffer_capacity =  16384; // 2048;
-    cpl->buffer = (Py_UCS4*)PyMem_Malloc(UCS4_SIZE * cpl->buffer_capacity);
+    cpl->kind = PyUnicode_1BYTE_KIND;
+    cpl->kind_max = 0xFF;
+    cpl->buffer = (char*)PyMem_RawMalloc(cpl->buffer_capacity);
     if (cpl->buffer == NULL) {
-        PyMem_Free(cpl);
-        return (AK_CodePointLine*)PyErr_NoMemory();
+        PyMem_RawFree(cpl);
+        AK_WITH_GIL(PyErr_NoMemory());
+        return NULL;
     }
     cpl->offsets_count = 0;
     cpl->offsets_capacity = 2048; // 16384; // 2048;
-    cpl->offsets = (Py_ssize_t*)PyMem_Malloc(sizeof(Py_ssize_t) * cpl->offsets_capacity);
+    cpl->offsets = (Py_ssize_t*)PyMem_RawMalloc(sizeof(Py_ssize_t) * cpl->offsets_capacity);
     if (cpl->offsets == NULL) {
-        PyMem_Free(cpl->buffer);
-        PyMem_Free(cpl);
-        return (AK_CodePointLine*)PyErr_NoMemory();
+        PyMem_RawFree(cpl->buffer);
+        PyMem_RawFree(cpl);
+        AK_WITH_GIL(PyErr_NoMemory());
+        return NULL;
     }
     cpl->buffer_current_ptr = cpl->buffer;
     cpl->offsets_current_index = 0; // position in offsets
@@ -1045,11 +1526,11 @@ AK_CPL_New(bool type_parse, Py_UCS4 tsep, Py_UCS4 decc)
 
     // optional, dynamic values
     if (type_parse) {
-        cpl->type_parser = AK_TP_New(tsep, decc);
+        cpl->type_parser = AK_TP_New(tsep, decc, infer_datetime);
         if (cpl->type_parser == NULL) {
-            PyMem_Free(cpl->offsets);
-            PyMem_Free(cpl->buffer);
-            PyMem_Free(cpl);
+            PyMem_RawFree(cpl->offsets);
+            PyMem_RawFree(cpl->buffer);
+            PyMem_RawFree(cpl);
             return NULL; // exception already set
         }
         cpl->type_parser_field_active = true;
@@ -1060,18 +1541,26 @@ AK_CPL_New(bool type_parse, Py_UCS4 tsep, Py_UCS4 decc)
         cpl->type_parser_field_active = false;
         cpl->type_parser_line_active = false;
     }
+    cpl->infer_rows = 0;
+    cpl->type_parser_sampled = false;
+    cpl->type_only = false;
+    cpl->na_values = NULL;
+    cpl->na_candidates = 0;
+    cpl->errors = NULL;
+    cpl->errors_count = 0;
     return cpl;
 }
 
 static inline void
 AK_CPL_Free(AK_CodePointLine* cpl)
 {
-    PyMem_Free(cpl->buffer);
-    PyMem_Free(cpl->offsets);
+    PyMem_RawFree(cpl->buffer);
+    PyMem_RawFree(cpl->offsets);
     if (cpl->type_parser) {
-        PyMem_Free(cpl->type_parser);
+        PyMem_RawFree(cpl->type_parser);
     }
-    PyMem_Free(cpl);
+    PyMem_RawFree(cpl->errors); // might be NULL
+    PyMem_RawFree(cpl);
 }
 
 //------------------------------------------------------------------------------
@@ -1085,13 +1574,54 @@ AK_CPL_resize_buffer(AK_CodePointLine* cpl, Py_ssize_t increment) {
         while (cpl->buffer_capacity < target) {
             cpl->buffer_capacity <<= 1;
         }
-        cpl->buffer = PyMem_Realloc(cpl->buffer,
-                UCS4_SIZE * cpl->buffer_capacity);
+        cpl->buffer = PyMem_RawRealloc(cpl->buffer,
+                cpl->kind * cpl->buffer_capacity);
         if (cpl->buffer == NULL) {
+            AK_WITH_GIL(PyErr_NoMemory());
             return -1;
         }
-        cpl->buffer_current_ptr = cpl->buffer + cpl->buffer_count;
+        cpl->buffer_current_ptr = cpl->buffer + cpl->kind * cpl->buffer_count;
+    }
+    return 0;
+}
+
+// Copy `count` code points from `src` of width `src_kind` to `dst` of width `dst_kind`; `dst_kind` must be greater than or equal to `src_kind`, or all points must fit `dst_kind`. Cannot error.
+static inline void
+AK_UCS_copy(int dst_kind, void *dst, int src_kind, const void *src, Py_ssize_t count)
+{
+    if (dst_kind == src_kind) {
+        memcpy(dst, src, count * dst_kind);
+        return;
+    }
+    for (Py_ssize_t i = 0; i < count; ++i) {
+        PyUnicode_WRITE(dst_kind, dst, i, PyUnicode_READ(src_kind, src, i));
+    }
+}
+
+// Widen the buffer such that code point `p` can be stored; all stored points are converted to the new width. Returns 0 on success, -1 on failure.
+static inline int
+AK_CPL_widen(AK_CodePointLine* cpl, Py_UCS4 p) {
+    int kind;
+    Py_UCS4 kind_max;
+    if (p <= 0xFFFF) {
+        kind = PyUnicode_2BYTE_KIND;
+        kind_max = 0xFFFF;
     }
+    else {
+        kind = PyUnicode_4BYTE_KIND;
+        kind_max = 0x10FFFF;
+    }
+    char *buffer = (char*)PyMem_RawMalloc(kind * cpl->buffer_capacity);
+    if (buffer == NULL) {
+        AK_WITH_GIL(PyErr_NoMemory());
+        return -1;
+    }
+    AK_UCS_copy(kind, buffer, cpl->kind, cpl->buffer, cpl->buffer_count);
+    PyMem_RawFree(cpl->buffer);
+    cpl->buffer = buffer;
+    cpl->kind = kind;
+    cpl->kind_max = kind_max;
+    cpl->buffer_current_ptr = cpl->buffer + kind * cpl->buffer_count;
     return 0;
 }
 
@@ -1102,9 +1632,10 @@ AK_CPL_resize_offsets(AK_CodePointLine* cpl) {
     if (AK_UNLIKELY(cpl->offsets_count == cpl->offsets_capacity)) {
         // realloc
         cpl->offsets_capacity <<= 1;
-        cpl->offsets = PyMem_Realloc(cpl->offsets,
+        cpl->offsets = PyMem_RawRealloc(cpl->offsets,
                 sizeof(Py_ssize_t) * cpl->offsets_capacity);
         if (cpl->offsets == NULL) {
+            AK_WITH_GIL(PyErr_NoMemory());
             return -1;
         }
     }
@@ -1119,32 +1650,34 @@ AK_CPL_AppendField(AK_CodePointLine* cpl, PyObject* field)
         PyErr_SetString(PyExc_TypeError, "elements must be strings");
         return -1;
     }
+    if (PyUnicode_READY(field) == -1) return -1;
     Py_ssize_t element_length = PyUnicode_GET_LENGTH(field);
+    int field_kind = PyUnicode_KIND(field);
+    const void *field_data = PyUnicode_DATA(field);
 
+    Py_UCS4 field_max = PyUnicode_MAX_CHAR_VALUE(field);
+    if (field_max > cpl->kind_max && AK_CPL_widen(cpl, field_max)) {
+        return -1;
+    }
     // if we cannot fit field length, resize
     if (AK_CPL_resize_buffer(cpl, element_length)) {
         return -1;
     }
-
     // we write the field directly into the CPL buffer
-    if(PyUnicode_AsUCS4(field,
+    AK_UCS_copy(cpl->kind,
             cpl->buffer_current_ptr,
-            cpl->buffer + cpl->buffer_capacity - cpl->buffer_current_ptr,
-            0) == NULL) { // last zero means do not copy null
-        return -1;
-    }
+            field_kind,
+            field_data,
+            element_length);
+
     // if type parsing has been enabled, we must process each char
     if (cpl->type_parser && cpl->type_parser_line_active) {
-        Py_UCS4* p = cpl->buffer_current_ptr;
-        Py_UCS4 *end = p + element_length;
-        Py_ssize_t pos = 0;
-        for (; p < end; ++p) {
+        for (Py_ssize_t pos = 0; pos < element_length; ++pos) {
             cpl->type_parser_field_active = AK_TP_ProcessChar(
                     cpl->type_parser,
-                    *p,
+                    PyUnicode_READ(field_kind, field_data, pos),
                     pos);
             if (!cpl->type_parser_field_active) break;
-            ++pos;
         }
         cpl->type_parser_line_active = AK_TP_ResolveLineResetField(cpl->type_parser, element_length);
         cpl->type_parser_field_active = true; // turn back on for next field
@@ -1154,7 +1687,7 @@ AK_CPL_AppendField(AK_CodePointLine* cpl, PyObject* field)
     if (AK_CPL_resize_offsets(cpl)) return -1;
     cpl->offsets[cpl->offsets_count++] = element_length;
     cpl->buffer_count += element_length;
-    cpl->buffer_current_ptr += element_length; // add to pointer
+    cpl->buffer_current_ptr += cpl->kind * element_length; // add to pointer
 
     if (element_length > cpl->offset_max) {
         cpl->offset_max = element_length;
@@ -1162,6 +1695,34 @@ AK_CPL_AppendField(AK_CodePointLine* cpl, PyObject* field)
     return 0;
 }
 
+// Given the point at `pos` of the current field, clear the bit of each token the field no longer matches. Cannot error.
+static inline void
+AK_CPL_na_process(AK_CodePointLine* cpl, Py_UCS4 p, Py_ssize_t pos)
+{
+    AK_NAValues *na = cpl->na_values;
+    npy_uint64 candidates = cpl->na_candidates;
+    for (Py_ssize_t i = 0; i < na->count; ++i) {
+        npy_uint64 bit = (npy_uint64)1 << i;
+        if ((candidates & bit) && (pos >= na->lengths[i] || na->tokens[i][pos] != p)) {
+            candidates &= ~bit;
+        }
+    }
+    cpl->na_candidates = candidates;
+}
+
+// Return true if the current field, of `offset` points, matches a token. Cannot error.
+static inline bool
+AK_CPL_na_match(AK_CodePointLine* cpl, Py_ssize_t offset)
+{
+    AK_NAValues *na = cpl->na_values;
+    for (Py_ssize_t i = 0; i < na->count; ++i) {
+        if ((cpl->na_candidates & ((npy_uint64)1 << i)) && na->lengths[i] == offset) {
+            return true;
+        }
+    }
+    return false;
+}
+
 // Add a single point (or character) to a line. This does not update offsets. This is valid when updating a character. Returns 0 on success, -1 on error.
 static inline int
 AK_CPL_AppendPoint(AK_CodePointLine* cpl,
@@ -1169,8 +1730,14 @@ AK_CPL_AppendPoint(AK_CodePointLine* cpl,
         Py_ssize_t pos)
 {
     // based on buffer_count, resize if we cannot fit one more character
-    if (AK_CPL_resize_buffer(cpl, 1)) return -1;
+    if (!cpl->type_only) {
+        if (AK_CPL_resize_buffer(cpl, 1)) return -1;
+        if (AK_UNLIKELY(p > cpl->kind_max) && AK_CPL_widen(cpl, p)) return -1;
+    }
 
+    if (cpl->na_candidates) {
+        AK_CPL_na_process(cpl, p, pos);
+    }
     // type_parser might not be active if we already know the dtype
     if (cpl->type_parser
             && cpl->type_parser_line_active
@@ -1180,17 +1747,70 @@ AK_CPL_AppendPoint(AK_CodePointLine* cpl,
                 p,
                 pos);
     }
-    *cpl->buffer_current_ptr++ = p;
+    if (cpl->type_only) return 0;
+
+    switch (cpl->kind) {
+        case PyUnicode_1BYTE_KIND:
+            *(Py_UCS1*)cpl->buffer_current_ptr = (Py_UCS1)p;
+            break;
+        case PyUnicode_2BYTE_KIND:
+            *(Py_UCS2*)cpl->buffer_current_ptr = (Py_UCS2)p;
+            break;
+        default:
+            *(Py_UCS4*)cpl->buffer_current_ptr = p;
+    }
+    cpl->buffer_current_ptr += cpl->kind;
     ++cpl->buffer_count;
     return 0;
 }
 
+// Add `count` 1-byte points of a field, starting at position 0, to a line; this is equivalent to calling AK_CPL_AppendPoint with each point, but the buffer is resized once and the points are copied at once. This does not update offsets. Returns 0 on success, -1 on error.
+static inline int
+AK_CPL_AppendPoints(AK_CodePointLine* cpl,
+        const Py_UCS1 *p,
+        Py_ssize_t count)
+{
+    for (Py_ssize_t pos = 0; pos < count && cpl->na_candidates; ++pos) {
+        AK_CPL_na_process(cpl, p[pos], pos);
+    }
+    if (cpl->type_parser
+            && cpl->type_parser_line_active
+            && cpl->type_parser_field_active) {
+        for (Py_ssize_t pos = 0; pos < count; ++pos) {
+            if (!AK_TP_ProcessChar(cpl->type_parser, p[pos], pos)) {
+                cpl->type_parser_field_active = false;
+                break;
+            }
+        }
+    }
+    if (cpl->type_only) return 0;
+
+    if (AK_CPL_resize_buffer(cpl, count)) return -1;
+    // all 1-byte points fit any kind
+    AK_UCS_copy(cpl->kind, cpl->buffer_current_ptr, PyUnicode_1BYTE_KIND, p, count);
+    cpl->buffer_current_ptr += cpl->kind * count;
+    cpl->buffer_count += count;
+    return 0;
+}
+
 // Append to offsets. This does not update buffer lines. This is called when closing a field. Return -1 on failure, 0 on success.
 static inline int
 AK_CPL_AppendOffset(AK_CodePointLine* cpl, Py_ssize_t offset)
 {
     // this will update cpl->offsets if necessary
-    if (AK_CPL_resize_offsets(cpl)) return -1;
+    if (!cpl->type_only && AK_CPL_resize_offsets(cpl)) return -1;
+
+    if (cpl->na_values) {
+        // a field matching a token is stored as an empty field, such that it is parsed and converted as empty
+        if (cpl->na_candidates && AK_CPL_na_match(cpl, offset)) {
+            if (!cpl->type_only) {
+                cpl->buffer_current_ptr -= offset * cpl->kind;
+                cpl->buffer_count -= offset;
+            }
+            offset = 0;
+        }
+        cpl->na_candidates = cpl->na_values->candidates;
+    }
 
     if (cpl->type_parser && cpl->type_parser_line_active) {
         // when we resolve the line, we might determine that no further line processing is necessary
@@ -1199,15 +1819,83 @@ AK_CPL_AppendOffset(AK_CodePointLine* cpl, Py_ssize_t offset)
                 offset);
         // NOTE: always turn on for next field; we choose not to check type_parser_line_active
         cpl->type_parser_field_active = true;
+        // if sampling, stop once enough fields have been evaluated and at least one was not empty; conversion verifies the type of the remaining fields
+        if (cpl->infer_rows > 0
+                && cpl->offsets_count + 1 >= cpl->infer_rows
+                && cpl->type_parser_line_active
+                && cpl->type_parser->parsed_line != TPS_EMPTY) {
+            cpl->type_parser_line_active = false;
+            cpl->type_parser_sampled = true;
+            // as narrower types would truncate values not sampled, do not downcast
+            cpl->type_parser->dc_int64 = true;
+            cpl->type_parser->dc_float32 = false;
+        }
     }
     // increment offset_count after assignment so we can grow if needed next time
-    cpl->offsets[cpl->offsets_count++] = offset;
+    if (!cpl->type_only) {
+        cpl->offsets[cpl->offsets_count] = offset;
+    }
+    ++cpl->offsets_count;
     if (offset > cpl->offset_max) {
         cpl->offset_max = offset;
     }
     return 0;
 }
 
+// Append all fields of `other` to `cpl`, resolving the type parser states of both; `other` is not modified. Used to merge lines parsed from separate regions of the same input. Returns 0 on success, -1 on error.
+static inline int
+AK_CPL_Extend(AK_CodePointLine* cpl, AK_CodePointLine* other)
+{
+    if (other->kind > cpl->kind && AK_CPL_widen(cpl, other->kind_max)) return -1;
+    if (AK_CPL_resize_buffer(cpl, other->buffer_count)) return -1;
+    AK_UCS_copy(cpl->kind,
+            cpl->buffer_current_ptr,
+            other->kind,
+            other->buffer,
+            other->buffer_count);
+    cpl->buffer_count += other->buffer_count;
+    cpl->buffer_current_ptr += cpl->kind * other->buffer_count;
+
+    Py_ssize_t target = cpl->offsets_count + other->offsets_count;
+    if (target > cpl->offsets_capacity) {
+        while (cpl->offsets_capacity < target) {
+            cpl->offsets_capacity <<= 1;
+        }
+        cpl->offsets = PyMem_RawRealloc(cpl->offsets,
+                sizeof(Py_ssize_t) * cpl->offsets_capacity);
+        if (cpl->offsets == NULL) {
+            PyErr_NoMemory();
+            return -1;
+        }
+    }
+    memcpy(cpl->offsets + cpl->offsets_count,
+            other->offsets,
+            sizeof(Py_ssize_t) * other->offsets_count);
+    cpl->offsets_count = target;
+    if (other->offset_max > cpl->offset_max) {
+        cpl->offset_max = other->offset_max;
+    }
+    cpl->type_parser_sampled |= other->type_parser_sampled;
+    // a line without fields has an unknown state that must not be resolved
+    if (cpl->type_parser && other->type_parser && other->offsets_count) {
+        cpl->type_parser->parsed_line = AK_TPS_Resolve(
+                cpl->type_parser->parsed_line,
+                other->type_parser->parsed_line);
+        if (other->type_parser->dt_unit_line > cpl->type_parser->dt_unit_line) {
+            cpl->type_parser->dt_unit_line = other->type_parser->dt_unit_line;
+        }
+        if (other->type_parser->dc_min < cpl->type_parser->dc_min) {
+            cpl->type_parser->dc_min = other->type_parser->dc_min;
+        }
+        if (other->type_parser->dc_max > cpl->type_parser->dc_max) {
+            cpl->type_parser->dc_max = other->type_parser->dc_max;
+        }
+        cpl->type_parser->dc_int64 |= other->type_parser->dc_int64;
+        cpl->type_parser->dc_float32 &= other->type_parser->dc_float32;
+    }
+    return 0;
+}
+
 //------------------------------------------------------------------------------
 // CodePointLine: Constructors
 
@@ -1218,7 +1906,7 @@ AK_CPL_FromIterable(PyObject* iterable, bool type_parse, Py_UCS4 tsep, Py_UCS4 d
     PyObject *iter = PyObject_GetIter(iterable);
     if (iter == NULL) return NULL;
 
-    AK_CodePointLine *cpl = AK_CPL_New(type_parse, tsep, decc);
+    AK_CodePointLine *cpl = AK_CPL_New(type_parse, tsep, decc, false);
     if (cpl == NULL) {
         Py_DECREF(iter);
         return NULL;
@@ -1256,51 +1944,110 @@ static inline void
 AK_CPL_CurrentAdvance(AK_CodePointLine* cpl)
 {
     // use offsets_current_index, then increment
-    cpl->buffer_current_ptr += cpl->offsets[cpl->offsets_current_index++];
+    cpl->buffer_current_ptr += cpl->kind * cpl->offsets[cpl->offsets_current_index++];
+}
+
+// Evaluate the type parser over all fields, discarding any state from sampling. Cannot error.
+static inline void
+AK_CPL_Reinfer(AK_CodePointLine* cpl)
+{
+    AK_TypeParser *tp = cpl->type_parser;
+    AK_TP_reset_field(tp);
+    AK_TP_reset_line(tp);
+
+    AK_CPL_CurrentReset(cpl);
+    for (Py_ssize_t i = 0; i < cpl->offsets_count; ++i) {
+        Py_ssize_t count = cpl->offsets[i];
+        for (Py_ssize_t pos = 0; pos < count; ++pos) {
+            if (!AK_TP_ProcessChar(tp,
+                    PyUnicode_READ(cpl->kind, cpl->buffer_current_ptr, pos),
+                    pos)) break;
+        }
+        if (!AK_TP_ResolveLineResetField(tp, count)) break;
+        AK_CPL_CurrentAdvance(cpl);
+    }
+    cpl->type_parser_line_active = false;
+    cpl->type_parser_sampled = false;
 }
 
+// Call the converter function of the width of the CPL, given as AK_UCS1_##name, with the current field and any additional arguments.
+#define AK_CPL_CURRENT_CONVERT(cpl, name, ...)                                   \
+    ((cpl)->kind == PyUnicode_1BYTE_KIND                                         \
+        ? AK_UCS1_##name((Py_UCS1*)(cpl)->buffer_current_ptr,                    \
+                (Py_UCS1*)(cpl)->buffer_current_ptr                              \
+                + (cpl)->offsets[(cpl)->offsets_current_index], __VA_ARGS__)     \
+        : (cpl)->kind == PyUnicode_2BYTE_KIND                                    \
+        ? AK_UCS2_##name((Py_UCS2*)(cpl)->buffer_current_ptr,                    \
+                (Py_UCS2*)(cpl)->buffer_current_ptr                              \
+                + (cpl)->offsets[(cpl)->offsets_current_index], __VA_ARGS__)     \
+        : AK_UCS4_##name((Py_UCS4*)(cpl)->buffer_current_ptr,                    \
+                (Py_UCS4*)(cpl)->buffer_current_ptr                              \
+                + (cpl)->offsets[(cpl)->offsets_current_index], __VA_ARGS__))
+
 // This will take any case of "TRUE" as True, while marking everything else as False; this is the same approach taken with genfromtxt when the dtype is given as bool. This will not fail for invalid true or false strings.
 static inline npy_int8
 AK_CPL_current_to_bool(AK_CodePointLine* cpl) {
-    // must have at least 4 characters
-    if (cpl->offsets[cpl->offsets_current_index] < 4) {
-        return 0;
+    Py_ssize_t count = cpl->offsets[cpl->offsets_current_index];
+    switch (cpl->kind) {
+        case PyUnicode_1BYTE_KIND: {
+            Py_UCS1 *p = (Py_UCS1*)cpl->buffer_current_ptr;
+            return AK_UCS1_to_bool(p, p + count);
+        }
+        case PyUnicode_2BYTE_KIND: {
+            Py_UCS2 *p = (Py_UCS2*)cpl->buffer_current_ptr;
+            return AK_UCS2_to_bool(p, p + count);
+        }
     }
-    Py_UCS4 *p = cpl->buffer_current_ptr;
-    Py_UCS4 *end = p + 4; // we must have at least 4 characters for True
-    int i = 0;
-    char c;
+    Py_UCS4 *p = (Py_UCS4*)cpl->buffer_current_ptr;
+    return AK_UCS4_to_bool(p, p + count);
+}
 
-    while (AK_is_space(*p)) p++;
+static inline bool
+AK_CPL_current_is_bool(AK_CodePointLine* cpl) {
+    Py_ssize_t count = cpl->offsets[cpl->offsets_current_index];
+    switch (cpl->kind) {
+        case PyUnicode_1BYTE_KIND: {
+            Py_UCS1 *p = (Py_UCS1*)cpl->buffer_current_ptr;
+            return AK_UCS1_is_bool(p, p + count);
+        }
+        case PyUnicode_2BYTE_KIND: {
+            Py_UCS2 *p = (Py_UCS2*)cpl->buffer_current_ptr;
+            return AK_UCS2_is_bool(p, p + count);
+        }
+    }
+    Py_UCS4 *p = (Py_UCS4*)cpl->buffer_current_ptr;
+    return AK_UCS4_is_bool(p, p + count);
+}
 
-    for (;p < end; ++p) {
-        c = *p;
-        if (c == TRUE_LOWER[i] || c == TRUE_UPPER[i]) {
-            ++i;
+static inline NPY_DATETIMEUNIT
+AK_CPL_current_datetime_unit(AK_CodePointLine* cpl) {
+    Py_ssize_t count = cpl->offsets[cpl->offsets_current_index];
+    switch (cpl->kind) {
+        case PyUnicode_1BYTE_KIND: {
+            Py_UCS1 *p = (Py_UCS1*)cpl->buffer_current_ptr;
+            return AK_UCS1_datetime_unit(p, p + count);
         }
-        else {
-            return 0;
+        case PyUnicode_2BYTE_KIND: {
+            Py_UCS2 *p = (Py_UCS2*)cpl->buffer_current_ptr;
+            return AK_UCS2_datetime_unit(p, p + count);
         }
     }
-    return 1; //matched all characters
+    Py_UCS4 *p = (Py_UCS4*)cpl->buffer_current_ptr;
+    return AK_UCS4_datetime_unit(p, p + count);
 }
 
 // NOTE: using PyOS_strtol was an alternative, but needed to be passed a null-terminated char, which would require copying the data out of the CPL. This approach reads directly from the CPL without copying.
 static inline npy_int64
 AK_CPL_current_to_int64(AK_CodePointLine* cpl, int *error, char tsep)
 {
-    Py_UCS4 *p = cpl->buffer_current_ptr;
-    Py_UCS4 *end = p + cpl->offsets[cpl->offsets_current_index]; // size is either 4 or 5
-    return AK_UCS4_to_int64(p, end, error, tsep);
+    return AK_CPL_CURRENT_CONVERT(cpl, to_int64, error, tsep);
 }
 
 // Provide start and end buffer positions to provide a range of bytes to read and transform into an integer. Returns 0 on error; does not set exception.
 static inline npy_uint64
 AK_CPL_current_to_uint64(AK_CodePointLine* cpl, int *error, char tsep)
 {
-    Py_UCS4 *p = cpl->buffer_current_ptr;
-    Py_UCS4 *end = p + cpl->offsets[cpl->offsets_current_index];
-    return AK_UCS4_to_uint64(p, end, error, tsep);
+    return AK_CPL_CURRENT_CONVERT(cpl, to_uint64, error, tsep);
 }
 
 static inline npy_float64
@@ -1310,70 +2057,150 @@ AK_CPL_current_to_float64(AK_CodePointLine* cpl, int *error, char tsep, char dec
     if (cpl->offsets[cpl->offsets_current_index] == 0) {
         return NPY_NAN;
     }
-    Py_UCS4 *p = cpl->buffer_current_ptr;
-    Py_UCS4 *end = p + cpl->offsets[cpl->offsets_current_index];
-    return AK_UCS4_to_float64(p, end, error, tsep, decc);
+    return AK_CPL_CURRENT_CONVERT(cpl, to_float64, error, tsep, decc);
+}
+
+// Write the real and imaginary parts of the current field to `parts`.
+static inline void
+AK_CPL_current_to_complex(AK_CodePointLine* cpl, int *error, char tsep, char decc, npy_float64 *parts)
+{
+    AK_CPL_CURRENT_CONVERT(cpl, to_complex, error, tsep, decc, parts);
+}
+
+static inline npy_int64
+AK_CPL_current_to_datetime64(AK_CodePointLine* cpl, int *error, NPY_DATETIMEUNIT unit)
+{
+    return AK_CPL_CURRENT_CONVERT(cpl, to_datetime64, error, unit);
 }
 
 //------------------------------------------------------------------------------
 // CodePointLine: Exporters
 
-static inline PyObject *
-AK_CPL_to_array_bool(AK_CodePointLine* cpl, PyArray_Descr* dtype)
-{
-    npy_intp dims[] = {cpl->offsets_count};
+// The AK_CPL_fill_* functions write converted values from the CPL into a pre-allocated, contiguous data buffer of `cpl->offsets_count` elements, writing every byte of every element. They do not use the Python C-API and can be called without the GIL. All return 0 on success or an error code greater than 0 on failure. Where given a non-NULL `stats`, ordered kinds accumulate statistics as values are written, setting `stats->filled`.
 
-    // initialize all values to False
-    PyObject *array = PyArray_Zeros(1, dims, dtype, 0); // steals dtype ref
-    if (array == NULL) {
-        return NULL;
-    }
+#define AK_ERROR_ITEMSIZE 4
 
-    npy_bool *array_buffer = (npy_bool*)PyArray_DATA((PyArrayObject*)array);
+// Statistics of an array converted from a CPL. Null values are empty fields, fields written as null by AK_CPL_NullErrors, NaN, and NaT; other values are ordered for Boolean, integer, float, and datetime64 kinds, with -0.0 ordered before 0.0. Positions of the min and max are stored such that they can be read from the array as any dtype.
+typedef struct AK_CPLStats {
+    AK_CodePointLine *cpl;
+    PyArrayObject *array; // if NULL, the line was converted to a categorical and values are not ordered
+    bool filled; // statistics were accumulated by an AK_CPL_fill_* function
+    Py_ssize_t null_count;
+    bool ordered; // values are compared; if false, the remaining fields are not set
+    npy_intp min_index; // -1 if all values are null
+    npy_intp max_index;
+    npy_intp last_index; // the last non-null value
+    bool increasing; // each non-null value is greater than or equal to the previous
+    bool decreasing;
+} AK_CPLStats;
 
-    NPY_BEGIN_THREADS_DEF;
-    NPY_BEGIN_THREADS;
+static inline void
+AK_CPLStats_init(AK_CPLStats *stats, bool ordered)
+{
+    stats->null_count = 0;
+    stats->ordered = ordered;
+    stats->min_index = -1;
+    stats->max_index = -1;
+    stats->last_index = -1;
+    stats->increasing = true;
+    stats->decreasing = true;
+}
 
+#define AK_STATS_LT(a, b) ((a) < (b))
+#define AK_STATS_LT_FLOAT(a, b) ((a) < (b) || ((a) == (b) && signbit(a) && !signbit(b)))
+#define AK_STATS_LT_HALF(a, b) AK_STATS_LT_FLOAT(npy_half_to_double(a), npy_half_to_double(b))
+
+// Update `stats` with the value at position `i` of `values`, where `null` is true if the value is null and `lt` orders two values.
+#define AK_CPLStats_UPDATE(stats, values, i, null, lt)                          \
+    do {                                                                        \
+        if (null) {                                                             \
+            ++(stats)->null_count;                                              \
+            break;                                                              \
+        }                                                                       \
+        if ((stats)->last_index == -1) {                                        \
+            (stats)->min_index = (i);                                           \
+            (stats)->max_index = (i);                                           \
+        }                                                                       \
+        else {                                                                  \
+            if (lt(values[i], values[(stats)->min_index])) (stats)->min_index = (i); \
+            if (lt(values[(stats)->max_index], values[i])) (stats)->max_index = (i); \
+            if (lt(values[i], values[(stats)->last_index])) (stats)->increasing = false; \
+            if (lt(values[(stats)->last_index], values[i])) (stats)->decreasing = false; \
+        }                                                                       \
+        (stats)->last_index = (i);                                              \
+    } while (0)
+
+
+// Return AK_ERROR_INVALID_CHARS if any field is not empty or any case of "true" or "false", else 0. As AK_CPL_fill_bool is forgiving, this verifies a Boolean type inferred from sampled fields.
+static inline int
+AK_CPL_verify_bool(AK_CodePointLine* cpl)
+{
     AK_CPL_CurrentReset(cpl);
     for (Py_ssize_t i=0; i < cpl->offsets_count; ++i) {
-        // this is forgiving in that invalid strings remain false
-        if (AK_CPL_current_to_bool(cpl)) {
-            array_buffer[i] = 1;
+        if (!AK_CPL_current_is_bool(cpl)) {
+            return AK_ERROR_INVALID_CHARS;
         }
         AK_CPL_CurrentAdvance(cpl);
     }
-    NPY_END_THREADS;
+    return 0;
+}
 
-    PyArray_CLEARFLAGS((PyArrayObject *)array, NPY_ARRAY_WRITEABLE);
-    return array;
+// Return AK_ERROR_DATETIME if any field is not empty or an ISO 8601 string representable in `unit` without loss, else 0. As native datetime conversion truncates to the unit, this verifies a datetime64 type inferred from sampled fields.
+static inline int
+AK_CPL_verify_datetime(AK_CodePointLine* cpl, NPY_DATETIMEUNIT unit)
+{
+    AK_CPL_CurrentReset(cpl);
+    for (Py_ssize_t i=0; i < cpl->offsets_count; ++i) {
+        NPY_DATETIMEUNIT field_unit = AK_CPL_current_datetime_unit(cpl);
+        if (field_unit == NPY_FR_ERROR || field_unit > unit) {
+            return AK_ERROR_DATETIME;
+        }
+        AK_CPL_CurrentAdvance(cpl);
+    }
+    return 0;
 }
 
-// Given a type of signed integer, return the corresponding array.
-static inline PyObject *
-AK_CPL_to_array_float(AK_CodePointLine* cpl, PyArray_Descr* dtype, char tsep, char decc)
+// Return AK_ERROR_INVALID_CHARS if the type parser, evaluated over all fields, does not resolve to the type found from sampled fields, else 0. As numeric converters accept forms the type parser does not (such as "j" as a complex), this verifies a numeric type inferred from sampled fields. The type parser is left evaluated over all fields.
+static inline int
+AK_CPL_verify_type(AK_CodePointLine* cpl)
 {
-    Py_ssize_t count = cpl->offsets_count;
-    npy_intp dims[] = {count};
+    AK_TypeParserState sampled = cpl->type_parser->parsed_line;
+    AK_CPL_Reinfer(cpl);
+    return cpl->type_parser->parsed_line == sampled ? 0 : AK_ERROR_INVALID_CHARS;
+}
 
-    // NOTE: empty preferred over zeros
-    PyObject *array = PyArray_Empty(1, dims, dtype, 0); // steals dtype ref
-    if (array == NULL) {
-        return NULL;
+static inline int
+AK_CPL_fill_bool(AK_CodePointLine* cpl, npy_bool *array_buffer, AK_CPLStats *stats)
+{
+    if (stats) AK_CPLStats_init(stats, true);
+    AK_CPL_CurrentReset(cpl);
+    for (Py_ssize_t i=0; i < cpl->offsets_count; ++i) {
+        // this is forgiving in that invalid strings remain false
+        array_buffer[i] = AK_CPL_current_to_bool(cpl);
+        if (stats) AK_CPLStats_UPDATE(stats, array_buffer, i, cpl->offsets[i] == 0, AK_STATS_LT);
+        AK_CPL_CurrentAdvance(cpl);
     }
+    if (stats) stats->filled = true;
+    return 0;
+}
 
+static inline int
+AK_CPL_fill_float(AK_CodePointLine* cpl,
+        char *data,
+        int elsize,
+        char tsep,
+        char decc,
+        AK_CPLStats *stats)
+{
+    Py_ssize_t count = cpl->offsets_count;
     // initialize error code to 0; only update on error.
     int error = 0;
-    bool matched_elsize = true;
-    int elsize = dtype->elsize;
-
-    NPY_BEGIN_THREADS_DEF;
-    NPY_BEGIN_THREADS;
 
     AK_CPL_CurrentReset(cpl);
 
     if (elsize == 16) {
         # ifdef PyFloat128ArrType_Type
-        npy_float128 *array_buffer = (npy_float128*)PyArray_DATA((PyArrayObject*)array);
+        npy_float128 *array_buffer = (npy_float128*)data;
         npy_float128 *end = array_buffer + count;
         while (array_buffer < end) {
             // NOTE: cannot cast to npy_float128 here
@@ -1383,23 +2210,29 @@ AK_CPL_to_array_float(AK_CodePointLine* cpl, PyArray_Descr* dtype, char tsep, ch
         # endif
     }
     else if (elsize == 8) {
-        npy_float64 *array_buffer = (npy_float64*)PyArray_DATA((PyArrayObject*)array);
-        npy_float64 *end = array_buffer + count;
-        while (array_buffer < end) {
-            *array_buffer++ = AK_CPL_current_to_float64(cpl, &error, tsep, decc);
+        npy_float64 *array_buffer = (npy_float64*)data;
+        if (stats) AK_CPLStats_init(stats, true);
+        for (Py_ssize_t i = 0; i < count; ++i) {
+            array_buffer[i] = AK_CPL_current_to_float64(cpl, &error, tsep, decc);
+            if (stats) AK_CPLStats_UPDATE(stats, array_buffer, i,
+                    array_buffer[i] != array_buffer[i], AK_STATS_LT_FLOAT);
             AK_CPL_CurrentAdvance(cpl);
         }
+        if (stats) stats->filled = true;
     }
     else if (elsize == 4) {
-        npy_float32 *array_buffer = (npy_float32*)PyArray_DATA((PyArrayObject*)array);
-        npy_float32 *end = array_buffer + count;
-        while (array_buffer < end) {
-            *array_buffer++ = (npy_float32)AK_CPL_current_to_float64(cpl, &error, tsep, decc);
+        npy_float32 *array_buffer = (npy_float32*)data;
+        if (stats) AK_CPLStats_init(stats, true);
+        for (Py_ssize_t i = 0; i < count; ++i) {
+            array_buffer[i] = (npy_float32)AK_CPL_current_to_float64(cpl, &error, tsep, decc);
+            if (stats) AK_CPLStats_UPDATE(stats, array_buffer, i,
+                    array_buffer[i] != array_buffer[i], AK_STATS_LT_FLOAT);
             AK_CPL_CurrentAdvance(cpl);
         }
+        if (stats) stats->filled = true;
     }
     else if (elsize == 2) {
-        npy_float16 *array_buffer = (npy_float16*)PyArray_DATA((PyArrayObject*)array);
+        npy_float16 *array_buffer = (npy_float16*)data;
         npy_float16 *end = array_buffer + count;
         while (array_buffer < end) {
             *array_buffer++ = npy_double_to_half(AK_CPL_current_to_float64(cpl, &error, tsep, decc));
@@ -1407,302 +2240,369 @@ AK_CPL_to_array_float(AK_CodePointLine* cpl, PyArray_Descr* dtype, char tsep, ch
         }
     }
     else {
-        matched_elsize = false;
-    }
-
-    NPY_END_THREADS;
-
-    if (!matched_elsize) {
-        PyErr_SetString(PyExc_TypeError, "cannot create array from itemsize");
-        Py_DECREF(array);
-        return NULL;
+        return AK_ERROR_ITEMSIZE;
     }
-    if (error) {
-        PyErr_SetString(PyExc_TypeError, "error parsing float");
-        Py_DECREF(array);
-        return NULL;
-     }
-
-    PyArray_CLEARFLAGS((PyArrayObject *)array, NPY_ARRAY_WRITEABLE);
-    return array;
+    return error;
 }
 
-// Given a type of signed integer, return the corresponding array.
-static inline PyObject *
-AK_CPL_to_array_int(AK_CodePointLine* cpl, PyArray_Descr* dtype, char tsep)
+static inline int
+AK_CPL_fill_complex(AK_CodePointLine* cpl, char *data, int elsize, char tsep, char decc)
 {
     Py_ssize_t count = cpl->offsets_count;
-    npy_intp dims[] = {count};
-
-    // NOTE: empty prefered over zeros
-    PyObject *array = PyArray_Empty(1, dims, dtype, 0); // steals dtype ref
-    if (array == NULL) {
-        return NULL;
-    }
     // initialize error code to 0; only update on error.
     int error = 0;
-    bool matched_elsize = true;
-    int elsize = dtype->elsize;
-
-    NPY_BEGIN_THREADS_DEF;
-    NPY_BEGIN_THREADS;
 
     AK_CPL_CurrentReset(cpl);
-    if (elsize == 8) {
-        npy_int64 *array_buffer = (npy_int64*)PyArray_DATA((PyArrayObject*)array);
-        npy_int64 *end = array_buffer + count;
-        while (array_buffer < end) {
-            *array_buffer++ = AK_CPL_current_to_int64(cpl, &error, tsep);
-            AK_CPL_CurrentAdvance(cpl);
-        }
-    }
-    else if (elsize == 4) {
-        npy_int32 *array_buffer = (npy_int32*)PyArray_DATA((PyArrayObject*)array);
-        npy_int32 *end = array_buffer + count;
-        while (array_buffer < end) {
-            *array_buffer++ = (npy_int32)AK_CPL_current_to_int64(cpl, &error, tsep);
-            AK_CPL_CurrentAdvance(cpl);
-        }
-    }
-    else if (elsize == 2) {
-        npy_int16 *array_buffer = (npy_int16*)PyArray_DATA((PyArrayObject*)array);
-        npy_int16 *end = array_buffer + count;
+    if (elsize == 16) {
+        // write the parts directly into each element
+        npy_float64 *array_buffer = (npy_float64*)data;
+        npy_float64 *end = array_buffer + 2 * count;
         while (array_buffer < end) {
-            *array_buffer++ = (npy_int16)AK_CPL_current_to_int64(cpl, &error, tsep);
+            AK_CPL_current_to_complex(cpl, &error, tsep, decc, array_buffer);
+            array_buffer += 2;
             AK_CPL_CurrentAdvance(cpl);
         }
     }
-    else if (elsize == 1) {
-        npy_int8 *array_buffer = (npy_int8*)PyArray_DATA((PyArrayObject*)array);
-        npy_int8 *end = array_buffer + count;
+    else if (elsize == 8) {
+        npy_float64 parts[2];
+        npy_float32 *array_buffer = (npy_float32*)data;
+        npy_float32 *end = array_buffer + 2 * count;
         while (array_buffer < end) {
-            *array_buffer++ = (npy_int8)AK_CPL_current_to_int64(cpl, &error, tsep);
+            AK_CPL_current_to_complex(cpl, &error, tsep, decc, parts);
+            *array_buffer++ = (npy_float32)parts[0];
+            *array_buffer++ = (npy_float32)parts[1];
             AK_CPL_CurrentAdvance(cpl);
         }
     }
     else {
-        matched_elsize = false;
+        return AK_ERROR_ITEMSIZE;
     }
-    NPY_END_THREADS;
+    return error;
+}
 
-    if (!matched_elsize) {
-        PyErr_SetString(PyExc_TypeError, "cannot create array from integer itemsize");
-        Py_DECREF(array);
-        return NULL;
+// Return true if `v` is outside the range of a signed integer of `elsize` bytes.
+static inline bool
+AK_int_overflows(npy_int64 v, int elsize)
+{
+    switch (elsize) {
+        case 1: return v < NPY_MIN_INT8 || v > NPY_MAX_INT8;
+        case 2: return v < NPY_MIN_INT16 || v > NPY_MAX_INT16;
+        case 4: return v < NPY_MIN_INT32 || v > NPY_MAX_INT32;
     }
-    if (error) {
-        PyErr_SetString(PyExc_TypeError, "error parsing integer");
-        Py_DECREF(array);
-        return NULL;
-     }
+    return false;
+}
 
-    PyArray_CLEARFLAGS((PyArrayObject *)array, NPY_ARRAY_WRITEABLE);
-    return array;
+// Return true if `v` is outside the range of an unsigned integer of `elsize` bytes.
+static inline bool
+AK_uint_overflows(npy_uint64 v, int elsize)
+{
+    switch (elsize) {
+        case 1: return v > NPY_MAX_UINT8;
+        case 2: return v > NPY_MAX_UINT16;
+        case 4: return v > NPY_MAX_UINT32;
+    }
+    return false;
 }
 
-// Given a type of signed integer, return the corresponding array. Return NULL on error.
-static inline PyObject *
-AK_CPL_to_array_uint(AK_CodePointLine* cpl, PyArray_Descr* dtype, char tsep)
+// If `check_range` is true, values outside the range of a narrow integer type are errors (AK_ERROR_OVERFLOW); else, they are truncated.
+static inline int
+AK_CPL_fill_int(AK_CodePointLine* cpl,
+        char *data,
+        int elsize,
+        char tsep,
+        bool check_range,
+        AK_CPLStats *stats)
 {
     Py_ssize_t count = cpl->offsets_count;
-    npy_intp dims[] = {count};
-
-    // NOTE: empty prefered over zeros
-    PyObject *array = PyArray_Empty(1, dims, dtype, 0); // steals dtype ref
-    if (array == NULL) {
-        return NULL;
-    }
     // initialize error code to 0; only update on error.
     int error = 0;
-    bool matched_elsize = true;
-    int elsize = dtype->elsize;
-
-    NPY_BEGIN_THREADS_DEF;
-    NPY_BEGIN_THREADS;
 
     AK_CPL_CurrentReset(cpl);
     if (elsize == 8) {
-        npy_uint64 *array_buffer = (npy_uint64*)PyArray_DATA((PyArrayObject*)array);
-        npy_uint64 *end = array_buffer + count;
-        while (array_buffer < end) {
-            *array_buffer++ = AK_CPL_current_to_uint64(cpl, &error, tsep);
+        npy_int64 *array_buffer = (npy_int64*)data;
+        if (stats) AK_CPLStats_init(stats, true);
+        for (Py_ssize_t i = 0; i < count; ++i) {
+            array_buffer[i] = AK_CPL_current_to_int64(cpl, &error, tsep);
+            if (stats) AK_CPLStats_UPDATE(stats, array_buffer, i, cpl->offsets[i] == 0, AK_STATS_LT);
             AK_CPL_CurrentAdvance(cpl);
         }
+        if (stats) stats->filled = true;
     }
     else if (elsize == 4) {
-        npy_uint32 *array_buffer = (npy_uint32*)PyArray_DATA((PyArrayObject*)array);
-        npy_uint32 *end = array_buffer + count;
-        while (array_buffer < end) {
-            *array_buffer++ = (npy_uint32)AK_CPL_current_to_uint64(cpl, &error, tsep);
+        npy_int32 *array_buffer = (npy_int32*)data;
+        if (stats) AK_CPLStats_init(stats, true);
+        for (Py_ssize_t i = 0; i < count; ++i) {
+            npy_int64 v = AK_CPL_current_to_int64(cpl, &error, tsep);
+            if (check_range && AK_UNLIKELY(AK_int_overflows(v, 4))) error = AK_ERROR_OVERFLOW;
+            array_buffer[i] = (npy_int32)v;
+            if (stats) AK_CPLStats_UPDATE(stats, array_buffer, i, cpl->offsets[i] == 0, AK_STATS_LT);
             AK_CPL_CurrentAdvance(cpl);
         }
+        if (stats) stats->filled = true;
     }
     else if (elsize == 2) {
-        npy_uint16 *array_buffer = (npy_uint16*)PyArray_DATA((PyArrayObject*)array);
-        npy_uint16 *end = array_buffer + count;
-        while (array_buffer < end) {
-            *array_buffer++ = (npy_uint16)AK_CPL_current_to_uint64(cpl, &error, tsep);
+        npy_int16 *array_buffer = (npy_int16*)data;
+        if (stats) AK_CPLStats_init(stats, true);
+        for (Py_ssize_t i = 0; i < count; ++i) {
+            npy_int64 v = AK_CPL_current_to_int64(cpl, &error, tsep);
+            if (check_range && AK_UNLIKELY(AK_int_overflows(v, 2))) error = AK_ERROR_OVERFLOW;
+            array_buffer[i] = (npy_int16)v;
+            if (stats) AK_CPLStats_UPDATE(stats, array_buffer, i, cpl->offsets[i] == 0, AK_STATS_LT);
             AK_CPL_CurrentAdvance(cpl);
         }
+        if (stats) stats->filled = true;
     }
     else if (elsize == 1) {
-        npy_uint8 *array_buffer = (npy_uint8*)PyArray_DATA((PyArrayObject*)array);
-        npy_uint8 *end = array_buffer + count;
-        while (array_buffer < end) {
-            *array_buffer++ = (npy_uint8)AK_CPL_current_to_uint64(cpl, &error, tsep);
+        npy_int8 *array_buffer = (npy_int8*)data;
+        if (stats) AK_CPLStats_init(stats, true);
+        for (Py_ssize_t i = 0; i < count; ++i) {
+            npy_int64 v = AK_CPL_current_to_int64(cpl, &error, tsep);
+            if (check_range && AK_UNLIKELY(AK_int_overflows(v, 1))) error = AK_ERROR_OVERFLOW;
+            array_buffer[i] = (npy_int8)v;
+            if (stats) AK_CPLStats_UPDATE(stats, array_buffer, i, cpl->offsets[i] == 0, AK_STATS_LT);
             AK_CPL_CurrentAdvance(cpl);
         }
+        if (stats) stats->filled = true;
     }
     else {
-        matched_elsize = false;
-    }
-    NPY_END_THREADS;
-
-    if (!matched_elsize) {
-        PyErr_SetString(PyExc_TypeError, "cannot create array from unsigned integer itemsize");
-        Py_DECREF(array);
-        return NULL;
-    }
-    if (error != 0) {
-        PyErr_SetString(PyExc_TypeError, "error parsing unisigned integer");
-        Py_DECREF(array);
-        return NULL;
+        return AK_ERROR_ITEMSIZE;
     }
-    PyArray_CLEARFLAGS((PyArrayObject *)array, NPY_ARRAY_WRITEABLE);
-    return array;
+    return error;
 }
 
-static inline PyObject *
-AK_CPL_to_array_unicode(AK_CodePointLine* cpl, PyArray_Descr* dtype)
+static inline int
+AK_CPL_fill_uint(AK_CodePointLine* cpl,
+        char *data,
+        int elsize,
+        char tsep,
+        bool check_range,
+        AK_CPLStats *stats)
 {
     Py_ssize_t count = cpl->offsets_count;
-    npy_intp dims[] = {count};
-
-    Py_ssize_t field_points;
-    // If `capped_points` is True, we have been given a dtype with specific elsize, and we will only load that many code points; if `capper_points` is False, we set the dtype elsize to the max observed code opints via the CPL offset.
-    bool capped_points;
+    // initialize error code to 0; only update on error.
+    int error = 0;
 
-    // mutate the passed dtype as it is new and will be stolen in array construction
-    if (dtype->elsize == 0) {
-        field_points = cpl->offset_max;
-        dtype->elsize = (int)(field_points * UCS4_SIZE);
-        capped_points = false;
-    }
-    else {
-        // assume that elsize is already given in units of 4
-        // assert(dtype->elsize % UCS4_SIZE == 0);
-        field_points = dtype->elsize / UCS4_SIZE;
-        capped_points = true;
+    AK_CPL_CurrentReset(cpl);
+    if (elsize == 8) {
+        npy_uint64 *array_buffer = (npy_uint64*)data;
+        if (stats) AK_CPLStats_init(stats, true);
+        for (Py_ssize_t i = 0; i < count; ++i) {
+            array_buffer[i] = AK_CPL_current_to_uint64(cpl, &error, tsep);
+            if (stats) AK_CPLStats_UPDATE(stats, array_buffer, i, cpl->offsets[i] == 0, AK_STATS_LT);
+            AK_CPL_CurrentAdvance(cpl);
+        }
+        if (stats) stats->filled = true;
     }
-
-    // NOTE: it is assumed (though not verified in some testing) that we need to get zeroed array here as we might copy to the array with less than the full item size width
-    PyObject *array = PyArray_Zeros(1, dims, dtype, 0); // increfs dtype
-    if (array == NULL) {
-        // expected array to steal dtype reference
-        return NULL;
+    else if (elsize == 4) {
+        npy_uint32 *array_buffer = (npy_uint32*)data;
+        if (stats) AK_CPLStats_init(stats, true);
+        for (Py_ssize_t i = 0; i < count; ++i) {
+            npy_uint64 v = AK_CPL_current_to_uint64(cpl, &error, tsep);
+            if (check_range && AK_UNLIKELY(AK_uint_overflows(v, 4))) error = AK_ERROR_OVERFLOW;
+            array_buffer[i] = (npy_uint32)v;
+            if (stats) AK_CPLStats_UPDATE(stats, array_buffer, i, cpl->offsets[i] == 0, AK_STATS_LT);
+            AK_CPL_CurrentAdvance(cpl);
+        }
+        if (stats) stats->filled = true;
     }
-
-    Py_UCS4 *array_buffer = (Py_UCS4*)PyArray_DATA((PyArrayObject*)array);
-    Py_UCS4 *end = array_buffer + count * field_points;
-
-    NPY_BEGIN_THREADS_DEF;
-    NPY_BEGIN_THREADS;
-
-    AK_CPL_CurrentReset(cpl);
-    if (capped_points) {
-        Py_ssize_t copy_bytes;
-        while (array_buffer < end) {
-            if (cpl->offsets[cpl->offsets_current_index] >= field_points) {
-                copy_bytes = field_points * UCS4_SIZE;
-            } else {
-                copy_bytes = cpl->offsets[cpl->offsets_current_index] * UCS4_SIZE;
-            }
-            memcpy(array_buffer,
-                    cpl->buffer_current_ptr,
-                    copy_bytes);
-            array_buffer += field_points;
+    else if (elsize == 2) {
+        npy_uint16 *array_buffer = (npy_uint16*)data;
+        if (stats) AK_CPLStats_init(stats, true);
+        for (Py_ssize_t i = 0; i < count; ++i) {
+            npy_uint64 v = AK_CPL_current_to_uint64(cpl, &error, tsep);
+            if (check_range && AK_UNLIKELY(AK_uint_overflows(v, 2))) error = AK_ERROR_OVERFLOW;
+            array_buffer[i] = (npy_uint16)v;
+            if (stats) AK_CPLStats_UPDATE(stats, array_buffer, i, cpl->offsets[i] == 0, AK_STATS_LT);
             AK_CPL_CurrentAdvance(cpl);
         }
+        if (stats) stats->filled = true;
     }
-    else { // faster if we always know the offset will fit
-        while (array_buffer < end) {
-            memcpy(array_buffer,
-                    cpl->buffer_current_ptr,
-                    cpl->offsets[cpl->offsets_current_index] * UCS4_SIZE);
-            array_buffer += field_points;
+    else if (elsize == 1) {
+        npy_uint8 *array_buffer = (npy_uint8*)data;
+        if (stats) AK_CPLStats_init(stats, true);
+        for (Py_ssize_t i = 0; i < count; ++i) {
+            npy_uint64 v = AK_CPL_current_to_uint64(cpl, &error, tsep);
+            if (check_range && AK_UNLIKELY(AK_uint_overflows(v, 1))) error = AK_ERROR_OVERFLOW;
+            array_buffer[i] = (npy_uint8)v;
+            if (stats) AK_CPLStats_UPDATE(stats, array_buffer, i, cpl->offsets[i] == 0, AK_STATS_LT);
             AK_CPL_CurrentAdvance(cpl);
         }
+        if (stats) stats->filled = true;
     }
-    NPY_END_THREADS;
-
-    PyArray_CLEARFLAGS((PyArrayObject *)array, NPY_ARRAY_WRITEABLE);
-    return array;
+    else {
+        return AK_ERROR_ITEMSIZE;
+    }
+    return error;
 }
 
-// Return NULL on error
-static inline PyObject *
-AK_CPL_to_array_bytes(AK_CodePointLine* cpl, PyArray_Descr* dtype)
+// Stops at the first field that is not parsed natively, returning AK_ERROR_DATETIME such that the caller can defer to NumPy.
+static inline int
+AK_CPL_fill_datetime(AK_CodePointLine* cpl,
+        npy_int64 *array_buffer,
+        NPY_DATETIMEUNIT unit,
+        AK_CPLStats *stats)
 {
-    Py_ssize_t count = cpl->offsets_count;
-    npy_intp dims[] = {count};
-
-    Py_ssize_t field_points;
-    bool capped_points;
+    int error = 0;
 
-    if (dtype->elsize == 0) {
-        field_points = cpl->offset_max;
-        dtype->elsize = (int)field_points;
-        capped_points = false;
-    }
-    else {
-        field_points = dtype->elsize;
-        capped_points = true;
+    if (stats) AK_CPLStats_init(stats, true);
+    AK_CPL_CurrentReset(cpl);
+    for (Py_ssize_t i = 0; i < cpl->offsets_count; ++i) {
+        array_buffer[i] = AK_CPL_current_to_datetime64(cpl, &error, unit);
+        if (error) return error;
+        if (stats) AK_CPLStats_UPDATE(stats, array_buffer, i,
+                array_buffer[i] == NPY_DATETIME_NAT, AK_STATS_LT);
+        AK_CPL_CurrentAdvance(cpl);
     }
+    if (stats) stats->filled = true;
+    return 0;
+}
 
-    PyObject *array = PyArray_Zeros(1, dims, dtype, 0);
-    if (array == NULL) {
-        // expected array to steal dtype reference
-        return NULL;
+// Copy at most `field_points` code points per field, zero-filling the remainder of each element.
+static inline int
+AK_CPL_fill_unicode(AK_CodePointLine* cpl, Py_UCS4 *array_buffer, Py_ssize_t field_points)
+{
+    Py_UCS4 *end = array_buffer + cpl->offsets_count * field_points;
+    Py_ssize_t copy_points;
+
+    AK_CPL_CurrentReset(cpl);
+    while (array_buffer < end) {
+        copy_points = cpl->offsets[cpl->offsets_current_index];
+        if (copy_points > field_points) {
+            copy_points = field_points;
+        }
+        AK_UCS_copy(PyUnicode_4BYTE_KIND,
+                array_buffer,
+                cpl->kind,
+                cpl->buffer_current_ptr,
+                copy_points);
+        if (copy_points < field_points) {
+            memset(array_buffer + copy_points,
+                    0,
+                    (field_points - copy_points) * UCS4_SIZE);
+        }
+        array_buffer += field_points;
+        AK_CPL_CurrentAdvance(cpl);
     }
+    return 0;
+}
 
-    char *array_buffer = (char*)PyArray_DATA((PyArrayObject*)array);
-    char *end = array_buffer + count * field_points;
+// Copy at most `field_points` code points per field, truncating each to a char and zero-filling the remainder of each element.
+static inline int
+AK_CPL_fill_bytes(AK_CodePointLine* cpl, char *array_buffer, Py_ssize_t field_points)
+{
+    char *end = array_buffer + cpl->offsets_count * field_points;
     char *field_end;
 
     Py_ssize_t copy_points;
-    Py_UCS4 *p;
-    Py_UCS4 *p_end;
-
-    NPY_BEGIN_THREADS_DEF;
-    NPY_BEGIN_THREADS;
 
     AK_CPL_CurrentReset(cpl);
     while (array_buffer < end) {
-        if (!capped_points || cpl->offsets[cpl->offsets_current_index] < field_points) {
-            // if not capped, or capped and offset is less than field points, use offset
-            copy_points = cpl->offsets[cpl->offsets_current_index];
-        }
-        else {
-            // if capped and offset is greater than field points, use field points
+        copy_points = cpl->offsets[cpl->offsets_current_index];
+        if (copy_points > field_points) {
             copy_points = field_points;
         }
         // NOTE: not using memcopy as we need to cast to char to fit each point
-        p = cpl->buffer_current_ptr;
-        p_end = p + copy_points;
         field_end = array_buffer + field_points;
-
-        while (p < p_end) {
-            *array_buffer++ = (char)*p++; // truncate
+        for (Py_ssize_t i = 0; i < copy_points; ++i) {
+            // truncate
+            *array_buffer++ = (char)PyUnicode_READ(cpl->kind, cpl->buffer_current_ptr, i);
+        }
+        while (array_buffer < field_end) {
+            *array_buffer++ = '\0';
         }
-        array_buffer = field_end; // jump to end regardless of how many chars written
         AK_CPL_CurrentAdvance(cpl);
     }
-    NPY_END_THREADS;
+    return 0;
+}
 
-    PyArray_CLEARFLAGS((PyArrayObject *)array, NPY_ARRAY_WRITEABLE);
-    return array;
+// Return true if AK_CPL_FillArray can convert to an array of this dtype.
+static inline bool
+AK_CPL_fill_kind(PyArray_Descr* dtype)
+{
+    switch (dtype->kind) {
+        case 'b':
+        case 'i':
+        case 'u':
+        case 'f':
+        case 'U':
+        case 'S':
+            return true;
+        case 'c': // long double complex is converted by NumPy
+            return dtype->elsize == 16 || dtype->elsize == 8;
+        case 'M': {
+            PyArray_DatetimeMetaData* dma = AK_datetime_meta(dtype);
+            return dma->num == 1 && AK_datetime64_unit_native(dma->base);
+        }
+    }
+    return false;
+}
+
+// Given a CPL and a pre-allocated, contiguous array of a dtype accepted by AK_CPL_fill_kind, convert all fields into the array, accumulating statistics in `stats` if not NULL. If `check_range` is true, integers that overflow a narrow dtype are errors. This does not use the Python C-API and can be called without the GIL. Returns 0 on success or an error code greater than 0 on failure; use AK_CPL_FinalizeArray to set the exception.
+static inline int
+AK_CPL_FillArray(AK_CodePointLine* cpl,
+        PyArrayObject* array,
+        char tsep,
+        char decc,
+        bool check_range,
+        AK_CPLStats *stats)
+{
+    PyArray_Descr* dtype = PyArray_DESCR(array);
+    char *data = (char*)PyArray_DATA(array);
+
+    switch (dtype->kind) {
+        case 'b':
+            return AK_CPL_fill_bool(cpl, (npy_bool*)data, stats);
+        case 'i':
+            return AK_CPL_fill_int(cpl, data, dtype->elsize, tsep, check_range, stats);
+        case 'u':
+            return AK_CPL_fill_uint(cpl, data, dtype->elsize, tsep, check_range, stats);
+        case 'f':
+            return AK_CPL_fill_float(cpl, data, dtype->elsize, tsep, decc, stats);
+        case 'c':
+            return AK_CPL_fill_complex(cpl, data, dtype->elsize, tsep, decc);
+        case 'U':
+            return AK_CPL_fill_unicode(cpl, (Py_UCS4*)data, dtype->elsize / UCS4_SIZE);
+        case 'S':
+            return AK_CPL_fill_bytes(cpl, data, dtype->elsize);
+        case 'M':
+            return AK_CPL_fill_datetime(cpl, (npy_int64*)data, AK_datetime_meta(dtype)->base, stats);
+    }
+    return AK_ERROR_ITEMSIZE;
+}
+
+// If a flexible dtype has an elsize of zero, set the elsize to the max observed offset (or one character if all fields are empty), mutating the dtype. Cannot error.
+static inline void
+AK_CPL_size_flexible(AK_CodePointLine* cpl, PyArray_Descr* dtype)
+{
+    if (dtype->elsize == 0) {
+        Py_ssize_t points = cpl->offset_max > 0 ? cpl->offset_max : 1;
+        if (dtype->kind == 'U') {
+            dtype->elsize = (int)(points * UCS4_SIZE);
+        }
+        else if (dtype->kind == 'S') {
+            dtype->elsize = (int)points;
+        }
+    }
+}
+
+// Allocate an uninitialized 1D array sized for the CPL, to be filled with AK_CPL_FillArray. If a flexible dtype has an elsize of zero, the elsize is set with AK_CPL_size_flexible; otherwise, fields will be truncated to the given elsize. The dtype must be a fresh instance as it might be mutated; its reference is stolen. Returns NULL on error.
+static inline PyObject *
+AK_CPL_NewArray(AK_CodePointLine* cpl, PyArray_Descr* dtype)
+{
+    npy_intp dims[] = {cpl->offsets_count};
+
+    AK_CPL_size_flexible(cpl, dtype);
+    // NOTE: empty preferred over zeros as fill functions write every byte
+    return PyArray_Empty(1, dims, dtype, 0); // steals dtype ref
 }
 
+// Forward declaration for AK_CPL_to_array_via_cast.
+static inline PyObject *
+AK_CPL_ToArray(AK_CodePointLine* cpl,
+        PyArray_Descr* dtype,
+        char tsep,
+        char decc);
+
 // If we cannot directly convert bytes to values in a pre-loaded array, we can create a bytes or unicode array and then use PyArray_CastToType to use numpy to interpret it as a new a array and handle conversions. Note that we can use bytes for a smaller memory load if we are confident that the values are not unicode. This is a safe assumption for complex. For datetime64, we have to use Unicode to get errors on malformed inputs: using bytes causes a seg fault with these interfaces (the same is not observed with astyping a byte array in Python).
 static inline PyObject *
 AK_CPL_to_array_via_cast(AK_CodePointLine* cpl,
@@ -1710,20 +2610,14 @@ AK_CPL_to_array_via_cast(AK_CodePointLine* cpl,
         int type_inter)
 {
     PyArray_Descr* dtype_inter; // interchange array
-    PyObject* array_inter = NULL;
 
     dtype_inter = PyArray_DescrNewFromType(type_inter);
     if (dtype_inter == NULL) {
         Py_DECREF(dtype);
         return NULL;
     }
-    if (type_inter == NPY_STRING) {
-        array_inter = AK_CPL_to_array_bytes(cpl, dtype_inter);
-    }
-    else if (type_inter == NPY_UNICODE) {
-        array_inter = AK_CPL_to_array_unicode(cpl, dtype_inter);
-    }
-    // else array_inter is NULL and we exit without an exception set
+    // tsep and decc are not used for bytes or unicode
+    PyObject* array_inter = AK_CPL_ToArray(cpl, dtype_inter, '\0', '.');
     if (array_inter == NULL) {
         Py_DECREF(dtype); // dtype_inter ref already stolen
         return NULL;
@@ -1738,7 +2632,190 @@ AK_CPL_to_array_via_cast(AK_CodePointLine* cpl,
     return array;
 }
 
-// Generic handler for converting a CPL to an array. The dtype given here must already be a fresh instance as it might be mutated. If passed dtype is NULL, must get dtype from type_parser-> parsed_line Might return NULL if array creation fails; an exception should be set. Will return NULL on error.
+// Given an array filled by AK_CPL_FillArray from `cpl` and the returned error code, either set an exception and release the array (returning NULL), or mark the array immutable and return it. If a datetime64 field cannot be parsed natively, the array is released and a new array is returned from NumPy's conversion of the same fields.
+static inline PyObject *
+AK_CPL_FinalizeArray(AK_CodePointLine* cpl, PyObject* array, int error)
+{
+    if (error == AK_ERROR_DATETIME) {
+        PyArray_Descr* dtype = PyArray_DESCR((PyArrayObject*)array);
+        Py_INCREF(dtype);
+        Py_DECREF(array);
+        return AK_CPL_to_array_via_cast(cpl, dtype, NPY_UNICODE);
+    }
+    if (error) {
+        char kind = PyArray_DESCR((PyArrayObject*)array)->kind;
+        if (error == AK_ERROR_ITEMSIZE) {
+            if (kind == 'i') {
+                PyErr_SetString(PyExc_TypeError, "cannot create array from integer itemsize");
+            }
+            else if (kind == 'u') {
+                PyErr_SetString(PyExc_TypeError, "cannot create array from unsigned integer itemsize");
+            }
+            else {
+                PyErr_SetString(PyExc_TypeError, "cannot create array from itemsize");
+            }
+        }
+        else if (kind == 'i') {
+            PyErr_SetString(PyExc_TypeError, "error parsing integer");
+        }
+        else if (kind == 'u') {
+            PyErr_SetString(PyExc_TypeError, "error parsing unisigned integer");
+        }
+        else if (kind == 'c') { // a ValueError, as raised by complex()
+            PyErr_SetString(PyExc_ValueError, "error parsing complex");
+        }
+        else {
+            PyErr_SetString(PyExc_TypeError, "error parsing float");
+        }
+        Py_DECREF(array);
+        return NULL;
+    }
+    PyArray_CLEARFLAGS((PyArrayObject *)array, NPY_ARRAY_WRITEABLE);
+    return array;
+}
+
+// Convert the current field with NumPy into `value`, as for datetime64 fields not parsed natively. Returns 0 on success, AK_ERROR_DATETIME if NumPy cannot parse the field, or -1 on error.
+static inline int
+AK_CPL_current_to_datetime64_via_cast(AK_CodePointLine* cpl, PyArray_Descr* dtype, npy_int64 *value)
+{
+    PyObject *field = PyUnicode_FromKindAndData(cpl->kind,
+            cpl->buffer_current_ptr,
+            cpl->offsets[cpl->offsets_current_index]);
+    if (field == NULL) return -1;
+    PyObject *array = PyArray_FromAny(field, NULL, 0, 0, 0, NULL);
+    Py_DECREF(field);
+    if (array == NULL) return -1;
+    Py_INCREF(dtype);
+    PyObject *cast = PyArray_CastToType((PyArrayObject*)array, dtype, 0); // steals dtype
+    Py_DECREF(array);
+    if (cast == NULL) {
+        if (!PyErr_ExceptionMatches(PyExc_ValueError)) return -1;
+        PyErr_Clear();
+        return AK_ERROR_DATETIME;
+    }
+    *value = *(npy_int64*)PyArray_DATA((PyArrayObject*)cast);
+    Py_DECREF(cast);
+    return 0;
+}
+
+// Given an array of a numeric or datetime64 kind filled by AK_CPL_FillArray that returned a conversion error, convert each field again, writing a null value (NaN, NaT, or zero for integers) for each field that fails, or that overflows a narrow integer type, and storing its position in `errors`. Datetime64 fields not parsed natively are converted by NumPy, and the array need not have been filled. If `report` is not NULL, a (record, field, text) tuple is appended for each failed field, where `line` is the position of the CPL on `axis`. Returns 0 on success, -1 on error.
+static inline int
+AK_CPL_NullErrors(AK_CodePointLine* cpl,
+        PyArrayObject* array,
+        char tsep,
+        char decc,
+        Py_ssize_t line,
+        int axis,
+        PyObject *report)
+{
+    PyArray_Descr* dtype = PyArray_DESCR(array);
+    char *data = (char*)PyArray_DATA(array);
+    int elsize = dtype->elsize;
+    npy_float64 parts[2];
+
+    PyMem_RawFree(cpl->errors);
+    cpl->errors = NULL;
+    cpl->errors_count = 0;
+
+    bool datetime_native = false;
+    if (dtype->kind == 'M') {
+        // most fields not parsed natively are valid: try NumPy's conversion of all fields before converting each field
+        Py_INCREF(dtype);
+        PyObject *cast = AK_CPL_to_array_via_cast(cpl, dtype, NPY_UNICODE);
+        if (cast != NULL) {
+            int err = PyArray_CopyInto(array, (PyArrayObject*)cast);
+            Py_DECREF(cast);
+            return err;
+        }
+        if (!PyErr_ExceptionMatches(PyExc_ValueError)) return -1;
+        PyErr_Clear();
+        datetime_native = AK_CPL_fill_kind(dtype);
+    }
+
+    AK_CPL_CurrentReset(cpl);
+    for (Py_ssize_t i = 0; i < cpl->offsets_count; ++i) {
+        int error = 0;
+        switch (dtype->kind) {
+            case 'M': {
+                npy_int64 v = NPY_DATETIME_NAT;
+                if (datetime_native) {
+                    v = AK_CPL_current_to_datetime64(cpl, &error, AK_datetime_meta(dtype)->base);
+                }
+                if (!datetime_native || error) {
+                    error = AK_CPL_current_to_datetime64_via_cast(cpl, dtype, &v);
+                    if (error < 0) return -1;
+                }
+                *(npy_int64*)(data + i * elsize) = error ? NPY_DATETIME_NAT : v;
+                break;
+            }
+            case 'i':
+                if (AK_int_overflows(AK_CPL_current_to_int64(cpl, &error, tsep), elsize)) {
+                    error = AK_ERROR_OVERFLOW;
+                }
+                break;
+            case 'u':
+                if (AK_uint_overflows(AK_CPL_current_to_uint64(cpl, &error, tsep), elsize)) {
+                    error = AK_ERROR_OVERFLOW;
+                }
+                break;
+            case 'f':
+                AK_CPL_current_to_float64(cpl, &error, tsep, decc);
+                break;
+            case 'c':
+                AK_CPL_current_to_complex(cpl, &error, tsep, decc, parts);
+                break;
+        }
+        if (error) {
+            char *item = data + i * elsize;
+            if (dtype->kind == 'i' || dtype->kind == 'u') {
+                memset(item, 0, elsize);
+            }
+            else if (dtype->kind == 'M') {
+                ; // NaT written above
+            }
+            else { // complex parts are each written as a float of half the size
+                int part_size = dtype->kind == 'c' ? elsize / 2 : elsize;
+                for (char *part = item; part < item + elsize; part += part_size) {
+                    if (part_size == 2) {
+                        *(npy_float16*)part = npy_double_to_half(NPY_NAN);
+                    }
+                    else if (part_size == 4) {
+                        *(npy_float32*)part = NPY_NANF;
+                    }
+                    else if (part_size == 8) {
+                        *(npy_float64*)part = NPY_NAN;
+                    }
+                    # ifdef PyFloat128ArrType_Type
+                    else if (part_size == 16) {
+                        *(npy_float128*)part = NPY_NANL;
+                    }
+                    # endif
+                }
+            }
+            if (cpl->errors == NULL) {
+                cpl->errors = (Py_ssize_t*)PyMem_RawMalloc(
+                        sizeof(Py_ssize_t) * cpl->offsets_count);
+                if (cpl->errors == NULL) {
+                    PyErr_NoMemory();
+                    return -1;
+                }
+            }
+            cpl->errors[cpl->errors_count++] = i;
+            if (report && AK_report_append(report,
+                    axis == 0 ? line : i,
+                    axis == 0 ? i : line,
+                    PyUnicode_FromKindAndData(cpl->kind,
+                            cpl->buffer_current_ptr,
+                            cpl->offsets[i]))) {
+                return -1;
+            }
+        }
+        AK_CPL_CurrentAdvance(cpl);
+    }
+    return 0;
+}
+
+// Generic handler for converting a CPL to an array. The dtype given here must already be a fresh instance as it might be mutated; its reference is stolen. If passed dtype is NULL, must get dtype from type_parser-> parsed_line Might return NULL if array creation fails; an exception should be set. Will return NULL on error.
 static inline PyObject *
 AK_CPL_ToArray(AK_CodePointLine* cpl,
         PyArray_Descr* dtype,
@@ -1749,7 +2826,7 @@ AK_CPL_ToArray(AK_CodePointLine* cpl,
         // If we have a type_parser on the CPL, we can use that to get the dtype
         if (cpl->type_parser) {
             // will return a fresh instance
-            dtype = AK_TPS_ToDtype(cpl->type_parser->parsed_line);
+            dtype = AK_TP_ToDtype(cpl->type_parser);
             if (dtype == NULL) return NULL;
         }
         else {
@@ -1757,63 +2834,626 @@ AK_CPL_ToArray(AK_CodePointLine* cpl,
         }
     }
     switch (dtype->kind) {
-        case 'i':
-            return AK_CPL_to_array_int(cpl, dtype, tsep);
-        case 'f':
-            return AK_CPL_to_array_float(cpl, dtype, tsep, decc);
-        case 'U':
-            return AK_CPL_to_array_unicode(cpl, dtype);
-        case 'M':
-            return AK_CPL_to_array_via_cast(cpl, dtype, NPY_UNICODE);
-        case 'b':
-            return AK_CPL_to_array_bool(cpl, dtype);
-        case 'S':
-            return AK_CPL_to_array_bytes(cpl, dtype);
-        case 'u':
-            return AK_CPL_to_array_uint(cpl, dtype, tsep);
-        case 'c': // cannot pass tsep, decc as using NumPy cast
-            return AK_CPL_to_array_via_cast(cpl, dtype, NPY_STRING);
+        case 'M': // units not parsed natively are converted by NumPy
+            if (!AK_CPL_fill_kind(dtype)) {
+                return AK_CPL_to_array_via_cast(cpl, dtype, NPY_UNICODE);
+            }
+            break;
+        case 'c': // long double complex uses a NumPy cast and cannot use tsep, decc
+            if (!AK_CPL_fill_kind(dtype)) {
+                return AK_CPL_to_array_via_cast(cpl, dtype, NPY_STRING);
+            }
+            break;
     }
-    PyErr_Format(PyExc_NotImplementedError, "No handling for %R", dtype);
-    // caller will decref the passed dtype on error
-    return NULL;
+    if (!AK_CPL_fill_kind(dtype)) {
+        PyErr_Format(PyExc_NotImplementedError, "No handling for %R", dtype);
+        Py_DECREF(dtype);
+        return NULL;
+    }
+    PyObject *array = AK_CPL_NewArray(cpl, dtype);
+    if (array == NULL) return NULL;
+
+    int error;
+    NPY_BEGIN_THREADS_DEF;
+    NPY_BEGIN_THREADS;
+    error = AK_CPL_FillArray(cpl, (PyArrayObject*)array, tsep, decc, false, NULL);
+    NPY_END_THREADS;
+
+    return AK_CPL_FinalizeArray(cpl, array, error);
+}
+
+//------------------------------------------------------------------------------
+// CodePointLine: Categorical
+
+// Return the FNV-1a hash of `size` bytes. Cannot error.
+static inline npy_uint64
+AK_hash_bytes(const char *p, Py_ssize_t size)
+{
+    npy_uint64 hash = 14695981039346656037ULL;
+    for (Py_ssize_t i = 0; i < size; ++i) {
+        hash ^= (unsigned char)p[i];
+        hash *= 1099511628211ULL;
+    }
+    return hash;
+}
+
+// Set each slot of `table`, of `table_size` slots (a power of two), to the position of a distinct value, or -1 if empty, using linear probing. Cannot error.
+static inline void
+AK_uniques_table_fill(Py_ssize_t *table,
+        Py_ssize_t table_size,
+        npy_uint64 *hashes,
+        Py_ssize_t count)
+{
+    Py_ssize_t mask = table_size - 1;
+    memset(table, -1, sizeof(Py_ssize_t) * table_size);
+    for (Py_ssize_t u = 0; u < count; ++u) {
+        Py_ssize_t slot = (Py_ssize_t)(hashes[u] & (npy_uint64)mask);
+        while (table[slot] != -1) {
+            slot = (slot + 1) & mask;
+        }
+        table[slot] = u;
+    }
+}
+
+// Get or set the code at position `i` of `data`, a buffer of codes of `code_type`.
+static inline npy_int64
+AK_codes_get(void *data, int code_type, Py_ssize_t i)
+{
+    switch (code_type) {
+        case NPY_INT8: return ((npy_int8*)data)[i];
+        case NPY_INT16: return ((npy_int16*)data)[i];
+        case NPY_INT32: return ((npy_int32*)data)[i];
+    }
+    return ((npy_int64*)data)[i];
+}
+
+static inline void
+AK_codes_set(void *data, int code_type, Py_ssize_t i, npy_int64 code)
+{
+    switch (code_type) {
+        case NPY_INT8: ((npy_int8*)data)[i] = (npy_int8)code; return;
+        case NPY_INT16: ((npy_int16*)data)[i] = (npy_int16)code; return;
+        case NPY_INT32: ((npy_int32*)data)[i] = (npy_int32)code; return;
+    }
+    ((npy_int64*)data)[i] = code;
+}
+
+// Given an array of codes of `*code_type`, return a new array of the same size and the next wider signed integer type, with the first `filled` codes copied, and update `*code_type`. Steals the reference to `codes`. Returns NULL on error.
+static inline PyObject *
+AK_codes_widen(PyObject *codes, int *code_type, Py_ssize_t filled)
+{
+    int code_type_new = *code_type == NPY_INT8 ? NPY_INT16
+            : *code_type == NPY_INT16 ? NPY_INT32 : NPY_INT64;
+    PyObject *post = PyArray_EMPTY(1,
+            PyArray_DIMS((PyArrayObject*)codes),
+            code_type_new,
+            0);
+    if (post != NULL) {
+        void *src = PyArray_DATA((PyArrayObject*)codes);
+        void *dst = PyArray_DATA((PyArrayObject*)post);
+        for (Py_ssize_t i = 0; i < filled; ++i) {
+            AK_codes_set(dst, code_type_new, i, AK_codes_get(src, *code_type, i));
+        }
+        *code_type = code_type_new;
+    }
+    Py_DECREF(codes);
+    return post;
+}
+
+// Return a new tuple of an array of integer codes, one per field, and an array of the distinct fields in order of first appearance, such that the distinct fields indexed by the codes are the fields. Distinct fields are found with a hash table of pointers into the CPL buffer, such that no field is copied more than once. Codes are written as int8 and the array is widened only when a code exceeds the range of its type, such that codes use the smallest signed integer type that can index all distinct fields. Returns NULL on error.
+static inline PyObject *
+AK_CPL_ToCategorical(AK_CodePointLine* cpl)
+{
+    Py_ssize_t count = cpl->offsets_count;
+    Py_ssize_t capacity = 512; // distinct values permitted before the table grows
+    Py_ssize_t table_size = capacity * 2;
+    Py_ssize_t uniques_count = 0;
+    Py_ssize_t points_max = 0;
+
+    char **starts = (char**)PyMem_Malloc(sizeof(char*) * capacity);
+    Py_ssize_t *lengths = (Py_ssize_t*)PyMem_Malloc(sizeof(Py_ssize_t) * capacity);
+    npy_uint64 *hashes = (npy_uint64*)PyMem_Malloc(sizeof(npy_uint64) * capacity);
+    Py_ssize_t *table = (Py_ssize_t*)PyMem_Malloc(sizeof(Py_ssize_t) * table_size);
+    PyObject *codes = NULL;
+    PyObject *uniques = NULL;
+    PyObject *post = NULL;
+
+    if (starts == NULL || lengths == NULL || hashes == NULL || table == NULL) {
+        PyErr_NoMemory();
+        goto exit;
+    }
+    AK_uniques_table_fill(table, table_size, hashes, 0);
+
+    int code_type = NPY_INT8;
+    npy_int64 code_max = NPY_MAX_INT8;
+    npy_intp dims[] = {count};
+    codes = PyArray_EMPTY(1, dims, code_type, 0);
+    if (codes == NULL) goto exit;
+    void *codes_buffer = PyArray_DATA((PyArrayObject*)codes);
+
+    AK_CPL_CurrentReset(cpl);
+    for (Py_ssize_t i = 0; i < count; ++i) {
+        if (AK_UNLIKELY(uniques_count == capacity)) {
+            // keep the table at most half full
+            capacity *= 2;
+            table_size *= 2;
+            // on failure, buffers not yet reallocated are released on exit
+            char **starts_new = (char**)PyMem_Realloc(starts, sizeof(char*) * capacity);
+            if (starts_new == NULL) {
+                PyErr_NoMemory();
+                goto exit;
+            }
+            starts = starts_new;
+            Py_ssize_t *lengths_new = (Py_ssize_t*)PyMem_Realloc(lengths, sizeof(Py_ssize_t) * capacity);
+            if (lengths_new == NULL) {
+                PyErr_NoMemory();
+                goto exit;
+            }
+            lengths = lengths_new;
+            npy_uint64 *hashes_new = (npy_uint64*)PyMem_Realloc(hashes, sizeof(npy_uint64) * capacity);
+            if (hashes_new == NULL) {
+                PyErr_NoMemory();
+                goto exit;
+            }
+            hashes = hashes_new;
+            PyMem_Free(table);
+            table = (Py_ssize_t*)PyMem_Malloc(sizeof(Py_ssize_t) * table_size);
+            if (table == NULL) {
+                PyErr_NoMemory();
+                goto exit;
+            }
+            AK_uniques_table_fill(table, table_size, hashes, uniques_count);
+        }
+        Py_ssize_t points = cpl->offsets[i];
+        Py_ssize_t size = points * cpl->kind;
+        char *p = cpl->buffer_current_ptr;
+        npy_uint64 hash = AK_hash_bytes(p, size);
+
+        Py_ssize_t mask = table_size - 1;
+        Py_ssize_t slot = (Py_ssize_t)(hash & (npy_uint64)mask);
+        Py_ssize_t u;
+        while (true) {
+            u = table[slot];
+            if (u == -1) { // a new distinct value
+                u = uniques_count++;
+                table[slot] = u;
+                starts[u] = p;
+                lengths[u] = points;
+                hashes[u] = hash;
+                if (points > points_max) {
+                    points_max = points;
+                }
+                break;
+            }
+            if (hashes[u] == hash
+                    && lengths[u] == points
+                    && memcmp(starts[u], p, size) == 0) {
+                break;
+            }
+            slot = (slot + 1) & mask;
+        }
+        if (AK_UNLIKELY(u > code_max)) {
+            codes = AK_codes_widen(codes, &code_type, i);
+            if (codes == NULL) goto exit;
+            codes_buffer = PyArray_DATA((PyArrayObject*)codes);
+            code_max = code_type == NPY_INT16 ? NPY_MAX_INT16
+                    : code_type == NPY_INT32 ? NPY_MAX_INT32 : NPY_MAX_INT64;
+        }
+        AK_codes_set(codes_buffer, code_type, i, u);
+        AK_CPL_CurrentAdvance(cpl);
+    }
+
+    PyArray_Descr *dtype = PyArray_DescrNewFromType(NPY_UNICODE);
+    if (dtype == NULL) goto exit;
+    Py_ssize_t field_points = points_max > 0 ? points_max : 1;
+    dtype->elsize = (int)(field_points * UCS4_SIZE);
+    dims[0] = uniques_count;
+    uniques = PyArray_Empty(1, dims, dtype, 0); // steals dtype ref
+    if (uniques == NULL) goto exit;
+
+    Py_UCS4 *uniques_buffer = (Py_UCS4*)PyArray_DATA((PyArrayObject*)uniques);
+    for (Py_ssize_t u = 0; u < uniques_count; ++u) {
+        AK_UCS_copy(PyUnicode_4BYTE_KIND,
+                uniques_buffer,
+                cpl->kind,
+                starts[u],
+                lengths[u]);
+        if (lengths[u] < field_points) {
+            memset(uniques_buffer + lengths[u],
+                    0,
+                    (field_points - lengths[u]) * UCS4_SIZE);
+        }
+        uniques_buffer += field_points;
+    }
+    PyArray_CLEARFLAGS((PyArrayObject *)uniques, NPY_ARRAY_WRITEABLE);
+
+    PyArray_CLEARFLAGS((PyArrayObject *)codes, NPY_ARRAY_WRITEABLE);
+    post = PyTuple_Pack(2, codes, uniques);
+exit:
+    Py_XDECREF(codes);
+    Py_XDECREF(uniques);
+    PyMem_Free(starts);
+    PyMem_Free(lengths);
+    PyMem_Free(hashes);
+    PyMem_Free(table);
+    return post; // could be NULL
+}
+
+//------------------------------------------------------------------------------
+// Task pool: run C-only tasks on multiple threads with the GIL released
+
+// A function called once for each task index; must not use the Python C-API without first acquiring the GIL.
+typedef void (*AK_TaskFunc)(void *context, Py_ssize_t index);
+
+typedef struct AK_TaskPool {
+    AK_TaskFunc func;
+    void *context;
+    Py_ssize_t count;          // total number of tasks
+    Py_ssize_t next;           // next task index to claim
+    PyThread_type_lock lock;   // guards next; NULL if only one thread
+} AK_TaskPool;
+
+typedef struct AK_TaskWorker {
+    AK_TaskPool *pool;
+    PyThread_type_lock done;   // held until the worker has finished
+} AK_TaskWorker;
+
+// Claim and run tasks until none remain. Cannot error.
+static inline void
+AK_TaskPool_work(AK_TaskPool *pool)
+{
+    Py_ssize_t i;
+    while (true) {
+        if (pool->lock) {
+            PyThread_acquire_lock(pool->lock, WAIT_LOCK);
+            i = pool->next++;
+            PyThread_release_lock(pool->lock);
+        }
+        else {
+            i = pool->next++;
+        }
+        if (i >= pool->count) break;
+        pool->func(pool->context, i);
+    }
+}
+
+static void
+AK_TaskPool_worker(void *arg)
+{
+    AK_TaskWorker *worker = (AK_TaskWorker*)arg;
+    AK_TaskPool_work(worker->pool);
+    PyThread_release_lock(worker->done);
+}
+
+// Run `count` tasks on up to `threads` threads, including the calling thread, which must hold the GIL; the GIL is released while tasks run. If a thread cannot be started (or threads are not supported on the platform), remaining tasks run on the calling thread. Returns 0 on success, -1 on error.
+static inline int
+AK_TaskPool_Run(AK_TaskFunc func, void *context, Py_ssize_t count, int threads)
+{
+    AK_TaskPool pool = {func, context, count, 0, NULL};
+    AK_TaskWorker *workers = NULL;
+    Py_ssize_t workers_count = (threads < count ? threads : count) - 1;
+    Py_ssize_t started = 0;
+
+    if (workers_count > 0) {
+        pool.lock = PyThread_allocate_lock();
+        if (pool.lock == NULL) {
+            PyErr_NoMemory();
+            return -1;
+        }
+        workers = (AK_TaskWorker*)PyMem_Malloc(sizeof(AK_TaskWorker) * workers_count);
+        if (workers == NULL) {
+            PyThread_free_lock(pool.lock);
+            PyErr_NoMemory();
+            return -1;
+        }
+        for (; started < workers_count; ++started) {
+            AK_TaskWorker *worker = &workers[started];
+            worker->pool = &pool;
+            worker->done = PyThread_allocate_lock();
+            if (worker->done == NULL) break;
+            PyThread_acquire_lock(worker->done, WAIT_LOCK);
+            if (PyThread_start_new_thread(AK_TaskPool_worker, worker)
+                    == PYTHREAD_INVALID_THREAD_ID) {
+                PyThread_release_lock(worker->done);
+                PyThread_free_lock(worker->done);
+                break;
+            }
+        }
+    }
+    Py_BEGIN_ALLOW_THREADS
+    AK_TaskPool_work(&pool);
+    // wait for each worker to release its done lock
+    for (Py_ssize_t i = 0; i < started; ++i) {
+        PyThread_acquire_lock(workers[i].done, WAIT_LOCK);
+        PyThread_release_lock(workers[i].done);
+        PyThread_free_lock(workers[i].done);
+    }
+    Py_END_ALLOW_THREADS
+
+    if (pool.lock) {
+        PyThread_free_lock(pool.lock);
+    }
+    PyMem_Free(workers);
+    return 0;
 }
 
 //------------------------------------------------------------------------------
-// utility function used by CPG and DR
+// AK_LineSelect, used by CPG and DR
+
+// A selection of lines (axis 0) or fields (axis 1) by number. A callable is called with each number; a Boolean array or integer positions (normalized to sorted, unique positions) and a slice are evaluated without calling into Python.
+typedef struct AK_LineSelect {
+    PyObject *func;         // strong reference to a callable, or NULL
+    Py_ssize_t *positions;  // if not NULL, sorted, unique numbers that are selected
+    Py_ssize_t positions_count;
+    Py_ssize_t start;       // if func and positions are NULL, numbers within this slice are selected
+    Py_ssize_t stop;
+    Py_ssize_t step;
+} AK_LineSelect;
+
+static inline void
+AK_LineSelect_Free(AK_LineSelect *ls)
+{
+    if (ls == NULL) return;
+    Py_XDECREF(ls->func);
+    PyMem_Free(ls->positions);
+    PyMem_Free(ls);
+}
+
+// Set `target` to a new AK_LineSelect from `src`, a callable, a Boolean array, an iterable of integer positions, or a slice with non-negative start and stop and a positive step. If `src` is NULL or None, `target` is set to NULL, selecting all. Returns -1 on error.
+static inline int
+AK_set_line_select(AK_LineSelect **target, PyObject *src)
+{
+    *target = NULL;
+    if (src == NULL || src == Py_None) return 0;
+
+    AK_LineSelect *ls = (AK_LineSelect*)PyMem_Malloc(sizeof(AK_LineSelect));
+    if (ls == NULL) {
+        PyErr_NoMemory();
+        return -1;
+    }
+    ls->func = NULL;
+    ls->positions = NULL;
+    ls->positions_count = 0;
+    ls->start = 0;
+    ls->stop = PY_SSIZE_T_MAX;
+    ls->step = 1;
+
+    if (PySlice_Check(src)) {
+        if (PySlice_Unpack(src, &ls->start, &ls->stop, &ls->step)) {
+            PyMem_Free(ls);
+            return -1;
+        }
+        if (ls->start < 0 || ls->stop < 0 || ls->step < 0) {
+            PyErr_SetString(PyExc_ValueError,
+                    "line_select slice must have non-negative start and stop and a positive step");
+            PyMem_Free(ls);
+            return -1;
+        }
+    }
+    else if (PyCallable_Check(src)) {
+        Py_INCREF(src);
+        ls->func = src;
+    }
+    else if (AK_set_positions("line_select", &ls->positions, &ls->positions_count, src)) {
+        PyMem_Free(ls);
+        return -1;
+    }
+    *target = ls;
+    return 0;
+}
 
+// Return 1 if `lookup_number` is selected, 0 if not, or -1 on error. If `axis_target` is false or `ls` is NULL, all are selected.
 static inline int
 AK_line_select_keep(
-        PyObject *line_select,
+        AK_LineSelect *ls,
         bool axis_target,
         Py_ssize_t lookup_number)
 {
-    if (axis_target && (line_select != NULL)) {
-        PyObject* number = PyLong_FromSsize_t(lookup_number);
-        if (number == NULL) return -1;
-
-        PyObject* keep = PyObject_CallFunctionObjArgs(
-                line_select,
-                number,
-                NULL
+    if (!axis_target || ls == NULL) return 1;
+
+    if (ls->positions != NULL) {
+        return AK_positions_contain(ls->positions, ls->positions_count, lookup_number);
+    }
+    if (ls->func == NULL) {
+        return (lookup_number >= ls->start &&
+                lookup_number < ls->stop &&
+                (lookup_number - ls->start) % ls->step == 0);
+    }
+    PyObject* number = PyLong_FromSsize_t(lookup_number);
+    if (number == NULL) return -1;
+
+    PyObject* keep = PyObject_CallFunctionObjArgs(
+            ls->func,
+            number,
+            NULL
+            );
+    Py_DECREF(number);
+    if (keep == NULL) {
+        PyErr_Format(PyExc_RuntimeError,
+                "line_select callable failed for input: %d",
+                lookup_number
                 );
-        Py_DECREF(number);
-        if (keep == NULL) {
-            PyErr_Format(PyExc_RuntimeError,
-                    "line_select callable failed for input: %d",
-                    lookup_number
-                    );
-            return -1;
+        return -1;
+    }
+
+    int t = PyObject_IsTrue(keep); // 1 if truthy
+    Py_DECREF(keep);
+    if (t < 0) {
+        return -1; // error
+    }
+    return t; // 0 or 1
+}
+
+//------------------------------------------------------------------------------
+// AK_DTypes, used by CPG
+
+// The dtype of each line, given as a callable that is called with each line number, or as a list, tuple, or dict of dtype specifiers that are resolved once into descriptors.
+typedef struct AK_DTypes {
+    PyObject *func;             // strong reference to a callable, or NULL
+    PyArray_Descr **descrs;     // if func is NULL, a descriptor, or NULL to infer, for each number less than count
+    Py_ssize_t count;
+} AK_DTypes;
+
+static inline void
+AK_DTypes_Free(AK_DTypes *dt)
+{
+    if (dt == NULL) return;
+    Py_XDECREF(dt->func);
+    for (Py_ssize_t i = 0; i < dt->count; ++i) {
+        Py_XDECREF(dt->descrs[i]);
+    }
+    PyMem_Free(dt->descrs);
+    PyMem_Free(dt);
+}
+
+// Set the descriptor at `number` from a specifier; None leaves the descriptor NULL. Returns -1 on error.
+static inline int
+AK_DTypes_set_descr(AK_DTypes *dt, Py_ssize_t number, PyObject *dtype_specifier)
+{
+    if (dtype_specifier == Py_None) return 0;
+    PyArray_Descr *dtype = NULL;
+    if (!PyArray_DescrConverter2(dtype_specifier, &dtype)) return -1;
+    Py_XSETREF(dt->descrs[number], dtype);
+    return 0;
+}
+
+// Set `target` to a new AK_DTypes from `src`, a callable, or a list, tuple, or dict (keyed by non-negative integers) of dtype specifiers, where None or a missing position infers the type. If `src` is NULL or None, `target` is set to NULL, inferring all types. Returns -1 on error.
+static inline int
+AK_set_dtypes(AK_DTypes **target, PyObject *src)
+{
+    *target = NULL;
+    if (src == NULL || src == Py_None) return 0;
+
+    bool is_dict = PyDict_Check(src);
+    if (!is_dict && !PyCallable_Check(src) && !PyList_Check(src) && !PyTuple_Check(src)) {
+        PyErr_SetString(PyExc_TypeError,
+                "dtypes must be a callable, a list, tuple, or dict, or None");
+        return -1;
+    }
+    AK_DTypes *dt = (AK_DTypes*)PyMem_Malloc(sizeof(AK_DTypes));
+    if (dt == NULL) {
+        PyErr_NoMemory();
+        return -1;
+    }
+    dt->func = NULL;
+    dt->descrs = NULL;
+    dt->count = 0;
+
+    if (PyCallable_Check(src)) {
+        Py_INCREF(src);
+        dt->func = src;
+        *target = dt;
+        return 0;
+    }
+    Py_ssize_t count = 0;
+    PyObject *key;
+    PyObject *value;
+    Py_ssize_t pos = 0;
+    if (is_dict) {
+        while (PyDict_Next(src, &pos, &key, &value)) {
+            Py_ssize_t number = PyNumber_AsSsize_t(key, PyExc_OverflowError);
+            if (number == -1 && PyErr_Occurred()) goto error;
+            if (number < 0) {
+                PyErr_SetString(PyExc_ValueError, "dtypes keys must be non-negative");
+                goto error;
+            }
+            if (number >= count) count = number + 1;
+        }
+    }
+    else {
+        count = PySequence_Fast_GET_SIZE(src); // list or tuple
+    }
+    dt->descrs = (PyArray_Descr**)PyMem_Calloc(count > 0 ? count : 1, sizeof(PyArray_Descr*));
+    if (dt->descrs == NULL) {
+        PyErr_NoMemory();
+        goto error;
+    }
+    dt->count = count;
+    if (is_dict) {
+        pos = 0;
+        while (PyDict_Next(src, &pos, &key, &value)) {
+            if (AK_DTypes_set_descr(dt, PyNumber_AsSsize_t(key, NULL), value)) goto error;
+        }
+    }
+    else {
+        PyObject **items = PySequence_Fast_ITEMS(src);
+        for (Py_ssize_t i = 0; i < count; ++i) {
+            if (AK_DTypes_set_descr(dt, i, items[i])) goto error;
         }
+    }
+    *target = dt;
+    return 0;
+error:
+    AK_DTypes_Free(dt);
+    return -1;
+}
+
+// Call the dtypes callable with `number`, returning a new reference to the specifier or NULL on error.
+static inline PyObject *
+AK_DTypes_call(AK_DTypes *dt, Py_ssize_t number)
+{
+    PyObject* line_count = PyLong_FromSsize_t(number);
+    if (line_count == NULL) return NULL;
+
+    PyObject* dtype_specifier = PyObject_CallFunctionObjArgs(
+            dt->func,
+            line_count,
+            NULL
+            );
+    Py_DECREF(line_count);
+    if (dtype_specifier == NULL) {
+        // NOTE: not sure how to get the exception from the failed call...
+        PyErr_Format(PyExc_RuntimeError,
+                "dtypes callable failed for input: %d",
+                number
+                );
+    }
+    return dtype_specifier;
+}
 
-        int t = PyObject_IsTrue(keep); // 1 if truthy
-        Py_DECREF(keep);
-        if (t < 0) {
-            return -1; // error
+// Return 1 if the type of the line at `number` must be inferred, 0 if a dtype is given, or -1 on error.
+static inline int
+AK_DTypes_infer(AK_DTypes *dt, Py_ssize_t number)
+{
+    if (dt == NULL) return 1;
+    if (dt->func == NULL) {
+        return number >= dt->count || dt->descrs[number] == NULL;
+    }
+    PyObject* dtype_specifier = AK_DTypes_call(dt, number);
+    if (dtype_specifier == NULL) return -1;
+    int infer = dtype_specifier == Py_None;
+    Py_DECREF(dtype_specifier);
+    return infer;
+}
+
+// Set `dtype` to the dtype of the line at `number`, or NULL if the type must be inferred. A returned dtype is a new reference that might be mutated (as it is a fresh instance) or that will not be mutated (as it is not flexible with an elsize of zero). Returns -1 on error.
+static inline int
+AK_DTypes_get(AK_DTypes *dt, Py_ssize_t number, PyArray_Descr **dtype)
+{
+    *dtype = NULL;
+    if (dt == NULL) return 0;
+    if (dt->func == NULL) {
+        if (number >= dt->count || dt->descrs[number] == NULL) return 0;
+        PyArray_Descr *descr = dt->descrs[number];
+        if (descr->elsize == 0) { // will be sized by AK_CPL_NewArray
+            *dtype = PyArray_DescrNew(descr);
+            return *dtype == NULL ? -1 : 0;
+        }
+        Py_INCREF(descr);
+        *dtype = descr;
+        return 0;
+    }
+    PyObject* dtype_specifier = AK_DTypes_call(dt, number);
+    if (dtype_specifier == NULL) return -1;
+    if (dtype_specifier != Py_None) {
+        // Set dtype; this value can be NULL or a dtype (never Py_None); if dtype_specifier is Py_None, keep dtype set as NULL (above); this will be a new reference that if used will be stolen in array construction.
+        if (AK_DTypeFromSpecifier(dtype_specifier, dtype)) {
+            Py_DECREF(dtype_specifier);
+            return -1;
         }
-        return t; // 0 or 1
     }
-    return 1;
+    Py_DECREF(dtype_specifier);
+    return 0;
 }
 
 //------------------------------------------------------------------------------
@@ -1823,36 +3463,45 @@ typedef struct AK_CodePointGrid {
     Py_ssize_t lines_count;    // accumulated number of lines
     Py_ssize_t lines_capacity; // max number of lines
     AK_CodePointLine **lines;  // array of pointers
-    PyObject *dtypes;          // a callable that returns None or a dtype initializer
+    AK_DTypes *dtypes;         // if not NULL, the dtype of each line; borrowed
     Py_UCS4 tsep;
     Py_UCS4 decc;
+    bool infer_datetime;       // if type parsing, permit datetime64 inference
+    Py_ssize_t infer_rows;     // if greater than 0, the number of fields sampled for type parsing
+    bool type_only;            // lines do not store code points; see AK_CPG_ToDtypeList
+    bool downcast;             // if type parsing, infer the smallest integer and float types
+    AK_NAValues *na_values;    // if not NULL, tokens of missing values; borrowed
+    Py_ssize_t *keep;          // if not NULL, sorted, unique positions of lines to create, others are NULL; borrowed from AK_DelimitedReader
+    Py_ssize_t keep_count;
+    AK_OnError on_error;       // handling of fields that fail conversion
+    PyObject *report;          // if not NULL, a list to collect (record, field, text) tuples of errors; borrowed
 } AK_CodePointGrid;
 
-// Create a new Code Point Grid; returns NULL on error. Missing `dtypes` has been normalized as NULL.
+// Create a new Code Point Grid; returns NULL on error. If `dtypes` is NULL, all types are inferred.
 static inline AK_CodePointGrid *
-AK_CPG_New(PyObject *dtypes, Py_UCS4 tsep, Py_UCS4 decc)
+AK_CPG_New(AK_DTypes *dtypes, Py_UCS4 tsep, Py_UCS4 decc, bool infer_datetime)
 {
-    // normalize dtypes to NULL or callable
-    if ((dtypes == NULL) || (dtypes == Py_None)) {
-        dtypes = NULL;
-    }
-    else if (!PyCallable_Check(dtypes)) {
-        PyErr_SetString(PyExc_TypeError, "dtypes must be a callable or None");
-        return NULL;
-    }
-
-    AK_CodePointGrid *cpg = (AK_CodePointGrid*)PyMem_Malloc(sizeof(AK_CodePointGrid));
+    AK_CodePointGrid *cpg = (AK_CodePointGrid*)PyMem_RawMalloc(sizeof(AK_CodePointGrid));
     if (cpg == NULL) return (AK_CodePointGrid*)PyErr_NoMemory();
 
     cpg->tsep = tsep;
     cpg->decc = decc;
+    cpg->infer_datetime = infer_datetime;
+    cpg->infer_rows = 0;
+    cpg->type_only = false;
+    cpg->downcast = false;
+    cpg->na_values = NULL;
     cpg->lines_count = 0;
     cpg->lines_capacity = 1024;
-    cpg->lines = (AK_CodePointLine**)PyMem_Malloc(
+    cpg->lines = (AK_CodePointLine**)PyMem_RawMalloc(
             sizeof(AK_CodePointLine*) * cpg->lines_capacity);
     if (cpg->lines == NULL) return (AK_CodePointGrid*)PyErr_NoMemory();
 
     cpg->dtypes = dtypes;
+    cpg->keep = NULL;
+    cpg->keep_count = 0;
+    cpg->on_error = AK_ON_ERROR_RAISE;
+    cpg->report = NULL;
     return cpg;
 }
 
@@ -1860,10 +3509,12 @@ static inline void
 AK_CPG_Free(AK_CodePointGrid* cpg)
 {
     for (Py_ssize_t i=0; i < cpg->lines_count; ++i) {
-        AK_CPL_Free(cpg->lines[i]);
+        if (cpg->lines[i]) {
+            AK_CPL_Free(cpg->lines[i]);
+        }
     }
-    PyMem_Free(cpg->lines);
-    PyMem_Free(cpg);
+    PyMem_RawFree(cpg->lines);
+    PyMem_RawFree(cpg);
 }
 
 //------------------------------------------------------------------------------
@@ -1873,53 +3524,46 @@ AK_CPG_Free(AK_CodePointGrid* cpg)
 static inline int
 AK_CPG_resize(AK_CodePointGrid* cpg, Py_ssize_t line)
 {
-    Py_ssize_t lines_count = cpg->lines_count;
-    if (line < lines_count) return 0; // most common scenario
+    if (line < cpg->lines_count) return 0; // most common scenario
 
     if (AK_UNLIKELY(line >= cpg->lines_capacity)) {
-        cpg->lines_capacity *= 2;
+        while (line >= cpg->lines_capacity) {
+            cpg->lines_capacity *= 2;
+        }
         // NOTE: we assume this only copies the pointers, not the data in the CPLs
-        cpg->lines = PyMem_Realloc(cpg->lines,
+        cpg->lines = PyMem_RawRealloc(cpg->lines,
                 sizeof(AK_CodePointLine*) * cpg->lines_capacity);
-        if (cpg->lines == NULL) return -1;
-    }
-    // Create the new CPL; first check if we need to set type_parse by calling into the dtypes function. For now we assume sequential growth, so should only check if equal
-    if (AK_UNLIKELY(line >= lines_count)) {
-        // determine if we need to parse types
-        bool type_parse = false;
-        if (cpg->dtypes == NULL) {
-            type_parse = true;
+        if (cpg->lines == NULL) {
+            AK_WITH_GIL(PyErr_NoMemory());
+            return -1;
         }
-        else {
-            PyObject* line_count = PyLong_FromSsize_t(line);
-            if (line_count == NULL) return -1;
-
-            PyObject* dtype_specifier = PyObject_CallFunctionObjArgs(
-                    cpg->dtypes,
-                    line_count,
-                    NULL
-                    );
-            Py_DECREF(line_count);
-
-            if (dtype_specifier == NULL) {
-                // NOTE: not sure how to get the exception from the failed call...
-                PyErr_Format(PyExc_RuntimeError,
-                        "dtypes callable failed for input: %d",
-                        line
-                        );
-                return -1;
-            }
-            if (dtype_specifier == Py_None) {
-                type_parse = true;
-            }
-            Py_DECREF(dtype_specifier);
+    }
+    // Create the new CPL; first check if we need to set type_parse by calling into the dtypes function. Growth is usually sequential; unselected lines are left NULL.
+    while (cpg->lines_count <= line) {
+        if (cpg->keep && !AK_positions_contain(cpg->keep, cpg->keep_count, cpg->lines_count)) {
+            cpg->lines[cpg->lines_count++] = NULL;
+            continue;
         }
+        // determine if we need to parse types
+        int type_parse = AK_DTypes_infer(cpg->dtypes, cpg->lines_count);
+        if (type_parse == -1) return -1;
         // Always initialize a CPL in the new position
-        AK_CodePointLine *cpl = AK_CPL_New(type_parse, cpg->tsep, cpg->decc);
+        AK_CodePointLine *cpl = AK_CPL_New(type_parse == 1,
+                cpg->tsep,
+                cpg->decc,
+                cpg->infer_datetime);
         if (cpl == NULL) return -1; // memory error set
+        cpl->infer_rows = cpg->infer_rows;
+        cpl->type_only = cpg->type_only;
+        if (cpg->na_values) {
+            cpl->na_values = cpg->na_values;
+            cpl->na_candidates = cpg->na_values->candidates;
+        }
+        if (cpl->type_parser) {
+            cpl->type_parser->downcast = cpg->downcast;
+        }
 
-        cpg->lines[line] = cpl;
-        ++cpg->lines_count;
+        cpg->lines[cpg->lines_count++] = cpl;
     }
     return 0;
 }
@@ -1938,6 +3582,20 @@ AK_CPG_AppendPointAtLine(
     return 0;
 }
 
+// Append the 1-byte points of a field on the line. Return 0 on success, -1 on failure.
+static inline int
+AK_CPG_AppendPointsAtLine(
+        AK_CodePointGrid* cpg,
+        Py_ssize_t line,
+        const Py_UCS1 *p,
+        Py_ssize_t count
+        )
+{
+    if (AK_CPG_resize(cpg, line)) return -1;
+    if (AK_CPL_AppendPoints(cpg->lines[line], p, count)) return -1;
+    return 0;
+}
+
 // Append an offset in a line. Returns 0 on success, -1 on failure.
 static inline int
 AK_CPG_AppendOffsetAtLine(
@@ -1951,99 +3609,603 @@ AK_CPG_AppendOffsetAtLine(
     return 0;
 }
 
-// Given a fully-loaded CodePointGrid, process each CodePointLine into an array and return a new list of those arrays. Returns NULL on failure.
+// A pre-allocated array to be filled from a CPL, possibly on a worker thread.
+typedef struct AK_CPLFill {
+    AK_CodePointLine *cpl;
+    PyArrayObject *array;
+    Py_ssize_t index; // position in the list
+    Py_ssize_t line; // position in the CPG
+    char tsep;
+    char decc;
+    bool sampled; // the dtype was inferred from sampled fields and must be verified
+    bool check_range; // integers that overflow a narrow dtype are errors, to be nulled
+    AK_CPLStats *stats; // NULL if statistics are not requested
+    int error;
+} AK_CPLFill;
+
+static void
+AK_CPLFill_task(void *context, Py_ssize_t index)
+{
+    AK_CPLFill *fill = (AK_CPLFill*)context + index;
+    fill->error = AK_CPL_FillArray(fill->cpl,
+            fill->array,
+            fill->tsep,
+            fill->decc,
+            fill->check_range,
+            fill->stats);
+    if (fill->error || !fill->sampled) return;
+    PyArray_Descr *descr = PyArray_DESCR(fill->array);
+    if (descr->kind == 'b') {
+        fill->error = AK_CPL_verify_bool(fill->cpl);
+    }
+    else if (descr->kind == 'M') {
+        fill->error = AK_CPL_verify_datetime(fill->cpl, AK_datetime_meta(descr)->base);
+    }
+    else {
+        fill->error = AK_CPL_verify_type(fill->cpl);
+    }
+}
+
+// Given a fully-loaded CodePointGrid, process each CodePointLine into an array and return a new list of those arrays. Dtypes are resolved and arrays are allocated on the calling thread; arrays of kinds that permit C-only conversion are then filled on up to `threads` threads with the GIL released. If `categorical` is true, lines of unsized Unicode dtypes (including all inferred strings) are returned as a tuple of codes and unique values from AK_CPL_ToCategorical. If `stats` is not NULL, it must have space for `cpg->lines_count` elements; an element is set for each array, with statistics accumulated while filling where possible, to be completed by AK_CPG_ToStatsList. Returns NULL on failure.
 static inline PyObject *
 AK_CPG_ToArrayList(AK_CodePointGrid* cpg,
         int axis,
-        PyObject* line_select,
+        AK_LineSelect* line_select,
         char tsep,
-        char decc)
+        char decc,
+        bool categorical,
+        AK_CPLStats *stats,
+        int threads)
 {
-    bool ls_inactive = line_select == NULL;
-    PyObject *list;
-
-    if (ls_inactive) {
-        // if we know how many lines we will need, can pre-allocate
-        list = PyList_New(cpg->lines_count);
-    }
-    else {
-        list = PyList_New(0);
-    }
+    PyObject *list = PyList_New(0);
     if (list == NULL) return NULL;
 
-    PyObject* dtypes = cpg->dtypes;
+    AK_CPLFill *fills = (AK_CPLFill*)PyMem_Malloc(
+            sizeof(AK_CPLFill) * (cpg->lines_count > 0 ? cpg->lines_count : 1));
+    if (fills == NULL) {
+        Py_DECREF(list);
+        return PyErr_NoMemory();
+    }
+    Py_ssize_t fills_count = 0;
 
     // Iterate over lines in the code point grid
     for (Py_ssize_t i = 0; i < cpg->lines_count; ++i) {
         // if axis is axis 1, apply keep
+        if (cpg->lines[i] == NULL) continue; // not selected by usecols
         switch (AK_line_select_keep(line_select, 1 == axis, i)) {
             case -1:
-                Py_DECREF(list);
-                return NULL;
+                goto error;
             case 0:
                 continue;
         }
-        // If dtypes is not NULL, fetch the dtype_specifier and use it to set dtype; else, pass the dtype as NULL to CPL.
-        PyArray_Descr* dtype = NULL;
-
-        if (dtypes != NULL) {
-            // NOTE: we call this with i regardless of if we skipped a line
-            PyObject* line_count = PyLong_FromSsize_t(i);
-            if (line_count == NULL) {
-                Py_DECREF(list);
-                return NULL;
-            }
-            PyObject* dtype_specifier = PyObject_CallFunctionObjArgs(
-                    dtypes,
-                    line_count,
-                    NULL
-                    );
-            Py_DECREF(line_count);
-            if (dtype_specifier == NULL) {
-                Py_DECREF(list);
-                // NOTE: not sure how to get the exception from the failed call...
-                PyErr_Format(PyExc_RuntimeError,
-                        "dtypes callable failed for input: %d",
-                        i
-                        );
-                return NULL;
-            }
-            if (dtype_specifier != Py_None) {
-                // Set dtype; this value can be NULL or a dtype (never Py_None); if dtype_specifier is Py_None, keep dtype set as NULL (above); this will be a new reference that if used will be stolen in array construction.
-                if (AK_DTypeFromSpecifier(dtype_specifier, &dtype)) {
-                    Py_DECREF(dtype_specifier);
-                    Py_DECREF(list);
-                    return NULL;
-                }
-            }
-            Py_DECREF(dtype_specifier);
+        // If dtypes gives a dtype for this line, use it; else, the dtype is NULL and is taken from the type parser of the CPL.
+        PyArray_Descr* dtype;
+        if (AK_DTypes_get(cpg->dtypes, i, &dtype)) goto error;
+        AK_CodePointLine *cpl = cpg->lines[i];
+        bool sampled = false;
+        if (dtype == NULL && cpl->type_parser) {
+            dtype = AK_TP_ToDtype(cpl->type_parser);
+            if (dtype == NULL) goto error;
+            sampled = cpl->type_parser_sampled;
         }
-        // This function will observe if dtype is NULL and read dtype from the CPL's type_parser if necessary
-        // NOTE: this might be multi-threadable for dtypes that permit C-only buffer transfers
-        PyObject* array = AK_CPL_ToArray(cpg->lines[i], dtype, tsep, decc);
-        if (array == NULL) {
-            // if array creation has been aborted due to a bad character, we will already have decrefed the array
-            Py_DECREF(list);
-            return NULL;
+        AK_CPLStats *st = NULL;
+        if (stats) {
+            st = &stats[PyList_GET_SIZE(list)];
+            st->cpl = cpl;
+            st->filled = false;
         }
-
-        if (ls_inactive) {
-            PyList_SET_ITEM(list, i, array); // steals reference
+        PyObject* array;
+        if (categorical
+                && dtype != NULL
+                && dtype->kind == 'U'
+                && dtype->elsize == 0) {
+            Py_DECREF(dtype);
+            array = AK_CPL_ToCategorical(cpl);
+            if (array == NULL) goto error;
         }
-        else {
-            if (PyList_Append(list, array)) {
+        else if (dtype != NULL && AK_CPL_fill_kind(dtype)) {
+            // allocate now, fill below
+            array = AK_CPL_NewArray(cpl, dtype);
+            if (array == NULL) goto error;
+            AK_CPLFill *fill = &fills[fills_count++];
+            fill->cpl = cpl;
+            fill->array = (PyArrayObject*)array;
+            fill->index = PyList_GET_SIZE(list);
+            fill->line = i;
+            fill->tsep = tsep;
+            fill->decc = decc;
+            fill->sampled = sampled;
+            fill->check_range = cpg->on_error != AK_ON_ERROR_RAISE;
+            fill->stats = st;
+            fill->error = 0;
+        }
+        else if (dtype != NULL
+                && dtype->kind == 'M'
+                && cpg->on_error != AK_ON_ERROR_RAISE) {
+            // units not parsed natively are converted by NumPy, field by field if any field fails
+            array = AK_CPL_NewArray(cpl, dtype);
+            if (array == NULL) goto error;
+            if (AK_CPL_NullErrors(cpl, (PyArrayObject*)array, tsep, decc, i, axis, cpg->report)) {
                 Py_DECREF(array);
-                Py_DECREF(list);
-                return NULL;
+                goto error;
             }
-            Py_DECREF(array); // decref as list owns
+            PyArray_CLEARFLAGS((PyArrayObject *)array, NPY_ARRAY_WRITEABLE);
+        }
+        else {
+            // kinds that require the Python C-API are converted here
+            array = AK_CPL_ToArray(cpl, dtype, tsep, decc);
+            if (array == NULL) goto error;
+        }
+        if (PyList_Append(list, array)) {
+            Py_DECREF(array);
+            goto error;
         }
+        Py_DECREF(array); // decref as list owns
     }
-    return list;
-}
 
-//------------------------------------------------------------------------------
-// AK_Dialect, based on _csv.c from CPython
+    if (AK_TaskPool_Run(AK_CPLFill_task, fills, fills_count, threads)) goto error;
+
+    for (Py_ssize_t i = 0; i < fills_count; ++i) {
+        // the list holds a reference to each array; AK_CPL_FinalizeArray releases one reference if it does not return the same array
+        PyObject *array = (PyObject*)fills[i].array;
+        Py_INCREF(array);
+        PyObject *final;
+        if (fills[i].error && fills[i].stats) {
+            // values were changed after filling; statistics are evaluated from the final array
+            fills[i].stats->filled = false;
+        }
+        if (fills[i].error && fills[i].sampled) {
+            // the type inferred from sampled fields does not fit all fields: infer from all fields and convert again
+            Py_DECREF(array);
+            if (fills[i].cpl->type_parser_sampled) { // not yet evaluated by AK_CPL_verify_type
+                AK_CPL_Reinfer(fills[i].cpl);
+            }
+            final = AK_CPL_ToArray(fills[i].cpl, NULL, tsep, decc);
+        }
+        else {
+            if (fills[i].error
+                    && cpg->on_error != AK_ON_ERROR_RAISE
+                    && fills[i].error != AK_ERROR_ITEMSIZE) {
+                if (AK_CPL_NullErrors(fills[i].cpl,
+                        fills[i].array,
+                        tsep,
+                        decc,
+                        fills[i].line,
+                        axis,
+                        cpg->report)) {
+                    Py_DECREF(array);
+                    goto error;
+                }
+                fills[i].error = 0;
+            }
+            final = AK_CPL_FinalizeArray(fills[i].cpl, array, fills[i].error);
+        }
+        if (final == NULL) goto error;
+        if (final == array) {
+            Py_DECREF(array);
+        }
+        else { // steals the reference to final, releases the list's reference to array
+            PyList_SET_ITEM(list, fills[i].index, final);
+            Py_DECREF(array);
+        }
+    }
+    PyMem_Free(fills);
+    return list;
+error:
+    PyMem_Free(fills);
+    Py_DECREF(list);
+    return NULL;
+}
+
+// Given a fully-loaded CodePointGrid, write the fields of each line into `out`, a sequence of one writable, contiguous, 1D array per line selected, starting at position `offset` of each array. Arrays of kinds that permit C-only conversion are filled in place on up to `threads` threads with the GIL released; other kinds are converted to a new array and copied. Returns the most fields written to any array, or -1 on failure.
+static inline Py_ssize_t
+AK_CPG_ToOut(AK_CodePointGrid* cpg,
+        int axis,
+        AK_LineSelect* line_select,
+        char tsep,
+        char decc,
+        PyObject *out,
+        Py_ssize_t offset,
+        int threads)
+{
+    Py_ssize_t rows = -1;
+    Py_ssize_t *selected = NULL;
+    AK_CPLFill *fills = NULL;
+    PyObject *views = NULL;
+    PyObject *seq = PySequence_Fast(out, "out must be a sequence of arrays");
+    if (seq == NULL) return -1;
+    Py_ssize_t out_count = PySequence_Fast_GET_SIZE(seq);
+    PyObject **items = PySequence_Fast_ITEMS(seq);
+
+    // line_select might be a function, and is only called once per line
+    selected = (Py_ssize_t*)PyMem_Malloc(
+            sizeof(Py_ssize_t) * (cpg->lines_count > 0 ? cpg->lines_count : 1));
+    fills = (AK_CPLFill*)PyMem_Malloc(
+            sizeof(AK_CPLFill) * (cpg->lines_count > 0 ? cpg->lines_count : 1));
+    views = PyList_New(0);
+    if (selected == NULL || fills == NULL) {
+        PyErr_NoMemory();
+        goto finally;
+    }
+    if (views == NULL) goto finally;
+    Py_ssize_t selected_count = 0;
+    for (Py_ssize_t i = 0; i < cpg->lines_count; ++i) {
+        if (cpg->lines[i] == NULL) continue; // not selected by usecols
+        switch (AK_line_select_keep(line_select, 1 == axis, i)) {
+            case -1:
+                goto finally;
+            case 1:
+                selected[selected_count++] = i;
+        }
+    }
+    if (selected_count != out_count) {
+        PyErr_Format(PyExc_ValueError,
+                "out has %zd arrays but %zd lines were loaded",
+                out_count,
+                selected_count);
+        goto finally;
+    }
+    // validate all arrays before writing to any
+    Py_ssize_t most = 0;
+    for (Py_ssize_t j = 0; j < out_count; ++j) {
+        PyObject *target = items[j];
+        if (!PyArray_Check(target)
+                || PyArray_NDIM((PyArrayObject*)target) != 1
+                || !PyArray_IS_C_CONTIGUOUS((PyArrayObject*)target)
+                || !PyArray_ISWRITEABLE((PyArrayObject*)target)) {
+            PyErr_SetString(PyExc_ValueError,
+                    "out must be a sequence of writable, contiguous, 1D arrays");
+            goto finally;
+        }
+        Py_ssize_t count = cpg->lines[selected[j]]->offsets_count;
+        if (offset + count > PyArray_DIM((PyArrayObject*)target, 0)) {
+            PyErr_Format(PyExc_ValueError,
+                    "out array %zd has fewer than %zd elements",
+                    j,
+                    offset + count);
+            goto finally;
+        }
+        if (count > most) most = count;
+    }
+    Py_ssize_t fills_count = 0;
+    for (Py_ssize_t j = 0; j < out_count; ++j) {
+        PyArrayObject *target = (PyArrayObject*)items[j];
+        AK_CodePointLine *cpl = cpg->lines[selected[j]];
+        PyArray_Descr *dtype = PyArray_DESCR(target);
+        npy_intp dims[] = {cpl->offsets_count};
+
+        Py_INCREF(dtype);
+        PyObject *view = PyArray_NewFromDescr(&PyArray_Type,
+                dtype,
+                1,
+                dims,
+                NULL,
+                PyArray_BYTES(target) + offset * PyArray_ITEMSIZE(target),
+                NPY_ARRAY_CARRAY,
+                NULL); // steals dtype
+        if (view == NULL) goto finally;
+        Py_INCREF(target);
+        if (PyArray_SetBaseObject((PyArrayObject*)view, (PyObject*)target)) { // steals target
+            Py_DECREF(view);
+            goto finally;
+        }
+        if (PyList_Append(views, view)) {
+            Py_DECREF(view);
+            goto finally;
+        }
+        Py_DECREF(view); // decref as list owns
+
+        if (AK_CPL_fill_kind(dtype)) {
+            AK_CPLFill *fill = &fills[fills_count++];
+            fill->cpl = cpl;
+            fill->array = (PyArrayObject*)view;
+            fill->index = j;
+            fill->line = selected[j];
+            fill->tsep = tsep;
+            fill->decc = decc;
+            fill->sampled = false;
+            fill->check_range = cpg->on_error != AK_ON_ERROR_RAISE;
+            fill->stats = NULL;
+            fill->error = 0;
+        }
+        else if (dtype->kind == 'M' && cpg->on_error != AK_ON_ERROR_RAISE) {
+            // units not parsed natively are converted by NumPy, field by field if any field fails
+            if (AK_CPL_NullErrors(cpl,
+                    (PyArrayObject*)view,
+                    tsep,
+                    decc,
+                    selected[j],
+                    axis,
+                    cpg->report)) goto finally;
+        }
+        else {
+            // kinds that require the Python C-API are converted to a new array and copied
+            PyArray_Descr *dtype_new = PyArray_DescrNew(dtype);
+            if (dtype_new == NULL) goto finally;
+            PyObject *array = AK_CPL_ToArray(cpl, dtype_new, tsep, decc);
+            if (array == NULL) goto finally;
+            int err = PyArray_CopyInto((PyArrayObject*)view, (PyArrayObject*)array);
+            Py_DECREF(array);
+            if (err) goto finally;
+        }
+    }
+
+    if (AK_TaskPool_Run(AK_CPLFill_task, fills, fills_count, threads)) goto finally;
+
+    for (Py_ssize_t i = 0; i < fills_count; ++i) {
+        AK_CPLFill *fill = &fills[i];
+        if (fill->error == AK_ERROR_DATETIME && cpg->on_error == AK_ON_ERROR_RAISE) {
+            // fields not parsed natively are converted by NumPy and copied
+            PyArray_Descr *dtype_new = PyArray_DescrNew(PyArray_DESCR(fill->array));
+            if (dtype_new == NULL) goto finally;
+            PyObject *array = AK_CPL_to_array_via_cast(fill->cpl, dtype_new, NPY_UNICODE);
+            if (array == NULL) goto finally;
+            int err = PyArray_CopyInto(fill->array, (PyArrayObject*)array);
+            Py_DECREF(array);
+            if (err) goto finally;
+        }
+        else if (fill->error
+                && cpg->on_error != AK_ON_ERROR_RAISE
+                && fill->error != AK_ERROR_ITEMSIZE) {
+            if (AK_CPL_NullErrors(fill->cpl,
+                    fill->array,
+                    tsep,
+                    decc,
+                    fill->line,
+                    axis,
+                    cpg->report)) goto finally;
+        }
+        else if (fill->error) {
+            // sets the exception and releases the reference
+            Py_INCREF(fill->array);
+            AK_CPL_FinalizeArray(fill->cpl, (PyObject*)fill->array, fill->error);
+            goto finally;
+        }
+    }
+    rows = most;
+finally:
+    Py_XDECREF(views);
+    PyMem_Free(fills);
+    PyMem_Free(selected);
+    Py_DECREF(seq);
+    return rows;
+}
+
+// Given a fully-loaded CodePointGrid, return a new list of the dtype of each line, as would be used by AK_CPG_ToArrayList. If `widths` is not NULL, it is set to a new list of the max field width (in code points) of each line. Lines need not store code points. Returns NULL on failure.
+static inline PyObject *
+AK_CPG_ToDtypeList(AK_CodePointGrid* cpg,
+        int axis,
+        AK_LineSelect* line_select,
+        PyObject **widths)
+{
+    PyObject *list = PyList_New(0);
+    if (list == NULL) return NULL;
+    if (widths) {
+        *widths = PyList_New(0);
+        if (*widths == NULL) goto error;
+    }
+    for (Py_ssize_t i = 0; i < cpg->lines_count; ++i) {
+        if (cpg->lines[i] == NULL) continue; // not selected by usecols
+        switch (AK_line_select_keep(line_select, 1 == axis, i)) {
+            case -1:
+                goto error;
+            case 0:
+                continue;
+        }
+        PyArray_Descr* dtype;
+        if (AK_DTypes_get(cpg->dtypes, i, &dtype)) goto error;
+        AK_CodePointLine *cpl = cpg->lines[i];
+        if (dtype == NULL) {
+            dtype = AK_TP_ToDtype(cpl->type_parser);
+            if (dtype == NULL) goto error;
+        }
+        AK_CPL_size_flexible(cpl, dtype);
+        if (PyList_Append(list, (PyObject*)dtype)) {
+            Py_DECREF(dtype);
+            goto error;
+        }
+        Py_DECREF(dtype); // decref as list owns
+        if (widths) {
+            PyObject *width = PyLong_FromSsize_t(cpl->offset_max);
+            if (width == NULL) goto error;
+            if (PyList_Append(*widths, width)) {
+                Py_DECREF(width);
+                goto error;
+            }
+            Py_DECREF(width);
+        }
+    }
+    return list;
+error:
+    Py_DECREF(list);
+    if (widths) {
+        Py_CLEAR(*widths);
+    }
+    return NULL;
+}
+
+// Given a fully-loaded CodePointGrid, return a new list of an immutable Boolean array for each line, as would be selected by AK_CPG_ToArrayList, that is true where a field is missing: empty, or (as stored as empty) matching a token of `na_values`. Returns NULL on failure.
+static inline PyObject *
+AK_CPG_ToMaskList(AK_CodePointGrid* cpg,
+        int axis,
+        AK_LineSelect* line_select)
+{
+    PyObject *list = PyList_New(0);
+    if (list == NULL) return NULL;
+
+    for (Py_ssize_t i = 0; i < cpg->lines_count; ++i) {
+        if (cpg->lines[i] == NULL) continue; // not selected by usecols
+        switch (AK_line_select_keep(line_select, 1 == axis, i)) {
+            case -1:
+                goto error;
+            case 0:
+                continue;
+        }
+        AK_CodePointLine *cpl = cpg->lines[i];
+        npy_intp dims[] = {cpl->offsets_count};
+        PyObject *mask = PyArray_EMPTY(1, dims, NPY_BOOL, 0);
+        if (mask == NULL) goto error;
+        npy_bool *mask_buffer = (npy_bool*)PyArray_DATA((PyArrayObject*)mask);
+        for (Py_ssize_t j = 0; j < cpl->offsets_count; ++j) {
+            mask_buffer[j] = cpl->offsets[j] == 0;
+        }
+        for (Py_ssize_t j = 0; j < cpl->errors_count; ++j) {
+            mask_buffer[cpl->errors[j]] = 1;
+        }
+        PyArray_CLEARFLAGS((PyArrayObject *)mask, NPY_ARRAY_WRITEABLE);
+        if (PyList_Append(list, mask)) {
+            Py_DECREF(mask);
+            goto error;
+        }
+        Py_DECREF(mask); // decref as list owns
+    }
+    return list;
+error:
+    Py_DECREF(list);
+    return NULL;
+}
+
+// Evaluate all elements of an array of `type`, where `value_null` evaluates to true if the value at position `i` of `values` is null.
+#define AK_CPL_STATS_ORDERED(type, value_null, lt)                               \
+    do {                                                                         \
+        type *values = (type*)PyArray_DATA(stats->array);                        \
+        for (Py_ssize_t i = 0; i < count; ++i) {                                 \
+            bool null = (value_null);                                            \
+            if (e < cpl->errors_count && cpl->errors[e] == i) {                  \
+                null = true;                                                     \
+                ++e;                                                             \
+            }                                                                    \
+            AK_CPLStats_UPDATE(stats, values, i, null, lt);                      \
+        }                                                                        \
+    } while (0)
+
+// Evaluate statistics for arrays not filled by AK_CPL_FillArray, or for which fields were converted again after an error.
+static void
+AK_CPLStats_task(void *context, Py_ssize_t index)
+{
+    AK_CPLStats *stats = (AK_CPLStats*)context + index;
+    if (stats->filled) return;
+
+    AK_CodePointLine *cpl = stats->cpl;
+    Py_ssize_t count = cpl->offsets_count;
+    Py_ssize_t e = 0; // position in errors
+
+    AK_CPLStats_init(stats, true);
+    char kind = stats->array ? PyArray_DESCR(stats->array)->kind : '\0';
+    int elsize = stats->array ? PyArray_DESCR(stats->array)->elsize : 0;
+    if (kind == 'b') {
+        AK_CPL_STATS_ORDERED(npy_bool, cpl->offsets[i] == 0, AK_STATS_LT);
+    }
+    else if (kind == 'i' && elsize == 8) {
+        AK_CPL_STATS_ORDERED(npy_int64, cpl->offsets[i] == 0, AK_STATS_LT);
+    }
+    else if (kind == 'i' && elsize == 4) {
+        AK_CPL_STATS_ORDERED(npy_int32, cpl->offsets[i] == 0, AK_STATS_LT);
+    }
+    else if (kind == 'i' && elsize == 2) {
+        AK_CPL_STATS_ORDERED(npy_int16, cpl->offsets[i] == 0, AK_STATS_LT);
+    }
+    else if (kind == 'i' && elsize == 1) {
+        AK_CPL_STATS_ORDERED(npy_int8, cpl->offsets[i] == 0, AK_STATS_LT);
+    }
+    else if (kind == 'u' && elsize == 8) {
+        AK_CPL_STATS_ORDERED(npy_uint64, cpl->offsets[i] == 0, AK_STATS_LT);
+    }
+    else if (kind == 'u' && elsize == 4) {
+        AK_CPL_STATS_ORDERED(npy_uint32, cpl->offsets[i] == 0, AK_STATS_LT);
+    }
+    else if (kind == 'u' && elsize == 2) {
+        AK_CPL_STATS_ORDERED(npy_uint16, cpl->offsets[i] == 0, AK_STATS_LT);
+    }
+    else if (kind == 'u' && elsize == 1) {
+        AK_CPL_STATS_ORDERED(npy_uint8, cpl->offsets[i] == 0, AK_STATS_LT);
+    }
+    else if (kind == 'f' && elsize == 8) {
+        AK_CPL_STATS_ORDERED(npy_float64, values[i] != values[i], AK_STATS_LT_FLOAT);
+    }
+    else if (kind == 'f' && elsize == 4) {
+        AK_CPL_STATS_ORDERED(npy_float32, values[i] != values[i], AK_STATS_LT_FLOAT);
+    }
+    else if (kind == 'f' && elsize == 2) { // half floats are compared as doubles
+        AK_CPL_STATS_ORDERED(npy_half, npy_half_isnan(values[i]), AK_STATS_LT_HALF);
+    }
+    else if (kind == 'f' && elsize == sizeof(npy_longdouble)) {
+        AK_CPL_STATS_ORDERED(npy_longdouble, values[i] != values[i], AK_STATS_LT_FLOAT);
+    }
+    else if (kind == 'M') {
+        AK_CPL_STATS_ORDERED(npy_int64, values[i] == NPY_DATETIME_NAT, AK_STATS_LT);
+    }
+    else { // only empty fields are counted as null
+        stats->ordered = false;
+        for (Py_ssize_t i = 0; i < count; ++i) {
+            if (cpl->offsets[i] == 0) {
+                ++stats->null_count;
+            }
+        }
+    }
+}
+
+// Given `stats` populated by AK_CPG_ToArrayList and the list it returned, return a new list of a dict of statistics for each array: "null_count", "min", "max", "width" (the most code points in a field), "increasing", and "decreasing". For arrays of kinds that are not ordered, "min", "max", "increasing", and "decreasing" are None. Statistics not accumulated while filling are evaluated on up to `threads` threads with the GIL released. Returns NULL on failure.
+static inline PyObject *
+AK_CPG_ToStatsList(AK_CPLStats *stats, PyObject *arrays, int threads)
+{
+    Py_ssize_t count = PyList_GET_SIZE(arrays);
+    for (Py_ssize_t i = 0; i < count; ++i) {
+        PyObject *array = PyList_GET_ITEM(arrays, i);
+        stats[i].array = PyArray_Check(array) ? (PyArrayObject*)array : NULL;
+        if (stats[i].array == NULL) {
+            stats[i].filled = false;
+        }
+    }
+    if (AK_TaskPool_Run(AK_CPLStats_task, stats, count, threads)) return NULL;
+
+    PyObject *list = PyList_New(count);
+    if (list == NULL) return NULL;
+    for (Py_ssize_t k = 0; k < count; ++k) {
+        AK_CPLStats *st = &stats[k];
+        PyObject *min = Py_None;
+        PyObject *max = Py_None;
+        PyObject *increasing = Py_None;
+        PyObject *decreasing = Py_None;
+        if (st->ordered) {
+            increasing = st->increasing ? Py_True : Py_False;
+            decreasing = st->decreasing ? Py_True : Py_False;
+        }
+        if (st->ordered && st->min_index >= 0) {
+            min = PyArray_Scalar(PyArray_GETPTR1(st->array, st->min_index),
+                    PyArray_DESCR(st->array),
+                    (PyObject*)st->array);
+            max = PyArray_Scalar(PyArray_GETPTR1(st->array, st->max_index),
+                    PyArray_DESCR(st->array),
+                    (PyObject*)st->array);
+        }
+        else {
+            Py_INCREF(min);
+            Py_INCREF(max);
+        }
+        PyObject *item = NULL;
+        if (min && max) {
+            item = Py_BuildValue("{snsOsOsnsOsO}",
+                    "null_count", st->null_count,
+                    "min", min,
+                    "max", max,
+                    "width", st->cpl->offset_max,
+                    "increasing", increasing,
+                    "decreasing", decreasing);
+        }
+        Py_XDECREF(min);
+        Py_XDECREF(max);
+        if (item == NULL) {
+            Py_DECREF(list);
+            return NULL;
+        }
+        PyList_SET_ITEM(list, k, item); // steals reference
+    }
+    return list;
+}
+
+//------------------------------------------------------------------------------
+// AK_Dialect, based on _csv.c from CPython
 
 typedef enum AK_DialectQuoteStyle {
     QUOTE_MINIMAL,
@@ -2213,6 +4375,10 @@ typedef enum AK_DelimitedReaderState {
 
 typedef struct AK_DelimitedReader{
     PyObject *input_iter;
+    Py_buffer buffer;           // used in place of input_iter when buffer_active
+    bool buffer_active;
+    const Py_UCS1 *buffer_pos;  // start of the next line to read
+    const Py_UCS1 *buffer_end;
     PyObject *line_select;
     AK_Dialect *dialect;
     AK_DelimitedReaderState state;
@@ -2222,27 +4388,76 @@ typedef struct AK_DelimitedReader{
     Py_ssize_t field_number; // field in current record, reset for each record
     int axis;
     Py_ssize_t *axis_pos; // points to either record_number or field_number
+    Py_ssize_t *field_keep; // if not NULL, sorted, unique field positions to load
+    Py_ssize_t field_keep_count;
+    bool field_skip; // if the current field is not loaded
+    bool plain_active; // if records without special characters can be split on the delimiter alone
+    Py_UCS1 plain_specials[5]; // characters that require AK_DR_process_char
+    int plain_specials_count;
+    Py_ssize_t *fixed_specs; // if not NULL, start and stop pairs of fixed-width fields, in code points
+    Py_ssize_t fixed_count;
+    Py_UCS4 *fixed_points; // if not NULL, decoded points of a non-ASCII UTF-8 record
+    Py_ssize_t fixed_points_capacity;
+    Py_ssize_t skip_header; // count of lines not yet skipped from the start of input_iter
+    PyObject **footer_lines; // if not NULL, a ring of the last lines from input_iter, not yet processed
+    Py_ssize_t footer_count;
+    Py_ssize_t footer_pos;
+    Py_UCS4 comment_char; // if not null, lines starting with this character are skipped
+    AK_OnError on_error; // if not AK_ON_ERROR_RAISE, strict-mode errors are recovered as if not strict
+    PyObject *report; // if not NULL, a list to collect (record, field, text) tuples of errors; borrowed
 } AK_DelimitedReader;
 
+// Return true if the field at `field_number` is not selected to be loaded. Cannot error.
+static inline bool
+AK_DR_field_skip(AK_DelimitedReader *dr)
+{
+    return dr->field_keep && !AK_positions_contain(dr->field_keep,
+            dr->field_keep_count,
+            dr->field_number);
+}
+
+// On axis 1, lines are field positions: share the field selection with the AK_CodePointGrid such that lines not selected are not created. Cannot error.
+static inline void
+AK_DR_share_keep(AK_DelimitedReader *dr, AK_CodePointGrid *cpg)
+{
+    if (dr->axis == 1) {
+        cpg->keep = dr->field_keep;
+        cpg->keep_count = dr->field_keep_count;
+    }
+}
+
 // Called once at the close of each field in a line. Returns 0 on success, -1 on failure
 static inline int
 AK_DR_close_field(AK_DelimitedReader *dr, AK_CodePointGrid *cpg)
 {
-    if (AK_CPG_AppendOffsetAtLine(cpg,
+    if (!dr->field_skip && AK_CPG_AppendOffsetAtLine(cpg,
             *(dr->axis_pos),
             dr->field_len)) return -1;
     dr->field_len = 0; // clear to close
     // AK_DEBUG_MSG_OBJ("closing field", PyLong_FromLong(dr->field_number));
     ++dr->field_number; // increment after adding each offset, reset in AK_DR_line_reset
+    dr->field_skip = AK_DR_field_skip(dr);
     return 0;
 }
 
+// Append a strict-mode error at the current record and field to the report, with the unexpected character (or an empty string at the end of data) as its text. Returns 0 on success, -1 on failure.
+static inline int
+AK_DR_report(AK_DelimitedReader *dr, Py_UCS4 c)
+{
+    int err;
+    AK_WITH_GIL(err = AK_report_append(dr->report,
+            dr->record_number,
+            dr->field_number,
+            c ? PyUnicode_FromOrdinal(c) : PyUnicode_New(0, 0)));
+    return err;
+}
+
 // Called once to add each character, appending that character to the CPL. Return 0 on success, -1 on failure.
 static inline int
 AK_DR_add_char(AK_DelimitedReader *dr, AK_CodePointGrid *cpg, Py_UCS4 c)
 {
-    // NOTE: ideally we could use line_select here; however, we would need to cache the lookup in another container as this is called once per char and line_select is a Python function; further, we would need to increment the field_number separately from another counter, which is done in AK_DR_close_field
-    if (AK_CPG_AppendPointAtLine(cpg,
+    // NOTE: ideally we could use line_select here; however, we would need to cache the lookup in another container as this is called once per char and line_select is a Python function; further, we would need to increment the field_number separately from another counter, which is done in AK_DR_close_field. Fields not selected by usecols are tokenized but not loaded.
+    if (!dr->field_skip && AK_CPG_AppendPointAtLine(cpg,
             *(dr->axis_pos),
             dr->field_len,
             c)) return -1;
@@ -2350,13 +4565,14 @@ AK_DR_process_char(AK_DelimitedReader *dr, AK_CodePointGrid *cpg, Py_UCS4 c)
             if (AK_DR_close_field(dr, cpg)) return -1;
             dr->state = (c == '\0' ? START_RECORD : EAT_CRNL);
         }
-        else if (!dialect->strict) {
+        else if (!dialect->strict || dr->on_error != AK_ON_ERROR_RAISE) {
+            if (dialect->strict && dr->report && AK_DR_report(dr, c)) return -1;
             if (AK_DR_add_char(dr, cpg, c)) return -1;
             dr->state = IN_FIELD;
         }
         else { // illegal
-            PyErr_Format(PyExc_RuntimeError, "'%c' expected after '%c'",
-                    dialect->delimiter, dialect->quotechar);
+            AK_WITH_GIL(PyErr_Format(PyExc_RuntimeError, "'%c' expected after '%c'",
+                    dialect->delimiter, dialect->quotechar));
             return -1;
         }
         break;
@@ -2365,8 +4581,8 @@ AK_DR_process_char(AK_DelimitedReader *dr, AK_CodePointGrid *cpg, Py_UCS4 c)
         else if (c == '\0')
             dr->state = START_RECORD;
         else {
-            PyErr_Format(PyExc_RuntimeError,
-                    "new-line character seen in unquoted field - do you need to open the file in universal-newline mode?");
+            AK_WITH_GIL(PyErr_Format(PyExc_RuntimeError,
+                    "new-line character seen in unquoted field - do you need to open the file in universal-newline mode?"));
             return -1;
         }
         break;
@@ -2381,159 +4597,733 @@ AK_DR_line_reset(AK_DelimitedReader *dr)
     dr->field_len = 0;
     dr->state = START_RECORD;
     dr->field_number = 0;
+    dr->field_skip = AK_DR_field_skip(dr);
 }
 
-// Using AK_DelimitedReader's state, process one record (via next(input_iter)); call AK_DR_process_char on each char in that line, loading individual fields into AK_CodePointGrid. Returns 1 when there are more lines to process, 0 when there are no lines to process, and -1 for error.
+// Called when the input is exhausted; close any field left open by the last record. Returns 0 on success, -1 on error.
 static inline int
-AK_DR_ProcessRecord(AK_DelimitedReader *dr,
-        AK_CodePointGrid *cpg,
-        PyObject *line_select
-        )
+AK_DR_close_input(AK_DelimitedReader *dr, AK_CodePointGrid *cpg)
 {
-    Py_ssize_t linelen;
-    unsigned int kind;
-    const void *data;
-    PyObject *record;
-
-    AK_DR_line_reset(dr);
-    do {
-        // get a string, representing one record, to parse
-        record = PyIter_Next(dr->input_iter);
-        if (record == NULL) {
-            if (PyErr_Occurred()) return -1;
-            // if parser is in an unexptected state
-            if ((dr->field_len != 0) || (dr->state == IN_QUOTED_FIELD)) {
-                if (dr->dialect->strict) {
-                    PyErr_SetString(PyExc_RuntimeError, "unexpected end of data");
-                    return -1;
-                }
-                // try to close the field, propagate error
-                if (AK_DR_close_field(dr, cpg)) return -1;
-            }
-            return 0; // end of input, not an error
-        }
-        ++dr->record_iter_number;
-
-        if (!PyUnicode_Check(record)) {
-            PyErr_Format(PyExc_RuntimeError,
-                    "iterator should return strings, not %.200s "
-                    "(the file should be opened in text mode)",
-                    Py_TYPE(record)->tp_name
-                    );
-            Py_DECREF(record);
-            return -1;
-        }
-        if (PyUnicode_READY(record) == -1) {
-            Py_DECREF(record);
+    // if parser is in an unexptected state
+    if ((dr->field_len != 0) || (dr->state == IN_QUOTED_FIELD)) {
+        if (dr->dialect->strict && dr->report && AK_DR_report(dr, '\0')) return -1;
+        if (dr->dialect->strict && dr->on_error == AK_ON_ERROR_RAISE) {
+            AK_WITH_GIL(PyErr_SetString(PyExc_RuntimeError, "unexpected end of data"));
             return -1;
         }
-
-        switch (AK_line_select_keep(line_select,
-                0 == dr->axis,
-                dr->record_iter_number)) {
-            case -1 :
-                Py_DECREF(record);
-                return -1;
-            case 0:
-                Py_DECREF(record);
-                return 1; // skip, process more records
-        }
-        // NOTE: record_number should reflect the processed line count, and exlude any skipped lines. The value is initialized to -1 such the first line is number 0
-        ++dr->record_number;
-        // AK_DEBUG_MSG_OBJ("processing line", PyLong_FromLong(dr->record_number));
-
-        kind = PyUnicode_KIND(record);
-        data = PyUnicode_DATA(record);
-        linelen = PyUnicode_GET_LENGTH(record);
-
-        // NOTE: we used to check that the read character was not \0; this seems rare enough to not be necessary to handle explicit, as AK_DR_process_char will treat it as an end of record
-        switch (kind) {
-            case PyUnicode_1BYTE_KIND: {
-                Py_UCS1* uc = (Py_UCS1*)data;
-                Py_UCS1* uc_end = uc + linelen;
-                while (uc < uc_end) {
-                    if (AK_DR_process_char(dr, cpg, *uc++)) {
-                        Py_DECREF(record);
-                        return -1;
-                    }
-                }
-                break;
-            }
-            case PyUnicode_2BYTE_KIND: {
-                Py_UCS2* uc = (Py_UCS2*)data;
-                Py_UCS2* uc_end = uc + linelen;
-                while (uc < uc_end) {
-                    if (AK_DR_process_char(dr, cpg, *uc++)) {
-                        Py_DECREF(record);
-                        return -1;
-                    }
-                }
-                break;
-            }
-            case PyUnicode_4BYTE_KIND: {
-                Py_UCS4* uc = (Py_UCS4*)data;
-                Py_UCS4* uc_end = uc + linelen;
-                while (uc < uc_end) {
-                    if (AK_DR_process_char(dr, cpg, *uc++)) {
-                        Py_DECREF(record);
-                        return -1;
-                    }
-                }
-                break;
-            }
-        }
-        Py_DECREF(record);
-        // force signaling we are at the end of a line
-        if (AK_DR_process_char(dr, cpg, '\0')) return -1;
-
-    } while (dr->state != START_RECORD);
-    return 1; // more lines to process
+        // try to close the field, propagate error
+        if (AK_DR_close_field(dr, cpg)) return -1;
+    }
+    return 0;
 }
 
-static inline void
-AK_DR_Free(AK_DelimitedReader *dr)
+// Return the length in bytes of the next line in the buffer, including its line terminator. As with universal newlines, lines end with \n, \r\n, or a lone \r. Cannot error.
+static inline Py_ssize_t
+AK_DR_buffer_line_length(AK_DelimitedReader *dr)
 {
-    if (dr->dialect) {
-        AK_Dialect_Free(dr->dialect);
+    const Py_UCS1 *p = dr->buffer_pos;
+    Py_ssize_t remaining = dr->buffer_end - p;
+
+    const Py_UCS1 *nl = (const Py_UCS1 *)memchr(p, '\n', remaining);
+    Py_ssize_t len = nl == NULL ? remaining : nl - p + 1;
+    // only search for \r within the current line to avoid scanning the remainder of the buffer
+    const Py_UCS1 *cr = (const Py_UCS1 *)memchr(p, '\r', len);
+    if (cr != NULL && cr + 1 < p + remaining && *(cr + 1) != '\n') {
+        len = cr - p + 1; // a lone \r
     }
-    Py_XDECREF(dr->input_iter); // might already be NULL
-    PyMem_Free(dr);
+    return len;
 }
 
-// The arguments to this constructor are validated before this function is valled. Returns NULL on error.
-static inline AK_DelimitedReader *
-AK_DR_New(PyObject *iterable,
-        int axis,
-        PyObject *delimiter,
-        PyObject *doublequote,
-        PyObject *escapechar,
-        PyObject *quotechar,
-        PyObject *quoting,
-        PyObject *skipinitialspace,
-        PyObject *strict
-        )
+// Decode one UTF-8 code point starting at *p, advancing *p past the code point. Returns 0 on success, -1 for invalid or truncated sequences; does not set an exception.
+static inline int
+AK_UTF8_decode(const Py_UCS1 **p, const Py_UCS1 *end, Py_UCS4 *c)
 {
-    AK_DelimitedReader *dr = (AK_DelimitedReader*)PyMem_Malloc(sizeof(AK_DelimitedReader));
-    if (dr == NULL) return (AK_DelimitedReader*)PyErr_NoMemory();
-
-    dr->axis = axis;
+    const Py_UCS1 *s = *p;
+    Py_UCS4 point = *s;
+    int n; // count of continuation bytes
 
-    // we configure axis_pos to be a pointer that points to either record_number or field_number to avoid doing this per char/ field.
-    if (axis == 0) {
-        dr->axis_pos = &(dr->record_number);
+    if (point < 0x80) {
+        *c = point;
+        *p = s + 1;
+        return 0;
+    }
+    else if ((point & 0xE0) == 0xC0) {
+        n = 1;
+        point &= 0x1F;
+    }
+    else if ((point & 0xF0) == 0xE0) {
+        n = 2;
+        point &= 0x0F;
+    }
+    else if ((point & 0xF8) == 0xF0) {
+        n = 3;
+        point &= 0x07;
     }
     else {
-        dr->axis_pos = &(dr->field_number);
+        return -1;
     }
+    if (end - s <= n) return -1;
 
-    dr->record_number = -1;
-    dr->record_iter_number = -1;
-    dr->dialect = NULL; // init in case input_iter fails to init
-
-    dr->input_iter = PyObject_GetIter(iterable); // new ref, decref in free
-    if (dr->input_iter == NULL) {
-        AK_DR_Free(dr);
-        return NULL;
+    for (int i = 1; i <= n; ++i) {
+        if ((s[i] & 0xC0) != 0x80) return -1;
+        point = (point << 6) | (s[i] & 0x3F);
+    }
+    // reject overlong encodings, surrogates, and values beyond the unicode range
+    if ((n == 1 && point < 0x80)
+            || (n == 2 && point < 0x800)
+            || (n == 3 && point < 0x10000)
+            || point > 0x10FFFF
+            || (point >= 0xD800 && point <= 0xDFFF)) {
+        return -1;
+    }
+    *c = point;
+    *p = s + n + 1;
+    return 0;
+}
+
+// Pseudo kind used for UTF-8 lines read from a buffer; PyUnicode kinds are 1, 2, or 4.
+# define AK_UTF8_KIND 0
+
+//------------------------------------------------------------------------------
+// AK_DelimitedReader: plain records
+
+// Records of 1-byte points (or ASCII UTF-8 bytes) without quote, escape, null, or line terminator characters (other than a terminator ending the record) are split on the delimiter alone, as a word of eight bytes at a time, and fields are appended to the CPL at once, bypassing AK_DR_process_char.
+
+# define AK_SWAR_ONES ((npy_uint64)0x0101010101010101ULL)
+# define AK_SWAR_HIGHS ((npy_uint64)0x8080808080808080ULL)
+
+// Return a non-zero value if any byte of `word` is zero. As borrows propagate to higher bytes, this identifies that a zero byte is present, not which. Cannot error.
+static inline npy_uint64
+AK_SWAR_has_zero(npy_uint64 word)
+{
+    return (word - AK_SWAR_ONES) & ~word & AK_SWAR_HIGHS;
+}
+
+// Configure the plain record fast path from the dialect. Plain records are not used with skipinitialspace or a delimiter that is not a 1-byte point. Cannot error.
+static inline void
+AK_DR_plain_init(AK_DelimitedReader *dr)
+{
+    AK_Dialect *dialect = dr->dialect;
+    dr->plain_active = !dialect->skipinitialspace && dialect->delimiter < 0x100;
+    dr->plain_specials_count = 0;
+    dr->plain_specials[dr->plain_specials_count++] = '\0';
+    dr->plain_specials[dr->plain_specials_count++] = '\n';
+    dr->plain_specials[dr->plain_specials_count++] = '\r';
+    // characters that do not fit 1-byte points cannot be found in plain records
+    if (dialect->quoting != QUOTE_NONE && dialect->quotechar < 0x100) {
+        dr->plain_specials[dr->plain_specials_count++] = (Py_UCS1)dialect->quotechar;
+    }
+    if (dialect->escapechar != '\0' && dialect->escapechar < 0x100) {
+        dr->plain_specials[dr->plain_specials_count++] = (Py_UCS1)dialect->escapechar;
+    }
+}
+
+// Return true if the `count` bytes of a record, less its line terminator, contain no special characters and, if `ascii`, only ASCII bytes. Cannot error.
+static inline bool
+AK_DR_line_plain(AK_DelimitedReader *dr,
+        const Py_UCS1 *p,
+        Py_ssize_t count,
+        bool ascii)
+{
+    const Py_UCS1 *end = p + count;
+    npy_intp lookahead = sizeof(npy_uint64);
+    npy_uint64 word;
+    while (end - p >= lookahead) {
+        memcpy(&word, p, lookahead);
+        if (ascii && (word & AK_SWAR_HIGHS)) return false;
+        for (int i = 0; i < dr->plain_specials_count; ++i) {
+            if (AK_SWAR_has_zero(word ^ (AK_SWAR_ONES * dr->plain_specials[i]))) return false;
+        }
+        p += lookahead;
+    }
+    for (; p < end; ++p) {
+        if (ascii && *p >= 0x80) return false;
+        for (int i = 0; i < dr->plain_specials_count; ++i) {
+            if (*p == dr->plain_specials[i]) return false;
+        }
+    }
+    return true;
+}
+
+// Load the fields of a plain record of `count` bytes, less its line terminator, finding each delimiter a word at a time. A record without bytes has no fields. Returns 0 on success, -1 on failure.
+static inline int
+AK_DR_process_line_plain(AK_DelimitedReader *dr,
+        AK_CodePointGrid *cpg,
+        const Py_UCS1 *p,
+        Py_ssize_t count)
+{
+    if (count == 0) return 0;
+
+    const Py_UCS1 *end = p + count;
+    Py_UCS1 delimiter = (Py_UCS1)dr->dialect->delimiter;
+    npy_uint64 pattern = AK_SWAR_ONES * delimiter;
+    npy_intp lookahead = sizeof(npy_uint64);
+    npy_uint64 word;
+    const Py_UCS1 *field = p;
+    while (true) {
+        const Py_UCS1 *q = field;
+        while (end - q >= lookahead) {
+            memcpy(&word, q, lookahead);
+            if (AK_SWAR_has_zero(word ^ pattern)) {
+                break; // found a delimiter within lookahead
+            }
+            q += lookahead;
+        }
+        while (q < end && *q != delimiter) {
+            ++q;
+        }
+        dr->field_len = q - field;
+        if (!dr->field_skip && AK_CPG_AppendPointsAtLine(cpg,
+                *(dr->axis_pos),
+                field,
+                dr->field_len)) return -1;
+        if (AK_DR_close_field(dr, cpg)) return -1;
+        if (q == end) break;
+        field = q + 1;
+    }
+    return 0;
+}
+
+//------------------------------------------------------------------------------
+// AK_DelimitedReader: fixed-width records
+
+// Records of fixed-width fields are sliced at the code point positions of `fixed_specs`, bypassing AK_DR_process_char; there are no delimiters, quotes, or escapes. Leading and trailing spaces are excluded from each field, and fields beyond the end of a short record are empty.
+
+// Given a record of `count` points of `kind` (or UTF-8 bytes), less its line terminator, load each fixed-width field. A record without points has no fields. Returns 0 on success, -1 on failure.
+static inline int
+AK_DR_process_line_fixed(AK_DelimitedReader *dr,
+        AK_CodePointGrid *cpg,
+        unsigned int kind,
+        const void *data,
+        Py_ssize_t count)
+{
+    if (kind == AK_UTF8_KIND) {
+        const Py_UCS1 *p = (const Py_UCS1*)data;
+        const Py_UCS1 *end = p + count;
+        npy_intp lookahead = sizeof(npy_uint64);
+        npy_uint64 word;
+        while (end - p >= lookahead) {
+            memcpy(&word, p, lookahead);
+            if (word & AK_SWAR_HIGHS) break;
+            p += lookahead;
+        }
+        while (p < end && *p < 0x80) {
+            ++p;
+        }
+        kind = PyUnicode_1BYTE_KIND;
+        if (p < end) { // decode to points as positions are in points, not bytes
+            if (dr->fixed_points_capacity < count) {
+                Py_UCS4 *points = (Py_UCS4*)PyMem_Realloc(dr->fixed_points,
+                        sizeof(Py_UCS4) * count);
+                if (points == NULL) {
+                    PyErr_NoMemory();
+                    return -1;
+                }
+                dr->fixed_points = points;
+                dr->fixed_points_capacity = count;
+            }
+            Py_ssize_t points_count = 0;
+            p = (const Py_UCS1*)data;
+            while (p < end) {
+                if (AK_UTF8_decode(&p, end, dr->fixed_points + points_count)) {
+                    AK_WITH_GIL(PyErr_Format(PyExc_ValueError,
+                            "invalid UTF-8 byte sequence at offset %zd",
+                            p - (const Py_UCS1*)dr->buffer.buf));
+                    return -1;
+                }
+                ++points_count;
+            }
+            kind = PyUnicode_4BYTE_KIND;
+            data = dr->fixed_points;
+            count = points_count;
+        }
+    }
+    if (count == 0) return 0;
+
+    for (Py_ssize_t i = 0; i < dr->fixed_count; ++i) {
+        Py_ssize_t start = Py_MIN(dr->fixed_specs[2 * i], count);
+        Py_ssize_t stop = Py_MIN(dr->fixed_specs[2 * i + 1], count);
+        while (start < stop && PyUnicode_READ(kind, data, start) == ' ') {
+            ++start;
+        }
+        while (stop > start && PyUnicode_READ(kind, data, stop - 1) == ' ') {
+            --stop;
+        }
+        if (kind == PyUnicode_1BYTE_KIND) {
+            dr->field_len = stop - start;
+            if (!dr->field_skip && AK_CPG_AppendPointsAtLine(cpg,
+                    *(dr->axis_pos),
+                    (const Py_UCS1*)data + start,
+                    dr->field_len)) return -1;
+        }
+        else {
+            for (Py_ssize_t pos = start; pos < stop; ++pos) {
+                if (AK_DR_add_char(dr, cpg, PyUnicode_READ(kind, data, pos))) return -1;
+            }
+        }
+        if (AK_DR_close_field(dr, cpg)) return -1;
+    }
+    return 0;
+}
+
+//------------------------------------------------------------------------------
+// AK_DelimitedReader: header, footer, and comment lines
+
+// Header and footer lines are counted as lines of input (not records), and are removed before line_select is applied. Buffers are bounded to exclude header and footer lines at once; lines from input_iter are skipped as read, and footer lines are held back in a ring such that lines are only processed once `footer_count` lines follow them.
+
+// Set the count of header and footer lines to skip, and the comment character. Returns 0 on success, -1 on error.
+static inline int
+AK_DR_set_skips(AK_DelimitedReader *dr,
+        Py_ssize_t skip_header,
+        Py_ssize_t skip_footer,
+        Py_UCS4 comment_char)
+{
+    dr->comment_char = comment_char;
+    if (dr->buffer_active) {
+        for (Py_ssize_t i = 0; i < skip_header && dr->buffer_pos < dr->buffer_end; ++i) {
+            dr->buffer_pos += AK_DR_buffer_line_length(dr);
+        }
+        const Py_UCS1 *start = dr->buffer_pos;
+        const Py_UCS1 *end = dr->buffer_end;
+        for (Py_ssize_t i = 0; i < skip_footer && end > start; ++i) {
+            // exclude the terminator of the last line, then the line
+            if (*(end - 1) == '\n') --end;
+            if (end > start && *(end - 1) == '\r') --end;
+            while (end > start && *(end - 1) != '\n' && *(end - 1) != '\r') {
+                --end;
+            }
+        }
+        dr->buffer_end = end;
+        return 0;
+    }
+    dr->skip_header = skip_header;
+    if (skip_footer > 0) {
+        dr->footer_lines = (PyObject**)PyMem_Calloc(skip_footer, sizeof(PyObject*));
+        if (dr->footer_lines == NULL) {
+            PyErr_NoMemory();
+            return -1;
+        }
+        dr->footer_count = skip_footer;
+    }
+    return 0;
+}
+
+// Return a new reference to the next line from input_iter, skipping header lines and holding back footer lines. Returns NULL at the end of input, or on error with an exception set.
+static inline PyObject *
+AK_DR_next_line(AK_DelimitedReader *dr)
+{
+    PyObject *line;
+    for (; dr->skip_header > 0; --dr->skip_header) {
+        line = PyIter_Next(dr->input_iter);
+        if (line == NULL) return NULL;
+        Py_DECREF(line);
+    }
+    if (dr->footer_lines == NULL) {
+        return PyIter_Next(dr->input_iter);
+    }
+    // fill the ring before the first line is returned
+    while (dr->footer_lines[dr->footer_pos] == NULL) {
+        line = PyIter_Next(dr->input_iter);
+        if (line == NULL) return NULL;
+        dr->footer_lines[dr->footer_pos] = line;
+        dr->footer_pos = (dr->footer_pos + 1) % dr->footer_count;
+    }
+    line = PyIter_Next(dr->input_iter);
+    if (line == NULL) return NULL; // lines remaining in the ring are the footer
+    PyObject *post = dr->footer_lines[dr->footer_pos];
+    dr->footer_lines[dr->footer_pos] = line;
+    dr->footer_pos = (dr->footer_pos + 1) % dr->footer_count;
+    return post;
+}
+
+// Return true if a line of `kind` (or UTF-8 bytes) starts with the comment character. Cannot error.
+static inline bool
+AK_DR_line_comment(AK_DelimitedReader *dr,
+        unsigned int kind,
+        const void *data,
+        Py_ssize_t linelen)
+{
+    if (linelen == 0) return false;
+    if (kind == AK_UTF8_KIND) {
+        const Py_UCS1 *p = (const Py_UCS1*)data;
+        Py_UCS4 c;
+        if (AK_UTF8_decode(&p, p + linelen, &c)) return false;
+        return c == dr->comment_char;
+    }
+    return PyUnicode_READ(kind, data, 0) == dr->comment_char;
+}
+
+// Return true if a line of `kind` (or UTF-8 bytes) has no characters other than line terminators. Cannot error.
+static inline bool
+AK_DR_line_blank(unsigned int kind,
+        const void *data,
+        Py_ssize_t linelen)
+{
+    Py_UCS4 c;
+    for (Py_ssize_t i = 0; i < linelen; ++i) {
+        c = kind == AK_UTF8_KIND ? ((const Py_UCS1*)data)[i] : PyUnicode_READ(kind, data, i);
+        if (c != '\n' && c != '\r') return false;
+    }
+    return true;
+}
+
+// Using AK_DelimitedReader's state, process one record, either via next(input_iter) or by reading lines from the buffer; call AK_DR_process_char on each char in that line, loading individual fields into AK_CodePointGrid. Returns 1 when there are more lines to process, 0 when there are no lines to process, and -1 for error.
+static inline int
+AK_DR_ProcessRecord(AK_DelimitedReader *dr,
+        AK_CodePointGrid *cpg,
+        AK_LineSelect *line_select
+        )
+{
+    Py_ssize_t linelen;
+    unsigned int kind;
+    const void *data;
+    PyObject *record = NULL;
+
+    AK_DR_line_reset(dr);
+    do {
+        if (dr->buffer_active) {
+            // get a line of UTF-8 bytes, representing one record, to parse
+            if (dr->buffer_pos >= dr->buffer_end) {
+                if (AK_DR_close_input(dr, cpg)) return -1;
+                return 0; // end of input, not an error
+            }
+            kind = AK_UTF8_KIND;
+            data = dr->buffer_pos;
+            linelen = AK_DR_buffer_line_length(dr);
+            dr->buffer_pos += linelen;
+        }
+        else {
+            // get a string, representing one record, to parse
+            record = AK_DR_next_line(dr);
+            if (record == NULL) {
+                if (PyErr_Occurred()) return -1;
+                if (AK_DR_close_input(dr, cpg)) return -1;
+                return 0; // end of input, not an error
+            }
+            if (!PyUnicode_Check(record)) {
+                PyErr_Format(PyExc_RuntimeError,
+                        "iterator should return strings, not %.200s "
+                        "(the file should be opened in text mode)",
+                        Py_TYPE(record)->tp_name
+                        );
+                Py_DECREF(record);
+                return -1;
+            }
+            if (PyUnicode_READY(record) == -1) {
+                Py_DECREF(record);
+                return -1;
+            }
+            kind = PyUnicode_KIND(record);
+            data = PyUnicode_DATA(record);
+            linelen = PyUnicode_GET_LENGTH(record);
+        }
+        // blank lines are not records on either axis
+        if (dr->state == START_RECORD && AK_DR_line_blank(kind, data, linelen)) {
+            Py_XDECREF(record);
+            return 1; // skip, process more records
+        }
+        if (dr->comment_char
+                && dr->state == START_RECORD
+                && AK_DR_line_comment(dr, kind, data, linelen)) {
+            Py_XDECREF(record);
+            return 1; // skip, process more records
+        }
+        ++dr->record_iter_number;
+
+        switch (AK_line_select_keep(line_select,
+                0 == dr->axis,
+                dr->record_iter_number)) {
+            case -1 :
+                Py_XDECREF(record);
+                return -1;
+            case 0:
+                Py_XDECREF(record);
+                return 1; // skip, process more records
+        }
+        // NOTE: record_number should reflect the processed record count, and exlude any skipped lines. The value is initialized to -1 such the first record is number 0. A line that continues a record (a quoted field spanning lines) does not start a new record.
+        if (dr->state == START_RECORD) {
+            ++dr->record_number;
+        }
+        // AK_DEBUG_MSG_OBJ("processing line", PyLong_FromLong(dr->record_number));
+
+        if (dr->fixed_specs) {
+            Py_ssize_t count = linelen;
+            if (kind == AK_UTF8_KIND) {
+                const Py_UCS1* uc = (const Py_UCS1*)data;
+                while (count > 0 && (uc[count - 1] == '\n' || uc[count - 1] == '\r')) {
+                    --count;
+                }
+            }
+            else {
+                while (count > 0 && (PyUnicode_READ(kind, data, count - 1) == '\n'
+                        || PyUnicode_READ(kind, data, count - 1) == '\r')) {
+                    --count;
+                }
+            }
+            int err = AK_DR_process_line_fixed(dr, cpg, kind, data, count);
+            Py_XDECREF(record);
+            if (err) return -1;
+            return 1; // more lines to process
+        }
+        if (dr->plain_active
+                && dr->state == START_RECORD
+                && (kind == AK_UTF8_KIND || kind == PyUnicode_1BYTE_KIND)) {
+            const Py_UCS1* uc = (const Py_UCS1*)data;
+            Py_ssize_t count = linelen;
+            while (count > 0 && (uc[count - 1] == '\n' || uc[count - 1] == '\r')) {
+                --count;
+            }
+            if (AK_DR_line_plain(dr, uc, count, kind == AK_UTF8_KIND)) {
+                int err = AK_DR_process_line_plain(dr, cpg, uc, count);
+                Py_XDECREF(record);
+                if (err) return -1;
+                return 1; // more lines to process
+            }
+        }
+
+        // NOTE: we used to check that the read character was not \0; this seems rare enough to not be necessary to handle explicit, as AK_DR_process_char will treat it as an end of record
+        switch (kind) {
+            case AK_UTF8_KIND: {
+                const Py_UCS1* uc = (const Py_UCS1*)data;
+                const Py_UCS1* uc_end = uc + linelen;
+                Py_UCS4 c;
+                while (uc < uc_end) {
+                    if (AK_UTF8_decode(&uc, uc_end, &c)) {
+                        AK_WITH_GIL(PyErr_Format(PyExc_ValueError,
+                                "invalid UTF-8 byte sequence at offset %zd",
+                                uc - (const Py_UCS1*)dr->buffer.buf));
+                        return -1;
+                    }
+                    if (AK_DR_process_char(dr, cpg, c)) return -1;
+                }
+                break;
+            }
+            case PyUnicode_1BYTE_KIND: {
+                Py_UCS1* uc = (Py_UCS1*)data;
+                Py_UCS1* uc_end = uc + linelen;
+                while (uc < uc_end) {
+                    if (AK_DR_process_char(dr, cpg, *uc++)) {
+                        Py_DECREF(record);
+                        return -1;
+                    }
+                }
+                break;
+            }
+            case PyUnicode_2BYTE_KIND: {
+                Py_UCS2* uc = (Py_UCS2*)data;
+                Py_UCS2* uc_end = uc + linelen;
+                while (uc < uc_end) {
+                    if (AK_DR_process_char(dr, cpg, *uc++)) {
+                        Py_DECREF(record);
+                        return -1;
+                    }
+                }
+                break;
+            }
+            case PyUnicode_4BYTE_KIND: {
+                Py_UCS4* uc = (Py_UCS4*)data;
+                Py_UCS4* uc_end = uc + linelen;
+                while (uc < uc_end) {
+                    if (AK_DR_process_char(dr, cpg, *uc++)) {
+                        Py_DECREF(record);
+                        return -1;
+                    }
+                }
+                break;
+            }
+        }
+        Py_XDECREF(record);
+        record = NULL;
+        // force signaling we are at the end of a line
+        if (AK_DR_process_char(dr, cpg, '\0')) return -1;
+
+    } while (dr->state != START_RECORD);
+    return 1; // more lines to process
+}
+
+static inline void
+AK_DR_Free(AK_DelimitedReader *dr)
+{
+    if (dr->dialect) {
+        AK_Dialect_Free(dr->dialect);
+    }
+    if (dr->buffer_active) {
+        PyBuffer_Release(&dr->buffer);
+    }
+    Py_XDECREF(dr->input_iter); // might already be NULL
+    PyMem_Free(dr->field_keep); // might be NULL
+    PyMem_Free(dr->fixed_specs); // might be NULL
+    PyMem_Free(dr->fixed_points); // might be NULL
+    if (dr->footer_lines) {
+        for (Py_ssize_t i = 0; i < dr->footer_count; ++i) {
+            Py_XDECREF(dr->footer_lines[i]);
+        }
+        PyMem_Free(dr->footer_lines);
+    }
+    PyMem_Free(dr);
+}
+
+// Return true if `obj` provides a contiguous buffer of single-byte items, such as bytes, bytearray, memoryview, or mmap, to be read as UTF-8. Arrays, including arrays of strings, are iterated. Cannot error.
+static inline bool
+AK_is_byte_buffer(PyObject *obj)
+{
+    if (PyBytes_Check(obj) || PyByteArray_Check(obj)) return true;
+    if (PyArray_Check(obj) || !PyObject_CheckBuffer(obj)) return false;
+    Py_buffer view;
+    if (PyObject_GetBuffer(obj, &view, PyBUF_FORMAT | PyBUF_C_CONTIGUOUS)) {
+        PyErr_Clear();
+        return false;
+    }
+    bool bytes = view.itemsize == 1;
+    PyBuffer_Release(&view);
+    return bytes;
+}
+
+// Given an os.PathLike, return a new reference to a read-only mmap of the file, or to an empty bytes if the file is empty (as empty files cannot be mapped). Returns NULL on error.
+static inline PyObject *
+AK_buffer_from_path(PyObject *path)
+{
+    PyObject *mapped = NULL;
+    PyObject *mmap = NULL;
+    PyObject *file = NULL;
+    PyObject *size = NULL;
+    PyObject *io = PyImport_ImportModule("io");
+    if (io == NULL) return NULL;
+
+    file = PyObject_CallMethod(io, "open", "Os", path, "rb");
+    if (file == NULL) goto finally;
+
+    size = PyObject_CallMethod(file, "seek", "ii", 0, 2);
+    if (size == NULL) goto finally;
+    int empty = PyObject_Not(size);
+    if (empty == -1) goto finally;
+    if (empty) {
+        mapped = PyBytes_FromStringAndSize(NULL, 0);
+    }
+    else {
+        // positional arguments differ by platform, so access is given by keyword
+        mmap = PyImport_ImportModule("mmap");
+        if (mmap == NULL) goto finally;
+        PyObject *mmap_type = PyObject_GetAttrString(mmap, "mmap");
+        PyObject *access = PyObject_GetAttrString(mmap, "ACCESS_READ");
+        PyObject *args = PyObject_CallMethod(file, "fileno", NULL);
+        PyObject *kwargs = NULL;
+        if (mmap_type && access && args) {
+            Py_SETREF(args, Py_BuildValue("(Oi)", args, 0));
+            kwargs = Py_BuildValue("{sO}", "access", access);
+        }
+        if (args && kwargs) {
+            mapped = PyObject_Call(mmap_type, args, kwargs);
+        }
+        Py_XDECREF(kwargs);
+        Py_XDECREF(args);
+        Py_XDECREF(access);
+        Py_XDECREF(mmap_type);
+    }
+finally:
+    if (file) {
+        // the map remains valid after the file is closed
+        PyObject *closed = PyObject_CallMethod(file, "close", NULL);
+        if (closed == NULL && mapped) {
+            Py_CLEAR(mapped);
+        }
+        Py_XDECREF(closed);
+    }
+    Py_XDECREF(size);
+    Py_XDECREF(file);
+    Py_XDECREF(mmap);
+    Py_DECREF(io);
+    return mapped;
+}
+
+// The arguments to this constructor are validated before this function is valled. If `iterable` supports the buffer protocol (bytes, memoryview, mmap), it is read directly as UTF-8 encoded lines; an os.PathLike (such as a pathlib.Path) is mapped and read in the same way; otherwise it must be an iterable of strings. Returns NULL on error.
+static inline AK_DelimitedReader *
+AK_DR_New(PyObject *iterable,
+        int axis,
+        PyObject *usecols,
+        PyObject *delimiter,
+        PyObject *doublequote,
+        PyObject *escapechar,
+        PyObject *quotechar,
+        PyObject *quoting,
+        PyObject *skipinitialspace,
+        PyObject *strict
+        )
+{
+    AK_DelimitedReader *dr = (AK_DelimitedReader*)PyMem_Malloc(sizeof(AK_DelimitedReader));
+    if (dr == NULL) return (AK_DelimitedReader*)PyErr_NoMemory();
+
+    dr->axis = axis;
+
+    // we configure axis_pos to be a pointer that points to either record_number or field_number to avoid doing this per char/ field.
+    if (axis == 0) {
+        dr->axis_pos = &(dr->record_number);
+    }
+    else {
+        dr->axis_pos = &(dr->field_number);
+    }
+
+    dr->record_number = -1;
+    dr->record_iter_number = -1;
+    dr->dialect = NULL; // init in case input_iter fails to init
+    dr->input_iter = NULL;
+    dr->buffer_active = false;
+    dr->field_keep = NULL;
+    dr->field_skip = false;
+    dr->fixed_specs = NULL;
+    dr->fixed_count = 0;
+    dr->fixed_points = NULL;
+    dr->fixed_points_capacity = 0;
+    dr->skip_header = 0;
+    dr->footer_lines = NULL;
+    dr->footer_count = 0;
+    dr->footer_pos = 0;
+    dr->comment_char = '\0';
+    dr->on_error = AK_ON_ERROR_RAISE;
+    dr->report = NULL;
+
+    if (AK_set_positions("usecols",
+            &dr->field_keep,
+            &dr->field_keep_count,
+            usecols)) {
+        AK_DR_Free(dr);
+        return NULL;
+    }
+
+    if (!PyUnicode_Check(iterable)
+            && !PyBytes_Check(iterable)
+            && PyObject_HasAttrString(iterable, "__fspath__")) {
+        PyObject *mapped = AK_buffer_from_path(iterable);
+        if (mapped == NULL) {
+            AK_DR_Free(dr);
+            return NULL;
+        }
+        // the buffer holds a reference to the map, released in AK_DR_Free
+        int err = PyObject_GetBuffer(mapped, &dr->buffer, PyBUF_SIMPLE);
+        Py_DECREF(mapped);
+        if (err) {
+            AK_DR_Free(dr);
+            return NULL;
+        }
+        dr->buffer_active = true;
+        dr->buffer_pos = (const Py_UCS1*)dr->buffer.buf;
+        dr->buffer_end = dr->buffer_pos + dr->buffer.len;
+    }
+    else if (AK_is_byte_buffer(iterable)) {
+        if (PyObject_GetBuffer(iterable, &dr->buffer, PyBUF_SIMPLE)) {
+            AK_DR_Free(dr);
+            return NULL;
+        }
+        dr->buffer_active = true;
+        dr->buffer_pos = (const Py_UCS1*)dr->buffer.buf;
+        dr->buffer_end = dr->buffer_pos + dr->buffer.len;
+    }
+    else {
+        dr->input_iter = PyObject_GetIter(iterable); // new ref, decref in free
+        if (dr->input_iter == NULL) {
+            AK_DR_Free(dr);
+            return NULL;
+        }
     }
 
     dr->dialect = AK_Dialect_New(
@@ -2544,47 +5334,1928 @@ AK_DR_New(PyObject *iterable,
             quoting,
             skipinitialspace,
             strict);
-    if (dr->dialect == NULL) {
+    if (dr->dialect == NULL) {
+        AK_DR_Free(dr);
+        return NULL;
+    }
+    AK_DR_plain_init(dr);
+    return dr;
+}
+
+//------------------------------------------------------------------------------
+// AK_DelimitedReader: parallel parsing of buffers
+
+// Minimum size in bytes of a region of a buffer parsed on its own thread; smaller inputs are not split.
+# define AK_DR_REGION_MIN 65536
+
+// Return the state of an AK_DelimitedReader after processing character `c`; this mirrors the transitions of AK_DR_process_char without loading fields or raising on strict-mode errors, such that record boundaries can be found without parsing. Cannot error.
+static inline AK_DelimitedReaderState
+AK_DR_scan_char(AK_Dialect *dialect, AK_DelimitedReaderState state, Py_UCS4 c)
+{
+    switch (state) {
+    case START_RECORD:
+        if (c == '\0') return START_RECORD;
+        if (c == '\n' || c == '\r') return EAT_CRNL;
+        // fallthru
+    case START_FIELD:
+        if (c == '\n' || c == '\r' || c == '\0') return c == '\0' ? START_RECORD : EAT_CRNL;
+        if (c == dialect->quotechar && dialect->quoting != QUOTE_NONE) return IN_QUOTED_FIELD;
+        if (c == dialect->escapechar) return ESCAPED_CHAR;
+        if (c == ' ' && dialect->skipinitialspace) return START_FIELD;
+        if (c == dialect->delimiter) return START_FIELD;
+        return IN_FIELD;
+    case ESCAPED_CHAR:
+        if (c == '\n' || c == '\r') return AFTER_ESCAPED_CRNL;
+        return IN_FIELD;
+    case AFTER_ESCAPED_CRNL:
+        if (c == '\0') return AFTER_ESCAPED_CRNL;
+        // fallthru
+    case IN_FIELD:
+        if (c == '\n' || c == '\r' || c == '\0') return c == '\0' ? START_RECORD : EAT_CRNL;
+        if (c == dialect->escapechar) return ESCAPED_CHAR;
+        if (c == dialect->delimiter) return START_FIELD;
+        return IN_FIELD;
+    case IN_QUOTED_FIELD:
+        if (c == '\0') return IN_QUOTED_FIELD;
+        if (c == dialect->escapechar) return ESCAPE_IN_QUOTED_FIELD;
+        if (c == dialect->quotechar && dialect->quoting != QUOTE_NONE) {
+            return dialect->doublequote ? QUOTE_IN_QUOTED_FIELD : IN_FIELD;
+        }
+        return IN_QUOTED_FIELD;
+    case ESCAPE_IN_QUOTED_FIELD:
+        return IN_QUOTED_FIELD;
+    case QUOTE_IN_QUOTED_FIELD:
+        if (dialect->quoting != QUOTE_NONE && c == dialect->quotechar) return IN_QUOTED_FIELD;
+        if (c == dialect->delimiter) return START_FIELD;
+        if (c == '\n' || c == '\r' || c == '\0') return c == '\0' ? START_RECORD : EAT_CRNL;
+        return IN_FIELD;
+    case EAT_CRNL:
+        if (c == '\0') return START_RECORD;
+        return EAT_CRNL;
+    }
+    return state;
+}
+
+// Given a buffer-backed AK_DelimitedReader positioned at the start of its buffer, write into `bounds` the `count` + 1 byte offsets that divide the buffer into `count` regions of similar size, each beginning at the start of a record. When the buffer contains no quote or escape characters every line ends a record and each boundary is found with memchr; otherwise, the buffer is scanned once with AK_DR_scan_char such that quoted fields spanning lines are never split. Regions might be empty. Cannot error.
+static inline void
+AK_DR_find_bounds(AK_DelimitedReader *dr, Py_ssize_t *bounds, Py_ssize_t count)
+{
+    AK_Dialect *dialect = dr->dialect;
+    const Py_UCS1 *start = dr->buffer_pos;
+    const Py_UCS1 *end = dr->buffer_end;
+    Py_ssize_t len = end - start;
+
+    bool plain = ((dialect->quoting == QUOTE_NONE)
+            || (memchr(start, (int)dialect->quotechar, len) == NULL))
+            && ((dialect->escapechar == 0)
+            || (memchr(start, (int)dialect->escapechar, len) == NULL));
+
+    bounds[0] = 0;
+    bounds[count] = len;
+    if (plain) {
+        for (Py_ssize_t i = 1; i < count; ++i) {
+            Py_ssize_t target = len / count * i;
+            if (target < bounds[i-1]) target = bounds[i-1];
+            const Py_UCS1 *nl = (const Py_UCS1 *)memchr(start + target, '\n', len - target);
+            bounds[i] = nl == NULL ? len : nl - start + 1;
+        }
+        return;
+    }
+    // scan every line as AK_DR_ProcessRecord would, noting the first record start at or after each target
+    AK_DelimitedReaderState state = START_RECORD;
+    Py_ssize_t i = 1;
+    const Py_UCS1 *p = start;
+    while (p < end && i < count) {
+        dr->buffer_pos = p;
+        const Py_UCS1 *line_end = p + AK_DR_buffer_line_length(dr);
+        for (; p < line_end; ++p) {
+            state = AK_DR_scan_char(dialect, state, *p);
+        }
+        state = AK_DR_scan_char(dialect, state, '\0');
+        if (state == START_RECORD) {
+            while (i < count && p - start >= len / count * i) {
+                bounds[i++] = p - start;
+            }
+        }
+    }
+    while (i < count) {
+        bounds[i++] = len;
+    }
+    dr->buffer_pos = start;
+}
+
+// A region of a buffer, parsed with its own copy of an AK_DelimitedReader into its own AK_CodePointGrid, possibly on a worker thread.
+typedef struct AK_DRRegion {
+    AK_DelimitedReader dr;
+    AK_CodePointGrid *cpg;
+    int status;
+    PyObject *err_type;
+    PyObject *err_value;
+    PyObject *err_traceback;
+} AK_DRRegion;
+
+static void
+AK_DRRegion_task(void *context, Py_ssize_t index)
+{
+    AK_DRRegion *region = (AK_DRRegion*)context + index;
+    // acquire a thread state for this thread such that an exception set while parsing persists until fetched below
+    PyGILState_STATE gil = PyGILState_Ensure();
+    PyThreadState *ts = PyEval_SaveThread();
+    int status;
+    do {
+        status = AK_DR_ProcessRecord(&region->dr, region->cpg, NULL);
+    } while (status == 1);
+    PyEval_RestoreThread(ts);
+    if (status == -1) {
+        PyErr_Fetch(&region->err_type, &region->err_value, &region->err_traceback);
+    }
+    region->status = status;
+    PyGILState_Release(gil);
+}
+
+// Ensure capacity for `count` lines in the AK_CodePointGrid. Returns 0 on success, -1 on failure.
+static inline int
+AK_CPG_reserve(AK_CodePointGrid* cpg, Py_ssize_t count)
+{
+    if (count <= cpg->lines_capacity) return 0;
+    while (count > cpg->lines_capacity) {
+        cpg->lines_capacity *= 2;
+    }
+    cpg->lines = PyMem_RawRealloc(cpg->lines,
+            sizeof(AK_CodePointLine*) * cpg->lines_capacity);
+    if (cpg->lines == NULL) {
+        PyErr_NoMemory();
+        return -1;
+    }
+    return 0;
+}
+
+// Move or merge the lines of each region's AK_CodePointGrid into `cpg`, in order; region lines are always moved or freed. On axis 0, each line is a record, and lines are moved; records without fields at the end of a region are filled with empty lines if more records follow, as would be done by a single reader. On axis 1, each line is a field position, and lines of later regions are appended to those of earlier regions. Returns 0 on success, -1 on error.
+static inline int
+AK_DR_merge_regions(AK_DRRegion *regions, Py_ssize_t count, AK_CodePointGrid *cpg, int axis)
+{
+    Py_ssize_t lines_count = 0;
+    for (Py_ssize_t r = 0; r < count; ++r) {
+        if (axis == 0) {
+            lines_count += regions[r].dr.record_number + 1;
+        }
+        else if (regions[r].cpg->lines_count > lines_count) {
+            lines_count = regions[r].cpg->lines_count;
+        }
+    }
+    if (AK_CPG_reserve(cpg, lines_count)) return -1;
+
+    Py_ssize_t base = 0; // on axis 0, the line number of the first record in the region
+    for (Py_ssize_t r = 0; r < count; ++r) {
+        AK_CodePointGrid *src = regions[r].cpg;
+        if (axis == 0) {
+            if (src->lines_count && base > 0 && AK_CPG_resize(cpg, base - 1)) return -1;
+            for (Py_ssize_t i = 0; i < src->lines_count; ++i) {
+                cpg->lines[cpg->lines_count++] = src->lines[i];
+            }
+            src->lines_count = 0; // all lines moved
+            base += regions[r].dr.record_number + 1;
+        }
+        else {
+            int err = 0;
+            for (Py_ssize_t i = 0; i < src->lines_count; ++i) {
+                if (i < cpg->lines_count && cpg->lines[i]) {
+                    if (src->lines[i] == NULL) continue; // not selected
+                    if (!err) err = AK_CPL_Extend(cpg->lines[i], src->lines[i]);
+                    AK_CPL_Free(src->lines[i]);
+                }
+                else if (i < cpg->lines_count) { // not selected
+                    cpg->lines[i] = src->lines[i];
+                }
+                else {
+                    cpg->lines[cpg->lines_count++] = src->lines[i];
+                }
+            }
+            src->lines_count = 0; // all lines moved or freed
+            if (err) return -1;
+        }
+    }
+    return 0;
+}
+
+// Load all records of a buffer-backed AK_DelimitedReader into `cpg`, dividing the buffer into regions at record boundaries and parsing each region on up to `threads` threads; each region is type parsed independently and types are resolved when merged. Returns 1 if records were loaded, 0 if the input is not suitable for splitting (and the caller should process records serially), and -1 on error.
+static inline int
+AK_DR_ProcessBuffer(AK_DelimitedReader *dr,
+        AK_CodePointGrid *cpg,
+        int threads)
+{
+    AK_Dialect *dialect = dr->dialect;
+    Py_ssize_t len = dr->buffer_end - dr->buffer_pos;
+    Py_ssize_t count = len / AK_DR_REGION_MIN;
+    if (count > threads) count = threads;
+    // boundary scanning compares bytes, so multi-byte dialect characters are not supported
+    if (count < 2
+            || dialect->delimiter >= 0x80
+            || dialect->quotechar >= 0x80
+            || dialect->escapechar >= 0x80
+            || dr->comment_char // comment lines might have unbalanced quotes
+            || dr->report // reported record numbers are not known within regions
+            || dr->record_number != -1) {
+        return 0;
+    }
+    Py_ssize_t *bounds = (Py_ssize_t*)PyMem_Malloc(sizeof(Py_ssize_t) * (count + 1));
+    if (bounds == NULL) {
+        PyErr_NoMemory();
+        return -1;
+    }
+    AK_DRRegion *regions = (AK_DRRegion*)PyMem_Calloc(count, sizeof(AK_DRRegion));
+    if (regions == NULL) {
+        PyMem_Free(bounds);
+        PyErr_NoMemory();
+        return -1;
+    }
+    int status = 1;
+    AK_DR_find_bounds(dr, bounds, count);
+
+    Py_ssize_t i;
+    for (i = 0; i < count; ++i) {
+        AK_DRRegion *region = &regions[i];
+        region->dr = *dr; // shares the dialect and buffer; must not be freed
+        region->dr.buffer_end = dr->buffer_pos + bounds[i+1];
+        region->dr.buffer_pos = dr->buffer_pos + bounds[i];
+        if (dr->axis == 0) {
+            region->dr.axis_pos = &(region->dr.record_number);
+        }
+        else {
+            region->dr.axis_pos = &(region->dr.field_number);
+        }
+        // all lines are type parsed; dtypes are applied after merging
+        region->cpg = AK_CPG_New(NULL, cpg->tsep, cpg->decc, cpg->infer_datetime);
+        if (region->cpg == NULL) {
+            status = -1;
+            goto finally;
+        }
+        AK_DR_share_keep(dr, region->cpg);
+        region->cpg->infer_rows = cpg->infer_rows;
+        region->cpg->downcast = cpg->downcast;
+        region->cpg->na_values = cpg->na_values;
+    }
+    if (AK_TaskPool_Run(AK_DRRegion_task, regions, count, threads)) {
+        status = -1;
+        goto finally;
+    }
+    // raise the error of the first region that failed, as it would be raised by a single reader
+    for (i = 0; i < count; ++i) {
+        if (regions[i].status == -1) {
+            PyErr_Restore(regions[i].err_type,
+                    regions[i].err_value,
+                    regions[i].err_traceback);
+            regions[i].err_type = NULL;
+            regions[i].err_value = NULL;
+            regions[i].err_traceback = NULL;
+            status = -1;
+            goto finally;
+        }
+    }
+    if (AK_DR_merge_regions(regions, count, cpg, dr->axis)) {
+        status = -1;
+        goto finally;
+    }
+    dr->buffer_pos = dr->buffer_end;
+finally:
+    for (i = 0; i < count; ++i) {
+        if (regions[i].cpg) {
+            AK_CPG_Free(regions[i].cpg);
+        }
+        Py_XDECREF(regions[i].err_type);
+        Py_XDECREF(regions[i].err_value);
+        Py_XDECREF(regions[i].err_traceback);
+    }
+    PyMem_Free(regions);
+    PyMem_Free(bounds);
+    return status;
+}
+
+//------------------------------------------------------------------------------
+// AK_DelimitedReader: record index
+
+// Return a new int64 array of the byte offsets of the start of each record in the buffer of a buffer-backed AK_DelimitedReader. Line terminators within quoted fields do not start records, and, as when parsing, empty lines are not records. Returns NULL on error.
+static inline PyObject *
+AK_DR_RecordIndex(AK_DelimitedReader *dr)
+{
+    AK_Dialect *dialect = dr->dialect;
+    const Py_UCS1 *base = (const Py_UCS1*)dr->buffer.buf;
+    const Py_UCS1 *start = dr->buffer_pos;
+    const Py_UCS1 *end = dr->buffer_end;
+
+    Py_ssize_t capacity = 1024;
+    Py_ssize_t count = 0;
+    npy_int64 *offsets = (npy_int64*)PyMem_Malloc(sizeof(npy_int64) * capacity);
+    if (offsets == NULL) return PyErr_NoMemory();
+
+    bool plain = ((dialect->quoting == QUOTE_NONE)
+            || (dialect->quotechar < 0x80
+            && memchr(start, (int)dialect->quotechar, end - start) == NULL))
+            && ((dialect->escapechar == 0)
+            || (dialect->escapechar < 0x80
+            && memchr(start, (int)dialect->escapechar, end - start) == NULL));
+
+    AK_DelimitedReaderState state = START_RECORD;
+    const Py_UCS1 *p = start;
+    Py_UCS4 c;
+    while (p < end) {
+        dr->buffer_pos = p;
+        const Py_UCS1 *line_end = p + AK_DR_buffer_line_length(dr);
+        if (state == START_RECORD && *p != '\n' && *p != '\r') {
+            if (count == capacity) {
+                capacity <<= 1;
+                npy_int64 *offsets_new = (npy_int64*)PyMem_Realloc(offsets,
+                        sizeof(npy_int64) * capacity);
+                if (offsets_new == NULL) {
+                    PyMem_Free(offsets);
+                    return PyErr_NoMemory();
+                }
+                offsets = offsets_new;
+            }
+            offsets[count++] = p - base;
+        }
+        if (plain) { // every line terminator ends a record
+            p = line_end;
+            continue;
+        }
+        while (p < line_end) {
+            if (AK_UTF8_decode(&p, line_end, &c)) {
+                c = *p++; // invalid sequences are reported when parsed
+            }
+            state = AK_DR_scan_char(dialect, state, c);
+        }
+        state = AK_DR_scan_char(dialect, state, '\0');
+    }
+    dr->buffer_pos = start;
+
+    npy_intp dims[] = {count};
+    PyObject *array = PyArray_EMPTY(1, dims, NPY_INT64, 0);
+    if (array == NULL) {
+        PyMem_Free(offsets);
+        return NULL;
+    }
+    if (count) {
+        memcpy(PyArray_DATA((PyArrayObject*)array), offsets, sizeof(npy_int64) * count);
+    }
+    PyMem_Free(offsets);
+    PyArray_CLEARFLAGS((PyArrayObject*)array, NPY_ARRAY_WRITEABLE);
+    return array;
+}
+
+// Load only the records selected by `rows` from a buffer-backed AK_DelimitedReader into `cpg`, where `record_index` is an array of the byte offsets of the start of each record, as returned by AK_DR_RecordIndex. `rows` is a slice or an iterable of integers selecting positions in `record_index`; records are loaded in the order selected. Returns 0 on success, -1 on error.
+static inline int
+AK_DR_ProcessRows(AK_DelimitedReader *dr,
+        AK_CodePointGrid *cpg,
+        AK_LineSelect *line_select,
+        PyObject *record_index,
+        PyObject *rows)
+{
+    PyArrayObject *offsets = (PyArrayObject*)PyArray_FROMANY(record_index,
+            NPY_INT64, 1, 1, NPY_ARRAY_CARRAY_RO);
+    if (offsets == NULL) return -1;
+
+    const npy_int64 *starts = (const npy_int64*)PyArray_DATA(offsets);
+    Py_ssize_t count = PyArray_SIZE(offsets);
+    const Py_UCS1 *base = (const Py_UCS1*)dr->buffer.buf;
+    Py_ssize_t len = dr->buffer.len;
+    for (Py_ssize_t i = 0; i < count; ++i) {
+        if (starts[i] < 0 || starts[i] > len || (i && starts[i] < starts[i-1])) {
+            PyErr_SetString(PyExc_ValueError,
+                    "record_index must be increasing offsets within the buffer");
+            Py_DECREF(offsets);
+            return -1;
+        }
+    }
+    PyArrayObject *positions = NULL;
+    Py_ssize_t slice_start = 0, slice_step = 1, slice_len;
+    if (PySlice_Check(rows)) {
+        Py_ssize_t slice_stop;
+        if (PySlice_GetIndicesEx(rows, count, &slice_start, &slice_stop, &slice_step, &slice_len)) {
+            Py_DECREF(offsets);
+            return -1;
+        }
+    }
+    else {
+        PyArrayObject *src = (PyArrayObject*)PyArray_FromAny(rows, NULL, 1, 1, 0, NULL);
+        if (src == NULL) {
+            Py_DECREF(offsets);
+            return -1;
+        }
+        if (PyArray_TYPE(src) == NPY_BOOL) {
+            // as with line_select, a Boolean array is a mask; other Boolean iterables are not positions
+            if (!PyArray_Check(rows)) {
+                PyErr_SetString(PyExc_TypeError,
+                        "rows positions must be integers; provide a mask as a Boolean array");
+            }
+            else if (PyArray_SIZE(src) != count) {
+                PyErr_Format(PyExc_IndexError,
+                        "rows mask of length %zd does not match %zd records",
+                        PyArray_SIZE(src),
+                        count);
+            }
+            else {
+                PyObject *nonzero = PyArray_Nonzero(src);
+                if (nonzero != NULL) {
+                    positions = (PyArrayObject*)PyArray_FROMANY(PyTuple_GET_ITEM(nonzero, 0),
+                            NPY_INTP, 1, 1, NPY_ARRAY_CARRAY_RO);
+                    Py_DECREF(nonzero);
+                }
+            }
+        }
+        else {
+            positions = (PyArrayObject*)PyArray_FROMANY((PyObject*)src,
+                    NPY_INTP, 1, 1, NPY_ARRAY_CARRAY_RO);
+        }
+        Py_DECREF(src);
+        if (positions == NULL) {
+            Py_DECREF(offsets);
+            return -1;
+        }
+        slice_len = PyArray_SIZE(positions);
+    }
+    int status = 0;
+    Py_ssize_t pos;
+    for (Py_ssize_t i = 0; i < slice_len; ++i) {
+        if (positions) {
+            pos = ((const npy_intp*)PyArray_DATA(positions))[i];
+            if (pos < 0) pos += count;
+            if (pos < 0 || pos >= count) {
+                PyErr_Format(PyExc_IndexError,
+                        "row %zd is out of bounds for %zd records",
+                        ((const npy_intp*)PyArray_DATA(positions))[i],
+                        count);
+                status = -1;
+                break;
+            }
+        }
+        else {
+            pos = slice_start + i * slice_step;
+        }
+        dr->buffer_pos = base + starts[pos];
+        dr->buffer_end = pos + 1 < count ? base + starts[pos + 1] : base + len;
+        // process one record, excluding any empty lines that follow it
+        if (AK_DR_ProcessRecord(dr, cpg, line_select) == -1) {
+            status = -1;
+            break;
+        }
+    }
+    dr->buffer_pos = dr->buffer_end;
+    Py_XDECREF(positions);
+    Py_DECREF(offsets);
+    return status;
+}
+
+//------------------------------------------------------------------------------
+
+// Convert an sequence of strings to a 1D array.
+static inline PyObject *
+AK_IterableStrToArray1D(
+    PyObject *sequence,
+    PyObject *dtype_specifier,
+    Py_UCS4 tsep,
+    Py_UCS4 decc)
+{
+    PyArray_Descr* dtype = NULL;
+    // will set dtype_specifier to NULL for None, and propagate NULLs
+    if (AK_DTypeFromSpecifier(dtype_specifier, &dtype)) return NULL;
+
+    // dtype only NULL from here
+    bool type_parse = dtype == NULL;
+
+    AK_CodePointLine* cpl = AK_CPL_FromIterable(sequence, type_parse, tsep, decc);
+    if (cpl == NULL) return NULL;
+
+    PyObject* array = AK_CPL_ToArray(cpl, dtype, tsep, decc);
+    AK_CPL_Free(cpl);
+    return array; // might be NULL
+}
+
+//------------------------------------------------------------------------------
+// AK_DelimitedWriter
+
+// Size in bytes of encoded records accumulated before writing to the output.
+# define AK_DW_FLUSH_SIZE 1048576
+
+typedef enum AK_DWColumnKind {
+    AK_DWC_BOOL,
+    AK_DWC_INT,
+    AK_DWC_UINT,
+    AK_DWC_FLOAT,
+    AK_DWC_DATETIME,
+    AK_DWC_UNICODE,
+    AK_DWC_OBJECT, // formatted with str() of each element
+} AK_DWColumnKind;
+
+typedef struct AK_DWColumn {
+    PyArrayObject *array; // new reference; might be a converted copy of the source
+    AK_DWColumnKind kind;
+    const char *data;
+    npy_intp stride;
+    npy_intp itemsize;
+    NPY_DATETIMEUNIT unit;
+} AK_DWColumn;
+
+typedef struct AK_DelimitedWriter {
+    AK_Dialect *dialect;
+    PyObject *lineterminator; // a str
+    Py_ssize_t lineterminator_len; // in code points
+    bool lineterminator_other; // if lineterminator has characters other than \r and \n
+    const char *lineterminator_utf8; // borrowed from lineterminator
+    Py_ssize_t lineterminator_size; // in bytes
+    const char *float_format; // NULL to format floats with repr
+    PyObject *target; // a bytearray, or the write method of a file-like
+    bool text; // if the target requires str
+    char *buffer;
+    Py_ssize_t buffer_len;
+    Py_ssize_t buffer_capacity;
+} AK_DelimitedWriter;
+
+// Ensure `size` more bytes can be added to the buffer. Returns 0 on success, -1 on error.
+static inline int
+AK_DW_reserve(AK_DelimitedWriter *dw, Py_ssize_t size)
+{
+    if (dw->buffer_len + size <= dw->buffer_capacity) return 0;
+    Py_ssize_t capacity = dw->buffer_capacity ? dw->buffer_capacity : 4096;
+    while (capacity < dw->buffer_len + size) {
+        capacity <<= 1;
+    }
+    char *buffer = (char*)PyMem_Realloc(dw->buffer, capacity);
+    if (buffer == NULL) {
+        PyErr_NoMemory();
+        return -1;
+    }
+    dw->buffer = buffer;
+    dw->buffer_capacity = capacity;
+    return 0;
+}
+
+// Write all buffered bytes to the target. Returns 0 on success, -1 on error.
+static inline int
+AK_DW_flush(AK_DelimitedWriter *dw)
+{
+    if (dw->buffer_len == 0) return 0;
+    if (PyByteArray_Check(dw->target)) {
+        Py_ssize_t size = PyByteArray_GET_SIZE(dw->target);
+        if (PyByteArray_Resize(dw->target, size + dw->buffer_len)) return -1;
+        memcpy(PyByteArray_AS_STRING(dw->target) + size, dw->buffer, dw->buffer_len);
+    }
+    else {
+        PyObject *chunk = dw->text
+                ? PyUnicode_DecodeUTF8(dw->buffer, dw->buffer_len, "strict")
+                : PyBytes_FromStringAndSize(dw->buffer, dw->buffer_len);
+        if (chunk == NULL) return -1;
+        PyObject *post = PyObject_CallOneArg(dw->target, chunk);
+        Py_DECREF(chunk);
+        if (post == NULL) return -1;
+        Py_DECREF(post);
+    }
+    dw->buffer_len = 0;
+    return 0;
+}
+
+// Append the code point `c` to the buffer as UTF-8; capacity must have been reserved.
+static inline void
+AK_DW_append_point(AK_DelimitedWriter *dw, Py_UCS4 c)
+{
+    char *p = dw->buffer + dw->buffer_len;
+    if (c < 0x80) {
+        *p = (char)c;
+        dw->buffer_len += 1;
+    }
+    else if (c < 0x800) {
+        p[0] = (char)(0xC0 | (c >> 6));
+        p[1] = (char)(0x80 | (c & 0x3F));
+        dw->buffer_len += 2;
+    }
+    else if (c < 0x10000) {
+        p[0] = (char)(0xE0 | (c >> 12));
+        p[1] = (char)(0x80 | ((c >> 6) & 0x3F));
+        p[2] = (char)(0x80 | (c & 0x3F));
+        dw->buffer_len += 3;
+    }
+    else {
+        p[0] = (char)(0xF0 | (c >> 18));
+        p[1] = (char)(0x80 | ((c >> 12) & 0x3F));
+        p[2] = (char)(0x80 | ((c >> 6) & 0x3F));
+        p[3] = (char)(0x80 | (c & 0x3F));
+        dw->buffer_len += 4;
+    }
+}
+
+// Append a field of `count` code points of PyUnicode `kind` at `data`, quoting and escaping as the dialect requires, following the rules of csv.writer. With QUOTE_NONNUMERIC, `numeric` fields are not quoted; an empty field that is the only field of a record is always quoted. Returns 0 on success, -1 on error.
+static inline int
+AK_DW_append_field(AK_DelimitedWriter *dw,
+        int kind,
+        const void *data,
+        Py_ssize_t count,
+        bool numeric,
+        bool only)
+{
+    AK_Dialect *dialect = dw->dialect;
+    bool quoted = dialect->quoting == QUOTE_ALL
+            || (dialect->quoting == QUOTE_NONNUMERIC && !numeric)
+            || (only && count == 0);
+    if (quoted && dialect->quoting == QUOTE_NONE) {
+        PyErr_SetString(PyExc_ValueError, "single empty field record must be quoted");
+        return -1;
+    }
+    Py_UCS4 c;
+    Py_ssize_t i;
+    // determine if quoting is required, and if escaping is possible
+    for (i = 0; i < count; ++i) {
+        c = PyUnicode_READ(kind, data, i);
+        if (c == dialect->delimiter
+                || c == '\n'
+                || c == '\r'
+                || (c == dialect->escapechar && c)
+                || c == dialect->quotechar
+                || (dw->lineterminator_other
+                && PyUnicode_FindChar(dw->lineterminator, c, 0, dw->lineterminator_len, 1) >= 0)) {
+            bool escape = dialect->quoting == QUOTE_NONE
+                    || c == dialect->escapechar
+                    || (c == dialect->quotechar && !dialect->doublequote);
+            if (escape && dialect->escapechar == 0) {
+                PyErr_SetString(PyExc_ValueError, "need to escape, but no escapechar set");
+                return -1;
+            }
+            if (!escape) quoted = true;
+        }
+    }
+    // at most an escape before each code point, each of up to four bytes
+    if (AK_DW_reserve(dw, count * 8 + 8)) return -1;
+    if (quoted) AK_DW_append_point(dw, dialect->quotechar);
+    for (i = 0; i < count; ++i) {
+        c = PyUnicode_READ(kind, data, i);
+        if (dialect->quoting == QUOTE_NONE) {
+            if (c == dialect->delimiter
+                    || c == '\n'
+                    || c == '\r'
+                    || c == dialect->escapechar
+                    || c == dialect->quotechar
+                    || (dw->lineterminator_other
+                && PyUnicode_FindChar(dw->lineterminator, c, 0, dw->lineterminator_len, 1) >= 0)) {
+                AK_DW_append_point(dw, dialect->escapechar);
+            }
+        }
+        else if (c == dialect->quotechar) {
+            AK_DW_append_point(dw, dialect->doublequote ? dialect->quotechar : dialect->escapechar);
+        }
+        else if (c == dialect->escapechar && c) {
+            AK_DW_append_point(dw, dialect->escapechar);
+        }
+        AK_DW_append_point(dw, c);
+    }
+    if (quoted) AK_DW_append_point(dw, dialect->quotechar);
+    return 0;
+}
+
+// Return the number of characters written to `buffer` representing integer `v`. The buffer must be at least 21 characters.
+static inline Py_ssize_t
+AK_DW_format_uint(char *buffer, npy_uint64 v)
+{
+    char digits[20];
+    Py_ssize_t count = 0;
+    do {
+        digits[count++] = (char)('0' + v % 10);
+        v /= 10;
+    } while (v);
+    for (Py_ssize_t i = 0; i < count; ++i) {
+        buffer[i] = digits[count - i - 1];
+    }
+    return count;
+}
+
+// Write to `buffer` the shortest representation of `v` with at most 8 fractional digits that uniquely converts back to `v`, matching repr(); returns the number of characters written, or -1 if `v` requires more digits or exponential notation, such that repr() must be used. The buffer must be at least 28 characters.
+static inline Py_ssize_t
+AK_DW_format_float_short(char *buffer, double v)
+{
+    static const double scales[] = {1e0, 1e1, 1e2, 1e3, 1e4, 1e5, 1e6, 1e7, 1e8};
+    double a = fabs(v);
+    if (!(a >= 1e-4) && a != 0) return -1; // includes NaN
+    for (int k = 0; k <= 8; ++k) {
+        double scaled = a * scales[k];
+        if (scaled >= 9007199254740992.0) return -1; // 2**53
+        npy_uint64 m = (npy_uint64)(scaled + 0.5);
+        // as m and the scale are exact, division is correctly rounded, as is the conversion of the decimal
+        if ((double)m / scales[k] != a) continue;
+        // if a neighbor also converts back, repr() selects the closest, which requires exact arithmetic
+        if ((double)(m + 1) / scales[k] == a || (m && (double)(m - 1) / scales[k] == a)) return -1;
+
+        Py_ssize_t count = 0;
+        if (signbit(v)) buffer[count++] = '-';
+        npy_uint64 scale = (npy_uint64)scales[k];
+        count += AK_DW_format_uint(buffer + count, m / scale);
+        buffer[count++] = '.';
+        if (k == 0) {
+            buffer[count++] = '0';
+            return count;
+        }
+        npy_uint64 fraction = m % scale;
+        for (int i = k - 1; i >= 0; --i) {
+            buffer[count + i] = (char)('0' + fraction % 10);
+            fraction /= 10;
+        }
+        return count + k;
+    }
+    return -1;
+}
+
+// Write to `buffer` the ISO 8601 representation of the datetime64 `v` of `unit`, as formatted by NumPy; returns the number of characters written, or -1 if the year is not of four digits, such that str() must be used. The buffer must be at least 30 characters.
+static inline Py_ssize_t
+AK_DW_format_datetime(char *buffer, npy_int64 v, NPY_DATETIMEUNIT unit)
+{
+    if (v == NPY_DATETIME_NAT) {
+        memcpy(buffer, "NaT", 3);
+        return 3;
+    }
+    npy_int64 year;
+    int month = 1;
+    int day = 1;
+    npy_int64 days = 0;
+    npy_int64 rem = 0; // time of day in the unit
+    npy_int64 per_day;
+    int digits = 0; // fractional seconds
+    switch (unit) {
+        case NPY_FR_Y: year = 1970 + v; break;
+        case NPY_FR_M:
+            year = 1970 + (v >= 0 ? v / 12 : (v - 11) / 12);
+            month = (int)(v - (year - 1970) * 12) + 1;
+            break;
+        default:
+            switch (unit) {
+                case NPY_FR_D: per_day = 1; break;
+                case NPY_FR_h: per_day = 24; break;
+                case NPY_FR_m: per_day = 1440; break;
+                case NPY_FR_s: per_day = 86400; break;
+                case NPY_FR_ms: per_day = 86400000LL; digits = 3; break;
+                case NPY_FR_us: per_day = 86400000000LL; digits = 6; break;
+                default: per_day = 86400000000000LL; digits = 9; break;
+            }
+            days = v >= 0 ? v / per_day : (v - per_day + 1) / per_day;
+            rem = v - days * per_day;
+            AK_civil_from_days(days, &year, &month, &day);
+    }
+    if (year < 0 || year > 9999) return -1;
+
+    Py_ssize_t count = 0;
+    #define AK_DW_DIGITS(value, width) do {                    \
+        npy_int64 _v = (value);                                \
+        for (int _i = (width) - 1; _i >= 0; --_i) {            \
+            buffer[count + _i] = (char)('0' + _v % 10);        \
+            _v /= 10;                                          \
+        }                                                      \
+        count += (width);                                      \
+    } while (0)
+
+    AK_DW_DIGITS(year, 4);
+    if (unit == NPY_FR_Y) return count;
+    buffer[count++] = '-';
+    AK_DW_DIGITS(month, 2);
+    if (unit == NPY_FR_M) return count;
+    buffer[count++] = '-';
+    AK_DW_DIGITS(day, 2);
+    if (unit == NPY_FR_D) return count;
+
+    npy_int64 fraction = 1;
+    for (int i = 0; i < digits; ++i) fraction *= 10;
+    npy_int64 seconds = rem / fraction;
+    buffer[count++] = 'T';
+    if (unit == NPY_FR_h) {
+        AK_DW_DIGITS(rem, 2);
+        return count;
+    }
+    if (unit == NPY_FR_m) {
+        AK_DW_DIGITS(rem / 60, 2);
+        buffer[count++] = ':';
+        AK_DW_DIGITS(rem % 60, 2);
+        return count;
+    }
+    AK_DW_DIGITS(seconds / 3600, 2);
+    buffer[count++] = ':';
+    AK_DW_DIGITS(seconds / 60 % 60, 2);
+    buffer[count++] = ':';
+    AK_DW_DIGITS(seconds % 60, 2);
+    if (digits) {
+        buffer[count++] = '.';
+        AK_DW_DIGITS(rem % fraction, digits);
+    }
+    #undef AK_DW_DIGITS
+    return count;
+}
+
+// Append the element at `row` of `column`. Returns 0 on success, -1 on error.
+static inline int
+AK_DW_append_element(AK_DelimitedWriter *dw,
+        AK_DWColumn *column,
+        npy_intp row,
+        bool only)
+{
+    const char *p = column->data + row * column->stride;
+    char buffer[128];
+    Py_ssize_t count;
+
+    switch (column->kind) {
+        case AK_DWC_BOOL: {
+            bool v = *(npy_bool*)p;
+            return AK_DW_append_field(dw,
+                    PyUnicode_1BYTE_KIND, v ? "True" : "False", v ? 4 : 5, true, only);
+        }
+        case AK_DWC_INT: {
+            npy_int64 v;
+            switch (column->itemsize) {
+                case 1: v = *(npy_int8*)p; break;
+                case 2: v = *(npy_int16*)p; break;
+                case 4: v = *(npy_int32*)p; break;
+                default: v = *(npy_int64*)p; break;
+            }
+            if (v < 0) {
+                buffer[0] = '-';
+                count = 1 + AK_DW_format_uint(buffer + 1, (npy_uint64)0 - (npy_uint64)v);
+            }
+            else {
+                count = AK_DW_format_uint(buffer, (npy_uint64)v);
+            }
+            return AK_DW_append_field(dw, PyUnicode_1BYTE_KIND, buffer, count, true, only);
+        }
+        case AK_DWC_UINT: {
+            npy_uint64 v;
+            switch (column->itemsize) {
+                case 1: v = *(npy_uint8*)p; break;
+                case 2: v = *(npy_uint16*)p; break;
+                case 4: v = *(npy_uint32*)p; break;
+                default: v = *(npy_uint64*)p; break;
+            }
+            count = AK_DW_format_uint(buffer, v);
+            return AK_DW_append_field(dw, PyUnicode_1BYTE_KIND, buffer, count, true, only);
+        }
+        case AK_DWC_FLOAT: {
+            double v;
+            switch (column->itemsize) {
+                case 2: v = npy_half_to_double(*(npy_half*)p); break;
+                case 4: v = *(npy_float32*)p; break;
+                default: v = *(npy_float64*)p; break;
+            }
+            if (dw->float_format) {
+                count = PyOS_snprintf(buffer, sizeof(buffer), dw->float_format, v);
+                if (count < 0 || count >= (Py_ssize_t)sizeof(buffer)) {
+                    PyErr_SetString(PyExc_ValueError, "float_format produced too many characters");
+                    return -1;
+                }
+                return AK_DW_append_field(dw, PyUnicode_1BYTE_KIND, buffer, count, true, only);
+            }
+            count = AK_DW_format_float_short(buffer, v);
+            if (count >= 0) {
+                return AK_DW_append_field(dw, PyUnicode_1BYTE_KIND, buffer, count, true, only);
+            }
+            char *repr = PyOS_double_to_string(v, 'r', 0, Py_DTSF_ADD_DOT_0, NULL);
+            if (repr == NULL) return -1;
+            int err = AK_DW_append_field(dw,
+                    PyUnicode_1BYTE_KIND, repr, (Py_ssize_t)strlen(repr), true, only);
+            PyMem_Free(repr);
+            return err;
+        }
+        case AK_DWC_DATETIME: {
+            count = AK_DW_format_datetime(buffer, *(npy_int64*)p, column->unit);
+            if (count >= 0) {
+                return AK_DW_append_field(dw, PyUnicode_1BYTE_KIND, buffer, count, false, only);
+            }
+            break; // format with str()
+        }
+        case AK_DWC_UNICODE: {
+            const Py_UCS4 *v = (const Py_UCS4*)p;
+            count = column->itemsize / UCS4_SIZE;
+            while (count > 0 && v[count - 1] == 0) {
+                --count;
+            }
+            return AK_DW_append_field(dw, PyUnicode_4BYTE_KIND, v, count, false, only);
+        }
+        case AK_DWC_OBJECT:
+            break;
+    }
+    // format with str(), as csv.writer
+    PyObject *element = PyArray_Scalar((void*)p,
+            PyArray_DESCR(column->array),
+            (PyObject*)column->array);
+    if (element == NULL) return -1;
+    if (element == Py_None) {
+        Py_DECREF(element);
+        return AK_DW_append_field(dw, PyUnicode_1BYTE_KIND, "", 0, false, only);
+    }
+    bool numeric = PyNumber_Check(element);
+    PyObject *str = PyObject_Str(element);
+    Py_DECREF(element);
+    if (str == NULL) return -1;
+    int err = AK_DW_append_field(dw,
+            PyUnicode_KIND(str),
+            PyUnicode_DATA(str),
+            PyUnicode_GET_LENGTH(str),
+            numeric,
+            only);
+    Py_DECREF(str);
+    return err;
+}
+
+// Prepare `column` from the 1D array `array`; without a `float_format`, float16 and float32 elements are formatted with str() for their shortest representation. Returns 0 on success, -1 on error.
+static inline int
+AK_DWColumn_init(AK_DWColumn *column, PyObject *array, bool float_format)
+{
+    if (!PyArray_Check(array) || PyArray_NDIM((PyArrayObject*)array) != 1) {
+        PyErr_SetString(PyExc_ValueError, "arrays must be one-dimensional");
+        return -1;
+    }
+    PyArrayObject *a = (PyArrayObject*)array;
+    if (PyArray_ISNOTSWAPPED(a) && PyArray_ISALIGNED(a)) {
+        Py_INCREF(a);
+    }
+    else { // elements are read from memory as native types
+        PyArray_Descr *native = PyArray_DescrNewByteorder(PyArray_DESCR(a), NPY_NATIVE);
+        if (native == NULL) return -1;
+        a = (PyArrayObject*)PyArray_FromAny(array, // steals native
+                native,
+                1,
+                1,
+                NPY_ARRAY_NOTSWAPPED | NPY_ARRAY_ALIGNED,
+                NULL);
+        if (a == NULL) return -1;
+    }
+    int type_num = PyArray_TYPE(a);
+    if (PyTypeNum_ISBOOL(type_num)) {
+        column->kind = AK_DWC_BOOL;
+    }
+    else if (PyTypeNum_ISSIGNED(type_num) && PyArray_ITEMSIZE(a) <= 8) {
+        column->kind = AK_DWC_INT;
+    }
+    else if (PyTypeNum_ISUNSIGNED(type_num) && PyArray_ITEMSIZE(a) <= 8) {
+        column->kind = AK_DWC_UINT;
+    }
+    else if (type_num == NPY_FLOAT64
+            || (float_format && (type_num == NPY_HALF || type_num == NPY_FLOAT32))) {
+        column->kind = AK_DWC_FLOAT;
+    }
+    else if (type_num == NPY_UNICODE) {
+        column->kind = AK_DWC_UNICODE;
+    }
+    else if (type_num == NPY_DATETIME
+            && AK_datetime_meta(PyArray_DESCR(a))->num == 1
+            && AK_datetime64_unit_native(AK_datetime_meta(PyArray_DESCR(a))->base)
+            && AK_datetime_meta(PyArray_DESCR(a))->base != NPY_FR_W) {
+        column->kind = AK_DWC_DATETIME;
+        column->unit = AK_datetime_meta(PyArray_DESCR(a))->base;
+    }
+    else if (type_num == NPY_DATETIME) { // NumPy formats ISO 8601 strings
+        column->kind = AK_DWC_UNICODE;
+        PyArrayObject *str = (PyArrayObject*)PyObject_CallMethod((PyObject*)a, "astype", "s", "U");
+        Py_DECREF(a);
+        if (str == NULL) return -1;
+        a = str;
+    }
+    else {
+        column->kind = AK_DWC_OBJECT;
+    }
+    column->array = a;
+    column->data = PyArray_BYTES(a);
+    column->stride = PyArray_STRIDE(a, 0);
+    column->itemsize = PyArray_ITEMSIZE(a);
+    return 0;
+}
+
+// Validate `float_format` as a printf-style format with one floating-point conversion. Returns 0 on success, -1 on error.
+static inline int
+AK_DW_check_float_format(const char *format)
+{
+    Py_ssize_t conversions = 0;
+    const char *p = format;
+    while (*p) {
+        if (*p++ != '%') continue;
+        if (*p == '%') {
+            ++p;
+            continue;
+        }
+        while (*p && strchr("-+ #0", *p)) ++p;
+        while (*p >= '0' && *p <= '9') ++p;
+        if (*p == '.') {
+            ++p;
+            while (*p >= '0' && *p <= '9') ++p;
+        }
+        if (*p == '\0' || !strchr("eEfFgG", *p)) break;
+        ++p;
+        ++conversions;
+    }
+    if (*p || conversions != 1) {
+        PyErr_Format(PyExc_ValueError,
+                "float_format must have one floating-point conversion, not '%s'",
+                format);
+        return -1;
+    }
+    return 0;
+}
+
+//------------------------------------------------------------------------------
+// AK module public methods
+//------------------------------------------------------------------------------
+
+static char *delimited_to_ararys_kwarg_names[] = {
+    "file_like",
+    "axis",
+    "dtypes",
+    "line_select",
+    "usecols",
+    "skip_header",
+    "skip_footer",
+    "comment_char",
+    "delimiter",
+    "doublequote",
+    "escapechar",
+    "quotechar",
+    "quoting",
+    "skipinitialspace",
+    "strict",
+    "thousandschar",
+    "decimalchar",
+    "infer_datetime",
+    "infer_rows",
+    "downcast",
+    "categorical",
+    "na_values",
+    "return_mask",
+    "return_stats",
+    "on_error",
+    "out",
+    "out_offset",
+    "record_index",
+    "rows",
+    "threads",
+    NULL
+};
+
+PyObject *
+delimited_to_arrays(PyObject *Py_UNUSED(m), PyObject *args, PyObject *kwargs)
+{
+    PyObject *file_like;
+    int axis = 0;
+    PyObject *dtypes = NULL;
+    PyObject *line_select = NULL;
+    PyObject *usecols = NULL;
+    Py_ssize_t skip_header = 0;
+    Py_ssize_t skip_footer = 0;
+    PyObject *comment_char_obj = NULL;
+    PyObject *delimiter = NULL;
+    PyObject *doublequote = NULL;
+    PyObject *escapechar = NULL;
+    PyObject *quotechar = NULL;
+    PyObject *quoting = NULL;
+    PyObject *skipinitialspace = NULL;
+    PyObject *strict = NULL;
+    PyObject *thousandschar = NULL;
+    PyObject *decimalchar = NULL;
+    PyObject *infer_datetime_obj = NULL;
+    Py_ssize_t infer_rows = 0;
+    PyObject *downcast_obj = NULL;
+    PyObject *categorical_obj = NULL;
+    PyObject *na_values = NULL;
+    PyObject *return_mask_obj = NULL;
+    PyObject *return_stats_obj = NULL;
+    PyObject *on_error_obj = NULL;
+    PyObject *out = NULL;
+    Py_ssize_t out_offset = 0;
+    PyObject *record_index = NULL;
+    PyObject *rows = NULL;
+    int threads = 1;
+
+    if (!PyArg_ParseTupleAndKeywords(args, kwargs,
+            "O|$iOOOnnOOOOOOOOOOOnOOOOOOOnOOi:delimited_to_arrays",
+            delimited_to_ararys_kwarg_names,
+            &file_like,
+            // kwarg only
+            &axis,
+            &dtypes,
+            &line_select,
+            &usecols,
+            &skip_header,
+            &skip_footer,
+            &comment_char_obj,
+            &delimiter,
+            &doublequote,
+            &escapechar,
+            &quotechar,
+            &quoting,
+            &skipinitialspace,
+            &strict,
+            &thousandschar,
+            &decimalchar,
+            &infer_datetime_obj,
+            &infer_rows,
+            &downcast_obj,
+            &categorical_obj,
+            &na_values,
+            &return_mask_obj,
+            &return_stats_obj,
+            &on_error_obj,
+            &out,
+            &out_offset,
+            &record_index,
+            &rows,
+            &threads))
+        return NULL;
+
+    if ((axis < 0) || (axis > 1)) {
+        PyErr_SetString(PyExc_ValueError, "Axis must be 0 or 1");
+        return NULL;
+    }
+    if (threads < 1) {
+        PyErr_SetString(PyExc_ValueError, "threads must be greater than zero");
+        return NULL;
+    }
+    if (record_index == Py_None) {
+        record_index = NULL;
+    }
+    if (rows == Py_None) {
+        rows = NULL;
+    }
+    if (rows && record_index == NULL) {
+        PyErr_SetString(PyExc_ValueError, "rows requires a record_index");
+        return NULL;
+    }
+    if (record_index && (skip_header || skip_footer || comment_char_obj)) {
+        PyErr_SetString(PyExc_ValueError,
+                "record_index cannot be used with skip_header, skip_footer, or comment_char");
+        return NULL;
+    }
+    if (infer_rows < 0) {
+        PyErr_SetString(PyExc_ValueError, "infer_rows must be zero or greater");
+        return NULL;
+    }
+    if (skip_header < 0 || skip_footer < 0) {
+        PyErr_SetString(PyExc_ValueError, "skip_header and skip_footer must be zero or greater");
+        return NULL;
+    }
+    Py_UCS4 comment_char;
+    if (AK_set_char(
+            "comment_char",
+            &comment_char,
+            comment_char_obj,
+            '\0')) {
+        return NULL;
+    }
+    bool downcast;
+    if (AK_set_bool(
+            "downcast",
+            &downcast,
+            downcast_obj,
+            false)) {
+        return NULL;
+    }
+    bool categorical;
+    if (AK_set_bool(
+            "categorical",
+            &categorical,
+            categorical_obj,
+            false)) {
+        return NULL;
+    }
+    bool return_mask;
+    if (AK_set_bool(
+            "return_mask",
+            &return_mask,
+            return_mask_obj,
+            false)) {
+        return NULL;
+    }
+    bool return_stats;
+    if (AK_set_bool(
+            "return_stats",
+            &return_stats,
+            return_stats_obj,
+            false)) {
+        return NULL;
+    }
+    AK_OnError on_error;
+    if (AK_set_on_error(&on_error, on_error_obj)) {
+        return NULL;
+    }
+    if (out == Py_None) {
+        out = NULL;
+    }
+    if (out && (categorical || return_stats)) {
+        PyErr_SetString(PyExc_ValueError, "out cannot be used with categorical or return_stats");
+        return NULL;
+    }
+    if (out_offset < 0) {
+        PyErr_SetString(PyExc_ValueError, "out_offset must be zero or greater");
+        return NULL;
+    }
+    AK_DelimitedReader *dr = AK_DR_New(file_like,
+            axis,
+            usecols,
+            delimiter,
+            doublequote,
+            escapechar,
+            quotechar,
+            quoting,
+            skipinitialspace,
+            strict);
+    if (dr == NULL) { // can happen due to validation of dialect parameters
+        return NULL;
+    }
+    if (record_index && !dr->buffer_active) {
+        PyErr_SetString(PyExc_TypeError, "record_index requires file_like to be a buffer or path");
+        AK_DR_Free(dr);
+        return NULL;
+    }
+    if (AK_DR_set_skips(dr, skip_header, skip_footer, comment_char)) {
+        AK_DR_Free(dr);
+        return NULL;
+    }
+    Py_UCS4 tsep;
+    if (AK_set_char(
+            "thousandschar",
+            &tsep,
+            thousandschar,
+            '\0')) {
+        AK_DR_Free(dr);
+        return NULL; // default is off (skips evaluation)
+    }
+    Py_UCS4 decc;
+    if (AK_set_char(
+            "decimalchar",
+            &decc,
+            decimalchar,
+            '.')) {
+        AK_DR_Free(dr);
+        return NULL;
+    }
+    bool infer_datetime;
+    if (AK_set_bool(
+            "infer_datetime",
+            &infer_datetime,
+            infer_datetime_obj,
+            false)) {
+        AK_DR_Free(dr);
+        return NULL;
+    }
+
+    AK_DTypes *dt = NULL;
+    AK_LineSelect *ls = NULL;
+    AK_NAValues *na = NULL;
+    AK_CodePointGrid* cpg = NULL;
+    AK_CPLStats *stats = NULL;
+    PyObject* arrays = NULL;
+    PyObject* parts = NULL;
+    PyObject* report = NULL;
+
+    if (on_error == AK_ON_ERROR_COLLECT) {
+        report = PyList_New(0);
+        if (report == NULL) goto exit;
+    }
+    dr->on_error = on_error;
+    dr->report = report;
+    if (AK_set_dtypes(&dt, dtypes)) goto exit;
+    if (AK_set_line_select(&ls, line_select)) goto exit;
+    if (AK_set_na_values(&na, na_values)) goto exit;
+    cpg = AK_CPG_New(dt, tsep, decc, infer_datetime);
+    if (cpg == NULL) goto exit; // error will be set
+    cpg->infer_rows = infer_rows;
+    cpg->downcast = downcast;
+    cpg->na_values = na;
+    cpg->on_error = on_error;
+    cpg->report = report;
+    AK_DR_share_keep(dr, cpg);
+
+    // Consume all lines from dr and load into cpg; a large buffer might first be loaded from regions parsed on multiple threads, after which no lines remain. As regions do not know the number of the lines they parse, line_select can only be used on axis 1, where it is applied after loading.
+    int status;
+    if (rows) {
+        if (AK_DR_ProcessRows(dr, cpg, ls, record_index, rows)) goto exit;
+    }
+    else if (threads > 1 && dr->buffer_active && (ls == NULL || axis == 1)) {
+        if (AK_DR_ProcessBuffer(dr, cpg, threads) == -1) goto exit;
+    }
+    while (true) {
+        status = AK_DR_ProcessRecord(dr, cpg, ls);
+        if (status == 1) {
+            continue; // more lines to process
+        }
+        else if (status == 0) {
+            break;
+        }
+        else if (status == -1) {
+            goto exit;
+        }
+        // NOTE: could use PyErr_CheckSignals() at some number of dr->record_number
+    }
+    AK_DR_Free(dr);
+    dr = NULL;
+
+    if (out) {
+        Py_ssize_t rows = AK_CPG_ToOut(cpg, axis, ls, tsep, decc, out, out_offset, threads);
+        if (rows == -1) goto exit;
+        arrays = PyLong_FromSsize_t(rows);
+    }
+    else {
+        if (return_stats) {
+            stats = (AK_CPLStats*)PyMem_Malloc(
+                    sizeof(AK_CPLStats) * (cpg->lines_count > 0 ? cpg->lines_count : 1));
+            if (stats == NULL) {
+                PyErr_NoMemory();
+                goto exit;
+            }
+        }
+        arrays = AK_CPG_ToArrayList(cpg, axis, ls, tsep, decc, categorical, stats, threads);
+    }
+    if (arrays == NULL || !(return_mask || return_stats || report)) goto exit;
+
+    // return a tuple of the arrays followed by masks, stats, and report, as requested
+    parts = PyList_New(1);
+    if (parts == NULL) {
+        Py_CLEAR(arrays);
+        goto exit;
+    }
+    PyList_SET_ITEM(parts, 0, arrays); // steals reference
+    arrays = NULL;
+    PyObject* part;
+    if (return_mask) {
+        part = AK_CPG_ToMaskList(cpg, axis, ls);
+        if (part == NULL || PyList_Append(parts, part)) goto exit_part;
+        Py_DECREF(part);
+    }
+    if (return_stats) {
+        part = AK_CPG_ToStatsList(stats, PyList_GET_ITEM(parts, 0), threads);
+        if (part == NULL || PyList_Append(parts, part)) goto exit_part;
+        Py_DECREF(part);
+    }
+    if (report) {
+        part = AK_report_to_array(report);
+        if (part == NULL || PyList_Append(parts, part)) goto exit_part;
+        Py_DECREF(part);
+    }
+    arrays = PyList_AsTuple(parts);
+    goto exit;
+exit_part:
+    Py_XDECREF(part);
+exit:
+    if (dr) {
+        AK_DR_Free(dr);
+    }
+    if (cpg) {
+        AK_CPG_Free(cpg);
+    }
+    AK_LineSelect_Free(ls);
+    AK_DTypes_Free(dt);
+    AK_NAValues_Free(na);
+    PyMem_Free(stats);
+    Py_XDECREF(parts);
+    Py_XDECREF(report);
+    return arrays; // could be NULL
+}
+
+static char *delimited_to_record_index_kwarg_names[] = {
+    "file_like",
+    "delimiter",
+    "doublequote",
+    "escapechar",
+    "quotechar",
+    "quoting",
+    "skipinitialspace",
+    NULL
+};
+
+// Scan a buffer or path once, returning an int64 array of the byte offsets of the start of each record, suitable for use as the record_index of delimited_to_arrays.
+PyObject *
+delimited_to_record_index(PyObject *Py_UNUSED(m), PyObject *args, PyObject *kwargs)
+{
+    PyObject *file_like;
+    PyObject *delimiter = NULL;
+    PyObject *doublequote = NULL;
+    PyObject *escapechar = NULL;
+    PyObject *quotechar = NULL;
+    PyObject *quoting = NULL;
+    PyObject *skipinitialspace = NULL;
+
+    if (!PyArg_ParseTupleAndKeywords(args, kwargs,
+            "O|$OOOOOO:delimited_to_record_index",
+            delimited_to_record_index_kwarg_names,
+            &file_like,
+            // kwarg only
+            &delimiter,
+            &doublequote,
+            &escapechar,
+            &quotechar,
+            &quoting,
+            &skipinitialspace))
+        return NULL;
+
+    AK_DelimitedReader *dr = AK_DR_New(file_like,
+            0,
+            NULL,
+            delimiter,
+            doublequote,
+            escapechar,
+            quotechar,
+            quoting,
+            skipinitialspace,
+            NULL);
+    if (dr == NULL) { // can happen due to validation of dialect parameters
+        return NULL;
+    }
+    if (!dr->buffer_active) {
+        PyErr_SetString(PyExc_TypeError, "file_like must be a buffer or path");
+        AK_DR_Free(dr);
+        return NULL;
+    }
+    PyObject *index = AK_DR_RecordIndex(dr);
+    AK_DR_Free(dr);
+    return index; // could be NULL
+}
+
+static char *delimited_to_dtypes_kwarg_names[] = {
+    "file_like",
+    "axis",
+    "dtypes",
+    "line_select",
+    "usecols",
+    "delimiter",
+    "doublequote",
+    "escapechar",
+    "quotechar",
+    "quoting",
+    "skipinitialspace",
+    "strict",
+    "thousandschar",
+    "decimalchar",
+    "infer_datetime",
+    "downcast",
+    "na_values",
+    "max_rows",
+    "return_widths",
+    NULL
+};
+
+// Return a list of the dtype of each line, as would be returned by delimited_to_arrays, without storing fields or creating arrays. If `max_rows` is given, at most that many records are read. If `return_widths` is true, return a tuple of the list of dtypes and a list of the max field width of each line.
+PyObject *
+delimited_to_dtypes(PyObject *Py_UNUSED(m), PyObject *args, PyObject *kwargs)
+{
+    PyObject *file_like;
+    int axis = 0;
+    PyObject *dtypes = NULL;
+    PyObject *line_select = NULL;
+    PyObject *usecols = NULL;
+    PyObject *delimiter = NULL;
+    PyObject *doublequote = NULL;
+    PyObject *escapechar = NULL;
+    PyObject *quotechar = NULL;
+    PyObject *quoting = NULL;
+    PyObject *skipinitialspace = NULL;
+    PyObject *strict = NULL;
+    PyObject *thousandschar = NULL;
+    PyObject *decimalchar = NULL;
+    PyObject *infer_datetime_obj = NULL;
+    PyObject *downcast_obj = NULL;
+    PyObject *na_values = NULL;
+    PyObject *max_rows_obj = NULL;
+    PyObject *return_widths_obj = NULL;
+
+    if (!PyArg_ParseTupleAndKeywords(args, kwargs,
+            "O|$iOOOOOOOOOOOOOOOOO:delimited_to_dtypes",
+            delimited_to_dtypes_kwarg_names,
+            &file_like,
+            // kwarg only
+            &axis,
+            &dtypes,
+            &line_select,
+            &usecols,
+            &delimiter,
+            &doublequote,
+            &escapechar,
+            &quotechar,
+            &quoting,
+            &skipinitialspace,
+            &strict,
+            &thousandschar,
+            &decimalchar,
+            &infer_datetime_obj,
+            &downcast_obj,
+            &na_values,
+            &max_rows_obj,
+            &return_widths_obj))
+        return NULL;
+
+    if ((axis < 0) || (axis > 1)) {
+        PyErr_SetString(PyExc_ValueError, "Axis must be 0 or 1");
+        return NULL;
+    }
+    Py_ssize_t max_rows = -1; // read all records
+    if (max_rows_obj != NULL && max_rows_obj != Py_None) {
+        max_rows = PyNumber_AsSsize_t(max_rows_obj, PyExc_OverflowError);
+        if (max_rows == -1 && PyErr_Occurred()) return NULL;
+        if (max_rows < 0) {
+            PyErr_SetString(PyExc_ValueError, "max_rows must be None or zero or greater");
+            return NULL;
+        }
+    }
+    bool downcast;
+    if (AK_set_bool(
+            "downcast",
+            &downcast,
+            downcast_obj,
+            false)) {
+        return NULL;
+    }
+    bool return_widths;
+    if (AK_set_bool(
+            "return_widths",
+            &return_widths,
+            return_widths_obj,
+            false)) {
+        return NULL;
+    }
+    AK_DelimitedReader *dr = AK_DR_New(file_like,
+            axis,
+            usecols,
+            delimiter,
+            doublequote,
+            escapechar,
+            quotechar,
+            quoting,
+            skipinitialspace,
+            strict);
+    if (dr == NULL) { // can happen due to validation of dialect parameters
+        return NULL;
+    }
+
+    Py_UCS4 tsep;
+    if (AK_set_char(
+            "thousandschar",
+            &tsep,
+            thousandschar,
+            '\0')) {
+        AK_DR_Free(dr);
+        return NULL; // default is off (skips evaluation)
+    }
+    Py_UCS4 decc;
+    if (AK_set_char(
+            "decimalchar",
+            &decc,
+            decimalchar,
+            '.')) {
+        AK_DR_Free(dr);
+        return NULL;
+    }
+    bool infer_datetime;
+    if (AK_set_bool(
+            "infer_datetime",
+            &infer_datetime,
+            infer_datetime_obj,
+            false)) {
+        AK_DR_Free(dr);
+        return NULL;
+    }
+
+    AK_DTypes *dt = NULL;
+    AK_LineSelect *ls = NULL;
+    AK_NAValues *na = NULL;
+    AK_CodePointGrid* cpg = NULL;
+    PyObject* post = NULL;
+
+    if (AK_set_dtypes(&dt, dtypes)) goto exit;
+    if (AK_set_line_select(&ls, line_select)) goto exit;
+    if (AK_set_na_values(&na, na_values)) goto exit;
+    cpg = AK_CPG_New(dt, tsep, decc, infer_datetime);
+    if (cpg == NULL) goto exit; // error will be set
+    cpg->type_only = true;
+    cpg->downcast = downcast;
+    cpg->na_values = na;
+    AK_DR_share_keep(dr, cpg);
+
+    Py_ssize_t record_start = dr->record_number;
+    while (max_rows < 0 || dr->record_number - record_start < max_rows) {
+        int status = AK_DR_ProcessRecord(dr, cpg, ls);
+        if (status == 0) {
+            break;
+        }
+        else if (status == -1) {
+            goto exit;
+        }
+    }
+    AK_DR_Free(dr);
+    dr = NULL;
+
+    PyObject* widths = NULL;
+    PyObject* dtype_list = AK_CPG_ToDtypeList(cpg,
+            axis,
+            ls,
+            return_widths ? &widths : NULL);
+    if (dtype_list == NULL || !return_widths) {
+        post = dtype_list; // could be NULL
+        goto exit;
+    }
+    post = PyTuple_Pack(2, dtype_list, widths);
+    Py_DECREF(dtype_list);
+    Py_DECREF(widths);
+exit:
+    if (dr) {
+        AK_DR_Free(dr);
+    }
+    if (cpg) {
+        AK_CPG_Free(cpg);
+    }
+    AK_LineSelect_Free(ls);
+    AK_DTypes_Free(dt);
+    AK_NAValues_Free(na);
+    return post; // could be NULL
+}
+
+static char *fixed_width_to_arrays_kwarg_names[] = {
+    "file_like",
+    "axis",
+    "widths",
+    "colspecs",
+    "dtypes",
+    "line_select",
+    "thousandschar",
+    "decimalchar",
+    "infer_datetime",
+    "na_values",
+    "threads",
+    NULL
+};
+
+// Load records of fixed-width fields, given as `widths` or `colspecs`, into arrays; records are read with the same inputs as delimited_to_arrays, and fields are converted with the same type inference.
+PyObject *
+fixed_width_to_arrays(PyObject *Py_UNUSED(m), PyObject *args, PyObject *kwargs)
+{
+    PyObject *file_like;
+    int axis = 0;
+    PyObject *widths = NULL;
+    PyObject *colspecs = NULL;
+    PyObject *dtypes = NULL;
+    PyObject *line_select = NULL;
+    PyObject *thousandschar = NULL;
+    PyObject *decimalchar = NULL;
+    PyObject *infer_datetime_obj = NULL;
+    PyObject *na_values = NULL;
+    int threads = 1;
+
+    if (!PyArg_ParseTupleAndKeywords(args, kwargs,
+            "O|$iOOOOOOOOi:fixed_width_to_arrays",
+            fixed_width_to_arrays_kwarg_names,
+            &file_like,
+            // kwarg only
+            &axis,
+            &widths,
+            &colspecs,
+            &dtypes,
+            &line_select,
+            &thousandschar,
+            &decimalchar,
+            &infer_datetime_obj,
+            &na_values,
+            &threads))
+        return NULL;
+
+    if ((axis < 0) || (axis > 1)) {
+        PyErr_SetString(PyExc_ValueError, "Axis must be 0 or 1");
+        return NULL;
+    }
+    if (threads < 1) {
+        PyErr_SetString(PyExc_ValueError, "threads must be greater than zero");
+        return NULL;
+    }
+    Py_UCS4 tsep;
+    if (AK_set_char(
+            "thousandschar",
+            &tsep,
+            thousandschar,
+            '\0')) {
+        return NULL; // default is off (skips evaluation)
+    }
+    Py_UCS4 decc;
+    if (AK_set_char(
+            "decimalchar",
+            &decc,
+            decimalchar,
+            '.')) {
+        return NULL;
+    }
+    bool infer_datetime;
+    if (AK_set_bool(
+            "infer_datetime",
+            &infer_datetime,
+            infer_datetime_obj,
+            false)) {
+        return NULL;
+    }
+    // the dialect is not used, but is created with defaults
+    AK_DelimitedReader *dr = AK_DR_New(file_like,
+            axis,
+            NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL);
+    if (dr == NULL) {
+        return NULL;
+    }
+
+    AK_DTypes *dt = NULL;
+    AK_LineSelect *ls = NULL;
+    AK_NAValues *na = NULL;
+    AK_CodePointGrid* cpg = NULL;
+    PyObject* arrays = NULL;
+
+    if (AK_set_fixed_specs(&dr->fixed_specs, &dr->fixed_count, widths, colspecs)) goto exit;
+    if (AK_set_dtypes(&dt, dtypes)) goto exit;
+    if (AK_set_line_select(&ls, line_select)) goto exit;
+    if (AK_set_na_values(&na, na_values)) goto exit;
+    cpg = AK_CPG_New(dt, tsep, decc, infer_datetime);
+    if (cpg == NULL) goto exit; // error will be set
+    cpg->na_values = na;
+
+    int status;
+    while (true) {
+        status = AK_DR_ProcessRecord(dr, cpg, ls);
+        if (status == 1) {
+            continue; // more lines to process
+        }
+        else if (status == 0) {
+            break;
+        }
+        else if (status == -1) {
+            goto exit;
+        }
+    }
+    AK_DR_Free(dr);
+    dr = NULL;
+
+    arrays = AK_CPG_ToArrayList(cpg, axis, ls, tsep, decc, false, NULL, threads);
+exit:
+    if (dr) {
         AK_DR_Free(dr);
-        return NULL;
     }
-    return dr;
+    if (cpg) {
+        AK_CPG_Free(cpg);
+    }
+    AK_LineSelect_Free(ls);
+    AK_DTypes_Free(dt);
+    AK_NAValues_Free(na);
+    return arrays; // could be NULL
 }
 
 //------------------------------------------------------------------------------
+// DelimitedToArraysIterator
+
+typedef struct DTAIterObject {
+    PyObject_HEAD
+    AK_DelimitedReader *dr;
+    AK_DTypes *dtypes;
+    AK_LineSelect *line_select;
+    AK_NAValues *na_values;
+    Py_UCS4 tsep;
+    Py_UCS4 decc;
+    bool infer_datetime;
+    Py_ssize_t infer_rows;
+    int axis;
+    int threads;
+    Py_ssize_t chunk_rows;
+    // on axis 1, the resolved type and datetime unit of each line over all prior chunks
+    AK_TypeParserState *states;
+    NPY_DATETIMEUNIT *units;
+    Py_ssize_t states_count;
+    bool exhausted;
+} DTAIterObject;
 
-// Convert an sequence of strings to a 1D array.
-static inline PyObject *
-AK_IterableStrToArray1D(
-    PyObject *sequence,
-    PyObject *dtype_specifier,
-    Py_UCS4 tsep,
-    Py_UCS4 decc)
-{
-    PyArray_Descr* dtype = NULL;
-    // will set dtype_specifier to NULL for None, and propagate NULLs
-    if (AK_DTypeFromSpecifier(dtype_specifier, &dtype)) return NULL;
+static inline void
+DTAIter_dealloc(DTAIterObject *self) {
+    if (self->dr) {
+        AK_DR_Free(self->dr);
+    }
+    AK_DTypes_Free(self->dtypes);
+    AK_LineSelect_Free(self->line_select);
+    AK_NAValues_Free(self->na_values);
+    PyMem_Free(self->states);
+    PyMem_Free(self->units);
+    PyObject_Del((PyObject*)self);
+}
 
-    // dtype only NULL from here
-    bool type_parse = dtype == NULL;
+static inline PyObject*
+DTAIter_iter(DTAIterObject *self) {
+    Py_INCREF(self);
+    return (PyObject*)self;
+}
 
-    AK_CodePointLine* cpl = AK_CPL_FromIterable(sequence, type_parse, tsep, decc);
-    if (cpl == NULL) return NULL;
+// Resolve the type parser state of each line with `states` and `units`, the resolved type and datetime unit of each line over prior loads, and update them, such that the dtypes of successive loads can only widen. `states` and `units` are grown to the lines of `cpg`. Returns 0 on success, -1 on error.
+static inline int
+AK_CPG_resolve_states(AK_CodePointGrid *cpg,
+        AK_TypeParserState **states,
+        NPY_DATETIMEUNIT **units,
+        Py_ssize_t *states_count)
+{
+    if (cpg->lines_count > *states_count) {
+        AK_TypeParserState *states_new = (AK_TypeParserState*)PyMem_Realloc(
+                *states,
+                sizeof(AK_TypeParserState) * cpg->lines_count);
+        if (states_new == NULL) {
+            PyErr_NoMemory();
+            return -1;
+        }
+        *states = states_new;
+        NPY_DATETIMEUNIT *units_new = (NPY_DATETIMEUNIT*)PyMem_Realloc(
+                *units,
+                sizeof(NPY_DATETIMEUNIT) * cpg->lines_count);
+        if (units_new == NULL) {
+            PyErr_NoMemory();
+            return -1;
+        }
+        *units = units_new;
+        for (Py_ssize_t i = *states_count; i < cpg->lines_count; ++i) {
+            states_new[i] = TPS_UNKNOWN;
+            units_new[i] = NPY_FR_D;
+        }
+        *states_count = cpg->lines_count;
+    }
+    for (Py_ssize_t i = 0; i < cpg->lines_count; ++i) {
+        if (cpg->lines[i] == NULL) continue; // not selected
+        AK_TypeParser *tp = cpg->lines[i]->type_parser;
+        if (tp == NULL) continue;
+        tp->parsed_line = AK_TPS_Resolve((*states)[i], tp->parsed_line);
+        (*states)[i] = tp->parsed_line;
+        if ((*units)[i] > tp->dt_unit_line) {
+            tp->dt_unit_line = (*units)[i];
+        }
+        (*units)[i] = tp->dt_unit_line;
+    }
+    return 0;
+}
 
-    PyObject* array = AK_CPL_ToArray(cpl, dtype, tsep, decc);
-    AK_CPL_Free(cpl);
-    return array; // might be NULL
+// Resolve the type parser state of each line with those of prior chunks, such that the dtypes of successive chunks can only widen. Returns 0 on success, -1 on error.
+static inline int
+DTAIter_resolve_states(DTAIterObject *self, AK_CodePointGrid *cpg)
+{
+    return AK_CPG_resolve_states(cpg, &self->states, &self->units, &self->states_count);
 }
 
-//------------------------------------------------------------------------------
-// AK module public methods
-//------------------------------------------------------------------------------
+static inline PyObject *
+DTAIter_iternext(DTAIterObject *self) {
+    if (self->exhausted) {
+        return NULL;
+    }
+    AK_DelimitedReader *dr = self->dr;
+    AK_CodePointGrid* cpg = AK_CPG_New(self->dtypes,
+            self->tsep,
+            self->decc,
+            self->infer_datetime);
+    if (cpg == NULL) {
+        return NULL;
+    }
+    cpg->infer_rows = self->infer_rows;
+    cpg->na_values = self->na_values;
+    AK_DR_share_keep(dr, cpg);
+    if (self->axis == 0) {
+        dr->record_number = -1; // each chunk starts at line 0
+    }
+    Py_ssize_t record_start = dr->record_number;
+    int status;
+    while (dr->record_number - record_start < self->chunk_rows) {
+        status = AK_DR_ProcessRecord(dr, cpg, self->line_select);
+        if (status == -1) {
+            AK_CPG_Free(cpg);
+            return NULL;
+        }
+        else if (status == 0) {
+            self->exhausted = true;
+            break;
+        }
+    }
+    if (dr->record_number == record_start) { // no records in this chunk
+        AK_CPG_Free(cpg);
+        return NULL;
+    }
+    if (self->axis == 1 && DTAIter_resolve_states(self, cpg)) {
+        AK_CPG_Free(cpg);
+        return NULL;
+    }
+    PyObject* arrays = AK_CPG_ToArrayList(cpg,
+            self->axis,
+            self->line_select,
+            (char)self->tsep,
+            (char)self->decc,
+            false,
+            NULL,
+            self->threads);
+    AK_CPG_Free(cpg);
+    return arrays; // could be NULL
+}
 
-static char *delimited_to_ararys_kwarg_names[] = {
+PyTypeObject DTAIterType = {
+    PyVarObject_HEAD_INIT(NULL, 0)
+    .tp_basicsize = sizeof(DTAIterObject),
+    .tp_dealloc = (destructor) DTAIter_dealloc,
+    .tp_iter = (getiterfunc) DTAIter_iter,
+    .tp_iternext = (iternextfunc) DTAIter_iternext,
+    .tp_name = "arraykit.DTAIterator",
+};
+
+static char *iter_delimited_to_arrays_kwarg_names[] = {
     "file_like",
+    "chunk_rows",
     "axis",
     "dtypes",
     "line_select",
+    "usecols",
     "delimiter",
     "doublequote",
     "escapechar",
@@ -2594,17 +7265,23 @@ static char *delimited_to_ararys_kwarg_names[] = {
     "strict",
     "thousandschar",
     "decimalchar",
+    "infer_datetime",
+    "infer_rows",
+    "na_values",
+    "threads",
     NULL
 };
 
-// NOTE: implement skip_header, skip_footer in client Python, not here.
+// Return an iterator of lists of arrays, each list formed from at most `chunk_rows` records. On axis 1, type inference of each chunk is resolved with that of prior chunks.
 PyObject *
-delimited_to_arrays(PyObject *Py_UNUSED(m), PyObject *args, PyObject *kwargs)
+iter_delimited_to_arrays(PyObject *Py_UNUSED(m), PyObject *args, PyObject *kwargs)
 {
     PyObject *file_like;
+    Py_ssize_t chunk_rows = 65536;
     int axis = 0;
     PyObject *dtypes = NULL;
     PyObject *line_select = NULL;
+    PyObject *usecols = NULL;
     PyObject *delimiter = NULL;
     PyObject *doublequote = NULL;
     PyObject *escapechar = NULL;
@@ -2614,15 +7291,21 @@ delimited_to_arrays(PyObject *Py_UNUSED(m), PyObject *args, PyObject *kwargs)
     PyObject *strict = NULL;
     PyObject *thousandschar = NULL;
     PyObject *decimalchar = NULL;
+    PyObject *infer_datetime_obj = NULL;
+    Py_ssize_t infer_rows = 0;
+    PyObject *na_values = NULL;
+    int threads = 1;
 
     if (!PyArg_ParseTupleAndKeywords(args, kwargs,
-            "O|$iOOOOOOOOOOO:delimited_to_arrays",
-            delimited_to_ararys_kwarg_names,
+            "O|$niOOOOOOOOOOOOOnOi:iter_delimited_to_arrays",
+            iter_delimited_to_arrays_kwarg_names,
             &file_like,
             // kwarg only
+            &chunk_rows,
             &axis,
             &dtypes,
             &line_select,
+            &usecols,
             &delimiter,
             &doublequote,
             &escapechar,
@@ -2631,226 +7314,598 @@ delimited_to_arrays(PyObject *Py_UNUSED(m), PyObject *args, PyObject *kwargs)
             &skipinitialspace,
             &strict,
             &thousandschar,
-            &decimalchar))
+            &decimalchar,
+            &infer_datetime_obj,
+            &infer_rows,
+            &na_values,
+            &threads))
         return NULL;
 
-    // normalize line_select to NULL or callable
-    if ((line_select == NULL) || (line_select == Py_None)) {
-        line_select = NULL;
-    }
-    else if (!PyCallable_Check(line_select)) {
-        PyErr_SetString(PyExc_TypeError, "line_select must be a callable or None");
+    if (chunk_rows < 1) {
+        PyErr_SetString(PyExc_ValueError, "chunk_rows must be greater than zero");
         return NULL;
     }
-
     if ((axis < 0) || (axis > 1)) {
         PyErr_SetString(PyExc_ValueError, "Axis must be 0 or 1");
         return NULL;
     }
-    AK_DelimitedReader *dr = AK_DR_New(file_like,
-            axis,
-            delimiter,
-            doublequote,
-            escapechar,
-            quotechar,
-            quoting,
-            skipinitialspace,
-            strict);
-    if (dr == NULL) { // can happen due to validation of dialect parameters
+    if (threads < 1) {
+        PyErr_SetString(PyExc_ValueError, "threads must be greater than zero");
+        return NULL;
+    }
+    if (infer_rows < 0) {
+        PyErr_SetString(PyExc_ValueError, "infer_rows must be zero or greater");
         return NULL;
     }
-
     Py_UCS4 tsep;
     if (AK_set_char(
             "thousandschar",
             &tsep,
             thousandschar,
-            '\0')) {
-        AK_DR_Free(dr);
-        return NULL; // default is off (skips evaluation)
-    }
+            '\0')) return NULL; // default is off (skips evaluation)
     Py_UCS4 decc;
     if (AK_set_char(
             "decimalchar",
             &decc,
             decimalchar,
-            '.')) {
-        AK_DR_Free(dr);
+            '.')) return NULL;
+    bool infer_datetime;
+    if (AK_set_bool(
+            "infer_datetime",
+            &infer_datetime,
+            infer_datetime_obj,
+            false)) return NULL;
+    AK_DTypes *dt;
+    if (AK_set_dtypes(&dt, dtypes)) return NULL;
+    AK_LineSelect *ls;
+    if (AK_set_line_select(&ls, line_select)) {
+        AK_DTypes_Free(dt);
+        return NULL;
+    }
+    AK_NAValues *na;
+    if (AK_set_na_values(&na, na_values)) {
+        AK_LineSelect_Free(ls);
+        AK_DTypes_Free(dt);
         return NULL;
     }
 
-    // dtypes inc / dec ref bound within CPG life
-    AK_CodePointGrid* cpg = AK_CPG_New(dtypes, tsep, decc);
-    if (cpg == NULL) { // error will be set
+    AK_DelimitedReader *dr = AK_DR_New(file_like,
+            axis,
+            usecols,
+            delimiter,
+            doublequote,
+            escapechar,
+            quotechar,
+            quoting,
+            skipinitialspace,
+            strict);
+    if (dr == NULL) { // can happen due to validation of dialect parameters
+        AK_NAValues_Free(na);
+        AK_LineSelect_Free(ls);
+        AK_DTypes_Free(dt);
+        return NULL;
+    }
+    DTAIterObject *it = PyObject_New(DTAIterObject, &DTAIterType);
+    if (it == NULL) {
         AK_DR_Free(dr);
+        AK_NAValues_Free(na);
+        AK_LineSelect_Free(ls);
+        AK_DTypes_Free(dt);
         return NULL;
     }
-    // Consume all lines from dr and load into cpg
-    int status;
-    while (true) {
-        status = AK_DR_ProcessRecord(dr, cpg, line_select);
-        if (status == 1) {
-            continue; // more lines to process
+    it->dr = dr;
+    it->dtypes = dt;
+    it->line_select = ls;
+    it->na_values = na;
+    it->tsep = tsep;
+    it->decc = decc;
+    it->infer_datetime = infer_datetime;
+    it->infer_rows = infer_rows;
+    it->axis = axis;
+    it->threads = threads;
+    it->chunk_rows = chunk_rows;
+    it->states = NULL;
+    it->units = NULL;
+    it->states_count = 0;
+    it->exhausted = false;
+    return (PyObject*)it;
+}
+
+//------------------------------------------------------------------------------
+// DelimitedToArraysTail
+
+// Given a buffer-backed AK_DelimitedReader, return the length in bytes of the complete records at the start of its buffer, each ending with a line terminator outside of a quoted field. A trailing \r might precede a \n not yet written and does not end a record. Cannot error.
+static inline Py_ssize_t
+AK_DR_complete_length(AK_DelimitedReader *dr)
+{
+    AK_Dialect *dialect = dr->dialect;
+    const Py_UCS1 *start = dr->buffer_pos;
+    const Py_UCS1 *end = dr->buffer_end;
+    if (end > start && *(end - 1) == '\r') --end;
+
+    bool plain = ((dialect->quoting == QUOTE_NONE)
+            || (dialect->quotechar < 0x80
+            && memchr(start, (int)dialect->quotechar, end - start) == NULL))
+            && ((dialect->escapechar == 0)
+            || (dialect->escapechar < 0x80
+            && memchr(start, (int)dialect->escapechar, end - start) == NULL));
+    if (plain) { // every line terminator ends a record
+        const Py_UCS1 *p = end;
+        while (p > start && *(p - 1) != '\n' && *(p - 1) != '\r') {
+            --p;
         }
-        else if (status == 0) {
-            break;
+        return p - start;
+    }
+    // scan every line as AK_DR_ProcessRecord would, noting the end of the last record
+    AK_DelimitedReaderState state = START_RECORD;
+    Py_ssize_t complete = 0;
+    const Py_UCS1 *p = start;
+    Py_UCS4 c;
+    while (p < end) {
+        dr->buffer_pos = p;
+        const Py_UCS1 *line_end = p + AK_DR_buffer_line_length(dr);
+        if (line_end > end) break; // the trailing \r
+        while (p < line_end) {
+            if (AK_UTF8_decode(&p, line_end, &c)) {
+                c = *p++; // invalid sequences are reported when parsed
+            }
+            state = AK_DR_scan_char(dialect, state, c);
         }
-        else if (status == -1) {
-            AK_DR_Free(dr);
-            AK_CPG_Free(cpg);
-            return NULL;
+        state = AK_DR_scan_char(dialect, state, '\0');
+        if (state == START_RECORD
+                && (*(line_end - 1) == '\n' || *(line_end - 1) == '\r')) {
+            complete = line_end - start;
         }
-        // NOTE: could use PyErr_CheckSignals() at some number of dr->record_number
     }
-    AK_DR_Free(dr);
+    dr->buffer_pos = start;
+    return complete;
+}
+
+// Return a new reference to the bytes of the file at `path` after `offset`. If the file is shorter than `offset`, it is taken to have been truncated or replaced, and `offset` is set to zero. Returns NULL on error.
+static inline PyObject *
+AK_read_after(PyObject *path, Py_ssize_t *offset)
+{
+    PyObject *data = NULL;
+    PyObject *size = NULL;
+    PyObject *io = PyImport_ImportModule("io");
+    if (io == NULL) return NULL;
+
+    PyObject *file = PyObject_CallMethod(io, "open", "Os", path, "rb");
+    if (file == NULL) goto finally;
+
+    size = PyObject_CallMethod(file, "seek", "ii", 0, 2);
+    if (size == NULL) goto finally;
+    Py_ssize_t file_size = PyLong_AsSsize_t(size);
+    if (file_size == -1 && PyErr_Occurred()) goto finally;
+    if (file_size < *offset) {
+        *offset = 0;
+    }
+    Py_SETREF(size, PyObject_CallMethod(file, "seek", "ni", *offset, 0));
+    if (size == NULL) goto finally;
+    data = PyObject_CallMethod(file, "read", NULL);
+finally:
+    if (file) {
+        PyObject *closed = PyObject_CallMethod(file, "close", NULL);
+        if (closed == NULL && data) {
+            Py_CLEAR(data);
+        }
+        Py_XDECREF(closed);
+    }
+    Py_XDECREF(size);
+    Py_XDECREF(file);
+    Py_DECREF(io);
+    return data;
+}
+
+typedef struct DTATailObject {
+    PyObject_HEAD
+    PyObject *path;
+    Py_ssize_t offset; // bytes of the file loaded by prior calls, ending at a record boundary
+    AK_DelimitedReader *dr; // reads from the bytes after offset of each call
+    AK_DTypes *dtypes;
+    AK_LineSelect *line_select;
+    AK_NAValues *na_values;
+    Py_UCS4 tsep;
+    Py_UCS4 decc;
+    bool infer_datetime;
+    Py_ssize_t skip_header; // lines not yet skipped from the start of the file
+    bool return_mask;
+    AK_OnError on_error;
+    int axis;
+    int threads;
+    // on axis 1, the resolved type and datetime unit of each line over all prior calls
+    AK_TypeParserState *states;
+    NPY_DATETIMEUNIT *units;
+    Py_ssize_t states_count;
+} DTATailObject;
+
+static inline void
+DTATail_dealloc(DTATailObject *self) {
+    if (self->dr) {
+        AK_DR_Free(self->dr);
+    }
+    Py_XDECREF(self->path);
+    AK_DTypes_Free(self->dtypes);
+    AK_LineSelect_Free(self->line_select);
+    AK_NAValues_Free(self->na_values);
+    PyMem_Free(self->states);
+    PyMem_Free(self->units);
+    PyObject_Del((PyObject*)self);
+}
 
-    PyObject* arrays = AK_CPG_ToArrayList(cpg, axis, line_select, tsep, decc);
-    // NOTE: do not need to check if arrays is NULL as we will return NULL anyway
-    AK_CPG_Free(cpg); // will free reference to dtypes
+// Load the complete records appended to the file since the prior call, returning a new list of arrays, or a tuple of that list followed by masks and a report, as with delimited_to_arrays; a record not yet completely written is loaded by a later call. Header lines are skipped once, from the start of the file. On axis 1, type inference is resolved with that of prior calls.
+static inline PyObject *
+DTATail_call(DTATailObject *self, PyObject *args, PyObject *kwargs) {
+    static char *kwarg_names[] = {NULL};
+    if (!PyArg_ParseTupleAndKeywords(args, kwargs, ":DTATail", kwarg_names)) {
+        return NULL;
+    }
+    Py_ssize_t offset = self->offset;
+    PyObject *data = AK_read_after(self->path, &offset);
+    if (data == NULL) return NULL;
+
+    AK_DelimitedReader *dr = self->dr;
+    PyBuffer_Release(&dr->buffer);
+    int err = PyObject_GetBuffer(data, &dr->buffer, PyBUF_SIMPLE);
+    Py_DECREF(data); // the buffer holds a reference
+    if (err) return NULL;
+    dr->buffer_pos = (const Py_UCS1*)dr->buffer.buf;
+    dr->buffer_end = dr->buffer_pos + dr->buffer.len;
+    dr->buffer_end = dr->buffer_pos + AK_DR_complete_length(dr);
+    // header lines are only skipped once complete
+    for (; self->skip_header > 0 && dr->buffer_pos < dr->buffer_end; --self->skip_header) {
+        dr->buffer_pos += AK_DR_buffer_line_length(dr);
+    }
+
+    PyObject* arrays = NULL;
+    PyObject* parts = NULL;
+    PyObject* report = NULL;
+    if (self->on_error == AK_ON_ERROR_COLLECT) {
+        report = PyList_New(0);
+        if (report == NULL) return NULL;
+    }
+    AK_CodePointGrid* cpg = AK_CPG_New(self->dtypes,
+            self->tsep,
+            self->decc,
+            self->infer_datetime);
+    if (cpg == NULL) goto finally;
+    cpg->na_values = self->na_values;
+    cpg->on_error = self->on_error;
+    cpg->report = report;
+    dr->on_error = self->on_error;
+    dr->report = report;
+    AK_DR_share_keep(dr, cpg);
+    if (self->axis == 0) {
+        dr->record_number = -1; // each call starts at line 0
+    }
+    int status;
+    if (self->threads > 1 && (self->line_select == NULL || self->axis == 1)) {
+        if (AK_DR_ProcessBuffer(dr, cpg, self->threads) == -1) goto finally;
+    }
+    while (true) {
+        status = AK_DR_ProcessRecord(dr, cpg, self->line_select);
+        if (status == 0) break;
+        if (status == -1) goto finally;
+    }
+    if (self->axis == 1 && AK_CPG_resolve_states(cpg,
+            &self->states,
+            &self->units,
+            &self->states_count)) goto finally;
+    arrays = AK_CPG_ToArrayList(cpg,
+            self->axis,
+            self->line_select,
+            (char)self->tsep,
+            (char)self->decc,
+            false,
+            NULL,
+            self->threads);
+    if (arrays == NULL) goto finally;
+    // only advance once records are loaded
+    self->offset = offset + (dr->buffer_end - (const Py_UCS1*)dr->buffer.buf);
+    if (!(self->return_mask || report)) goto finally;
+
+    parts = PyList_New(1);
+    if (parts == NULL) {
+        Py_CLEAR(arrays);
+        goto finally;
+    }
+    PyList_SET_ITEM(parts, 0, arrays); // steals reference
+    arrays = NULL;
+    PyObject* part;
+    if (self->return_mask) {
+        part = AK_CPG_ToMaskList(cpg, self->axis, self->line_select);
+        if (part == NULL || PyList_Append(parts, part)) goto finally_part;
+        Py_DECREF(part);
+    }
+    if (report) {
+        part = AK_report_to_array(report);
+        if (part == NULL || PyList_Append(parts, part)) goto finally_part;
+        Py_DECREF(part);
+    }
+    arrays = PyList_AsTuple(parts);
+    goto finally;
+finally_part:
+    Py_XDECREF(part);
+finally:
+    dr->report = NULL;
+    if (cpg) {
+        AK_CPG_Free(cpg);
+    }
+    Py_XDECREF(parts);
+    Py_XDECREF(report);
     return arrays; // could be NULL
 }
 
-static char *iterable_str_to_array_1d_kwarg_names[] = {
-    "iterable",
-    "dtype",
+PyTypeObject DTATailType = {
+    PyVarObject_HEAD_INIT(NULL, 0)
+    .tp_basicsize = sizeof(DTATailObject),
+    .tp_dealloc = (destructor) DTATail_dealloc,
+    .tp_call = (ternaryfunc) DTATail_call,
+    .tp_name = "arraykit.DTATail",
+};
+
+static char *tail_delimited_to_arrays_kwarg_names[] = {
+    "path",
+    "axis",
+    "dtypes",
+    "line_select",
+    "usecols",
+    "skip_header",
+    "delimiter",
+    "doublequote",
+    "escapechar",
+    "quotechar",
+    "quoting",
+    "skipinitialspace",
+    "strict",
     "thousandschar",
     "decimalchar",
+    "infer_datetime",
+    "na_values",
+    "return_mask",
+    "on_error",
+    "threads",
     NULL
 };
 
+// Return a callable that, on each call, loads the complete records appended to the file at `path` since the prior call, returning a list of arrays. The first `skip_header` lines of the file are skipped. On axis 1, type inference of each call is resolved with that of prior calls.
 PyObject *
-iterable_str_to_array_1d(PyObject *Py_UNUSED(m), PyObject *args, PyObject *kwargs)
+tail_delimited_to_arrays(PyObject *Py_UNUSED(m), PyObject *args, PyObject *kwargs)
 {
-    PyObject *iterable = NULL;
-    PyObject *dtype_specifier = NULL;
+    PyObject *path_obj;
+    int axis = 0;
+    PyObject *dtypes = NULL;
+    PyObject *line_select = NULL;
+    PyObject *usecols = NULL;
+    Py_ssize_t skip_header = 0;
+    PyObject *delimiter = NULL;
+    PyObject *doublequote = NULL;
+    PyObject *escapechar = NULL;
+    PyObject *quotechar = NULL;
+    PyObject *quoting = NULL;
+    PyObject *skipinitialspace = NULL;
+    PyObject *strict = NULL;
     PyObject *thousandschar = NULL;
     PyObject *decimalchar = NULL;
+    PyObject *infer_datetime_obj = NULL;
+    PyObject *na_values = NULL;
+    PyObject *return_mask_obj = NULL;
+    PyObject *on_error_obj = NULL;
+    int threads = 1;
 
     if (!PyArg_ParseTupleAndKeywords(args, kwargs,
-            "O|OOO:iterable_str_to_array_1d",
-            iterable_str_to_array_1d_kwarg_names,
-            &iterable,
+            "O|$iOOOnOOOOOOOOOOOOOi:tail_delimited_to_arrays",
+            tail_delimited_to_arrays_kwarg_names,
+            &path_obj,
             // kwarg only
-            &dtype_specifier,
+            &axis,
+            &dtypes,
+            &line_select,
+            &usecols,
+            &skip_header,
+            &delimiter,
+            &doublequote,
+            &escapechar,
+            &quotechar,
+            &quoting,
+            &skipinitialspace,
+            &strict,
             &thousandschar,
-            &decimalchar))
+            &decimalchar,
+            &infer_datetime_obj,
+            &na_values,
+            &return_mask_obj,
+            &on_error_obj,
+            &threads))
         return NULL;
 
+    if ((axis < 0) || (axis > 1)) {
+        PyErr_SetString(PyExc_ValueError, "Axis must be 0 or 1");
+        return NULL;
+    }
+    if (threads < 1) {
+        PyErr_SetString(PyExc_ValueError, "threads must be greater than zero");
+        return NULL;
+    }
+    if (skip_header < 0) {
+        PyErr_SetString(PyExc_ValueError, "skip_header must be zero or greater");
+        return NULL;
+    }
+    bool return_mask;
+    if (AK_set_bool(
+            "return_mask",
+            &return_mask,
+            return_mask_obj,
+            false)) return NULL;
+    AK_OnError on_error;
+    if (AK_set_on_error(&on_error, on_error_obj)) return NULL;
     Py_UCS4 tsep;
     if (AK_set_char(
             "thousandschar",
             &tsep,
             thousandschar,
-            '\0')) return NULL;
-
+            '\0')) return NULL; // default is off (skips evaluation)
     Py_UCS4 decc;
     if (AK_set_char(
             "decimalchar",
             &decc,
             decimalchar,
             '.')) return NULL;
+    bool infer_datetime;
+    if (AK_set_bool(
+            "infer_datetime",
+            &infer_datetime,
+            infer_datetime_obj,
+            false)) return NULL;
 
-    return AK_IterableStrToArray1D(iterable, dtype_specifier, tsep, decc);
+    DTATailObject *tail = PyObject_New(DTATailObject, &DTATailType);
+    if (tail == NULL) return NULL;
+    tail->path = NULL;
+    tail->offset = 0;
+    tail->dr = NULL;
+    tail->dtypes = NULL;
+    tail->line_select = NULL;
+    tail->na_values = NULL;
+    tail->tsep = tsep;
+    tail->decc = decc;
+    tail->infer_datetime = infer_datetime;
+    tail->skip_header = skip_header;
+    tail->return_mask = return_mask;
+    tail->on_error = on_error;
+    tail->axis = axis;
+    tail->threads = threads;
+    tail->states = NULL;
+    tail->units = NULL;
+    tail->states_count = 0;
+
+    tail->path = PyOS_FSPath(path_obj);
+    if (tail->path == NULL) goto error;
+    if (AK_set_dtypes(&tail->dtypes, dtypes)) goto error;
+    if (AK_set_line_select(&tail->line_select, line_select)) goto error;
+    if (AK_set_na_values(&tail->na_values, na_values)) goto error;
+
+    // the reader is created with an empty buffer, replaced on each call
+    PyObject *empty = PyBytes_FromStringAndSize(NULL, 0);
+    if (empty == NULL) goto error;
+    tail->dr = AK_DR_New(empty,
+            axis,
+            usecols,
+            delimiter,
+            doublequote,
+            escapechar,
+            quotechar,
+            quoting,
+            skipinitialspace,
+            strict);
+    Py_DECREF(empty);
+    if (tail->dr == NULL) goto error; // can happen due to validation of dialect parameters
+    return (PyObject*)tail;
+error:
+    Py_DECREF(tail);
+    return NULL;
 }
 
-static char *split_after_count_kwarg_names[] = {
-    "string",
-    "delimiter",
-    "count",
-    "doublequote",
-    "escapechar",
-    "quotechar",
-    "quoting",
-    "strict",
+static char *iterable_str_to_array_1d_kwarg_names[] = {
+    "iterable",
+    "dtype",
+    "thousandschar",
+    "decimalchar",
     NULL
 };
 
 PyObject *
-split_after_count(PyObject *Py_UNUSED(m), PyObject *args, PyObject *kwargs)
+iterable_str_to_array_1d(PyObject *Py_UNUSED(m), PyObject *args, PyObject *kwargs)
 {
-    PyObject *string = NULL;
-    PyObject *delimiter = NULL;
-    int count = 0;
-    PyObject *doublequote = NULL;
-    PyObject *escapechar = NULL;
-    PyObject *quotechar = NULL;
-    PyObject *quoting = NULL;
-    PyObject *strict = NULL;
+    PyObject *iterable = NULL;
+    PyObject *dtype_specifier = NULL;
+    PyObject *thousandschar = NULL;
+    PyObject *decimalchar = NULL;
 
     if (!PyArg_ParseTupleAndKeywords(args, kwargs,
-            "O|$OiOOOOO:split_after_count",
-            split_after_count_kwarg_names,
-            &string,
-            // kwarg-only
-            &delimiter,
-            &count,
-            &doublequote,
-            &escapechar,
-            &quotechar,
-            &quoting,
-            &strict
-            )) {
+            "O|OOO:iterable_str_to_array_1d",
+            iterable_str_to_array_1d_kwarg_names,
+            &iterable,
+            // kwarg only
+            &dtype_specifier,
+            &thousandschar,
+            &decimalchar))
         return NULL;
-    }
 
-    if (!PyUnicode_Check(string)) {
-        PyErr_Format(PyExc_ValueError,
-                "a string is required, not %.200s",
-                Py_TYPE(string)->tp_name
-                );
-        return NULL;
-    }
-    if (count <= 0) {
-        PyErr_Format(PyExc_ValueError,
-                "count must be greater than zero, not %i",
-                count
-                );
-        return NULL;
-    }
+    Py_UCS4 tsep;
+    if (AK_set_char(
+            "thousandschar",
+            &tsep,
+            thousandschar,
+            '\0')) return NULL;
 
-    AK_Dialect dialect;
+    Py_UCS4 decc;
+    if (AK_set_char(
+            "decimalchar",
+            &decc,
+            decimalchar,
+            '.')) return NULL;
+
+    return AK_IterableStrToArray1D(iterable, dtype_specifier, tsep, decc);
+}
 
+// Set the fields of `dialect` used by split_after_count. Returns 0 on success, -1 on error.
+static inline int
+AK_split_after_count_dialect(AK_Dialect *dialect,
+        PyObject *delimiter,
+        PyObject *doublequote,
+        PyObject *escapechar,
+        PyObject *quotechar,
+        PyObject *quoting,
+        PyObject *strict)
+{
     if (AK_set_char(
             "delimiter",
-            &dialect.delimiter,
+            &dialect->delimiter,
             delimiter,
-            ',')) return NULL;
+            ',')) return -1;
 
     if (AK_set_bool(
             "doublequote",
-            &dialect.doublequote,
+            &dialect->doublequote,
             doublequote,
-            true)) return NULL;
+            true)) return -1;
 
     if (AK_set_char(
             "escapechar",
-            &dialect.escapechar,
+            &dialect->escapechar,
             escapechar,
-            0)) return NULL;
+            0)) return -1;
 
     if (AK_set_char(
             "quotechar",
-            &dialect.quotechar,
+            &dialect->quotechar,
             quotechar,
-            '"')) return NULL;
+            '"')) return -1;
 
     if (AK_set_int(
             "quoting",
-            &dialect.quoting,
+            &dialect->quoting,
             quoting,
-            QUOTE_MINIMAL)) return NULL;
+            QUOTE_MINIMAL)) return -1;
 
     if (AK_set_bool(
             "strict",
-            &dialect.strict,
+            &dialect->strict,
             strict,
-            false)) return NULL;
+            false)) return -1;
+    return 0;
+}
 
-    unsigned int kind = PyUnicode_KIND(string);
-    const void *data = PyUnicode_DATA(string);
+// Return the position of the `count` delimiter of the `linelen` code points of `kind` at `data`, or `linelen` if there are fewer delimiters. Returns -1 on error.
+static inline Py_ssize_t
+AK_split_after_count_pos(AK_Dialect *dialect,
+        unsigned int kind,
+        const void *data,
+        Py_ssize_t linelen,
+        int count)
+{
     Py_ssize_t pos = 0;
     Py_ssize_t delim_count = 0;
-    Py_ssize_t linelen = PyUnicode_GET_LENGTH(string);
     Py_UCS4 c;
     AK_DelimitedReaderState state = START_RECORD;
 
@@ -2871,13 +7926,13 @@ split_after_count(PyObject *Py_UNUSED(m), PyObject *args, PyObject *kwargs)
             if (c == '\n' || c == '\r' || c == '\0') {
                 state = (c == '\0' ? START_RECORD : EAT_CRNL);
             }
-            else if (c == dialect.quotechar && dialect.quoting != QUOTE_NONE) {
+            else if (c == dialect->quotechar && dialect->quoting != QUOTE_NONE) {
                 state = IN_QUOTED_FIELD;
             }
-            else if (c == dialect.escapechar) {
+            else if (c == dialect->escapechar) {
                 state = ESCAPED_CHAR;
             }
-            else if (c == dialect.delimiter) { // end of a field
+            else if (c == dialect->delimiter) { // end of a field
                 delim_count += 1;
             }
             else {
@@ -2900,21 +7955,21 @@ split_after_count(PyObject *Py_UNUSED(m), PyObject *args, PyObject *kwargs)
             if (c == '\n' || c == '\r' || c == '\0') { // end of line
                 state = (c == '\0' ? START_RECORD : EAT_CRNL);
             }
-            else if (c == dialect.escapechar) {
+            else if (c == dialect->escapechar) {
                 state = ESCAPED_CHAR;
             }
-            else if (c == dialect.delimiter) {
+            else if (c == dialect->delimiter) {
                 delim_count += 1;
                 state = START_FIELD;
             }
             break;
         case IN_QUOTED_FIELD: // in quoted field
             if (c == '\0');
-            else if (c == dialect.escapechar) {
+            else if (c == dialect->escapechar) {
                 state = ESCAPE_IN_QUOTED_FIELD;
             }
-            else if (c == dialect.quotechar && dialect.quoting != QUOTE_NONE) {
-                state = (dialect.doublequote ? QUOTE_IN_QUOTED_FIELD : IN_FIELD);
+            else if (c == dialect->quotechar && dialect->quoting != QUOTE_NONE) {
+                state = (dialect->doublequote ? QUOTE_IN_QUOTED_FIELD : IN_FIELD);
             }
             break;
         case ESCAPE_IN_QUOTED_FIELD:
@@ -2925,23 +7980,23 @@ split_after_count(PyObject *Py_UNUSED(m), PyObject *args, PyObject *kwargs)
             break;
         case QUOTE_IN_QUOTED_FIELD:
             // doublequote - seen a quote in a quoted field
-            if (dialect.quoting != QUOTE_NONE && c == dialect.quotechar) {
+            if (dialect->quoting != QUOTE_NONE && c == dialect->quotechar) {
                 state = IN_QUOTED_FIELD;
             }
-            else if (c == dialect.delimiter) {
+            else if (c == dialect->delimiter) {
                 delim_count += 1;
                 state = START_FIELD;
             }
             else if (c == '\n' || c == '\r' || c == '\0') {
                 state = (c == '\0' ? START_RECORD : EAT_CRNL);
             }
-            else if (!dialect.strict) {
+            else if (!dialect->strict) {
                 state = IN_FIELD;
             }
             else { // illegal
                 PyErr_Format(PyExc_RuntimeError, "'%c' expected after '%c'",
-                        dialect.delimiter, dialect.quotechar);
-                return NULL;
+                        dialect->delimiter, dialect->quotechar);
+                return -1;
             }
             break;
         case EAT_CRNL:
@@ -2951,7 +8006,7 @@ split_after_count(PyObject *Py_UNUSED(m), PyObject *args, PyObject *kwargs)
             else {
                 PyErr_Format(PyExc_RuntimeError,
                         "new-line character seen in unquoted field - do you need to open the file in universal-newline mode?");
-                return NULL;
+                return -1;
             }
             break;
         }
@@ -2962,6 +8017,81 @@ split_after_count(PyObject *Py_UNUSED(m), PyObject *args, PyObject *kwargs)
         pos++;
     }
 
+    return pos;
+}
+
+static char *split_after_count_kwarg_names[] = {
+    "string",
+    "delimiter",
+    "count",
+    "doublequote",
+    "escapechar",
+    "quotechar",
+    "quoting",
+    "strict",
+    NULL
+};
+
+PyObject *
+split_after_count(PyObject *Py_UNUSED(m), PyObject *args, PyObject *kwargs)
+{
+    PyObject *string = NULL;
+    PyObject *delimiter = NULL;
+    int count = 0;
+    PyObject *doublequote = NULL;
+    PyObject *escapechar = NULL;
+    PyObject *quotechar = NULL;
+    PyObject *quoting = NULL;
+    PyObject *strict = NULL;
+
+    if (!PyArg_ParseTupleAndKeywords(args, kwargs,
+            "O|$OiOOOOO:split_after_count",
+            split_after_count_kwarg_names,
+            &string,
+            // kwarg-only
+            &delimiter,
+            &count,
+            &doublequote,
+            &escapechar,
+            &quotechar,
+            &quoting,
+            &strict
+            )) {
+        return NULL;
+    }
+
+    if (!PyUnicode_Check(string)) {
+        PyErr_Format(PyExc_ValueError,
+                "a string is required, not %.200s",
+                Py_TYPE(string)->tp_name
+                );
+        return NULL;
+    }
+    if (count <= 0) {
+        PyErr_Format(PyExc_ValueError,
+                "count must be greater than zero, not %i",
+                count
+                );
+        return NULL;
+    }
+
+    AK_Dialect dialect;
+    if (AK_split_after_count_dialect(&dialect,
+            delimiter,
+            doublequote,
+            escapechar,
+            quotechar,
+            quoting,
+            strict)) return NULL;
+
+    Py_ssize_t linelen = PyUnicode_GET_LENGTH(string);
+    Py_ssize_t pos = AK_split_after_count_pos(&dialect,
+            PyUnicode_KIND(string),
+            PyUnicode_DATA(string),
+            linelen,
+            count);
+    if (pos == -1) return NULL;
+
     PyObject* left = PyUnicode_Substring(string, 0, pos);
     PyObject* right = PyUnicode_Substring(string, pos+1, linelen);
     PyObject *result = PyTuple_Pack(2, left, right);
@@ -2969,3 +8099,349 @@ split_after_count(PyObject *Py_UNUSED(m), PyObject *args, PyObject *kwargs)
     Py_DECREF(right);
     return result;
 }
+
+static char *split_after_count_array_kwarg_names[] = {
+    "strings",
+    "delimiter",
+    "count",
+    "doublequote",
+    "escapechar",
+    "quotechar",
+    "quoting",
+    "strict",
+    NULL
+};
+
+// Given a 1D unicode or object array, or an iterable, of strings, return a tuple of two unicode arrays, of the strings before and after the `count` delimiter of each string.
+PyObject *
+split_after_count_array(PyObject *Py_UNUSED(m), PyObject *args, PyObject *kwargs)
+{
+    PyObject *strings = NULL;
+    PyObject *delimiter = NULL;
+    int count = 0;
+    PyObject *doublequote = NULL;
+    PyObject *escapechar = NULL;
+    PyObject *quotechar = NULL;
+    PyObject *quoting = NULL;
+    PyObject *strict = NULL;
+
+    if (!PyArg_ParseTupleAndKeywords(args, kwargs,
+            "O|$OiOOOOO:split_after_count_array",
+            split_after_count_array_kwarg_names,
+            &strings,
+            // kwarg-only
+            &delimiter,
+            &count,
+            &doublequote,
+            &escapechar,
+            &quotechar,
+            &quoting,
+            &strict
+            )) {
+        return NULL;
+    }
+    if (count <= 0) {
+        PyErr_Format(PyExc_ValueError,
+                "count must be greater than zero, not %i",
+                count
+                );
+        return NULL;
+    }
+    AK_Dialect dialect;
+    if (AK_split_after_count_dialect(&dialect,
+            delimiter,
+            doublequote,
+            escapechar,
+            quotechar,
+            quoting,
+            strict)) return NULL;
+
+    // a unicode array is read in place; anything else is collected as a sequence of strings
+    PyArrayObject *array = NULL;
+    PyObject *seq = NULL;
+    Py_ssize_t size;
+    Py_ssize_t points = 0; // code points per element of array
+    if (PyArray_Check(strings)) {
+        if (PyArray_NDIM((PyArrayObject*)strings) != 1) {
+            PyErr_SetString(PyExc_ValueError, "strings must be one-dimensional");
+            return NULL;
+        }
+        // arrays not in native byte order or not aligned use the iterable path
+        if (PyArray_TYPE((PyArrayObject*)strings) == NPY_UNICODE
+                && PyArray_ISNOTSWAPPED((PyArrayObject*)strings)
+                && PyArray_ISALIGNED((PyArrayObject*)strings)) {
+            array = (PyArrayObject*)strings;
+            size = PyArray_SIZE(array);
+            points = PyArray_ITEMSIZE(array) / UCS4_SIZE;
+        }
+    }
+    if (array == NULL) {
+        seq = PySequence_Fast(strings, "strings must be an iterable");
+        if (seq == NULL) return NULL;
+        size = PySequence_Fast_GET_SIZE(seq);
+    }
+
+    PyObject *result = NULL;
+    PyObject *left = NULL;
+    PyObject *right = NULL;
+    // for each string, its length and the position of the split
+    Py_ssize_t *bounds = (Py_ssize_t*)PyMem_Malloc(sizeof(Py_ssize_t) * 2 * (size ? size : 1));
+    if (bounds == NULL) {
+        PyErr_NoMemory();
+        goto finally;
+    }
+    Py_ssize_t left_max = 1;
+    Py_ssize_t right_max = 1;
+    Py_ssize_t i;
+    unsigned int kind = PyUnicode_4BYTE_KIND;
+    const void *data = NULL;
+    Py_ssize_t linelen;
+    Py_ssize_t pos;
+
+    // first pass: find splits to size each array in one allocation
+    for (i = 0; i < size; ++i) {
+        if (array) {
+            data = PyArray_GETPTR1(array, i);
+            linelen = points;
+            while (linelen > 0 && ((const Py_UCS4*)data)[linelen - 1] == 0) {
+                --linelen;
+            }
+        }
+        else {
+            PyObject *string = PySequence_Fast_GET_ITEM(seq, i);
+            if (!PyUnicode_Check(string)) {
+                PyErr_Format(PyExc_ValueError,
+                        "a string is required, not %.200s",
+                        Py_TYPE(string)->tp_name
+                        );
+                goto finally;
+            }
+            kind = PyUnicode_KIND(string);
+            data = PyUnicode_DATA(string);
+            linelen = PyUnicode_GET_LENGTH(string);
+        }
+        pos = AK_split_after_count_pos(&dialect, kind, data, linelen, count);
+        if (pos == -1) goto finally;
+        bounds[2 * i] = linelen;
+        bounds[2 * i + 1] = pos;
+        if (pos > left_max) left_max = pos;
+        if (linelen - pos - 1 > right_max) right_max = linelen - pos - 1;
+    }
+
+    npy_intp dims[] = {size};
+    PyArray_Descr *dtype = PyArray_DescrNewFromType(NPY_UNICODE);
+    if (dtype == NULL) goto finally;
+    dtype->elsize = (int)(left_max * UCS4_SIZE);
+    left = PyArray_Zeros(1, dims, dtype, 0); // steals dtype reference
+    if (left == NULL) goto finally;
+    dtype = PyArray_DescrNewFromType(NPY_UNICODE);
+    if (dtype == NULL) goto finally;
+    dtype->elsize = (int)(right_max * UCS4_SIZE);
+    right = PyArray_Zeros(1, dims, dtype, 0); // steals dtype reference
+    if (right == NULL) goto finally;
+
+    // second pass: copy code points of each side
+    Py_UCS4 *left_data = (Py_UCS4*)PyArray_DATA((PyArrayObject*)left);
+    Py_UCS4 *right_data = (Py_UCS4*)PyArray_DATA((PyArrayObject*)right);
+    for (i = 0; i < size; ++i) {
+        if (array) {
+            data = PyArray_GETPTR1(array, i);
+        }
+        else {
+            PyObject *string = PySequence_Fast_GET_ITEM(seq, i);
+            kind = PyUnicode_KIND(string);
+            data = PyUnicode_DATA(string);
+        }
+        linelen = bounds[2 * i];
+        pos = bounds[2 * i + 1];
+        Py_UCS4 *dst = left_data + i * left_max;
+        for (Py_ssize_t j = 0; j < pos; ++j) {
+            *dst++ = PyUnicode_READ(kind, data, j);
+        }
+        dst = right_data + i * right_max;
+        for (Py_ssize_t j = pos + 1; j < linelen; ++j) {
+            *dst++ = PyUnicode_READ(kind, data, j);
+        }
+    }
+    PyArray_CLEARFLAGS((PyArrayObject *)left, NPY_ARRAY_WRITEABLE);
+    PyArray_CLEARFLAGS((PyArrayObject *)right, NPY_ARRAY_WRITEABLE);
+    result = PyTuple_Pack(2, left, right);
+finally:
+    Py_XDECREF(left);
+    Py_XDECREF(right);
+    PyMem_Free(bounds);
+    Py_XDECREF(seq);
+    return result;
+}
+
+static char *arrays_to_delimited_kwarg_names[] = {
+    "arrays",
+    "file_like",
+    "delimiter",
+    "doublequote",
+    "escapechar",
+    "quotechar",
+    "quoting",
+    "lineterminator",
+    "float_format",
+    NULL
+};
+
+// Write a sequence of 1D arrays, each a column, as delimited records to a bytearray, a file-like with a write method, or a path.
+PyObject *
+arrays_to_delimited(PyObject *Py_UNUSED(m), PyObject *args, PyObject *kwargs)
+{
+    PyObject *arrays;
+    PyObject *file_like;
+    PyObject *delimiter = NULL;
+    PyObject *doublequote = NULL;
+    PyObject *escapechar = NULL;
+    PyObject *quotechar = NULL;
+    PyObject *quoting = NULL;
+    PyObject *lineterminator = NULL;
+    PyObject *float_format = NULL;
+
+    if (!PyArg_ParseTupleAndKeywords(args, kwargs,
+            "OO|$OOOOOOO:arrays_to_delimited",
+            arrays_to_delimited_kwarg_names,
+            &arrays,
+            &file_like,
+            // kwarg only
+            &delimiter,
+            &doublequote,
+            &escapechar,
+            &quotechar,
+            &quoting,
+            &lineterminator,
+            &float_format))
+        return NULL;
+
+    if (lineterminator && !PyUnicode_Check(lineterminator)) {
+        PyErr_SetString(PyExc_TypeError, "lineterminator must be a string");
+        return NULL;
+    }
+    if (float_format == Py_None) {
+        float_format = NULL;
+    }
+    if (float_format && !PyUnicode_Check(float_format)) {
+        PyErr_SetString(PyExc_TypeError, "float_format must be a string");
+        return NULL;
+    }
+    PyObject *columns = PySequence_Fast(arrays, "arrays must be a sequence");
+    if (columns == NULL) return NULL;
+
+    PyObject *post = NULL;
+    PyObject *io = NULL;
+    PyObject *file = NULL; // opened from a path
+    AK_DWColumn *cols = NULL;
+    Py_ssize_t cols_count = PySequence_Fast_GET_SIZE(columns);
+    Py_ssize_t cols_init = 0;
+    AK_DelimitedWriter dw = {0};
+
+    dw.dialect = AK_Dialect_New(delimiter,
+            doublequote,
+            escapechar,
+            quotechar,
+            quoting,
+            NULL,
+            NULL);
+    if (dw.dialect == NULL) goto finally;
+
+    dw.lineterminator = lineterminator ? lineterminator : PyUnicode_FromString("\n");
+    if (lineterminator) Py_INCREF(lineterminator);
+    if (dw.lineterminator == NULL) goto finally;
+    dw.lineterminator_utf8 = PyUnicode_AsUTF8AndSize(dw.lineterminator, &dw.lineterminator_size);
+    if (dw.lineterminator_utf8 == NULL) goto finally;
+    dw.lineterminator_len = PyUnicode_GET_LENGTH(dw.lineterminator);
+    for (Py_ssize_t i = 0; i < dw.lineterminator_len; ++i) {
+        Py_UCS4 c = PyUnicode_READ_CHAR(dw.lineterminator, i);
+        if (c != '\r' && c != '\n') dw.lineterminator_other = true;
+    }
+    if (float_format) {
+        dw.float_format = PyUnicode_AsUTF8(float_format);
+        if (dw.float_format == NULL || AK_DW_check_float_format(dw.float_format)) goto finally;
+    }
+
+    cols = (AK_DWColumn*)PyMem_Calloc(cols_count ? cols_count : 1, sizeof(AK_DWColumn));
+    if (cols == NULL) {
+        PyErr_NoMemory();
+        goto finally;
+    }
+    npy_intp rows = 0;
+    while (cols_init < cols_count) {
+        if (AK_DWColumn_init(&cols[cols_init],
+                PySequence_Fast_GET_ITEM(columns, cols_init),
+                dw.float_format != NULL)) goto finally;
+        npy_intp size = PyArray_SIZE(cols[cols_init].array);
+        ++cols_init;
+        if (cols_init == 1) {
+            rows = size;
+        }
+        else if (size != rows) {
+            PyErr_SetString(PyExc_ValueError, "arrays must be of equal length");
+            goto finally;
+        }
+    }
+
+    if (PyByteArray_Check(file_like)) {
+        Py_INCREF(file_like);
+        dw.target = file_like;
+    }
+    else {
+        io = PyImport_ImportModule("io");
+        if (io == NULL) goto finally;
+        if (!PyObject_HasAttrString(file_like, "write")) {
+            PyObject *path = PyOS_FSPath(file_like);
+            if (path == NULL) goto finally;
+            file = PyObject_CallMethod(io, "open", "Os", path, "wb");
+            Py_DECREF(path);
+            if (file == NULL) goto finally;
+            file_like = file;
+        }
+        PyObject *text_base = PyObject_GetAttrString(io, "TextIOBase");
+        if (text_base == NULL) goto finally;
+        int text = PyObject_IsInstance(file_like, text_base);
+        Py_DECREF(text_base);
+        if (text == -1) goto finally;
+        dw.text = text;
+        dw.target = PyObject_GetAttrString(file_like, "write");
+        if (dw.target == NULL) goto finally;
+    }
+
+    for (npy_intp row = 0; row < rows; ++row) {
+        for (Py_ssize_t i = 0; i < cols_count; ++i) {
+            if (i) {
+                if (AK_DW_reserve(&dw, 4)) goto finally;
+                AK_DW_append_point(&dw, dw.dialect->delimiter);
+            }
+            if (AK_DW_append_element(&dw, &cols[i], row, cols_count == 1)) goto finally;
+        }
+        if (AK_DW_reserve(&dw, dw.lineterminator_size)) goto finally;
+        memcpy(dw.buffer + dw.buffer_len, dw.lineterminator_utf8, dw.lineterminator_size);
+        dw.buffer_len += dw.lineterminator_size;
+        if (dw.buffer_len >= AK_DW_FLUSH_SIZE && AK_DW_flush(&dw)) goto finally;
+    }
+    if (AK_DW_flush(&dw)) goto finally;
+    post = Py_None;
+    Py_INCREF(post);
+finally:
+    if (file) {
+        PyObject *closed = PyObject_CallMethod(file, "close", NULL);
+        if (closed == NULL) {
+            Py_CLEAR(post);
+        }
+        Py_XDECREF(closed);
+    }
+    for (Py_ssize_t i = 0; i < cols_init; ++i) {
+        Py_DECREF(cols[i].array);
+    }
+    PyMem_Free(cols);
+    PyMem_Free(dw.buffer);
+    Py_XDECREF(dw.target);
+    Py_XDECREF(dw.lineterminator);
+    AK_Dialect_Free(dw.dialect);
+    Py_XDECREF(file);
+    Py_XDECREF(io);
+    Py_DECREF(columns);
+    return post;
+}
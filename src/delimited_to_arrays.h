@@ -3,14 +3,37 @@
 
 # include "Python.h"
 
-// NOTE: implement skip_header, skip_footer in client Python, not here.
+extern PyTypeObject DTAIterType;
+extern PyTypeObject DTATailType;
+
 PyObject *
 delimited_to_arrays(PyObject *Py_UNUSED(m), PyObject *args, PyObject *kwargs);
 
+PyObject *
+delimited_to_record_index(PyObject *Py_UNUSED(m), PyObject *args, PyObject *kwargs);
+
+PyObject *
+delimited_to_dtypes(PyObject *Py_UNUSED(m), PyObject *args, PyObject *kwargs);
+
+PyObject *
+fixed_width_to_arrays(PyObject *Py_UNUSED(m), PyObject *args, PyObject *kwargs);
+
+PyObject *
+iter_delimited_to_arrays(PyObject *Py_UNUSED(m), PyObject *args, PyObject *kwargs);
+
+PyObject *
+tail_delimited_to_arrays(PyObject *Py_UNUSED(m), PyObject *args, PyObject *kwargs);
+
 PyObject *
 iterable_str_to_array_1d(PyObject *Py_UNUSED(m), PyObject *args, PyObject *kwargs);
 
 PyObject *
 split_after_count(PyObject *Py_UNUSED(m), PyObject *args, PyObject *kwargs);
 
+PyObject *
+split_after_count_array(PyObject *Py_UNUSED(m), PyObject *args, PyObject *kwargs);
+
+PyObject *
+arrays_to_delimited(PyObject *Py_UNUSED(m), PyObject *args, PyObject *kwargs);
+
 # endif /* ARRAYKIT_SRC_DELIMITED_TO_ARRAYS_H_ */
@@ -0,0 +1,671 @@
+// Template for functions that read code point buffers of one width. Include once for each width after defining AK_UCS_CHAR (Py_UCS1, Py_UCS2, or Py_UCS4) and AK_UCS_FUNC(name), which forms the function name for that width (such as AK_UCS1_##name); both are undefined at the end of this file. There is no include guard as this file is included multiple times.
+
+// This will take any case of "TRUE" as True, while marking everything else as False; this is the same approach taken with genfromtxt when the dtype is given as bool. This will not fail for invalid true or false strings.
+static inline npy_int8
+AK_UCS_FUNC(to_bool)(AK_UCS_CHAR *p, AK_UCS_CHAR *end)
+{
+    // must have at least 4 characters
+    if (end - p < 4) {
+        return 0;
+    }
+    end = p + 4; // we must have at least 4 characters for True
+    int i = 0;
+    char c;
+
+    while (AK_is_space(*p)) p++;
+
+    for (;p < end; ++p) {
+        c = *p;
+        if (c == TRUE_LOWER[i] || c == TRUE_UPPER[i]) {
+            ++i;
+        }
+        else {
+            return 0;
+        }
+    }
+    return 1; //matched all characters
+}
+
+// Return true if the field, less surrounding space, is empty or any case of "true" or "false".
+static inline bool
+AK_UCS_FUNC(is_bool)(AK_UCS_CHAR *p, AK_UCS_CHAR *end)
+{
+    while (p < end && AK_is_space(*p)) ++p;
+    while (p < end && AK_is_space(*(end - 1))) --end;
+    Py_ssize_t count = end - p;
+    if (count == 0) return true;
+
+    const char *lower;
+    const char *upper;
+    if (count == 4) {
+        lower = TRUE_LOWER;
+        upper = TRUE_UPPER;
+    }
+    else if (count == 5) {
+        lower = FALSE_LOWER;
+        upper = FALSE_UPPER;
+    }
+    else {
+        return false;
+    }
+    for (Py_ssize_t i = 0; i < count; ++i) {
+        if (p[i] != (AK_UCS_CHAR)lower[i] && p[i] != (AK_UCS_CHAR)upper[i]) return false;
+    }
+    return true;
+}
+
+// Return the unit that represents an ISO 8601 string without loss, as inferred by the type parser. Empty fields return NPY_FR_D, the least precise inferred unit; fields not inferred as datetimes return NPY_FR_ERROR.
+static inline NPY_DATETIMEUNIT
+AK_UCS_FUNC(datetime_unit)(AK_UCS_CHAR *p, AK_UCS_CHAR *end)
+{
+    while (p < end && AK_is_space(*p)) ++p;
+    if (p == end) return NPY_FR_D;
+    return AK_datetime64_unit_from_length(end - p);
+}
+
+// Convert a code point array to a signed integer. Extended from pandas/_libs/src/parser/tokenizer.c. Sets `error` to values greater than 0 on error; never sets error on success.
+static inline npy_int64
+AK_UCS_FUNC(to_int64)(AK_UCS_CHAR *p_item, AK_UCS_CHAR *end, int *error, char tsep)
+{
+    npy_int64 int_min = NPY_MIN_INT64;
+    npy_int64 int_max = NPY_MAX_INT64;
+    int isneg = 0;
+    npy_int64 number = 0;
+    int d;
+
+    AK_UCS_CHAR *p = p_item;
+
+    while (AK_is_space(*p)) {
+        ++p;
+        if (p >= end) return number; // NOTE: this means that all space will return zero without error
+    }
+    if (*p == '-') {
+        isneg = 1;
+        ++p;
+    } else if (*p == '+') {
+        ++p;
+    }
+    if (p >= end) return number;
+
+    // Check that there is a first digit.
+    if (!AK_is_digit(*p)) {
+        *error = AK_ERROR_NO_DIGITS;
+        return 0;
+    }
+    if (isneg) {
+        // If number is greater than pre_min, at least one more digit can be processed without overflowing.
+        int dig_pre_min = -(int_min % 10);
+        npy_int64 pre_min = int_min / 10;
+        d = *p;
+        if (tsep != '\0') {
+            while (1) {
+                if (d == tsep) {
+                    ++p;
+                    if (p >= end) return number;
+                    d = *p;
+                    continue;
+                } else if (!AK_is_digit(d)) {
+                    break;
+                }
+                if ((number > pre_min) ||
+                    ((number == pre_min) && (d - '0' <= dig_pre_min))) {
+                    number = number * 10 - (d - '0');
+                    ++p;
+                    if (p >= end) return number;
+                    d = *p;
+                } else {
+                    *error = AK_ERROR_OVERFLOW;
+                    return 0;
+                }
+            }
+        } else {
+            while (AK_is_digit(d)) {
+                if ((number > pre_min) ||
+                    ((number == pre_min) && (d - '0' <= dig_pre_min))) {
+                    number = number * 10 - (d - '0');
+                    ++p;
+                    if (p >= end) return number;
+                    d = *p;
+                } else {
+                    *error = AK_ERROR_OVERFLOW;
+                    return 0;
+                }
+            }
+        }
+    } else {
+        // If number is less than pre_max, at least one more digit can be processed without overflowing.
+        npy_int64 pre_max = int_max / 10;
+        int dig_pre_max = int_max % 10;
+        d = *p;
+        if (tsep != '\0') {
+            while (1) {
+                if (d == tsep) {
+                    ++p;
+                    if (p >= end) return number;
+                    d = *p;
+                    continue;
+                } else if (!AK_is_digit(d)) {
+                    break;
+                }
+                if ((number < pre_max) ||
+                    ((number == pre_max) && (d - '0' <= dig_pre_max))) {
+                    number = number * 10 + (d - '0');
+                    ++p;
+                    if (p >= end) return number;
+                    d = *p;
+                } else {
+                    *error = AK_ERROR_OVERFLOW;
+                    return 0;
+                }
+            }
+        } else {
+            while (AK_is_digit(d)) {
+                if ((number < pre_max) ||
+                    ((number == pre_max) && (d - '0' <= dig_pre_max))) {
+                    number = number * 10 + (d - '0');
+                    ++p;
+                    if (p >= end) return number;
+                    d = *p;
+                } else {
+                    *error = AK_ERROR_OVERFLOW;
+                    return 0;
+                }
+            }
+        }
+    }
+    while (p < end) {
+        if (!AK_is_space(*p)) {
+            *error = AK_ERROR_INVALID_CHARS;
+            return 0;
+        }
+        p++;
+    }
+    return number;
+}
+
+// Convert a code point array to an unsigned integer. Extended from pandas/_libs/src/parser/tokenizer.c. Sets error to > 0 on error; never sets error on success.
+static inline npy_uint64
+AK_UCS_FUNC(to_uint64)(AK_UCS_CHAR *p_item, AK_UCS_CHAR *end, int *error, char tsep)
+{
+    npy_uint64 pre_max = NPY_MAX_UINT64 / 10;
+    npy_uint64 number = 0;
+    int dig_pre_max = NPY_MAX_UINT64 % 10;
+    int d;
+
+    AK_UCS_CHAR *p = p_item;
+    while (AK_is_space(*p)) {
+        ++p;
+        if (p >= end) return number;
+    }
+    if (*p == '-') {
+        *error = AK_ERROR_INVALID_CHARS;
+        return 0;
+    } else if (*p == '+') {
+        p++;
+        if (p >= end) return number;
+    }
+
+    // Check that there is a first digit.
+    if (!AK_is_digit(*p)) {
+        *error = AK_ERROR_NO_DIGITS;
+        return 0;
+    }
+    // If number is less than pre_max, at least one more digit can be processed without overflowing.
+    d = *p;
+    if (tsep != '\0') {
+        while (1) {
+            if (d == tsep) {
+                ++p;
+                if (p >= end) return number;
+                d = *p;
+                continue;
+            } else if (!AK_is_digit(d)) {
+                break;
+            }
+            if ((number < pre_max) ||
+                ((number == pre_max) && (d - '0' <= dig_pre_max))) {
+                number = number * 10 + (d - '0');
+                ++p;
+                if (p >= end) return number;
+                d = *p;
+            } else {
+                *error = AK_ERROR_OVERFLOW;
+                return 0;
+            }
+        }
+    } else {
+        while (AK_is_digit(d)) {
+            if ((number < pre_max) ||
+                ((number == pre_max) && (d - '0' <= dig_pre_max))) {
+                number = number * 10 + (d - '0');
+                ++p;
+                if (p >= end) return number;
+                d = *p;
+            } else {
+                *error = AK_ERROR_OVERFLOW;
+                return 0;
+            }
+        }
+    }
+    while (p < end) {
+        if (!AK_is_space(*p)) {
+            *error = AK_ERROR_INVALID_CHARS;
+            return 0;
+        }
+        p++;
+    }
+    return number;
+}
+
+// Based on precise_xstrtod from pandas/_libs/src/parser/tokenizer.c.
+static inline npy_float64
+AK_UCS_FUNC(to_float64)(AK_UCS_CHAR *p_item, AK_UCS_CHAR *end, int *error, char tsep, char decc)
+{
+    // Cache powers of 10 in memory.
+    npy_float64 e[] = {
+        1.,    1e1,   1e2,   1e3,   1e4,   1e5,   1e6,   1e7,   1e8,   1e9,
+        1e10,  1e11,  1e12,  1e13,  1e14,  1e15,  1e16,  1e17,  1e18,  1e19,
+        1e20,  1e21,  1e22,  1e23,  1e24,  1e25,  1e26,  1e27,  1e28,  1e29,
+        1e30,  1e31,  1e32,  1e33,  1e34,  1e35,  1e36,  1e37,  1e38,  1e39,
+        1e40,  1e41,  1e42,  1e43,  1e44,  1e45,  1e46,  1e47,  1e48,  1e49,
+        1e50,  1e51,  1e52,  1e53,  1e54,  1e55,  1e56,  1e57,  1e58,  1e59,
+        1e60,  1e61,  1e62,  1e63,  1e64,  1e65,  1e66,  1e67,  1e68,  1e69,
+        1e70,  1e71,  1e72,  1e73,  1e74,  1e75,  1e76,  1e77,  1e78,  1e79,
+        1e80,  1e81,  1e82,  1e83,  1e84,  1e85,  1e86,  1e87,  1e88,  1e89,
+        1e90,  1e91,  1e92,  1e93,  1e94,  1e95,  1e96,  1e97,  1e98,  1e99,
+        1e100, 1e101, 1e102, 1e103, 1e104, 1e105, 1e106, 1e107, 1e108, 1e109,
+        1e110, 1e111, 1e112, 1e113, 1e114, 1e115, 1e116, 1e117, 1e118, 1e119,
+        1e120, 1e121, 1e122, 1e123, 1e124, 1e125, 1e126, 1e127, 1e128, 1e129,
+        1e130, 1e131, 1e132, 1e133, 1e134, 1e135, 1e136, 1e137, 1e138, 1e139,
+        1e140, 1e141, 1e142, 1e143, 1e144, 1e145, 1e146, 1e147, 1e148, 1e149,
+        1e150, 1e151, 1e152, 1e153, 1e154, 1e155, 1e156, 1e157, 1e158, 1e159,
+        1e160, 1e161, 1e162, 1e163, 1e164, 1e165, 1e166, 1e167, 1e168, 1e169,
+        1e170, 1e171, 1e172, 1e173, 1e174, 1e175, 1e176, 1e177, 1e178, 1e179,
+        1e180, 1e181, 1e182, 1e183, 1e184, 1e185, 1e186, 1e187, 1e188, 1e189,
+        1e190, 1e191, 1e192, 1e193, 1e194, 1e195, 1e196, 1e197, 1e198, 1e199,
+        1e200, 1e201, 1e202, 1e203, 1e204, 1e205, 1e206, 1e207, 1e208, 1e209,
+        1e210, 1e211, 1e212, 1e213, 1e214, 1e215, 1e216, 1e217, 1e218, 1e219,
+        1e220, 1e221, 1e222, 1e223, 1e224, 1e225, 1e226, 1e227, 1e228, 1e229,
+        1e230, 1e231, 1e232, 1e233, 1e234, 1e235, 1e236, 1e237, 1e238, 1e239,
+        1e240, 1e241, 1e242, 1e243, 1e244, 1e245, 1e246, 1e247, 1e248, 1e249,
+        1e250, 1e251, 1e252, 1e253, 1e254, 1e255, 1e256, 1e257, 1e258, 1e259,
+        1e260, 1e261, 1e262, 1e263, 1e264, 1e265, 1e266, 1e267, 1e268, 1e269,
+        1e270, 1e271, 1e272, 1e273, 1e274, 1e275, 1e276, 1e277, 1e278, 1e279,
+        1e280, 1e281, 1e282, 1e283, 1e284, 1e285, 1e286, 1e287, 1e288, 1e289,
+        1e290, 1e291, 1e292, 1e293, 1e294, 1e295, 1e296, 1e297, 1e298, 1e299,
+        1e300, 1e301, 1e302, 1e303, 1e304, 1e305, 1e306, 1e307, 1e308};
+
+    npy_float64 number = 0.0;
+    int exponent = 0;
+    bool negative_base = false;
+    bool negative_e = false;
+
+    int num_digits = 0;
+    int max_digits = 17;
+    int n = 0;
+
+    AK_UCS_CHAR *p = p_item;
+    while (AK_is_space(*p)) {
+        ++p;
+        if (p >= end) return number;
+    }
+    switch (*p) {
+        case '-':
+            negative_base = true;
+            // fall through
+        case '+':
+            p++;
+            if (p >= end) return number; // nothing to do with sign
+    }
+    // check for inf, nan
+    if (AK_is_i(*p)) {
+        p++;
+        if (p >= end) goto error;
+        if (AK_is_n(*p)) {
+            p++;
+            if (p >= end) goto error;
+            if (AK_is_f(*p)) {
+                p++;
+                while (p < end) {
+                    if (!AK_is_space(*p++)) goto error;
+                }
+                if (negative_base) return -NPY_INFINITY;
+                return NPY_INFINITY;
+            }
+        }
+        goto error; // matched i but nothing else
+    }
+    else if (AK_is_n(*p)) {
+        p++;
+        if (p >= end) goto error;
+        if (AK_is_a(*p)) {
+            p++;
+            if (p >= end) goto error;
+            if (AK_is_n(*p)) {
+                p++;
+                while (p < end) {
+                    if (!AK_is_space(*p++)) goto error;
+                }
+                return NPY_NAN;
+            }
+        }
+        goto error; // matched n but nothing else
+    }
+    while (AK_is_digit(*p)) {
+        if (num_digits < max_digits) {
+            number = number * 10. + (*p - '0');
+            num_digits++;
+        } else {
+            ++exponent;
+        }
+        p++;
+        if (p >= end) goto exit;
+        if (tsep != '\0' && *p == (Py_UCS4)tsep) {
+            ++p;
+            if (p >= end) goto exit;
+        }
+    }
+
+    if (*p == (Py_UCS4)decc) {
+        p++;
+        if (p >= end) goto exit;
+
+        while (num_digits < max_digits && AK_is_digit(*p)) {
+            number = number * 10. + (*p - '0');
+            num_digits++;
+            exponent--;
+            p++;
+            if (p >= end) goto exit;
+        }
+        if (num_digits >= max_digits)  // Consume extra decimal digits.
+            while (AK_is_digit(*p)) {
+                ++p;
+                if (p >= end) goto exit;
+            }
+    }
+    if (num_digits == 0) {
+        *error = ERANGE;
+        return 0.0;
+    }
+    if (AK_is_e(*p)) {
+        ++p;
+        if (p >= end) goto exit;
+
+        switch (*p) {
+            case '-':
+                negative_e = true;
+                // fall through
+            case '+':
+                p++;
+                if (p >= end) goto exit; // sign is not used
+        }
+        num_digits = 0; // reset
+        while (num_digits < max_digits && AK_is_digit(*p)) {
+            n = n * 10 + (*p - '0');
+            num_digits++;
+            p++;
+            if (p >= end) goto exit;
+        }
+    }
+    // if we have anything but space trailing, error
+    while (p < end) {
+        if (!AK_is_space(*p++)) goto error;
+    }
+exit:
+    if (negative_base) number = -number;
+    // n will be zero if no E found
+    if (negative_e) {
+        exponent -= n;
+    }
+    else {
+        exponent += n;
+    }
+    // AK_DEBUG_MSG_OBJ("at exit", PyLong_FromLong(exponent));
+    // done with p at this point
+    if (exponent > 308) {
+        *error = ERANGE;
+        return HUGE_VAL;
+    } else if (exponent > 0) {
+        number *= e[exponent];
+    } else if (exponent < -308) {  // Subnormal
+        if (exponent < -616) {  // Prevent invalid array access.
+            number = 0.;
+        } else {
+            number /= e[-308 - exponent];
+            number /= e[308];
+        }
+    } else {
+        number /= e[-exponent];
+    }
+
+    if (number == HUGE_VAL || number == -HUGE_VAL) *error = ERANGE;
+    return number;
+error:
+    *error = 1;
+    return number;
+}
+
+// Return true if [p, end) is any case of `word`, a lower-case ASCII string.
+static inline bool
+AK_UCS_FUNC(is_word)(AK_UCS_CHAR *p, AK_UCS_CHAR *end, const char *word)
+{
+    for (; p < end && *word; ++p, ++word) {
+        if ((*p | 0x20) != (AK_UCS_CHAR)*word) return false;
+    }
+    return p == end && *word == '\0';
+}
+
+// Convert one part of a complex number to a float. As with Python's float(), a part is an optional sign and then any case of "inf", "infinity", or "nan", or digits with an optional decimal character (`decc`) and an optional exponent of at least one digit; a single underscore is permitted between digits. A thousands separator (`tsep`) is permitted between digits before the decimal character. Sets `error` to values greater than 0 on any other form; never sets error on success.
+static inline npy_float64
+AK_UCS_FUNC(to_complex_part)(AK_UCS_CHAR *p, AK_UCS_CHAR *end, int *error, char tsep, char decc)
+{
+    AK_UCS_CHAR *start = p;
+    bool negative = p < end && *p == '-';
+    if (p < end && AK_is_sign(*p)) ++p;
+    if (AK_UCS_FUNC(is_word)(p, end, "inf") || AK_UCS_FUNC(is_word)(p, end, "infinity")) {
+        return negative ? -NPY_INFINITY : NPY_INFINITY;
+    }
+    if (AK_UCS_FUNC(is_word)(p, end, "nan")) {
+        return NPY_NAN;
+    }
+    // validate, counting underscores; a separator must be between digits
+    Py_ssize_t underscores = 0;
+    int digits = 0;
+    bool fraction = false;
+    bool exponent = false;
+    int exponent_digits = 0;
+    for (; p < end; ++p) {
+        AK_UCS_CHAR c = *p;
+        if (AK_is_digit(c)) {
+            if (exponent) ++exponent_digits;
+            else ++digits;
+            continue;
+        }
+        bool between = p > start && AK_is_digit(*(p - 1)) && p + 1 < end && AK_is_digit(*(p + 1));
+        if (c == '_') {
+            if (!between) goto error;
+            ++underscores;
+        }
+        else if (tsep != '\0' && c == (AK_UCS_CHAR)tsep && !fraction && !exponent) {
+            if (!between) goto error;
+        }
+        else if (c == (AK_UCS_CHAR)decc && !fraction && !exponent) {
+            fraction = true;
+        }
+        else if (AK_is_e(c) && !exponent && digits > 0) {
+            exponent = true;
+            if (p + 1 < end && AK_is_sign(*(p + 1))) ++p;
+        }
+        else {
+            goto error;
+        }
+    }
+    if (digits == 0 || (exponent && exponent_digits == 0)) goto error;
+    if (underscores == 0) {
+        return AK_UCS_FUNC(to_float64)(start, end, error, tsep, decc);
+    }
+    // copy without underscores
+    Py_ssize_t count = end - start - underscores;
+    AK_UCS_CHAR local[64];
+    AK_UCS_CHAR *buffer = local;
+    if (count > 64) {
+        buffer = (AK_UCS_CHAR*)PyMem_RawMalloc(sizeof(AK_UCS_CHAR) * count);
+        if (buffer == NULL) goto error;
+    }
+    AK_UCS_CHAR *q = buffer;
+    for (p = start; p < end; ++p) {
+        if (*p != '_') *q++ = *p;
+    }
+    npy_float64 v = AK_UCS_FUNC(to_float64)(buffer, q, error, tsep, decc);
+    if (buffer != local) PyMem_RawFree(buffer);
+    return v;
+error:
+    *error = 1;
+    return 0.0;
+}
+
+// Convert a code point array to a complex number, writing the real and imaginary parts to `parts`. Each part is converted with to_complex_part, such that `tsep` and `decc` are honored. Accepts the forms accepted by Python's complex(), such as "1", "2j", "1+2j", "1-j", "nan+infj", and "(1+2j)", with space permitted only around the number and within parentheses. As with floats, an empty field is NaN. Sets `error` to values greater than 0 on error; never sets error on success.
+static inline void
+AK_UCS_FUNC(to_complex)(AK_UCS_CHAR *p, AK_UCS_CHAR *end, int *error, char tsep, char decc, npy_float64 *parts)
+{
+    parts[0] = 0.0;
+    parts[1] = 0.0;
+
+    while (p < end && AK_is_space(*p)) ++p;
+    while (p < end && AK_is_space(*(end - 1))) --end;
+    if (p == end) {
+        parts[0] = NPY_NAN;
+        return;
+    }
+    if (AK_is_paren_open(*p)) {
+        if (end - p < 2 || !AK_is_paren_close(*(end - 1))) goto error;
+        ++p;
+        --end;
+        while (p < end && AK_is_space(*p)) ++p;
+        while (p < end && AK_is_space(*(end - 1))) --end;
+        if (p == end) goto error;
+    }
+    for (AK_UCS_CHAR *q = p; q < end; ++q) {
+        if (AK_is_space(*q)) goto error;
+    }
+    // the real part is [p, real_end), the imaginary part is [real_end, end)
+    AK_UCS_CHAR *real_end = end;
+    if (AK_is_j(*(end - 1))) {
+        --end;
+        real_end = p;
+        // the last sign not following an exponent separates the parts
+        for (AK_UCS_CHAR *q = end - 1; q > p; --q) {
+            if (AK_is_sign(*q) && !AK_is_e(*(q - 1))) {
+                real_end = q;
+                break;
+            }
+        }
+        if (real_end == end || (end - real_end == 1 && AK_is_sign(*real_end))) {
+            // a coefficient of one is implied
+            parts[1] = (real_end < end && *real_end == '-') ? -1.0 : 1.0;
+        }
+        else {
+            parts[1] = AK_UCS_FUNC(to_complex_part)(real_end, end, error, tsep, decc);
+        }
+    }
+    if (real_end > p) {
+        if (real_end - p == 1 && AK_is_sign(*p)) goto error;
+        parts[0] = AK_UCS_FUNC(to_complex_part)(p, real_end, error, tsep, decc);
+    }
+    return;
+error:
+    *error = 1;
+}
+
+// Read two digits into `target`, or go to `error`.
+#define AK_UCS_DIGITS2(target)                                           \
+    do {                                                                 \
+        if (end - p < 2 || !AK_is_digit(p[0]) || !AK_is_digit(p[1])) {   \
+            goto error;                                                  \
+        }                                                                \
+        target = (p[0] - '0') * 10 + (p[1] - '0');                       \
+        p += 2;                                                          \
+    } while (0)
+
+// Convert an ISO 8601 date or datetime to a datetime64 value of `unit`, truncating fields more precise than `unit`. Accepted forms are YYYY, YYYY-MM, YYYY-MM-DD, and YYYY-MM-DD followed by T or a space and then HH, HH:MM, HH:MM:SS, or HH:MM:SS.f, with any number of fractional digits; leading space is permitted. An empty field or any case of NaT is NaT. Sets `error` to AK_ERROR_DATETIME for any other form (such as a time zone) or out-of-range value such that the caller can defer to NumPy; never sets error on success.
+static inline npy_int64
+AK_UCS_FUNC(to_datetime64)(AK_UCS_CHAR *p, AK_UCS_CHAR *end, int *error, NPY_DATETIMEUNIT unit)
+{
+    int year;
+    int month = 1;
+    int day = 1;
+    int hour = 0;
+    int minute = 0;
+    int second = 0;
+    npy_int64 nanosecond = 0;
+
+    while (p < end && AK_is_space(*p)) ++p;
+    if (p == end) return NPY_DATETIME_NAT;
+    if (end - p == 3 && AK_is_n(p[0]) && AK_is_a(p[1]) && AK_is_t(p[2])) {
+        return NPY_DATETIME_NAT;
+    }
+    int hundreds;
+    AK_UCS_DIGITS2(hundreds);
+    AK_UCS_DIGITS2(year);
+    year += hundreds * 100;
+    if (p == end) goto convert;
+
+    if (*p++ != '-') goto error;
+    AK_UCS_DIGITS2(month);
+    if (month < 1 || month > 12) goto error;
+    if (p == end) goto convert;
+
+    if (*p++ != '-') goto error;
+    AK_UCS_DIGITS2(day);
+    if (day < 1 || day > AK_days_in_month(year, month)) goto error;
+    if (p == end) goto convert;
+
+    if (*p != 'T' && *p != ' ') goto error;
+    ++p;
+    AK_UCS_DIGITS2(hour);
+    if (hour > 23) goto error;
+    if (p == end) goto convert;
+
+    if (*p++ != ':') goto error;
+    AK_UCS_DIGITS2(minute);
+    if (minute > 59) goto error;
+    if (p == end) goto convert;
+
+    if (*p++ != ':') goto error;
+    AK_UCS_DIGITS2(second);
+    if (second > 59) goto error;
+    if (p == end) goto convert;
+
+    if (*p++ != '.' || p == end) goto error;
+    int digits = 0;
+    for (; p < end && AK_is_digit(*p); ++p, ++digits) {
+        if (digits < 9) {
+            nanosecond = nanosecond * 10 + (*p - '0');
+        }
+    }
+    if (p != end) goto error;
+    for (; digits < 9; ++digits) {
+        nanosecond *= 10;
+    }
+convert:;
+    npy_int64 value;
+    if (AK_datetime64_from_fields(year,
+            month,
+            day,
+            hour,
+            minute,
+            second,
+            nanosecond,
+            unit,
+            &value) == 0) {
+        return value;
+    }
+error:
+    *error = AK_ERROR_DATETIME;
+    return 0;
+}
+
+#undef AK_UCS_DIGITS2
+
+#undef AK_UCS_CHAR
+#undef AK_UCS_FUNC
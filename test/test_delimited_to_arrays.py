@@ -1,10 +1,21 @@
 import unittest
 import datetime
 import csv
+import io
+import mmap
+import pathlib
+import tempfile
+import typing as tp
 import numpy as np
 
 from arraykit import delimited_to_arrays
+from arraykit import delimited_to_dtypes
+from arraykit import delimited_to_record_index
+from arraykit import fixed_width_to_arrays
+from arraykit import iter_delimited_to_arrays
 from arraykit import iterable_str_to_array_1d
+from arraykit import tail_delimited_to_arrays
+from arraykit import arrays_to_delimited
 
 
 class TestUnit(unittest.TestCase):
@@ -385,6 +396,44 @@ class TestUnit(unittest.TestCase):
         with self.assertRaises(ValueError):
             a1 = iterable_str_to_array_1d(['-2+1.2asdfj', '1.5wer4.2j'], complex)
 
+    def test_iterable_str_to_array_1d_complex_7(self) -> None:
+        msg = ['1', '2j', '-j', '1-j', ' ( 1.5+2J ) ', '-inf+infj', '1e-3-2E+3j', '.5j']
+        a1 = iterable_str_to_array_1d(msg, complex)
+        self.assertEqual(a1.tolist(), [complex(s) for s in msg])
+        self.assertFalse(a1.flags.writeable)
+
+        a2 = iterable_str_to_array_1d(msg, np.complex64)
+        self.assertEqual(a2.dtype, np.dtype(np.complex64))
+        self.assertEqual(a2.tolist(), np.array([complex(s) for s in msg], dtype=np.complex64).tolist())
+
+        for s in ('1 + 2j', '1+2', '+', '()', '1j+2', '+-2j'):
+            with self.assertRaises(ValueError):
+                _ = iterable_str_to_array_1d([s], complex)
+
+    def test_iterable_str_to_array_1d_complex_8(self) -> None:
+        a1 = iterable_str_to_array_1d(['1.000,5+2,5j', '(-3,0j)'],
+                complex,
+                thousandschar='.',
+                decimalchar=',',
+                )
+        self.assertEqual(a1.tolist(), [(1000.5+2.5j), -3j])
+
+        a2 = iterable_str_to_array_1d(['1+2j', ''], complex)
+        self.assertEqual(a2[0], 1+2j)
+        self.assertTrue(np.isnan(a2[1].real))
+
+    def test_iterable_str_to_array_1d_complex_9(self) -> None:
+        # exponents and underscores as accepted by complex()
+        msg = ['1_000', '1_000j', '1.0_5-2e1_0j', 'infinity', '-Infinityj', '5.j', '1' + '_0' * 40]
+        a1 = iterable_str_to_array_1d(msg, complex)
+        self.assertEqual(a1.tolist(), [complex(s) for s in msg])
+
+        for s in ('1e+j', '1ej', '1e', '1e+', '1__0', '_1', '1_', '1_.5', '.j', 'e5', '1e5_'):
+            with self.assertRaises(ValueError):
+                complex(s)
+            with self.assertRaises(ValueError):
+                _ = iterable_str_to_array_1d([s], complex)
+
     #---------------------------------------------------------------------------
 
     def test_iterable_str_to_array_1d_dt64_1(self) -> None:
@@ -987,6 +1036,37 @@ class TestUnit(unittest.TestCase):
             _ = delimited_to_arrays(msg, axis=None)
 
 
+    #---------------------------------------------------------------------------
+    def test_delimited_to_arrays_dtypes_a(self) -> None:
+        msg = ['1,a,3.5,2020-01-01', '2,bb,4,2020-01-02']
+        post1 = delimited_to_arrays(msg, axis=1, dtypes=[np.int8, str, None, 'M8[D]'])
+        self.assertEqual([a.dtype for a in post1],
+                [np.dtype(np.int8), np.dtype('<U2'), np.dtype(float), np.dtype('M8[D]')])
+
+        # positions beyond the sequence are inferred
+        post2 = delimited_to_arrays(msg, axis=1, dtypes=(float,))
+        self.assertEqual([a.dtype.kind for a in post2], ['f', 'U', 'f', 'U'])
+
+        post3 = delimited_to_arrays(msg, axis=1, dtypes={3: 'M8[D]', 1: 'S1'})
+        self.assertEqual([a.tolist() for a in post3[1:2]], [[b'a', b'b']])
+        self.assertEqual([a.dtype.kind for a in post3], ['i', 'S', 'f', 'M'])
+
+        post4 = list(iter_delimited_to_arrays(msg, axis=1, chunk_rows=1, dtypes=[float]))
+        self.assertEqual([chunk[0].tolist() for chunk in post4], [[1.0], [2.0]])
+
+    def test_delimited_to_arrays_dtypes_b(self) -> None:
+        msg = ['1,2', '3,4']
+        with self.assertRaises(ValueError):
+            _ = delimited_to_arrays(msg, axis=1, dtypes={-1: int})
+        with self.assertRaises(TypeError):
+            _ = delimited_to_arrays(msg, axis=1, dtypes={'a': int})
+        with self.assertRaises(TypeError):
+            _ = delimited_to_arrays(msg, axis=1, dtypes=['foo'])
+        with self.assertRaises(TypeError):
+            _ = delimited_to_arrays(msg, axis=1, dtypes=5)
+        with self.assertRaises(TypeError):
+            _ = iter_delimited_to_arrays(msg, axis=1, dtypes=5)
+
     #---------------------------------------------------------------------------
     def test_delimited_to_arrays_line_select_a(self) -> None:
         msg = ['a,3,True', 'b,-1,False']
@@ -1020,6 +1100,72 @@ class TestUnit(unittest.TestCase):
         post1 = delimited_to_arrays(msg, axis=1, line_select=lambda i: False)
         self.assertEqual([x.tolist() for x in post1], [])
 
+    def test_delimited_to_arrays_line_select_g(self) -> None:
+        msg = ['1,2', 'False,True', 'foo,bar', '3.2,5.2', '4,5']
+        expected = [a.tolist() for a in delimited_to_arrays(msg, axis=0, line_select=lambda i: i in (1, 3))]
+        for line_select in (
+                np.array([False, True, False, True]),
+                np.array([1, 3]),
+                [3, 1],
+                slice(1, 4, 2),
+                ):
+            post = delimited_to_arrays(msg, axis=0, line_select=line_select)
+            self.assertEqual([a.tolist() for a in post], expected)
+
+        post = delimited_to_arrays(msg, axis=0, line_select=slice(3, None))
+        self.assertEqual([a.tolist() for a in post], [[3.2, 5.2], [4, 5]])
+
+    def test_delimited_to_arrays_line_select_h(self) -> None:
+        msg = ['1,a,True,4', '2,b,False,5']
+        post = delimited_to_arrays(msg, axis=1, line_select=np.array([0, 2]))
+        self.assertEqual([a.tolist() for a in post], [[1, 2], [True, False]])
+
+        post = delimited_to_arrays(msg, axis=1, line_select=slice(None, None, 3))
+        self.assertEqual([a.tolist() for a in post], [[1, 2], [4, 5]])
+
+        post = list(iter_delimited_to_arrays(msg, axis=1, chunk_rows=1, line_select=[1]))
+        self.assertEqual([[a.tolist() for a in chunk] for chunk in post], [[['a']], [['b']]])
+
+    def test_delimited_to_arrays_line_select_i(self) -> None:
+        # integer arrays of any width, stride, and byte order
+        msg = ['1,a,True,4', '2,b,False,5']
+        for positions in (
+                np.array([3, 0], dtype=np.int8),
+                np.array([0, 3], dtype=np.uint16),
+                np.array([0, 9, 3, 9], dtype=np.int64)[::2],
+                np.array([0, 3, 0], dtype='>i4'),
+                ):
+            post = delimited_to_arrays(msg, axis=1, line_select=positions)
+            self.assertEqual([a.tolist() for a in post], [[1, 2], [4, 5]])
+            post = delimited_to_arrays(msg, axis=1, usecols=positions)
+            self.assertEqual([a.tolist() for a in post], [[1, 2], [4, 5]])
+
+        with self.assertRaises(ValueError):
+            delimited_to_arrays(msg, axis=1, line_select=np.array([0, -1]))
+        with self.assertRaises(ValueError):
+            delimited_to_arrays(msg, axis=1, usecols=np.array([[0, 1]]))
+
+    def test_delimited_to_arrays_line_select_j(self) -> None:
+        # memory for positions does not scale with their values; order and duplicates are ignored
+        msg = ['1,a,True,4', '2,b,False,5']
+        for positions in ([10**11], np.array([10**15], dtype=np.uint64), {2**62}):
+            self.assertEqual(delimited_to_arrays(msg, axis=0, line_select=positions), [])
+            self.assertEqual(delimited_to_arrays(msg, axis=1, usecols=positions), [])
+
+        post = delimited_to_arrays(msg, axis=1, line_select=[10**12, 3, 0, 3])
+        self.assertEqual([a.tolist() for a in post], [[1, 2], [4, 5]])
+        post = delimited_to_arrays(msg, axis=0, usecols=np.array([10**12, 3, 0, 3]))
+        self.assertEqual([a.tolist() for a in post], [[1, 4], [2, 5]])
+
+        with self.assertRaises(ValueError):
+            _ = delimited_to_arrays(msg, axis=1, line_select=slice(-1, None))
+        with self.assertRaises(ValueError):
+            _ = delimited_to_arrays(msg, axis=1, line_select=slice(None, None, -1))
+        with self.assertRaises(ValueError):
+            _ = delimited_to_arrays(msg, axis=1, line_select=[-1])
+        with self.assertRaises(TypeError):
+            _ = delimited_to_arrays(msg, axis=1, line_select=[True, False])
+
     #---------------------------------------------------------------------------
     def test_delimited_to_arrays_thousandschar_a(self) -> None:
         msg = [
@@ -1111,6 +1257,1037 @@ class TestUnit(unittest.TestCase):
 
 
 
+    #---------------------------------------------------------------------------
+    def test_delimited_to_arrays_buffer_a(self) -> None:
+        msg = b'a,3,True\nb,-1,False\n'
+        post1 = delimited_to_arrays(msg, axis=1)
+        self.assertEqual([x.tolist() for x in post1],
+                [['a', 'b'], [3, -1], [True, False]])
+
+        post2 = delimited_to_arrays(memoryview(msg), axis=0)
+        self.assertEqual([x.tolist() for x in post2],
+                [['a', '3', 'True'], ['b', '-1', 'False']])
+
+    def test_delimited_to_arrays_buffer_b(self) -> None:
+        # line endings are handled as with universal newlines; the last line does not need a terminator
+        msg = b'a,1\r\nb,2\rc,3\nd,4'
+        post1 = delimited_to_arrays(msg, axis=1)
+        self.assertEqual([x.tolist() for x in post1],
+                [['a', 'b', 'c', 'd'], [1, 2, 3, 4]])
+
+    def test_delimited_to_arrays_buffer_c(self) -> None:
+        # quoted fields can span lines
+        msg = b'"a\nb",1\n"c",2\n'
+        post1 = delimited_to_arrays(msg, axis=1)
+        self.assertEqual([x.tolist() for x in post1], [['a\nb', 'c'], [1, 2]])
+
+    def test_delimited_to_arrays_buffer_d(self) -> None:
+        msg = 'α,1.5\nβ,2.5\n𝔸,3\n'
+        post1 = delimited_to_arrays(msg.encode('utf-8'), axis=1)
+        self.assertEqual([x.tolist() for x in post1], [['α', 'β', '𝔸'], [1.5, 2.5, 3.0]])
+
+        with self.assertRaises(ValueError):
+            _ = delimited_to_arrays(b'a,\xff\n', axis=1)
+
+    def test_delimited_to_arrays_buffer_e(self) -> None:
+        msg = b'a,3\nb,4\nc,5\n'
+        post1 = delimited_to_arrays(msg, axis=0, line_select=lambda i: i != 1)
+        self.assertEqual([x.tolist() for x in post1], [['a', '3'], ['c', '5']])
+
+        post2 = delimited_to_arrays(msg,
+                axis=1,
+                dtypes=lambda i: (str, float)[i],
+                )
+        self.assertEqual([x.tolist() for x in post2], [['a', 'b', 'c'], [3.0, 4.0, 5.0]])
+
+    def test_delimited_to_arrays_buffer_f(self) -> None:
+        with tempfile.TemporaryFile() as f:
+            f.write(b'1,2\n3,4\n')
+            f.flush()
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                post1 = delimited_to_arrays(mm, axis=1)
+        self.assertEqual([x.tolist() for x in post1], [[1, 3], [2, 4]])
+
+    def test_delimited_to_arrays_buffer_g(self) -> None:
+        self.assertEqual(delimited_to_arrays(b'', axis=1), [])
+
+    def test_delimited_to_arrays_buffer_h(self) -> None:
+        # arrays support the buffer protocol but are iterated as strings
+        post1 = delimited_to_arrays(np.array(['1,2', '3,4']), axis=1)
+        self.assertEqual([x.tolist() for x in post1], [[1, 3], [2, 4]])
+
+        post2 = delimited_to_arrays(np.array(['1,2', '3,4'], dtype=object), axis=0)
+        self.assertEqual([x.tolist() for x in post2], [[1, 2], [3, 4]])
+
+    def test_delimited_to_arrays_blank_line_a(self) -> None:
+        # blank lines are not records on either axis
+        for msg in (['1,2', '', '3,4', '\r\n'], b'1,2\n\n3,4\r\n\r\n'):
+            post1 = delimited_to_arrays(msg, axis=0)
+            self.assertEqual([x.tolist() for x in post1], [[1, 2], [3, 4]])
+
+            post2 = delimited_to_arrays(msg, axis=1)
+            self.assertEqual([x.tolist() for x in post2], [[1, 3], [2, 4]])
+
+        # a blank line within a quoted field is retained
+        post3 = delimited_to_arrays(b'"a\n\nb",1\n\nc,2\n', axis=0)
+        self.assertEqual([x.tolist() for x in post3], [['a\n\nb', '1'], ['c', '2']])
+
+    #---------------------------------------------------------------------------
+    def test_delimited_to_arrays_threads_a(self) -> None:
+        msg = [f'{i},{i * 0.5},{i % 2 == 0},a{i},2021-01-{i % 28 + 1:02},{i}+1j,{i}'
+                for i in range(500)]
+        dtypes = (None, None, None, None, 'datetime64[D]', complex, np.uint16).__getitem__
+        post1 = delimited_to_arrays(msg, axis=1, dtypes=dtypes)
+        post2 = delimited_to_arrays(msg, axis=1, dtypes=dtypes, threads=4)
+        self.assertEqual([a.dtype for a in post1], [a.dtype for a in post2])
+        self.assertEqual([a.tolist() for a in post1], [a.tolist() for a in post2])
+        self.assertTrue(all(not a.flags.writeable for a in post2))
+
+    def test_delimited_to_arrays_threads_b(self) -> None:
+        msg = ['1,a', '2,b', '3,c']
+        post1 = delimited_to_arrays(msg, axis=1, threads=8, line_select=lambda i: i == 1)
+        self.assertEqual([a.tolist() for a in post1], [['a', 'b', 'c']])
+
+        with self.assertRaises(ValueError):
+            _ = delimited_to_arrays(msg, axis=1, threads=0)
+
+    def test_delimited_to_arrays_threads_c(self) -> None:
+        msg = ['1,2', '3,x']
+        with self.assertRaises(TypeError):
+            _ = delimited_to_arrays(msg, axis=1, dtypes=lambda i: int, threads=2)
+
+    def test_delimited_to_arrays_threads_d(self) -> None:
+        # large buffers are split into regions at record boundaries
+        records = [f'{i},{i * 0.5},"a\nb{i}",{"true" if i % 2 else "false"},x{i}'
+                for i in range(40_000)]
+        msg = ('\n'.join(records) + '\n').encode()
+        post1 = delimited_to_arrays(msg, axis=1)
+        post2 = delimited_to_arrays(msg, axis=1, threads=4)
+        self.assertEqual([a.dtype for a in post1], [a.dtype for a in post2])
+        self.assertEqual([a.tolist() for a in post1], [a.tolist() for a in post2])
+        self.assertEqual(post2[2][-1], 'a\nb39999')
+
+        post3 = delimited_to_arrays(msg, axis=1, threads=4, line_select=lambda i: i > 2)
+        self.assertEqual([a.tolist() for a in post3], [a.tolist() for a in post1[3:]])
+
+    def test_delimited_to_arrays_threads_e(self) -> None:
+        # types are resolved across regions
+        records = ['1,true,a'] * 30_000 + ['1.5,,b']
+        msg = '\n'.join(records).encode()
+        post = delimited_to_arrays(msg, axis=1, threads=3)
+        self.assertEqual([a.dtype.kind for a in post], ['f', 'b', 'U'])
+        self.assertEqual(post[0][-1], 1.5)
+        self.assertEqual(len(post[0]), 30_001)
+
+    def test_delimited_to_arrays_threads_f(self) -> None:
+        # blank lines are skipped within and across regions on axis 0
+        records = ['x' * 100 + ',1'] * 1400
+        msg = ('\n'.join(records[:700]) + '\n\n\n' + '\n'.join(records[700:]) + '\n\n').encode()
+        post1 = delimited_to_arrays(msg, axis=0)
+        post2 = delimited_to_arrays(msg, axis=0, threads=3)
+        self.assertEqual(len(post1), 1400)
+        self.assertEqual([a.tolist() for a in post1], [a.tolist() for a in post2])
+
+    def test_delimited_to_arrays_threads_g(self) -> None:
+        # the error of the first region is raised
+        records = [f'{i},x{i}' for i in range(50_000)]
+        msg = bytearray(('\n'.join(records) + '\n').encode())
+        msg[len(msg) * 3 // 4] = 0xFF
+        msg[len(msg) // 2] = 0xFE
+        with self.assertRaises(ValueError) as cm:
+            _ = delimited_to_arrays(bytes(msg), axis=1, threads=4)
+        self.assertEqual(str(cm.exception),
+                f'invalid UTF-8 byte sequence at offset {len(msg) // 2}')
+
+        msg = ('\n'.join(records) + '\n"a"b,c\n' + '\n'.join(records)).encode()
+        with self.assertRaises(RuntimeError):
+            _ = delimited_to_arrays(msg, axis=1, threads=4, strict=True)
+
+    def test_delimited_to_arrays_path_a(self) -> None:
+        with tempfile.TemporaryDirectory() as dir:
+            fp = pathlib.Path(dir) / 'a.csv'
+            fp.write_bytes(b'1,a\n2,b\n')
+            post = delimited_to_arrays(fp, axis=1)
+            self.assertEqual([a.tolist() for a in post], [[1, 2], ['a', 'b']])
+
+            fp = pathlib.Path(dir) / 'b.csv'
+            fp.write_bytes(b'')
+            self.assertEqual(delimited_to_arrays(fp, axis=1), [])
+
+            with self.assertRaises(FileNotFoundError):
+                _ = delimited_to_arrays(pathlib.Path(dir) / 'c.csv')
+
+    def test_delimited_to_arrays_width_a(self) -> None:
+        # lines are widened as wider code points are found
+        msg = ['a,1,true', 'é,2,false', '€,3,TRUE', '𝄞,4,é']
+        post = delimited_to_arrays(msg, axis=1)
+        self.assertEqual([a.tolist() for a in post],
+                [['a', 'é', '€', '𝄞'], [1, 2, 3, 4], ['true', 'false', 'TRUE', 'é']])
+
+        post = delimited_to_arrays(msg, axis=1, dtypes=lambda i: bool if i == 2 else None)
+        self.assertEqual(post[2].tolist(), [True, False, True, False])
+
+        post = delimited_to_arrays(msg, axis=0)
+        self.assertEqual(post[3].tolist(), ['𝄞', '4', 'é'])
+
+    def test_delimited_to_arrays_width_b(self) -> None:
+        msg = '€,1.5\n2,3\n'.encode()
+        post = delimited_to_arrays(msg, axis=0, dtypes=lambda i: None if i == 0 else float)
+        self.assertEqual([a.tolist() for a in post], [['€', '1.5'], [2.0, 3.0]])
+        with self.assertRaises(TypeError):
+            _ = delimited_to_arrays(msg, axis=0, dtypes=lambda i: float)
+        with self.assertRaises(TypeError):
+            _ = delimited_to_arrays(msg, axis=0, dtypes=lambda i: int)
+
+    def test_delimited_to_arrays_usecols_a(self) -> None:
+        msg = ['1,a,true,1.5', '2,b,false,2.5']
+        post1 = delimited_to_arrays(msg, axis=1, usecols=[3, 0])
+        self.assertEqual([a.tolist() for a in post1], [[1, 2], [1.5, 2.5]])
+
+        post2 = delimited_to_arrays(msg, axis=1, usecols=np.array([False, True, True]))
+        self.assertEqual([a.tolist() for a in post2], [['a', 'b'], [True, False]])
+
+        post3 = delimited_to_arrays(msg, axis=1, usecols=np.array([9]))
+        self.assertEqual(post3, [])
+
+    def test_delimited_to_arrays_usecols_b(self) -> None:
+        # dtypes and line_select are called with field positions
+        msg = ['1,a,true,1.5', '2,b,false,2.5']
+        positions = []
+        def dtypes(i: int) -> tp.Any:
+            positions.append(i)
+            return str
+        post1 = delimited_to_arrays(msg,
+                axis=1,
+                usecols={1, 3},
+                dtypes=dtypes,
+                line_select=lambda i: i != 1,
+                )
+        self.assertEqual([a.tolist() for a in post1], [['1.5', '2.5']])
+        self.assertEqual(set(positions), {1, 3})
+
+    def test_delimited_to_arrays_usecols_c(self) -> None:
+        msg = ['1,a,true,1.5', '2,b,false,2.5']
+        post1 = delimited_to_arrays(msg, axis=0, usecols=[1, 3])
+        self.assertEqual([a.tolist() for a in post1], [['a', '1.5'], ['b', '2.5']])
+
+        with self.assertRaises(ValueError):
+            _ = delimited_to_arrays(msg, usecols=[-1])
+        with self.assertRaises(TypeError):
+            _ = delimited_to_arrays(msg, usecols=[True, False])
+        with self.assertRaises(TypeError):
+            _ = delimited_to_arrays(msg, usecols=3)
+
+    def test_delimited_to_arrays_usecols_d(self) -> None:
+        records = [f'{i},x{i},"q\n{i}",{i * 0.5}' for i in range(40_000)]
+        msg = '\n'.join(records).encode()
+        post1 = delimited_to_arrays(msg, axis=1, usecols=[0, 2])
+        post2 = delimited_to_arrays(msg, axis=1, usecols=[0, 2], threads=4)
+        self.assertEqual(post1[1][-1], 'q\n39999')
+        self.assertEqual([a.tolist() for a in post1], [a.tolist() for a in post2])
+
+    def test_delimited_to_arrays_multiline_record_a(self) -> None:
+        msg = ['x,"a\n', 'b",c\n', 'd,e\n']
+        post = delimited_to_arrays(msg, axis=0)
+        self.assertEqual([a.tolist() for a in post], [['x', 'a\nb', 'c'], ['d', 'e']])
+
+    #---------------------------------------------------------------------------
+    def test_iter_delimited_to_arrays_a(self) -> None:
+        msg = ['1,a,true', '2,b,false', '3,c,true', '4,d,false', '5,e,true']
+        post = list(iter_delimited_to_arrays(msg, chunk_rows=2, axis=1))
+        self.assertEqual(len(post), 3)
+        self.assertEqual([[a.tolist() for a in chunk] for chunk in post],
+                [[[1, 2], ['a', 'b'], [True, False]],
+                [[3, 4], ['c', 'd'], [True, False]],
+                [[5], ['e'], [True]]])
+
+        whole = delimited_to_arrays(msg, axis=1)
+        for i, a in enumerate(whole):
+            self.assertEqual(
+                    np.concatenate([chunk[i] for chunk in post]).tolist(),
+                    a.tolist())
+
+    def test_iter_delimited_to_arrays_b(self) -> None:
+        # types resolved in later chunks can only widen
+        msg = ['1,10', '2,20', '3.5,30', '4,x']
+        post = list(iter_delimited_to_arrays(msg, chunk_rows=2, axis=1))
+        self.assertEqual([a.dtype.kind for a in post[0]], ['i', 'i'])
+        self.assertEqual([a.dtype.kind for a in post[1]], ['f', 'U'])
+
+        post = list(iter_delimited_to_arrays(msg[2:] + msg[:2], chunk_rows=2, axis=1))
+        self.assertEqual([a.dtype.kind for a in post[1]], ['f', 'U'])
+
+    def test_iter_delimited_to_arrays_c(self) -> None:
+        msg = b'a,b\n"c\nd",e\nf,g\n'
+        post = list(iter_delimited_to_arrays(msg, chunk_rows=1, axis=0))
+        self.assertEqual([[a.tolist() for a in chunk] for chunk in post],
+                [[['a', 'b']], [['c\nd', 'e']], [['f', 'g']]])
+
+    def test_iter_delimited_to_arrays_d(self) -> None:
+        msg = ['1,2', '3,4', '5,6']
+        post = list(iter_delimited_to_arrays(msg,
+                chunk_rows=2,
+                axis=1,
+                dtypes=lambda i: str,
+                line_select=lambda i: i == 1,
+                ))
+        self.assertEqual([[a.tolist() for a in chunk] for chunk in post],
+                [[['2', '4']], [['6']]])
+
+    def test_iter_delimited_to_arrays_e(self) -> None:
+        self.assertEqual(list(iter_delimited_to_arrays([], chunk_rows=2)), [])
+        self.assertEqual(list(iter_delimited_to_arrays(b'', chunk_rows=2)), [])
+        with self.assertRaises(ValueError):
+            _ = iter_delimited_to_arrays(['1,2'], chunk_rows=0)
+
+        it = iter_delimited_to_arrays(['1,2', '3,x'], axis=1, dtypes=lambda i: int)
+        with self.assertRaises(TypeError):
+            _ = next(it)
+
+    def test_iter_delimited_to_arrays_f(self) -> None:
+        msg = ['2020-01-01', '2020-01-01T01', '2020-01-02']
+        post = list(iter_delimited_to_arrays(msg, chunk_rows=1, axis=1, infer_datetime=True))
+        self.assertEqual([chunk[0].dtype for chunk in post],
+                [np.dtype('M8[D]'), np.dtype('M8[h]'), np.dtype('M8[h]')])
+
+    #---------------------------------------------------------------------------
+    def test_delimited_to_record_index_a(self) -> None:
+        msg = b'a,1\n"b\nc",2\n\nd,3\r\n"e""",4'
+        post = delimited_to_record_index(msg)
+        self.assertEqual(post.dtype, np.dtype(np.int64))
+        self.assertEqual(post.tolist(), [0, 4, 13, 18])
+        self.assertFalse(post.flags.writeable)
+
+        self.assertEqual(delimited_to_record_index(b'').tolist(), [])
+        self.assertEqual(delimited_to_record_index(b'a\n"b\nc\n', quoting=csv.QUOTE_NONE).tolist(),
+                [0, 2, 5])
+
+        with self.assertRaises(TypeError):
+            _ = delimited_to_record_index(['a,1'])
+
+    def test_delimited_to_record_index_b(self) -> None:
+        msg = b'a,1\n"b\nc",2\n\nd,3\r\n"e""",4'
+        index = delimited_to_record_index(msg)
+
+        post = delimited_to_arrays(msg, axis=1, record_index=index, rows=[3, 1])
+        self.assertEqual([a.tolist() for a in post], [['e"', 'b\nc'], [4, 2]])
+
+        post = delimited_to_arrays(msg, axis=0, record_index=index, rows=slice(1, 3))
+        self.assertEqual([a.tolist() for a in post], [['b\nc', '2'], ['d', '3']])
+
+        post = delimited_to_arrays(msg, axis=1, record_index=index, rows=[-1])
+        self.assertEqual([a.tolist() for a in post], [['e"'], [4]])
+
+        with self.assertRaises(IndexError):
+            _ = delimited_to_arrays(msg, record_index=index, rows=[4])
+        with self.assertRaises(ValueError):
+            _ = delimited_to_arrays(msg, record_index=index[::-1], rows=[0])
+        with self.assertRaises(ValueError):
+            _ = delimited_to_arrays(msg, rows=[0])
+        with self.assertRaises(ValueError):
+            _ = delimited_to_arrays(msg, record_index=index, rows=[0], skip_header=1)
+
+    def test_delimited_to_record_index_c(self) -> None:
+        # a Boolean array of rows is a mask, as with line_select
+        msg = b'a,1\nb,2\nc,3\nd,4\ne,5\n'
+        index = delimited_to_record_index(msg)
+        post = delimited_to_arrays(msg, axis=1, record_index=index,
+                rows=np.array([True, False, True, False, False]))
+        self.assertEqual([a.tolist() for a in post], [['a', 'c'], [1, 3]])
+
+        post = delimited_to_arrays(msg, axis=1, record_index=index, rows=np.zeros(5, dtype=bool))
+        self.assertEqual(post, [])
+
+        with self.assertRaises(IndexError):
+            _ = delimited_to_arrays(msg, record_index=index, rows=np.array([True, False]))
+        with self.assertRaises(TypeError):
+            _ = delimited_to_arrays(msg, record_index=index, rows=[True, False, True, False, False])
+
+    #---------------------------------------------------------------------------
+    def test_arrays_to_delimited_a(self) -> None:
+        arrays = [
+                np.array([1, -2, 3]),
+                np.array([1.5, np.nan, 0.1]),
+                np.array([True, False, True]),
+                np.array(['a,b', 'c"d', 'e\nf']),
+                np.array(['2020-01-01', 'NaT', '2021-05-06T01'], dtype='M8[h]'),
+                np.array([None, 'x', 3], dtype=object),
+                ]
+        rows = [[a.tolist()[i] if a.dtype.kind != 'M' else str(a[i]) for a in arrays]
+                for i in range(3)]
+        for quoting in (csv.QUOTE_MINIMAL, csv.QUOTE_ALL, csv.QUOTE_NONNUMERIC, csv.QUOTE_NONE):
+            escapechar = '\\' if quoting == csv.QUOTE_NONE else None
+            post = bytearray()
+            arrays_to_delimited(arrays, post, quoting=quoting, escapechar=escapechar)
+            f = io.StringIO()
+            csv.writer(f, quoting=quoting, escapechar=escapechar, lineterminator='\n').writerows(rows)
+            self.assertEqual(post.decode(), f.getvalue())
+
+        with self.assertRaises(ValueError):
+            arrays_to_delimited(arrays, bytearray(), quoting=csv.QUOTE_NONE)
+
+    def test_arrays_to_delimited_b(self) -> None:
+        arrays = [np.array([1.0, 2.5]), np.array(['a', 'b'])]
+        f = io.StringIO()
+        arrays_to_delimited(arrays, f, delimiter='|', float_format='%.2f', lineterminator='\r\n')
+        self.assertEqual(f.getvalue(), '1.00|a\r\n2.50|b\r\n')
+
+        with tempfile.TemporaryDirectory() as dir:
+            fp = pathlib.Path(dir) / 'a.csv'
+            arrays_to_delimited(arrays, fp)
+            post = delimited_to_arrays(fp, axis=1)
+            self.assertEqual([a.tolist() for a in post], [a.tolist() for a in arrays])
+
+        with self.assertRaises(ValueError):
+            arrays_to_delimited(arrays, bytearray(), float_format='%d')
+        with self.assertRaises(ValueError):
+            arrays_to_delimited([np.arange(2), np.arange(3)], bytearray())
+        with self.assertRaises(ValueError):
+            arrays_to_delimited([np.arange(4).reshape(2, 2)], bytearray())
+
+    def test_arrays_to_delimited_c(self) -> None:
+        # floats and datetimes are formatted as repr() and str()
+        values = [0.0, -0.0, 0.1, 1e-05, 123456.789, 1e16, 2.675, 1 / 3, np.inf, np.nan]
+        post = bytearray()
+        arrays_to_delimited([np.array(values)], post)
+        self.assertEqual(post.decode().split('\n')[:-1], [repr(v) for v in values])
+
+        for unit in ('Y', 'M', 'W', 'D', 'h', 'm', 's', 'ms', 'us', 'ns'):
+            array = np.array([-10**6, -1, 0, 10**5], dtype=f'M8[{unit}]')
+            post = bytearray()
+            arrays_to_delimited([array], post)
+            self.assertEqual(post.decode().split('\n')[:-1], [str(v) for v in array])
+
+    def test_arrays_to_delimited_d(self) -> None:
+        # arrays not in native byte order are written by value
+        arrays = [
+                np.array([1, -2], dtype='>i8'),
+                np.array([1.5, 0.25], dtype='>f8'),
+                np.array(['aé', 'b'], dtype='>U2'),
+                np.array([1, 2], dtype='<u2')[::-1],
+                np.array(['2020-01-01', 'NaT'], dtype='>M8[D]'),
+                ]
+        post = bytearray()
+        arrays_to_delimited(arrays, post)
+        self.assertEqual(post.decode(), '1,1.5,aé,2,2020-01-01\n-2,0.25,b,1,NaT\n')
+
+    #---------------------------------------------------------------------------
+    def test_tail_delimited_to_arrays_a(self) -> None:
+        with tempfile.TemporaryDirectory() as dir:
+            fp = pathlib.Path(dir) / 'a.csv'
+            fp.write_bytes(b'')
+            tail = tail_delimited_to_arrays(fp, axis=1)
+            self.assertEqual(tail(), [])
+
+            with open(fp, 'ab') as f:
+                f.write(b'a,1\nb,2\nc,')
+            # a partial record is not loaded
+            post = tail()
+            self.assertEqual([a.tolist() for a in post], [['a', 'b'], [1, 2]])
+            self.assertEqual(tail(), [])
+
+            with open(fp, 'ab') as f:
+                f.write(b'3.5\nd,4\n')
+            post = tail()
+            self.assertEqual([a.tolist() for a in post], [['c', 'd'], [3.5, 4.0]])
+
+            # dtypes resolve with those of prior calls
+            with open(fp, 'ab') as f:
+                f.write(b'e,5\n')
+            post = tail()
+            self.assertEqual(post[1].dtype, np.dtype(float))
+
+            # a truncated file is read from the start
+            fp.write_bytes(b'f,6\n')
+            post = tail()
+            self.assertEqual([a.tolist() for a in post], [['f'], [6.0]])
+
+    def test_tail_delimited_to_arrays_b(self) -> None:
+        with tempfile.TemporaryDirectory() as dir:
+            fp = pathlib.Path(dir) / 'a.csv'
+            fp.write_bytes(b'1,"a\nb')
+            tail = tail_delimited_to_arrays(fp, axis=0)
+            # a quoted field is not complete at a line terminator
+            self.assertEqual(tail(), [])
+
+            with open(fp, 'ab') as f:
+                f.write(b'",2\r')
+            # a trailing \r might precede a \n
+            self.assertEqual(tail(), [])
+
+            with open(fp, 'ab') as f:
+                f.write('\n\u00e9,3\n'.encode())
+            post = tail()
+            self.assertEqual([a.tolist() for a in post], [['1', 'a\nb', '2'], ['\u00e9', '3']])
+
+            with self.assertRaises(TypeError):
+                _ = tail(1)
+
+            with self.assertRaises(FileNotFoundError):
+                _ = tail_delimited_to_arrays(pathlib.Path(dir) / 'b.csv')()
+
+    def test_tail_delimited_to_arrays_c(self) -> None:
+        with tempfile.TemporaryDirectory() as dir:
+            fp = pathlib.Path(dir) / 'a.csv'
+            fp.write_bytes(b'name,val')
+            tail = tail_delimited_to_arrays(fp, axis=1, dtypes=[str, int], skip_header=1, on_error='collect', return_mask=True)
+            # the header is skipped once complete
+            post, masks, report = tail()
+            self.assertEqual((post, masks, len(report)), ([], [], 0))
+
+            with open(fp, 'ab') as f:
+                f.write(b'\na,1\nb,')
+            post, masks, report = tail()
+            self.assertEqual([a.tolist() for a in post], [['a'], [1]])
+            self.assertEqual(masks[1].tolist(), [False])
+            self.assertEqual(report.tolist(), [])
+
+            with open(fp, 'ab') as f:
+                f.write(b'x\nc,3\n')
+            # header lines are only skipped at the start of the file
+            post, masks, report = tail()
+            self.assertEqual([a.tolist() for a in post], [['b', 'c'], [0, 3]])
+            self.assertEqual(masks[1].tolist(), [True, False])
+            self.assertEqual(report.tolist(), [(0, 1, 'x')])
+
+            with self.assertRaises(ValueError):
+                _ = tail_delimited_to_arrays(fp, skip_header=-1)
+            with self.assertRaises(ValueError):
+                _ = tail_delimited_to_arrays(fp, on_error='ignore')
+
+    #---------------------------------------------------------------------------
+    def test_delimited_to_arrays_datetime_a(self) -> None:
+        # native parsing matches NumPy for every unit
+        msg = ['2020-01-01',
+                '1969-12-31T23:59:59.999',
+                '1600-02-29 12',
+                ' 2020-05-06',
+                '2021-03-04T05:06:07.123456789123',
+                '2020',
+                '2020-07',
+                'NaT',
+                ]
+        for unit in ('Y', 'M', 'W', 'D', 'h', 'm', 's', 'ms', 'us', 'ns'):
+            dtype = np.dtype(f'M8[{unit}]')
+            post = delimited_to_arrays(msg, axis=0, dtypes=lambda i: dtype)
+            self.assertEqual([a.item() for a in post],
+                    np.array(msg).astype(dtype).tolist())
+            self.assertTrue(all(a.dtype == dtype for a in post))
+
+    def test_delimited_to_arrays_datetime_b(self) -> None:
+        post = delimited_to_arrays(['2262-04-11T23:47:16.854775807,,9999-12-31'],
+                axis=1,
+                dtypes=lambda i: 'M8[ns]' if i < 2 else 'M8[D]',
+                )
+        self.assertEqual(post[0].astype(np.int64).tolist(), [np.iinfo(np.int64).max])
+        self.assertTrue(np.isnat(post[1][0]))
+        self.assertEqual(post[2].tolist(), [datetime.date(9999, 12, 31)])
+        self.assertFalse(post[0].flags.writeable)
+
+    def test_delimited_to_arrays_datetime_c(self) -> None:
+        # forms not parsed natively defer to NumPy, including its errors
+        post = delimited_to_arrays(['2020-01-01', '2020-01-01T12', '1'],
+                axis=0,
+                dtypes=lambda i: 'M8[15m]',
+                )
+        self.assertEqual([str(a[0]) for a in post],
+                ['2020-01-01T00:00', '2020-01-01T12:00', '0001-01-01T00:00'])
+
+        with self.assertRaises(ValueError):
+            _ = delimited_to_arrays(['2020-13-01'], axis=1, dtypes=lambda i: 'M8[D]')
+        with self.assertRaises(ValueError):
+            _ = delimited_to_arrays(['2020-01-01 '], axis=1, dtypes=lambda i: 'M8[D]')
+
+    def test_delimited_to_arrays_datetime_d(self) -> None:
+        msg = ['2020-01-01,2020-01-01T01,3,2020-01-01',
+                '2020-02-01,2020-01-01 01:02:03.1234,x,2020-02-30',
+                ',,,',
+                ]
+        post = delimited_to_arrays(msg, axis=1, infer_datetime=True)
+        self.assertEqual([a.dtype for a in post],
+                [np.dtype('M8[D]'), np.dtype('M8[us]'), np.dtype('<U1'), np.dtype('<U10')])
+        self.assertEqual(post[0].tolist(),
+                [datetime.date(2020, 1, 1), datetime.date(2020, 2, 1), None])
+        self.assertEqual(post[1][1], np.datetime64('2020-01-01T01:02:03.1234'))
+
+        # inference is opt-in
+        post = delimited_to_arrays(msg, axis=1)
+        self.assertEqual([a.dtype.kind for a in post], ['U', 'U', 'U', 'U'])
+
+    def test_delimited_to_arrays_datetime_e(self) -> None:
+        msg = ['2020-01-01T01:02', '2020-01-01T01:02:03.5', '2020', '2020-01-01T01:02:03.']
+        post = delimited_to_arrays(msg, axis=0, infer_datetime=True)
+        self.assertEqual([a.dtype for a in post],
+                [np.dtype('M8[m]'), np.dtype('M8[ms]'), np.dtype(np.int64), np.dtype('<U20')])
+
+    #---------------------------------------------------------------------------
+    def test_delimited_to_arrays_infer_rows_a(self) -> None:
+        msg = ['1,true,a', '2,false,b', '3,TRUE,c']
+        post = delimited_to_arrays(msg, axis=1, infer_rows=1)
+        self.assertEqual([a.tolist() for a in post],
+                [[1, 2, 3], [True, False, True], ['a', 'b', 'c']])
+
+        with self.assertRaises(ValueError):
+            delimited_to_arrays(msg, axis=1, infer_rows=-1)
+
+    def test_delimited_to_arrays_infer_rows_b(self) -> None:
+        # fields after the sample that do not fit the sampled type are re-inferred
+        msg = ['1,true', '2,false', '3.5,foo', 'x,true']
+        post = delimited_to_arrays(msg, axis=1, infer_rows=2)
+        self.assertEqual([a.tolist() for a in post],
+                [['1', '2', '3.5', 'x'], ['true', 'false', 'foo', 'true']])
+
+        post = delimited_to_arrays(msg[:3], axis=1, infer_rows=2)
+        self.assertEqual(post[0].tolist(), [1.0, 2.0, 3.5])
+
+        post = delimited_to_arrays(msg * 1000, axis=1, infer_rows=2, threads=4)
+        self.assertEqual(post[0].dtype.kind, 'U')
+        self.assertEqual(post[1].dtype.kind, 'U')
+
+    def test_delimited_to_arrays_infer_rows_d(self) -> None:
+        # sampled inference matches full inference when later fields are accepted by converters but not the type parser
+        columns = [
+                ['(1+2j)', '1', 'j'],
+                ['1.5', '2', '1e'],
+                ['1.5', '2', '1_0'],
+                ['1', '2', '+'],
+                ['1', '2', '0x10'],
+                ['1', '2', '1j'],
+                ['1.5', '-inf', '1e-3', '2'],
+                ]
+        for column in columns:
+            expected = delimited_to_arrays(column, axis=1)[0]
+            for infer_rows in range(1, len(column) + 1):
+                for threads in (1, 2):
+                    post = delimited_to_arrays(column, axis=1, infer_rows=infer_rows, threads=threads)[0]
+                    self.assertEqual(post.dtype, expected.dtype, (column, infer_rows))
+                    self.assertEqual(post.tolist(), expected.tolist(), (column, infer_rows))
+
+    def test_delimited_to_arrays_infer_rows_c(self) -> None:
+        msg = ['2020-01-01', '2020-01-02', '2020-01-03T01', '2020-01-04']
+        post = delimited_to_arrays(msg, axis=1, infer_rows=2, infer_datetime=True)
+        self.assertEqual(post[0].dtype, np.dtype('M8[h]'))
+        self.assertEqual(post[0].tolist(), np.array(msg, dtype='M8[h]').tolist())
+
+    def test_delimited_to_arrays_skip_a(self) -> None:
+        msg = ['title\n', 'a,b\n', '1,2.5\n', '# note\n', '3,4\n', 'total,6.5\n']
+        for file_like in (msg, ''.join(msg).encode()):
+            post = delimited_to_arrays(file_like,
+                    axis=1,
+                    skip_header=2,
+                    skip_footer=1,
+                    comment_char='#',
+                    )
+            self.assertEqual([a.tolist() for a in post], [[1, 3], [2.5, 4.0]])
+
+            post = delimited_to_arrays(file_like, axis=0, skip_header=5, skip_footer=5)
+            self.assertEqual(post, [])
+
+    def test_delimited_to_arrays_skip_b(self) -> None:
+        # comment characters within a quoted field spanning lines are not comments
+        msg = ['1,"a\n', '#b"\n', '#2,c\n', '3,d\n']
+        post = delimited_to_arrays(msg, axis=1, comment_char='#')
+        self.assertEqual([a.tolist() for a in post], [[1, 3], ['a\n#b', 'd']])
+
+        # comment lines are not counted by line_select
+        post = delimited_to_arrays(msg[2:], axis=0, comment_char='#', line_select=[0])
+        self.assertEqual([a.tolist() for a in post], [['3', 'd']])
+
+        with self.assertRaises(ValueError):
+            delimited_to_arrays(msg, skip_footer=-1)
+        with self.assertRaises(TypeError):
+            delimited_to_arrays(msg, comment_char='##')
+
+    def test_delimited_to_arrays_on_error_a(self) -> None:
+        msg = ['1,2.5', 'x,3', '3,y', '99999999999999999999,4']
+        post, masks = delimited_to_arrays(msg,
+                axis=1,
+                dtypes=[int, float],
+                on_error='null',
+                return_mask=True,
+                )
+        self.assertEqual(post[0].tolist(), [1, 0, 3, 0])
+        self.assertEqual(post[1].tolist()[:2], [2.5, 3.0])
+        self.assertTrue(np.isnan(post[1][2]))
+        self.assertEqual([m.tolist() for m in masks],
+                [[False, True, False, True], [False, False, True, False]])
+
+        with self.assertRaises(TypeError):
+            delimited_to_arrays(msg, axis=1, dtypes=[int, float])
+        with self.assertRaises(ValueError):
+            delimited_to_arrays(msg, on_error='ignore')
+
+    def test_delimited_to_arrays_on_error_b(self) -> None:
+        msg = ['1,2.5', 'x,3', '3,y']
+        post, report = delimited_to_arrays(msg,
+                axis=1,
+                dtypes=[int, float],
+                on_error='collect',
+                )
+        self.assertEqual(post[0].tolist(), [1, 0, 3])
+        self.assertEqual(report.tolist(), [(1, 0, 'x'), (2, 1, 'y')])
+        self.assertEqual(report.dtype.names, ('record', 'field', 'text'))
+
+        # strict-mode errors are recovered as if not strict
+        post, report = delimited_to_arrays(['1,"a"b', '2,"c'],
+                axis=1,
+                strict=True,
+                on_error='collect',
+                )
+        self.assertEqual([a.tolist() for a in post], [[1, 2], ['ab', 'c']])
+        self.assertEqual(report.tolist(), [(0, 1, 'b'), (1, 1, '')])
+
+    def test_delimited_to_arrays_on_error_c(self) -> None:
+        # values that overflow a narrow integer dtype are errors
+        msg = ['300,256,-1', '-128,255,70000', '-129,0,65535']
+        post, masks, report = delimited_to_arrays(msg,
+                axis=1,
+                dtypes=[np.int8, np.uint8, np.uint16],
+                on_error='collect',
+                return_mask=True,
+                )
+        self.assertEqual([a.tolist() for a in post], [[0, -128, 0], [0, 255, 0], [0, 0, 65535]])
+        self.assertEqual(masks[0].tolist(), [True, False, True])
+        self.assertEqual(report.tolist(),
+                [(0, 0, '300'), (0, 1, '256'), (0, 2, '-1'), (1, 2, '70000'), (2, 0, '-129')])
+
+        out = [np.full(2, -1, dtype=np.int16)]
+        post = delimited_to_arrays(['40000', '2'], axis=1, out=out, on_error='null')
+        self.assertEqual(out[0].tolist(), [0, 2])
+
+    def test_delimited_to_arrays_on_error_d(self) -> None:
+        # unparseable datetimes are NaT, including units and forms parsed by NumPy
+        msg = ['2020-01-01,2020-01-01,2020-01-01', 'x,x,2020-01-02 03:00', '2020-01-03T05,,y']
+        post, masks, report = delimited_to_arrays(msg,
+                axis=1,
+                dtypes=[np.dtype('M8[D]'), np.dtype('M8[2D]'), np.dtype('M8[h]')],
+                on_error='collect',
+                return_mask=True,
+                )
+        self.assertEqual([a.astype(str).tolist() for a in post],
+                [['2020-01-01', 'NaT', '2020-01-03'],
+                ['2020-01-01', 'NaT', 'NaT'],
+                ['2020-01-01T00', '2020-01-02T03', 'NaT']])
+        self.assertEqual([m.tolist() for m in masks],
+                [[False, True, False], [False, True, True], [False, False, True]])
+        self.assertEqual(report.tolist(), [(1, 0, 'x'), (1, 1, 'x'), (2, 2, 'y')])
+
+        with self.assertRaises(ValueError):
+            _ = delimited_to_arrays(msg, axis=1, dtypes=[np.dtype('M8[D]')] * 3)
+
+        out = [np.zeros(3, dtype='M8[D]'), np.zeros(3, dtype='M8[2D]')]
+        post = delimited_to_arrays(msg, axis=1, usecols=[0, 1], out=out, on_error='null')
+        self.assertEqual(post, 3)
+        self.assertEqual(out[0].astype(str).tolist(), ['2020-01-01', 'NaT', '2020-01-03'])
+        self.assertEqual(out[1].astype(str).tolist(), ['2020-01-01', 'NaT', 'NaT'])
+
+    def test_delimited_to_arrays_out_a(self) -> None:
+        msg = ['1,2.5,2020-01-01,abcd', '2,3,2020-01-02,z']
+        out = [np.full(5, -1), np.zeros(5), np.zeros(5, dtype='M8[D]'), np.zeros(5, dtype='U3')]
+        post = delimited_to_arrays(msg, axis=1, out=out, out_offset=1)
+        self.assertEqual(post, 2)
+        self.assertEqual(out[0].tolist(), [-1, 1, 2, -1, -1])
+        self.assertEqual(out[1].tolist(), [0.0, 2.5, 3.0, 0.0, 0.0])
+        self.assertEqual(out[2][1:3].tolist(),
+                [datetime.date(2020, 1, 1), datetime.date(2020, 1, 2)])
+        self.assertEqual(out[3].tolist(), ['', 'abc', 'z', '', ''])
+
+        post = delimited_to_arrays(msg, axis=1, out=out[:2], usecols=[0, 1], out_offset=3)
+        self.assertEqual(post, 2)
+        self.assertEqual(out[0].tolist(), [-1, 1, 2, 1, 2])
+
+    def test_delimited_to_arrays_out_b(self) -> None:
+        msg = ['1,a', 'x,b']
+        out = [np.zeros(2, dtype=int), np.zeros(2, dtype='U1')]
+        with self.assertRaises(ValueError):
+            delimited_to_arrays(msg, axis=1, out=out[:1])
+        with self.assertRaises(ValueError):
+            delimited_to_arrays(msg, axis=1, out=out, out_offset=1)
+        with self.assertRaises(ValueError):
+            delimited_to_arrays(msg, axis=1, out=[np.zeros(4, dtype=int)[::2], out[1]])
+        with self.assertRaises(TypeError):
+            delimited_to_arrays(msg, axis=1, out=out)
+
+        post, masks = delimited_to_arrays(msg,
+                axis=1,
+                out=out,
+                on_error='null',
+                return_mask=True,
+                )
+        self.assertEqual(post, 2)
+        self.assertEqual(out[0].tolist(), [1, 0])
+        self.assertEqual(masks[0].tolist(), [False, True])
+
+    def test_delimited_to_arrays_stats_a(self) -> None:
+        msg = ['1,2.5,a,2020-01-01', '3,,bb,2020-01-03', '4,nan,,', '7,1,c,2020-01-02']
+        post, stats = delimited_to_arrays(msg,
+                axis=1,
+                infer_datetime=True,
+                return_stats=True,
+                )
+        self.assertEqual(len(post), len(stats))
+        self.assertEqual(stats[0],
+                dict(null_count=0, min=1, max=7, width=1, increasing=True, decreasing=False))
+        self.assertEqual(stats[1],
+                dict(null_count=2, min=1.0, max=2.5, width=3, increasing=False, decreasing=True))
+        self.assertEqual(stats[2],
+                dict(null_count=1, min=None, max=None, width=2, increasing=None, decreasing=None))
+        self.assertEqual(stats[3]['null_count'], 1)
+        self.assertEqual(stats[3]['min'], np.datetime64('2020-01-01'))
+        self.assertEqual(stats[3]['max'], np.datetime64('2020-01-03'))
+        self.assertFalse(stats[3]['increasing'])
+
+    def test_delimited_to_arrays_stats_b(self) -> None:
+        msg = ['1,', 'x,', '3,']
+        post, masks, stats, report = delimited_to_arrays(msg,
+                axis=1,
+                dtypes=[int],
+                on_error='collect',
+                return_mask=True,
+                return_stats=True,
+                )
+        self.assertEqual(stats[0]['null_count'], 1)
+        self.assertEqual(stats[0]['min'], 1)
+        self.assertTrue(stats[0]['increasing'])
+        self.assertEqual(stats[1]['null_count'], 3)
+        self.assertEqual(report.tolist(), [(1, 0, 'x')])
+
+        with self.assertRaises(ValueError):
+            delimited_to_arrays(msg, axis=1, return_stats=True, out=[np.zeros(3), np.zeros(3)])
+
+    def test_delimited_to_arrays_stats_c(self) -> None:
+        # -0.0 is ordered before 0.0
+        for dtype in (np.float64, np.float32, np.float16, np.longdouble):
+            post, stats = delimited_to_arrays(['0.0', '-0.0', '0.0'],
+                    axis=1,
+                    dtypes=[dtype],
+                    return_stats=True,
+                    )
+            self.assertTrue(np.signbit(stats[0]['min']))
+            self.assertFalse(np.signbit(stats[0]['max']))
+            self.assertFalse(stats[0]['increasing'])
+            self.assertFalse(stats[0]['decreasing'])
+
+    def test_delimited_to_arrays_stats_d(self) -> None:
+        # statistics of categoricals and of lines converted again after sampling
+        msg = [f'{i},a' for i in range(5)] + ['1.5,b']
+        post, stats = delimited_to_arrays(msg,
+                axis=1,
+                categorical=True,
+                infer_rows=3,
+                return_stats=True,
+                )
+        self.assertEqual(post[0].dtype.kind, 'f')
+        self.assertEqual(stats[0],
+                dict(null_count=0, min=0.0, max=4.0, width=3, increasing=False, decreasing=False))
+        self.assertEqual(stats[1],
+                dict(null_count=0, min=None, max=None, width=1, increasing=None, decreasing=None))
+
+    #---------------------------------------------------------------------------
+    def test_delimited_to_arrays_stats_e(self) -> None:
+        # half and long double floats are ordered
+        for dtype in (np.float16, np.longdouble):
+            post, stats = delimited_to_arrays(['3.5', 'nan', '-2', '100.25'],
+                    axis=1,
+                    dtypes=[dtype],
+                    return_stats=True,
+                    )
+            self.assertEqual(stats[0],
+                    dict(null_count=1, min=-2.0, max=100.25, width=6, increasing=False, decreasing=False))
+            self.assertEqual(stats[0]['min'].dtype, dtype)
+
+    def test_delimited_to_arrays_plain_a(self) -> None:
+        # records without special characters are split on the delimiter alone; others are processed per character
+        msg = ['a,bbbbbbbbbbbb,c\n', '"d,e",f,g', 'hhhhhhhhhhhhhhhh,,\r\n', '', '\u00e9,j,k', ',,']
+        post = delimited_to_arrays(msg, axis=0, dtypes=lambda i: str)
+        self.assertEqual([a.tolist() for a in post], [r for r in csv.reader(msg) if r])
+
+        post = delimited_to_arrays('\n'.join(msg).encode(), axis=1, dtypes=lambda i: str)
+        self.assertEqual([a.tolist() for a in post], [
+                ['a', 'd,e', 'hhhhhhhhhhhhhhhh', '\u00e9', ''],
+                ['bbbbbbbbbbbb', 'f', '', 'j', ''],
+                ['c', 'g', '', 'k', ''],
+                ])
+
+    def test_delimited_to_arrays_plain_b(self) -> None:
+        msg = ['1\t2.5\tx', '3\t4.5\ty\n']
+        post = delimited_to_arrays(msg, axis=1, delimiter='\t', usecols=[0, 2])
+        self.assertEqual([a.tolist() for a in post], [[1, 3], ['x', 'y']])
+
+        with self.assertRaises(RuntimeError):
+            delimited_to_arrays(['a,b\nc'], axis=0)
+
+    #---------------------------------------------------------------------------
+    def test_delimited_to_arrays_downcast_a(self) -> None:
+        msg = ['1,-200,70000,1.5,1.2345678,1e3,3000000000,nan,-128,',
+                '127,0,1,2.25,1,2,-1,inf,5,-1.5']
+        post = delimited_to_arrays(msg, axis=1, downcast=True)
+        self.assertEqual([a.dtype for a in post],
+                [np.dtype(np.int8), np.dtype(np.int16), np.dtype(np.int32), np.dtype(np.float32),
+                np.dtype(np.float64), np.dtype(np.float64), np.dtype(np.int64), np.dtype(np.float32),
+                np.dtype(np.int8), np.dtype(np.float32)])
+        self.assertEqual(post[1].tolist(), [-200, 0])
+        self.assertEqual(post[3].tolist(), [1.5, 2.25])
+        self.assertEqual(delimited_to_dtypes(msg, axis=1, downcast=True), [a.dtype for a in post])
+
+    def test_delimited_to_arrays_downcast_b(self) -> None:
+        # sampled types are not downcast
+        post = delimited_to_arrays(['1,1.5', '300,2.5'], axis=1, downcast=True, infer_rows=1)
+        self.assertEqual([a.dtype for a in post], [np.dtype(np.int64), np.dtype(np.float64)])
+
+        post = delimited_to_arrays(['0.000123', '123456.0', '1234567.0'], axis=0, downcast=True)
+        self.assertEqual([a.dtype for a in post],
+                [np.dtype(np.float32), np.dtype(np.float32), np.dtype(np.float64)])
+
+    #---------------------------------------------------------------------------
+    def test_delimited_to_arrays_na_values_a(self) -> None:
+        msg = ['1,1.5,2020-01-01,a,true', 'NA,N/A,null,NA,NA', '3,,NA,c,', 'null,2.5,2020-01-03,NAN,false']
+        arrays, masks = delimited_to_arrays(msg,
+                axis=1,
+                na_values=['NA', 'N/A', 'null'],
+                infer_datetime=True,
+                return_mask=True,
+                )
+        self.assertEqual([a.dtype.kind for a in arrays], ['i', 'f', 'M', 'U', 'b'])
+        self.assertEqual(arrays[0].tolist(), [1, 0, 3, 0])
+        self.assertEqual(arrays[1][[0, 3]].tolist(), [1.5, 2.5])
+        self.assertTrue(np.isnan(arrays[1][[1, 2]]).all())
+        self.assertTrue(np.isnat(arrays[2][[1, 2]]).all())
+        self.assertEqual(arrays[3].tolist(), ['a', '', 'c', 'NAN'])
+
+        self.assertEqual([m.tolist() for m in masks], [
+                [False, True, False, True],
+                [False, True, True, False],
+                [False, True, True, False],
+                [False, True, False, False],
+                [False, True, True, False],
+                ])
+        self.assertFalse(masks[0].flags.writeable)
+
+    def test_delimited_to_arrays_na_values_b(self) -> None:
+        post = delimited_to_arrays(b'1,NA\n2,3\n' * 50000, axis=1, na_values=['NA'], threads=4)
+        self.assertEqual(post[1].dtype, np.int64)
+        self.assertEqual(post[1][:4].tolist(), [0, 3, 0, 3])
+
+        post = list(iter_delimited_to_arrays(['NA', '1'], axis=1, na_values=('NA',), chunk_rows=1))
+        self.assertEqual([a[0].tolist() for a in post], [[''], [1]])
+
+        with self.assertRaises(TypeError):
+            delimited_to_arrays(['NA'], na_values='NA')
+        with self.assertRaises(TypeError):
+            delimited_to_arrays(['NA'], na_values=[None])
+
+    #---------------------------------------------------------------------------
+    def test_delimited_to_arrays_categorical_a(self) -> None:
+        msg = ['1,AAPL,x', '2,MSFT,', '3,AAPL,yy', '4,\u00e9,x']
+        post = delimited_to_arrays(msg, axis=1, categorical=True)
+        self.assertEqual(post[0].tolist(), [1, 2, 3, 4])
+
+        codes, uniques = post[1]
+        self.assertEqual(codes.dtype, np.int8)
+        self.assertEqual(codes.tolist(), [0, 1, 0, 2])
+        self.assertEqual(uniques.tolist(), ['AAPL', 'MSFT', '\u00e9'])
+        self.assertFalse(codes.flags.writeable)
+        self.assertFalse(uniques.flags.writeable)
+
+        codes, uniques = post[2]
+        self.assertEqual(uniques[codes].tolist(), ['x', '', 'yy', 'x'])
+
+    def test_delimited_to_arrays_categorical_b(self) -> None:
+        # sized unicode dtypes are not encoded
+        post = delimited_to_arrays(['a,b', 'c,d'], axis=1, categorical=True, dtypes=[str, 'U1'])
+        self.assertEqual(post[0][1].tolist(), ['a', 'c'])
+        self.assertEqual(post[1].tolist(), ['b', 'd'])
+
+        msg = [str(i % 1000) for i in range(5000)]
+        codes, uniques = delimited_to_arrays(msg, axis=1, categorical=True, dtypes=[str])[0]
+        self.assertEqual(codes.dtype, np.int16)
+        self.assertEqual(len(uniques), 1000)
+        self.assertEqual(uniques[codes].tolist(), msg)
+
+    def test_delimited_to_arrays_categorical_c(self) -> None:
+        # codes are widened at the limit of each type
+        for count, dtype in ((128, np.int8), (129, np.int16), (32768, np.int16), (32769, np.int32)):
+            msg = [str(i) for i in range(count)] + ['0', str(count - 1)]
+            codes, uniques = delimited_to_arrays(msg, axis=1, categorical=True, dtypes=[str])[0]
+            self.assertEqual(codes.dtype, dtype)
+            self.assertEqual(len(uniques), count)
+            self.assertEqual(codes[-2:].tolist(), [0, count - 1])
+            self.assertEqual(uniques[codes].tolist(), msg)
+
+    #---------------------------------------------------------------------------
+    def test_delimited_to_dtypes_a(self) -> None:
+        msg = ['1,true,a,,2020-01-01', '2.5,false,bbb,,2020-01-02T01', '3,TRUE,c,,x']
+        post = delimited_to_dtypes(msg, axis=1)
+        self.assertEqual(post, [a.dtype for a in delimited_to_arrays(msg, axis=1)])
+        self.assertEqual(post,
+                [np.dtype(float), np.dtype(bool), np.dtype('<U3'), np.dtype('<U1'), np.dtype('<U13')])
+
+    def test_delimited_to_dtypes_b(self) -> None:
+        msg = ['1,true,a,,2020-01-01', '2.5,false,bbb,,2020-01-02T01', '3,TRUE,c,,x']
+        dtypes, widths = delimited_to_dtypes(msg,
+                axis=1,
+                max_rows=2,
+                infer_datetime=True,
+                return_widths=True,
+                )
+        self.assertEqual(dtypes,
+                [np.dtype(float), np.dtype(bool), np.dtype('<U3'), np.dtype('<U1'), np.dtype('M8[h]')])
+        self.assertEqual(widths, [3, 5, 3, 0, 13])
+
+        self.assertEqual(delimited_to_dtypes(msg, axis=1, max_rows=0), [])
+        with self.assertRaises(ValueError):
+            delimited_to_dtypes(msg, axis=1, max_rows=-1)
+
+    def test_delimited_to_dtypes_c(self) -> None:
+        msg = b'1,2,a\n3,x,b\n'
+        post = delimited_to_dtypes(msg, axis=1, dtypes={2: 'S'}, usecols=[1, 2])
+        self.assertEqual(post, [np.dtype('<U1'), np.dtype('S1')])
+
+        post = delimited_to_dtypes(msg, axis=0, line_select=[1])
+        self.assertEqual(post, [np.dtype('<U1')])
+
+    def test_fixed_width_to_arrays_a(self) -> None:
+        msg = ['    1  abc  2.5\n', '12345 xyz    3\n', '    7\n']
+        post = fixed_width_to_arrays(msg, axis=1, widths=[5, 5, 5])
+        self.assertEqual([a.dtype for a in post],
+                [np.dtype(np.int64), np.dtype('<U3'), np.dtype(float)])
+        self.assertEqual(post[0].tolist(), [1, 12345, 7])
+        self.assertEqual(post[1].tolist(), ['abc', 'xyz', ''])
+        self.assertEqual(post[2].tolist()[:2], [2.5, 3.0])
+
+        post = fixed_width_to_arrays(''.join(msg).encode(), axis=0, widths=[5, 5, 5])
+        self.assertEqual([a.tolist() for a in post],
+                [['1', 'abc', '2.5'], ['12345', 'xyz', '3'], [7, 0, 0]])
+
+    def test_fixed_width_to_arrays_b(self) -> None:
+        msg = 'ab\u00e9 10\r\nx\U0001F600z 20\r\n'
+        for file_like in (msg.splitlines(True), msg.encode('utf-8')):
+            post = fixed_width_to_arrays(file_like,
+                    axis=1,
+                    colspecs=[(0, 1), (2, None)],
+                    dtypes=[None, str],
+                    )
+            self.assertEqual([a.tolist() for a in post], [['a', 'x'], ['\u00e9 10', 'z 20']])
+
+    def test_fixed_width_to_arrays_c(self) -> None:
+        with self.assertRaises(ValueError):
+            fixed_width_to_arrays(['1'])
+        with self.assertRaises(ValueError):
+            fixed_width_to_arrays(['1'], widths=[1], colspecs=[(0, 1)])
+        with self.assertRaises(ValueError):
+            fixed_width_to_arrays(['1'], widths=[0])
+        with self.assertRaises(ValueError):
+            fixed_width_to_arrays(['1'], colspecs=[(2, 1)])
+        with self.assertRaises(TypeError):
+            fixed_width_to_arrays(['1'], colspecs=[3])
+
+    def test_iter_delimited_to_arrays_g(self) -> None:
+        msg = ['1,2', '3,4', 'x,5']
+        post = list(iter_delimited_to_arrays(msg, axis=1, infer_rows=1, chunk_rows=2))
+        self.assertEqual([[a.tolist() for a in arrays] for arrays in post],
+                [[[1, 3], [2, 4]], [['x'], [5]]])
+
     #---------------------------------------------------------------------------
     def test_delimited_to_arrays_compare_int_a(self) -> None:
         # genfromtxt might translate an empty field to -1 or 0
@@ -2,7 +2,10 @@
 import unittest
 import csv
 
+import numpy as np
+
 from arraykit import split_after_count
+from arraykit import split_after_count_array
 
 class TestUnit(unittest.TestCase):
 
@@ -118,6 +121,39 @@ class TestUnit(unittest.TestCase):
         post = split_after_count('a,b,"c,"",d",e', doublequote=False, count=3)
         self.assertEqual(post, ('a,b,"c,""', 'd",e'))
 
+    #---------------------------------------------------------------------------
+
+    def test_split_after_count_array_a(self) -> None:
+        strings = ['a,b,c', 'a,"b,c",d', 'a', ',', 'x,yyyy,zz']
+        for src in (strings,
+                np.array(strings),
+                np.array(strings, dtype='>U9'),
+                np.array(strings)[::-1][::-1],
+                np.array(strings, dtype=object),
+                iter(strings)):
+            left, right = split_after_count_array(src, count=2)
+            self.assertEqual(left.dtype, np.dtype('<U7'))
+            self.assertEqual(right.dtype, np.dtype('<U2'))
+            self.assertFalse(left.flags.writeable)
+            self.assertEqual(list(zip(left.tolist(), right.tolist())),
+                    [split_after_count(s, count=2) for s in strings])
+
+    def test_split_after_count_array_b(self) -> None:
+        left, right = split_after_count_array([], count=1)
+        self.assertEqual((left.tolist(), right.tolist()), ([], []))
+
+        left, right = split_after_count_array(['a|b|c'], delimiter='|', count=1)
+        self.assertEqual((left.tolist(), right.tolist()), (['a'], ['b|c']))
+
+        with self.assertRaises(ValueError):
+            _ = split_after_count_array(['a', 3], count=1)
+        with self.assertRaises(ValueError):
+            _ = split_after_count_array(['a'], count=0)
+        with self.assertRaises(ValueError):
+            _ = split_after_count_array(np.array([['a']]), count=1)
+        with self.assertRaises(RuntimeError):
+            _ = split_after_count_array(['"a"b'], count=1, strict=True)
+
 
 
 